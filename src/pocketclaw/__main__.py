@@ -6,6 +6,7 @@ Changes:
   - 2026-02-06: Added --discord, --slack, --whatsapp CLI modes.
   - 2026-02-02: Added Rich logging for beautiful console output.
   - 2026-02-03: Handle port-in-use gracefully with automatic port finding.
+  - 2026-10-19: Added --startup-report (import-time breakdown of the entry points).
 """
 
 import argparse
@@ -192,7 +193,16 @@ async def run_multi_channel_mode(settings: Settings, args: argparse.Namespace) -
         logger.error("No channel adapters could be started. Check your configuration.")
         return
 
-    agent_loop = AgentLoop()
+    from pocketclaw.agents.workers import workers_enabled
+
+    if workers_enabled(settings):
+        from pocketclaw.agents.workers import WorkerPool
+
+        agent_loop = WorkerPool(
+            settings.agent_workers, bus, slots=settings.max_concurrent_conversations
+        )
+    else:
+        agent_loop = AgentLoop()
 
     for adapter in adapters:
         await adapter.start(bus)
@@ -342,6 +352,11 @@ Examples:
         action="store_true",
         help="Auto-fix fixable issues found by --security-audit",
     )
+    parser.add_argument(
+        "--startup-report",
+        action="store_true",
+        help="Print an import-time breakdown of pocketpaw and the dashboard, then exit",
+    )
     parser.add_argument(
         "--host",
         type=str,
@@ -355,6 +370,11 @@ Examples:
 
     args = parser.parse_args()
 
+    if args.startup_report:
+        from pocketclaw.startup_report import main as startup_report
+
+        raise SystemExit(startup_report([]))
+
     # Fail fast if optional deps are missing for the chosen mode
     _check_extras_installed(args)
 
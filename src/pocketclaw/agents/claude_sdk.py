@@ -18,10 +18,18 @@ Changes:
   - 2026-02-12: Hardened _block_dangerous_hook — wrapped in try/except to prevent
                 unhandled exceptions from tearing down the CLI stream. Updated hook
                 signature to match SDK 0.1.31 types (PreToolUseHookInput, HookContext).
+  - 2026-10-19: Session-scoped ClaudeSDKClient pool — turns with a session_key reuse
+                a live CLI process and its native conversation state (sdk_pool.py).
+  - 2026-10-19: Smart routing goes through ModelRouter.select() (telemetry-aware);
+                each turn's TTFT, latency, tokens and cost feed model_telemetry.
+  - 2026-10-19: Pooled clients get only the changed system-prompt blocks as a
+                context update and reconnect once updates pass _CONTEXT_UPDATE_LIMIT.
 """
 
 import logging
+import time
 from collections.abc import AsyncIterator
+from contextlib import aclosing
 from pathlib import Path
 from typing import Any
 
@@ -52,6 +60,10 @@ DANGEROUS_PATTERNS = [
     "wget | bash",
 ]
 
+# Characters of <context-update> a pooled client may accumulate before it is
+# reconnected with a fresh system prompt
+_CONTEXT_UPDATE_LIMIT = 16_000
+
 # Default identity fallback (used when AgentContextBuilder prompt is not available)
 _DEFAULT_IDENTITY = (
     "You are PocketPaw, a helpful AI assistant running locally on the user's computer."
@@ -214,6 +226,7 @@ class ClaudeAgentSDK:
         self._ToolUseBlock = None
         self._ToolResultBlock = None
         self._StreamEvent = None
+        self._ClaudeSDKClient = None
 
         self._initialize()
 
@@ -257,6 +270,14 @@ class ClaudeAgentSDK:
                 self._StreamEvent = None
                 logger.info("StreamEvent not available - coarse-grained streaming only")
 
+            # ClaudeSDKClient for long-lived per-session processes (optional)
+            try:
+                from claude_agent_sdk import ClaudeSDKClient
+
+                self._ClaudeSDKClient = ClaudeSDKClient
+            except ImportError:
+                self._ClaudeSDKClient = None
+
             self._sdk_available = True
 
             # Check if the `claude` CLI binary is actually installed
@@ -464,164 +485,249 @@ class ClaudeAgentSDK:
             servers[cfg.name] = entry
         return servers
 
-    async def chat(
-        self,
-        message: str,
-        *,
-        system_prompt: str | None = None,
-        history: list[dict] | None = None,
-    ) -> AsyncIterator[AgentEvent]:
-        """Process a message through Claude Agent SDK with streaming.
+    def _format_history(self, history: list[dict] | None) -> str:
+        """Flatten session history into a system prompt section."""
+        if not history:
+            return ""
+        lines = ["# Recent Conversation"]
+        for msg in history:
+            role = msg.get("role", "user").capitalize()
+            content = msg.get("content", "")
+            # Truncate very long messages to keep prompt manageable
+            if len(content) > 500:
+                content = content[:500] + "..."
+            lines.append(f"**{role}**: {content}")
+        return "\n\n" + "\n".join(lines)
+
+    def _build_options_kwargs(self) -> dict:
+        """Build ClaudeAgentOptions kwargs shared by every turn (no prompt/model)."""
+        import os
 
-        Uses the SDK's built-in tools and streaming capabilities.
+        # Build allowed tools list, filtered by tool policy
+        all_sdk_tools = [
+            "Bash",
+            "Read",
+            "Write",
+            "Edit",
+            "Glob",
+            "Grep",
+            "WebSearch",
+            "WebFetch",
+        ]
+        allowed_tools = [
+            t for t in all_sdk_tools if self._policy.is_tool_allowed(self._SDK_TO_POLICY.get(t, t))
+        ]
+        if len(allowed_tools) < len(all_sdk_tools):
+            blocked = set(all_sdk_tools) - set(allowed_tools)
+            logger.info("Tool policy blocked SDK tools: %s", blocked)
+
+        # Build hooks for security
+        hooks = {
+            "PreToolUse": [
+                self._HookMatcher(
+                    matcher="Bash",  # Only hook Bash commands
+                    hooks=[self._block_dangerous_hook],
+                )
+            ]
+        }
 
-        Args:
-            message: User message to process.
-            system_prompt: Dynamic system prompt from AgentContextBuilder.
-                Falls back to _DEFAULT_IDENTITY if not provided.
-            history: Recent session history as {"role", "content"} dicts.
-                Injected into the system prompt (SDK query() takes a single prompt string).
+        options_kwargs = {
+            "allowed_tools": allowed_tools,
+            "hooks": hooks,
+            "cwd": str(self._cwd),
+            "max_turns": 25,  # Safety net against runaway tool loops
+        }
 
-        Yields:
-            AgentEvent objects as the agent responds
-        """
-        if not self._sdk_available:
-            yield AgentEvent(
-                type="error",
-                content=(
-                    "❌ Claude Agent SDK Python package not found.\n\n"
-                    "Install with: pip install claude-agent-sdk\n\n"
-                    "Or switch to **PocketPaw Native** backend in **Settings → General**."
-                ),
-            )
-            return
+        # Pass API key to the Claude CLI subprocess via env.
+        # The SDK spawns a subprocess that needs ANTHROPIC_API_KEY in its
+        # environment — settings.anthropic_api_key alone is not enough.
+        api_key = os.environ.get("ANTHROPIC_API_KEY") or self.settings.anthropic_api_key
+        if api_key:
+            options_kwargs["env"] = {"ANTHROPIC_API_KEY": api_key}
+
+        # Wire in MCP servers (policy-filtered)
+        mcp_servers = self._get_mcp_servers()
+        if mcp_servers:
+            options_kwargs["mcp_servers"] = mcp_servers
+            logger.info("MCP: passing %d servers to Claude SDK", len(mcp_servers))
+
+        # Enable token-by-token streaming if StreamEvent is available
+        if self._StreamEvent is not None:
+            options_kwargs["include_partial_messages"] = True
+
+        # Permission handling — PocketPaw runs headless (web/chat), so
+        # there is no terminal to show interactive permission prompts.
+        # bypassPermissions auto-approves ALL tool calls (including MCP).
+        # Dangerous Bash commands are still caught by the PreToolUse hook.
+        if self.settings.bypass_permissions:
+            options_kwargs["permission_mode"] = "bypassPermissions"
+
+        return options_kwargs
+
+    def _select_model(self, message: str) -> str | None:
+        """Pick a model via smart routing (opt-in), or None for the CLI default."""
+        if not self.settings.smart_routing_enabled:
+            return None
+
+        from pocketclaw.agents.model_router import ModelRouter
+
+        model_router = ModelRouter(self.settings)
+        selection = model_router.select(message)
+        logger.info(
+            "Smart routing: %s -> %s (%s)",
+            selection.complexity.value,
+            selection.model,
+            selection.reason,
+        )
+        return selection.model
 
-        if not self._cli_available:
-            yield AgentEvent(
-                type="error",
-                content=(
-                    "❌ Claude Code CLI not found on this machine.\n\n"
-                    "Install with: `npm install -g @anthropic-ai/claude-code`\n\n"
-                    "Or switch to **PocketPaw Native** backend in "
-                    "**Settings → General** — it uses the Anthropic API directly "
-                    "and doesn't need the CLI."
-                ),
-            )
-            return
+    def _use_client_pool(self) -> bool:
+        """Whether turns with a session_key should run on a pooled client."""
+        return self._ClaudeSDKClient is not None and bool(
+            getattr(self.settings, "claude_sdk_pool_enabled", False)
+        )
 
-        import os
+    @staticmethod
+    def _context_delta(previous: str, current: str) -> str:
+        """Blocks of the new system prompt that weren't in the previous one."""
+        seen = set(previous.split("\n\n"))
+        return "\n\n".join(b for b in current.split("\n\n") if b.strip() and b not in seen)
 
-        self._stop_flag = False
+    @staticmethod
+    def _options_signature(options_kwargs: dict) -> str:
+        """Hash the options a pooled client must be rebuilt for when they change."""
+        import hashlib
+        import json
 
-        try:
-            # Compose final system prompt: identity/memory + tool docs
-            identity = system_prompt or _DEFAULT_IDENTITY
-            final_prompt = identity + "\n" + _TOOL_INSTRUCTIONS
-
-            # Inject session history into system prompt (SDK query() takes a single string)
-            if history:
-                lines = ["# Recent Conversation"]
-                for msg in history:
-                    role = msg.get("role", "user").capitalize()
-                    content = msg.get("content", "")
-                    # Truncate very long messages to keep prompt manageable
-                    if len(content) > 500:
-                        content = content[:500] + "..."
-                    lines.append(f"**{role}**: {content}")
-                final_prompt += "\n\n" + "\n".join(lines)
-
-            # Build allowed tools list, filtered by tool policy
-            all_sdk_tools = [
-                "Bash",
-                "Read",
-                "Write",
-                "Edit",
-                "Glob",
-                "Grep",
-                "WebSearch",
-                "WebFetch",
-            ]
-            allowed_tools = [
-                t
-                for t in all_sdk_tools
-                if self._policy.is_tool_allowed(self._SDK_TO_POLICY.get(t, t))
-            ]
-            if len(allowed_tools) < len(all_sdk_tools):
-                blocked = set(all_sdk_tools) - set(allowed_tools)
-                logger.info("Tool policy blocked SDK tools: %s", blocked)
-
-            # Build hooks for security
-            hooks = {
-                "PreToolUse": [
-                    self._HookMatcher(
-                        matcher="Bash",  # Only hook Bash commands
-                        hooks=[self._block_dangerous_hook],
-                    )
-                ]
-            }
+        stable = {k: v for k, v in options_kwargs.items() if k != "hooks"}
+        raw = json.dumps(stable, sort_keys=True, default=str)
+        return hashlib.sha256(raw.encode()).hexdigest()[:16]
 
-            # Build options
-            options_kwargs = {
-                "system_prompt": final_prompt,
-                "allowed_tools": allowed_tools,
-                "hooks": hooks,
-                "cwd": str(self._cwd),
-                "max_turns": 25,  # Safety net against runaway tool loops
-            }
+    async def _pooled_stream(
+        self,
+        session_key: str,
+        message: str,
+        identity: str,
+        history: list[dict] | None,
+        options_kwargs: dict,
+        model: str | None,
+    ) -> AsyncIterator[Any]:
+        """Run one turn on the session's long-lived SDK client.
+
+        The first turn connects a client with the full system prompt (plus any
+        existing history, e.g. after a restart or eviction). Follow-up turns
+        reuse the live process: only the new message is sent, the model is
+        switched in place, and only the identity/memory blocks that changed are
+        sent as a ``<context-update>``. Once those updates pass
+        ``_CONTEXT_UPDATE_LIMIT`` characters the client is reconnected with the
+        current prompt so the native conversation doesn't grow unbounded. A turn
+        that doesn't run to its ResultMessage (stop, timeout, error) discards
+        the client so the next turn starts clean.
+        """
+        from pocketclaw.agents.sdk_pool import get_sdk_client_pool
 
-            # Pass API key to the Claude CLI subprocess via env.
-            # The SDK spawns a subprocess that needs ANTHROPIC_API_KEY in its
-            # environment — settings.anthropic_api_key alone is not enough.
-            api_key = os.environ.get("ANTHROPIC_API_KEY") or self.settings.anthropic_api_key
-            if api_key:
-                options_kwargs["env"] = {"ANTHROPIC_API_KEY": api_key}
-
-            # Wire in MCP servers (policy-filtered)
-            mcp_servers = self._get_mcp_servers()
-            if mcp_servers:
-                options_kwargs["mcp_servers"] = mcp_servers
-                logger.info("MCP: passing %d servers to Claude SDK", len(mcp_servers))
-
-            # Enable token-by-token streaming if StreamEvent is available
-            if self._StreamEvent is not None:
-                options_kwargs["include_partial_messages"] = True
-
-            # Permission handling — PocketPaw runs headless (web/chat), so
-            # there is no terminal to show interactive permission prompts.
-            # bypassPermissions auto-approves ALL tool calls (including MCP).
-            # Dangerous Bash commands are still caught by the PreToolUse hook.
-            if self.settings.bypass_permissions:
-                options_kwargs["permission_mode"] = "bypassPermissions"
-
-            # Smart model routing (opt-in)
-            if self.settings.smart_routing_enabled:
-                from pocketclaw.agents.model_router import ModelRouter
-
-                model_router = ModelRouter(self.settings)
-                selection = model_router.classify(message)
-                options_kwargs["model"] = selection.model
-                logger.info(
-                    "Smart routing: %s -> %s (%s)",
-                    selection.complexity.value,
-                    selection.model,
-                    selection.reason,
-                )
+        pool = get_sdk_client_pool()
 
-            # Create options (after all kwargs are set, including model)
-            options = self._ClaudeAgentOptions(**options_kwargs)
+        async def connect():
+            kwargs = dict(options_kwargs)
+            kwargs["system_prompt"] = (
+                identity + "\n" + _TOOL_INSTRUCTIONS + self._format_history(history)
+            )
+            if model:
+                kwargs["model"] = model
+            client = self._ClaudeSDKClient(options=self._ClaudeAgentOptions(**kwargs))
+            await client.connect()
+            logger.info("🔌 Connected pooled Claude SDK client for %s", session_key)
+            return client
+
+        entry, reused = await pool.acquire(
+            session_key, self._options_signature(options_kwargs), connect
+        )
+        async with entry.lock:
+            prompt = message
+            if not reused:
+                entry.system_prompt = identity
+                entry.model = model
+            else:
+                if model and model != entry.model:
+                    await entry.client.set_model(model)
+                    entry.model = model
+                delta = self._context_delta(entry.system_prompt, identity)
+                if delta and entry.context_chars + len(delta) > _CONTEXT_UPDATE_LIMIT:
+                    logger.info("Context updates outgrew the limit, reconnecting %s", session_key)
+                    await pool.reconnect(entry, connect)
+                elif delta:
+                    prompt = f"<context-update>\n{delta}\n</context-update>\n\n{message}"
+                    entry.context_chars += len(delta)
+                entry.system_prompt = identity
+                logger.debug("♻️ Reusing Claude SDK client for %s", session_key)
+
+            completed = False
+            try:
+                await entry.client.query(prompt)
+                async for event in entry.client.receive_response():
+                    yield event
+                completed = True
+            finally:
+                entry.turns += 1
+                entry.touch()
+                if not completed:
+                    await pool.release(session_key)
+
+    def _record_telemetry(
+        self,
+        model: str | None,
+        started: float,
+        first_output_at: float | None,
+        result: Any = None,
+        error: bool = False,
+    ) -> None:
+        """Feed one turn's latency, tokens and cost into the model telemetry."""
+        from pocketclaw.agents.model_router import ModelRouter
+        from pocketclaw.agents.model_telemetry import get_model_telemetry
+
+        model = model or self.settings.anthropic_model
+        latency_ms = (time.monotonic() - started) * 1000
+        ttft_ms = (first_output_at - started) * 1000 if first_output_at else latency_ms
+        usage = getattr(result, "usage", None) or {}
+        output_tokens = usage.get("output_tokens", 0) if isinstance(usage, dict) else 0
+        cost = getattr(result, "total_cost_usd", None)
+        get_model_telemetry().record(
+            ModelRouter(self.settings).tier_for_model(model),
+            model,
+            ttft_ms=ttft_ms,
+            latency_ms=latency_ms,
+            output_tokens=output_tokens if isinstance(output_tokens, int) else 0,
+            cost_usd=cost if isinstance(cost, int | float) else 0.0,
+            error=error,
+        )
 
-            logger.debug(f"🚀 Starting Claude Agent SDK query: {message[:100]}...")
+    async def _translate_stream(
+        self, source: AsyncIterator[Any], model: str | None = None
+    ) -> AsyncIterator[AgentEvent]:
+        """Translate SDK messages into AgentEvents, honouring the stop flag.
 
-            # State tracking for StreamEvent deduplication
-            _streamed_via_events = False
-            _announced_tools: set[str] = set()
+        ``model`` is the routed model (None = CLI default) used to attribute
+        telemetry for the turn.
+        """
+        # State tracking for StreamEvent deduplication
+        _streamed_via_events = False
+        _announced_tools: set[str] = set()
+        started = time.monotonic()
+        first_output_at: float | None = None
+        recorded = False
 
-            # Stream responses from the SDK
-            async for event in self._query(prompt=message, options=options):
+        try:
+            async for event in source:
                 if self._stop_flag:
                     logger.info("🛑 Stop flag set, breaking stream")
                     break
 
+                if first_output_at is None and not (
+                    self._SystemMessage and isinstance(event, self._SystemMessage)
+                ):
+                    first_output_at = time.monotonic()
+
                 # Handle different message types using isinstance checks
 
                 # ========== StreamEvent - token-by-token streaming ==========
@@ -691,6 +797,10 @@ class ClaudeAgentSDK:
                 if self._ResultMessage and isinstance(event, self._ResultMessage):
                     is_error = getattr(event, "is_error", False)
                     result = getattr(event, "result", "")
+                    self._record_telemetry(
+                        model, started, first_output_at, event, error=bool(is_error)
+                    )
+                    recorded = True
 
                     if is_error:
                         logger.error(f"ResultMessage error: {result}")
@@ -703,6 +813,93 @@ class ClaudeAgentSDK:
                 # ========== Unknown event type - log it ==========
                 event_class = event.__class__.__name__
                 logger.debug(f"Unknown event type: {event_class}")
+        except Exception:
+            if not recorded:
+                self._record_telemetry(model, started, first_output_at, error=True)
+            raise
+        finally:
+            # Close the source promptly so a one-shot CLI subprocess is killed
+            # (or a pooled client discarded) when the stream is cut short
+            aclose = getattr(source, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+    async def chat(
+        self,
+        message: str,
+        *,
+        system_prompt: str | None = None,
+        history: list[dict] | None = None,
+        session_key: str | None = None,
+    ) -> AsyncIterator[AgentEvent]:
+        """Process a message through Claude Agent SDK with streaming.
+
+        Uses the SDK's built-in tools and streaming capabilities.
+
+        Args:
+            message: User message to process.
+            system_prompt: Dynamic system prompt from AgentContextBuilder.
+                Falls back to _DEFAULT_IDENTITY if not provided.
+            history: Recent session history as {"role", "content"} dicts.
+                Injected into the system prompt (SDK query() takes a single prompt string).
+                Ignored on follow-up turns of a pooled session client, which
+                keeps its own conversation state.
+            session_key: When set (and the client pool is enabled), the turn runs
+                on a long-lived per-session SDK client instead of a fresh query().
+
+        Yields:
+            AgentEvent objects as the agent responds
+        """
+        if not self._sdk_available:
+            yield AgentEvent(
+                type="error",
+                content=(
+                    "❌ Claude Agent SDK Python package not found.\n\n"
+                    "Install with: pip install claude-agent-sdk\n\n"
+                    "Or switch to **PocketPaw Native** backend in **Settings → General**."
+                ),
+            )
+            return
+
+        if not self._cli_available:
+            yield AgentEvent(
+                type="error",
+                content=(
+                    "❌ Claude Code CLI not found on this machine.\n\n"
+                    "Install with: `npm install -g @anthropic-ai/claude-code`\n\n"
+                    "Or switch to **PocketPaw Native** backend in "
+                    "**Settings → General** — it uses the Anthropic API directly "
+                    "and doesn't need the CLI."
+                ),
+            )
+            return
+
+        self._stop_flag = False
+
+        try:
+            # Compose final system prompt: identity/memory + tool docs
+            identity = system_prompt or _DEFAULT_IDENTITY
+            base_prompt = identity + "\n" + _TOOL_INSTRUCTIONS
+            options_kwargs = self._build_options_kwargs()
+            model = self._select_model(message)
+
+            if session_key and self._use_client_pool():
+                source = self._pooled_stream(
+                    session_key, message, identity, history, options_kwargs, model
+                )
+            else:
+                # One-shot query: inject history into the system prompt
+                # (SDK query() takes a single prompt string)
+                options_kwargs["system_prompt"] = base_prompt + self._format_history(history)
+                if model:
+                    options_kwargs["model"] = model
+                options = self._ClaudeAgentOptions(**options_kwargs)
+                logger.debug(f"🚀 Starting Claude Agent SDK query: {message[:100]}...")
+                source = self._query(prompt=message, options=options)
+
+            async with aclosing(self._translate_stream(source, model)) as stream:
+                async for agent_event in stream:
+                    yield agent_event
 
             yield AgentEvent(type="done", content="")
 
@@ -767,9 +964,12 @@ class ClaudeAgentSDKWrapper(ClaudeAgentSDK):
         *,
         system_prompt: str | None = None,
         history: list[dict] | None = None,
+        session_key: str | None = None,
     ) -> AsyncIterator[dict]:
         """Run the agent, yielding dict chunks for compatibility."""
-        async for event in self.chat(message, system_prompt=system_prompt, history=history):
+        async for event in self.chat(
+            message, system_prompt=system_prompt, history=history, session_key=session_key
+        ):
             yield {
                 "type": event.type,
                 "content": event.content,
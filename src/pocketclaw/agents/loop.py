@@ -4,6 +4,19 @@ Changes:
   - Added BrowserTool registration
   - 2026-02-05: Refactored to use AgentRouter for all backends.
                 Now properly emits system_event for tool_use/tool_result.
+  - 2026-10-19: Context assembly runs its independent stages concurrently
+                (system prompt ‖ history → store) with per-stage timing.
+  - 2026-10-19: Opt-in coalescing of rapid-fire messages in a session into
+                one agent turn (message_coalesce_enabled).
+  - 2026-10-19: Opt-in interrupt policy — a newer message cancels the session's
+                in-flight run, keeps the partial reply and starts the new turn.
+  - 2026-10-19: FairScheduler replaces the global FIFO semaphore — owner priority
+                lane, weighted fair queuing across channels, per-channel caps.
+  - 2026-10-19: Report turn durations to the bus for its admission control.
+  - 2026-10-19: Ack processed messages to the bus journal; replay on start.
+  - 2026-10-19: All system events carry session_key for per-session routing,
+                plus source_key (the channel's key before /new or /resume aliasing).
+  - 2026-10-19: ``started`` is set once the loop consumes the bus (startup readiness).
 
 This is the core "brain" of PocketPaw. It integrates:
 1. MessageBus (Input/Output)
@@ -16,8 +29,12 @@ It replaces the old highly-coupled bot loops.
 
 import asyncio
 import logging
+import time
+from collections.abc import Awaitable
+from typing import TypeVar
 
 from pocketclaw.agents.router import AgentRouter
+from pocketclaw.agents.scheduler import FairScheduler
 from pocketclaw.bootstrap import AgentContextBuilder
 from pocketclaw.bus import InboundMessage, OutboundMessage, SystemEvent, get_message_bus
 from pocketclaw.bus.commands import get_command_handler
@@ -28,6 +45,31 @@ from pocketclaw.security.injection_scanner import ThreatLevel, get_injection_sca
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+
+async def _timed(timings: dict[str, float], stage: str, awaitable: Awaitable[T]) -> T:
+    """Await a pipeline stage and record its wall time in ms under ``stage``."""
+    start = time.perf_counter()
+    try:
+        return await awaitable
+    finally:
+        timings[stage] = round((time.perf_counter() - start) * 1000, 1)
+
+
+def _merge_messages(batch: list[InboundMessage]) -> InboundMessage:
+    """Merge a burst of messages from one session into a single turn."""
+    last = batch[-1]
+    return InboundMessage(
+        channel=last.channel,
+        sender_id=last.sender_id,
+        chat_id=last.chat_id,
+        content="\n\n".join(m.content for m in batch),
+        timestamp=batch[0].timestamp,
+        media=[path for m in batch for path in m.media],
+        metadata={**last.metadata, "coalesced": len(batch)},
+    )
+
 
 async def _iter_with_timeout(aiter, first_timeout=30, timeout=120):
     """Yield items from an async iterator with per-item timeouts.
@@ -67,10 +109,27 @@ class AgentLoop:
 
         # Concurrency controls
         self._session_locks: dict[str, asyncio.Lock] = {}
-        self._global_semaphore = asyncio.Semaphore(self.settings.max_concurrent_conversations)
+        self.scheduler = FairScheduler(
+            self.settings.max_concurrent_conversations,
+            weights=dict(self.settings.scheduler_channel_weights),
+            caps=dict(self.settings.scheduler_channel_caps),
+            owner_id=self.settings.owner_id,
+        )
         self._background_tasks: set[asyncio.Task] = set()
 
+        # Message coalescing: per-session burst waiting for its turn, and the
+        # arrival time of its newest message (for the quiet window)
+        self._coalesce_buffers: dict[str, list[InboundMessage]] = {}
+        self._coalesce_last_arrival: dict[str, float] = {}
+
+        # Interrupt policy: task streaming each session's current run, and
+        # sessions whose run was cancelled because a newer message arrived
+        self._streaming_turns: dict[str, asyncio.Task] = {}
+        self._interrupted: set[str] = set()
+
         self._running = False
+        # Set once start() has replayed the journal and is consuming the bus
+        self.started = asyncio.Event()
 
     def _get_router(self) -> AgentRouter:
         """Get or create the agent router (lazy initialization)."""
@@ -85,11 +144,20 @@ class AgentLoop:
         self._running = True
         settings = Settings.load()
         logger.info(f"🤖 Agent Loop started (Backend: {settings.agent_backend})")
+        # Turns wait in the scheduler, not the bus queue: admission control reads it
+        self.bus.track_backlog(self.scheduler.stats)
+        replayed = await self.bus.replay_inbound()
+        if replayed:
+            logger.info("Replaying %d message(s) left unprocessed by the last run", replayed)
+        self.started.set()
         await self._loop()
 
     async def stop(self) -> None:
         """Stop the agent loop."""
         self._running = False
+        self.started.clear()
+        self.bus.track_backlog(None)
+        await self.bus.flush_journal()
         logger.info("🛑 Agent Loop stopped")
 
     async def _loop(self) -> None:
@@ -113,23 +181,106 @@ class AgentLoop:
         # Resolve alias so two chats aliased to the same session serialize correctly
         resolved_key = await self.memory.resolve_session_key(session_key)
 
-        # Global concurrency limit — blocks until a slot is available
-        async with self._global_semaphore:
-            # Per-session lock — serializes messages within the same session
-            if resolved_key not in self._session_locks:
-                self._session_locks[resolved_key] = asyncio.Lock()
-            lock = self._session_locks[resolved_key]
-            async with lock:
-                await self._process_message_inner(message, resolved_key)
-
-            # Clean up lock if no one else is waiting on it
-            if not lock.locked():
-                self._session_locks.pop(resolved_key, None)
+        # Interrupt — a newer message cancels the session's in-flight run
+        if self._should_interrupt(message):
+            turn = self._streaming_turns.get(resolved_key)
+            if turn is not None and not turn.done():
+                logger.info("⏹️ Interrupting in-flight run for %s", resolved_key)
+                self._interrupted.add(resolved_key)
+                turn.cancel()
+
+        # Coalescing — a message that arrives while an earlier one from the same
+        # session is still waiting for its turn joins that turn instead
+        coalesce = self._should_coalesce(message)
+        if coalesce:
+            self._coalesce_last_arrival[resolved_key] = time.monotonic()
+            buffer = self._coalesce_buffers.get(resolved_key)
+            if buffer is not None:
+                buffer.append(message)
+                logger.info("Coalesced message into pending turn for %s", resolved_key)
+                return
+            self._coalesce_buffers[resolved_key] = [message]
+            await self._wait_for_quiet(resolved_key)
+
+        # Per-session lock — serializes messages within the same session, so a
+        # session has at most one turn waiting in the scheduler at a time
+        if resolved_key not in self._session_locks:
+            self._session_locks[resolved_key] = asyncio.Lock()
+        lock = self._session_locks[resolved_key]
+        async with lock:
+            # Global concurrency limit — fair across lanes, owner first
+            async with self.scheduler.slot(message, resolved_key):
+                originals = None
+                if coalesce:
+                    # Everything that piled up while this turn was queued
+                    batch = self._coalesce_buffers.pop(resolved_key, [message])
+                    self._coalesce_last_arrival.pop(resolved_key, None)
+                    if len(batch) > 1:
+                        originals = batch
+                        message = _merge_messages(batch)
+                started = time.monotonic()
+                try:
+                    await self._process_message_inner(message, resolved_key, originals=originals)
+                except Exception:
+                    # Replaying a turn that failed would only fail again
+                    self.bus.ack_inbound(*(originals or [message]))
+                    raise
+                self.bus.record_turn_latency(time.monotonic() - started)
+                self.bus.ack_inbound(*(originals or [message]))
+
+        # Clean up lock if no one else is waiting on it
+        if not lock.locked():
+            self._session_locks.pop(resolved_key, None)
+
+    def _should_coalesce(self, message: InboundMessage) -> bool:
+        """Whether a message may be merged with others from its session."""
+        if not self.settings.message_coalesce_enabled:
+            return False
+        # Commands always run on their own
+        return not get_command_handler().is_command(message.content)
+
+    def _should_interrupt(self, message: InboundMessage) -> bool:
+        """Whether a message should cancel its session's in-flight run."""
+        if not self.settings.session_interrupt_enabled:
+            return False
+        channels = self.settings.session_interrupt_channels
+        if channels and message.channel.value not in channels:
+            return False
+        return not get_command_handler().is_command(message.content)
+
+    async def _wait_for_quiet(self, session_key: str) -> None:
+        """Wait until no new message arrived for the coalescing window.
+
+        The wait is capped at five windows so a steady stream of messages
+        can't postpone the turn forever.
+        """
+        window = self.settings.message_coalesce_window_ms / 1000
+        if window <= 0:
+            return
+        deadline = time.monotonic() + 5 * window
+        while True:
+            quiet_at = self._coalesce_last_arrival.get(session_key, 0.0) + window
+            remaining = min(quiet_at, deadline) - time.monotonic()
+            if remaining <= 0:
+                return
+            await asyncio.sleep(remaining)
 
     _WELCOME_EXCLUDED = frozenset({Channel.WEBSOCKET, Channel.CLI, Channel.SYSTEM})
 
-    async def _process_message_inner(self, message: InboundMessage, session_key: str) -> None:
-        """Inner message processing (called under concurrency guards)."""
+    async def _process_message_inner(
+        self,
+        message: InboundMessage,
+        session_key: str,
+        originals: list[InboundMessage] | None = None,
+    ) -> None:
+        """Inner message processing (called under concurrency guards).
+
+        Args:
+            message: The message to run (a merged message when coalesced).
+            session_key: Resolved session key.
+            originals: The individual messages a coalesced ``message`` was built
+                from; each is scanned and stored in session memory separately.
+        """
         # Keep context_builder in sync if memory manager was hot-reloaded
         if self.context_builder.memory is not self.memory:
             self.context_builder.memory = self.memory
@@ -166,83 +317,128 @@ class AgentLoop:
                 )
 
         try:
-            # 0. Injection scan for non-owner sources
-            content = message.content
+            timings: dict[str, float] = {}
+            assembly_start = time.perf_counter()
+
+            # 0. Injection scan for non-owner sources (each original of a burst)
+            parts = [m.content for m in originals] if originals else [message.content]
             if self.settings.injection_scan_enabled:
                 scanner = get_injection_scanner()
                 source = message.metadata.get("source", message.channel.value)
-                scan_result = scanner.scan(content, source=source)
-
-                if scan_result.threat_level == ThreatLevel.HIGH:
-                    if self.settings.injection_scan_llm:
-                        scan_result = await scanner.deep_scan(content, source=source)
+                scan_start = time.perf_counter()
+                for i, content in enumerate(parts):
+                    scan_result = scanner.scan(content, source=source)
 
                     if scan_result.threat_level == ThreatLevel.HIGH:
-                        logger.warning(
-                            "Blocked HIGH threat injection from %s: %s",
-                            source,
-                            scan_result.matched_patterns,
-                        )
-                        await self.bus.publish_system(
-                            SystemEvent(
-                                event_type="error",
-                                data={
-                                    "message": "Message blocked by injection scanner",
-                                    "patterns": scan_result.matched_patterns,
-                                },
+                        if self.settings.injection_scan_llm:
+                            scan_result = await scanner.deep_scan(content, source=source)
+
+                        if scan_result.threat_level == ThreatLevel.HIGH:
+                            logger.warning(
+                                "Blocked HIGH threat injection from %s: %s",
+                                source,
+                                scan_result.matched_patterns,
                             )
-                        )
-                        await self.bus.publish_outbound(
-                            OutboundMessage(
-                                channel=message.channel,
-                                chat_id=message.chat_id,
-                                content=(
-                                    "Your message was flagged by the security scanner and blocked."
-                                ),
+                            await self.bus.publish_system(
+                                SystemEvent(
+                                    event_type="error",
+                                    data={
+                                        "message": "Message blocked by injection scanner",
+                                        "patterns": scan_result.matched_patterns,
+                                        "session_key": session_key,
+                                        "source_key": message.session_key,
+                                    },
+                                )
                             )
-                        )
-                        return
-
-                # Wrap suspicious (non-blocked) content with sanitization markers
-                if scan_result.threat_level != ThreatLevel.NONE:
-                    content = scan_result.sanitized_content
-
-            # 1. Store User Message
-            await self.memory.add_to_session(
-                session_key=session_key,
-                role="user",
-                content=content,
-                metadata=message.metadata,
-            )
-
-            # 2. Build dynamic system prompt (identity + memory context + channel hint)
+                            await self.bus.publish_outbound(
+                                OutboundMessage(
+                                    channel=message.channel,
+                                    chat_id=message.chat_id,
+                                    content=(
+                                        "Your message was flagged by the security scanner "
+                                        "and blocked."
+                                    ),
+                                )
+                            )
+                            return
+
+                    # Wrap suspicious (non-blocked) content with sanitization markers
+                    if scan_result.threat_level != ThreatLevel.NONE:
+                        parts[i] = scan_result.sanitized_content
+                timings["scan"] = round((time.perf_counter() - scan_start) * 1000, 1)
+            content = "\n\n".join(parts)
+
+            # 1-2. Assemble context. Everything below depends only on the scanned
+            # content, so the slow stages run concurrently:
+            #   system prompt (bootstrap files + memory retrieval)
+            #   ‖ compacted history → store user message
+            # History is read before the store (with the new message passed as
+            # pending), which keeps it identical to store-then-read ordering.
             sender_id = message.sender_id
-            system_prompt = await self.context_builder.build_system_prompt(
-                user_query=content,
-                channel=message.channel,
-                sender_id=sender_id,
-                session_key=message.session_key,
-            )
 
-            # 2a. Retrieve session history with compaction
-            history = await self.memory.get_compacted_history(
+            async def _history_then_store() -> list[dict]:
+                history = await _timed(
+                    timings,
+                    "history",
+                    self.memory.get_compacted_history(
+                        session_key,
+                        recent_window=self.settings.compaction_recent_window,
+                        char_budget=self.settings.compaction_char_budget,
+                        summary_chars=self.settings.compaction_summary_chars,
+                        llm_summarize=self.settings.compaction_llm_summarize,
+                        pending=[{"role": "user", "content": part} for part in parts],
+                    ),
+                )
+                store_start = time.perf_counter()
+                for part, original in zip(parts, originals or [message], strict=True):
+                    await self.memory.add_to_session(
+                        session_key=session_key,
+                        role="user",
+                        content=part,
+                        metadata=original.metadata,
+                    )
+                timings["store"] = round((time.perf_counter() - store_start) * 1000, 1)
+                return history
+
+            system_prompt, history = await asyncio.gather(
+                _timed(
+                    timings,
+                    "system_prompt",
+                    self.context_builder.build_system_prompt(
+                        user_query=content,
+                        channel=message.channel,
+                        sender_id=sender_id,
+                        session_key=message.session_key,
+                    ),
+                ),
+                _history_then_store(),
+            )
+            timings["total"] = round((time.perf_counter() - assembly_start) * 1000, 1)
+            logger.debug(
+                "Context assembly for %s: %s",
                 session_key,
-                recent_window=self.settings.compaction_recent_window,
-                char_budget=self.settings.compaction_char_budget,
-                summary_chars=self.settings.compaction_summary_chars,
-                llm_summarize=self.settings.compaction_llm_summarize,
+                ", ".join(f"{stage}={ms}ms" for stage, ms in timings.items()),
             )
 
             # 2b. Emit thinking event
             await self.bus.publish_system(
-                SystemEvent(event_type="thinking", data={"session_key": session_key})
+                SystemEvent(
+                    event_type="thinking",
+                    data={"session_key": session_key, "source_key": message.session_key},
+                )
             )
 
             # 3. Run through AgentRouter (handles all backends)
             router = self._get_router()
             full_response = ""
 
-            run_iter = router.run(content, system_prompt=system_prompt, history=history)
+            run_iter = router.run(
+                content, system_prompt=system_prompt, history=history, session_key=session_key
+            )
+            # While streaming, a newer message may cancel this task (interrupt policy).
+            # Closing the run iterator stops only this run — router.stop() would
+            # stop every session sharing the backend.
+            self._streaming_turns[session_key] = asyncio.current_task()
             try:
                 async for chunk in _iter_with_timeout(run_iter):
                     chunk_type = chunk.get("type", "")
@@ -270,6 +466,8 @@ class AgentLoop:
                                 data={
                                     "name": f"run_{language}",
                                     "params": {"code": content[:100]},
+                                    "session_key": session_key,
+                                    "source_key": message.session_key,
                                 },
                             )
                         )
@@ -294,6 +492,8 @@ class AgentLoop:
                                     "name": "code_execution",
                                     "result": content[:200],
                                     "status": "success",
+                                    "session_key": session_key,
+                                    "source_key": message.session_key,
                                 },
                             )
                         )
@@ -314,7 +514,11 @@ class AgentLoop:
                         await self.bus.publish_system(
                             SystemEvent(
                                 event_type="thinking",
-                                data={"content": content, "session_key": session_key},
+                                data={
+                                    "content": content,
+                                    "session_key": session_key,
+                                    "source_key": message.session_key,
+                                },
                             )
                         )
 
@@ -322,7 +526,10 @@ class AgentLoop:
                         await self.bus.publish_system(
                             SystemEvent(
                                 event_type="thinking_done",
-                                data={"session_key": session_key},
+                                data={
+                                    "session_key": session_key,
+                                    "source_key": message.session_key,
+                                },
                             )
                         )
 
@@ -333,7 +540,12 @@ class AgentLoop:
                         await self.bus.publish_system(
                             SystemEvent(
                                 event_type="tool_start",
-                                data={"name": tool_name, "params": tool_input},
+                                data={
+                                    "name": tool_name,
+                                    "params": tool_input,
+                                    "session_key": session_key,
+                                    "source_key": message.session_key,
+                                },
                             )
                         )
 
@@ -347,6 +559,8 @@ class AgentLoop:
                                     "name": tool_name,
                                     "result": content[:200],
                                     "status": "success",
+                                    "session_key": session_key,
+                                    "source_key": message.session_key,
                                 },
                             )
                         )
@@ -360,6 +574,8 @@ class AgentLoop:
                                     "name": "agent",
                                     "result": content,
                                     "status": "error",
+                                    "session_key": session_key,
+                                    "source_key": message.session_key,
                                 },
                             )
                         )
@@ -377,7 +593,10 @@ class AgentLoop:
                         pass
             finally:
                 # Always close the async generator to kill any subprocess
-                await run_iter.aclose()
+                try:
+                    await run_iter.aclose()
+                finally:
+                    self._streaming_turns.pop(session_key, None)
 
             # 4. Send stream end marker
             await self.bus.publish_outbound(
@@ -400,7 +619,7 @@ class AgentLoop:
                     self.settings.memory_backend == "mem0" and self.settings.mem0_auto_learn
                 ) or (self.settings.memory_backend == "file" and self.settings.file_auto_learn)
                 if should_auto_learn:
-                    asyncio.create_task(
+                    t = asyncio.create_task(
                         self._auto_learn(
                             message.content,
                             full_response,
@@ -411,6 +630,15 @@ class AgentLoop:
                     self._background_tasks.add(t)
                     t.add_done_callback(self._background_tasks.discard)
 
+        except asyncio.CancelledError:
+            if session_key not in self._interrupted:
+                raise
+            # Interrupted by a newer message — swallow the cancellation so the
+            # lock is released normally and the new turn starts right away
+            self._interrupted.discard(session_key)
+            asyncio.current_task().uncancel()
+            await self._finish_interrupted(message, session_key, full_response)
+
         except TimeoutError:
             logger.error("Agent backend timed out")
             # Kill the hung backend so it releases resources
@@ -470,6 +698,27 @@ class AgentLoop:
                 )
             )
 
+    async def _finish_interrupted(
+        self, message: InboundMessage, session_key: str, partial: str
+    ) -> None:
+        """Close the stream of an interrupted turn and keep what was said so far."""
+        await self.bus.publish_outbound(
+            OutboundMessage(
+                channel=message.channel,
+                chat_id=message.chat_id,
+                content="",
+                is_stream_end=True,
+                metadata={"interrupted": True},
+            )
+        )
+        if partial:
+            await self.memory.add_to_session(
+                session_key=session_key,
+                role="assistant",
+                content=partial,
+                metadata={"interrupted": True},
+            )
+
     async def _send_response(self, original: InboundMessage, content: str) -> None:
         """Helper to send a simple text response."""
         await self.bus.publish_outbound(
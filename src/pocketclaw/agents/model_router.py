@@ -1,6 +1,8 @@
 # Smart Model Router — heuristic classifier for automatic model selection.
 # Created: 2026-02-07
 # Part of Phase 2 Integration Ecosystem
+# Updated: 2026-10-19 — select() adapts the heuristic choice with live per-tier
+#   telemetry (latency, error rate, cost) from model_telemetry.py.
 
 from __future__ import annotations
 
@@ -9,6 +11,7 @@ import re
 from dataclasses import dataclass
 from enum import Enum
 
+from pocketclaw.agents.model_telemetry import get_model_telemetry
 from pocketclaw.config import Settings
 
 logger = logging.getLogger(__name__)
@@ -71,6 +74,11 @@ class ModelRouter:
     - Short messages + simple patterns -> SIMPLE (Haiku)
     - Complex signals (plan, debug, architect) + long messages -> COMPLEX (Opus)
     - Default -> MODERATE (Sonnet)
+
+    With adaptive routing, select() degrades COMPLEX to MODERATE while the
+    complex tier is over its p95 time-to-first-token budget, error rate or
+    per-call cost budget (judged on recent telemetry only, so it recovers
+    once old samples age out).
     """
 
     def __init__(self, settings: Settings):
@@ -118,3 +126,59 @@ class ModelRouter:
             model=self.settings.model_tier_moderate,
             reason="Default moderate complexity",
         )
+
+    def tier_for_model(self, model: str) -> str:
+        """Map a model id back to its tier name ("other" if it isn't a tier model)."""
+        tiers = {
+            self.settings.model_tier_simple: TaskComplexity.SIMPLE.value,
+            self.settings.model_tier_moderate: TaskComplexity.MODERATE.value,
+            self.settings.model_tier_complex: TaskComplexity.COMPLEX.value,
+        }
+        return tiers.get(model, "other")
+
+    def select(self, message: str) -> ModelSelection:
+        """Classify a message, then adapt the choice using live telemetry.
+
+        The decision is recorded so the dashboard can show how often each
+        tier was chosen and degraded.
+        """
+        selection = self.classify(message)
+        classified = selection.complexity
+        if self.settings.smart_routing_adaptive:
+            selection = self._adapt(selection)
+        get_model_telemetry().record_decision(
+            classified.value, selection.complexity.value, selection.reason
+        )
+        return selection
+
+    def _adapt(self, selection: ModelSelection) -> ModelSelection:
+        """Degrade COMPLEX to MODERATE when the complex tier is unhealthy."""
+        if selection.complexity != TaskComplexity.COMPLEX:
+            return selection
+
+        stats = get_model_telemetry().tier_stats(
+            TaskComplexity.COMPLEX.value,
+            max_age=self.settings.smart_routing_window_seconds,
+        )
+        if stats is None or stats.samples < self.settings.smart_routing_min_samples:
+            return selection
+
+        reasons = []
+        budget_ms = self.settings.smart_routing_latency_budget_ms
+        if budget_ms and stats.ttft_p95_ms > budget_ms:
+            reasons.append(f"p95 TTFT {stats.ttft_p95_ms:.0f}ms > {budget_ms}ms")
+        if stats.error_rate > self.settings.smart_routing_max_error_rate:
+            reasons.append(f"error rate {stats.error_rate:.0%}")
+        cost_budget = self.settings.smart_routing_cost_budget_usd
+        if cost_budget and stats.avg_cost_usd > cost_budget:
+            reasons.append(f"avg cost ${stats.avg_cost_usd:.4f} > ${cost_budget:.4f}")
+
+        if not reasons:
+            return selection
+
+        logger.info("Adaptive routing: complex tier degraded (%s)", ", ".join(reasons))
+        return ModelSelection(
+            complexity=TaskComplexity.MODERATE,
+            model=self.settings.model_tier_moderate,
+            reason=f"{selection.reason}; degraded from complex: {', '.join(reasons)}",
+        )
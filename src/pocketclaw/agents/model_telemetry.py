@@ -0,0 +1,199 @@
+# Model Telemetry — rolling latency, throughput, error and cost stats per model tier.
+# Created: 2026-10-19
+#
+# Backends record one sample per LLM call (time-to-first-token, total latency,
+# output tokens, cost, error). ModelRouter.select() reads the per-tier
+# aggregates to adapt its complexity-based choice, and the dashboard exposes
+# them (plus routing decision counts) at /api/routing/stats.
+
+from __future__ import annotations
+
+import math
+import time
+from collections import Counter, deque
+from dataclasses import dataclass, field
+
+# Approximate list prices in USD per million tokens (input, output), matched by
+# substring of the model id. Used only when the backend doesn't report cost.
+_PRICING_PER_MTOK: list[tuple[str, tuple[float, float]]] = [
+    ("haiku", (1.0, 5.0)),
+    ("sonnet", (3.0, 15.0)),
+    ("opus", (5.0, 25.0)),
+]
+
+# Samples kept per tier
+_WINDOW = 200
+
+
+def estimate_cost(model: str, input_tokens: int, output_tokens: int) -> float:
+    """Estimate the USD cost of a call from token counts (0.0 for unknown models)."""
+    model_lower = model.lower()
+    for needle, (in_price, out_price) in _PRICING_PER_MTOK:
+        if needle in model_lower:
+            return (input_tokens * in_price + output_tokens * out_price) / 1_000_000
+    return 0.0
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile (0.0 for an empty list)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+@dataclass
+class CallSample:
+    """One LLM call as seen by a backend."""
+
+    model: str
+    ttft_ms: float
+    latency_ms: float
+    output_tokens: int = 0
+    cost_usd: float = 0.0
+    error: bool = False
+    at: float = field(default_factory=time.time)
+
+
+@dataclass
+class TierStats:
+    """Aggregates over a tier's rolling sample window."""
+
+    samples: int
+    errors: int
+    error_rate: float
+    ttft_p50_ms: float
+    ttft_p95_ms: float
+    latency_p95_ms: float
+    output_tokens_per_sec: float
+    avg_cost_usd: float
+    total_cost_usd: float
+
+    def to_dict(self) -> dict:
+        return {
+            "samples": self.samples,
+            "errors": self.errors,
+            "error_rate": round(self.error_rate, 3),
+            "ttft_p50_ms": round(self.ttft_p50_ms, 1),
+            "ttft_p95_ms": round(self.ttft_p95_ms, 1),
+            "latency_p95_ms": round(self.latency_p95_ms, 1),
+            "output_tokens_per_sec": round(self.output_tokens_per_sec, 1),
+            "avg_cost_usd": round(self.avg_cost_usd, 6),
+            "total_cost_usd": round(self.total_cost_usd, 6),
+        }
+
+
+class ModelTelemetry:
+    """Rolling per-tier call statistics plus routing decision counters."""
+
+    def __init__(self, window: int = _WINDOW):
+        self._window = window
+        self._samples: dict[str, deque[CallSample]] = {}
+        self._decisions: Counter[str] = Counter()
+        self._degraded: Counter[str] = Counter()
+        self._last_decisions: deque[dict] = deque(maxlen=20)
+
+    def record(
+        self,
+        tier: str,
+        model: str,
+        *,
+        ttft_ms: float,
+        latency_ms: float,
+        output_tokens: int = 0,
+        cost_usd: float = 0.0,
+        error: bool = False,
+    ) -> None:
+        """Record one call against a tier ("simple", "moderate", "complex" or "other")."""
+        samples = self._samples.setdefault(tier, deque(maxlen=self._window))
+        samples.append(
+            CallSample(
+                model=model,
+                ttft_ms=ttft_ms,
+                latency_ms=latency_ms,
+                output_tokens=output_tokens,
+                cost_usd=cost_usd,
+                error=error,
+            )
+        )
+
+    def record_decision(self, classified: str, chosen: str, reason: str) -> None:
+        """Count a routing decision (classified tier → tier actually used)."""
+        self._decisions[chosen] += 1
+        if classified != chosen:
+            self._degraded[f"{classified}->{chosen}"] += 1
+        self._last_decisions.append(
+            {"classified": classified, "chosen": chosen, "reason": reason, "at": time.time()}
+        )
+
+    def tier_stats(self, tier: str, max_age: float | None = None) -> TierStats | None:
+        """Aggregates for a tier, or None if nothing was recorded.
+
+        Args:
+            tier: Tier name.
+            max_age: Only consider samples recorded in the last ``max_age`` seconds.
+        """
+        samples = list(self._samples.get(tier, ()))
+        if max_age:
+            cutoff = time.time() - max_age
+            samples = [s for s in samples if s.at >= cutoff]
+        if not samples:
+            return None
+        ok = [s for s in samples if not s.error]
+        errors = len(samples) - len(ok)
+        gen_seconds = sum(max(s.latency_ms - s.ttft_ms, 0.0) for s in ok) / 1000
+        tokens = sum(s.output_tokens for s in ok)
+        total_cost = sum(s.cost_usd for s in samples)
+        return TierStats(
+            samples=len(samples),
+            errors=errors,
+            error_rate=errors / len(samples),
+            ttft_p50_ms=_percentile([s.ttft_ms for s in ok], 50),
+            ttft_p95_ms=_percentile([s.ttft_ms for s in ok], 95),
+            latency_p95_ms=_percentile([s.latency_ms for s in ok], 95),
+            output_tokens_per_sec=tokens / gen_seconds if gen_seconds > 0 else 0.0,
+            avg_cost_usd=total_cost / len(samples),
+            total_cost_usd=total_cost,
+        )
+
+    def snapshot(self) -> dict:
+        """All tier stats and decision counters, JSON-serializable."""
+        tiers = {}
+        for tier in self._samples:
+            stats = self.tier_stats(tier)
+            if stats is not None:
+                tiers[tier] = stats.to_dict()
+        return {
+            "tiers": tiers,
+            "decisions": dict(self._decisions),
+            "degraded": dict(self._degraded),
+            "recent_decisions": list(self._last_decisions),
+        }
+
+    def reset(self) -> None:
+        """Drop all samples and counters."""
+        self._samples.clear()
+        self._decisions.clear()
+        self._degraded.clear()
+        self._last_decisions.clear()
+
+
+# Singleton instance
+_telemetry: ModelTelemetry | None = None
+
+
+def get_model_telemetry() -> ModelTelemetry:
+    """Get the global model telemetry instance."""
+    global _telemetry
+    if _telemetry is None:
+        _telemetry = ModelTelemetry()
+
+        from pocketclaw.lifecycle import register
+
+        def _reset():
+            global _telemetry
+            _telemetry = None
+
+        register("model_telemetry", reset=_reset)
+    return _telemetry
@@ -94,6 +94,7 @@ class OpenInterpreterAgent:
         system_prompt: str | None = None,
         history: list[dict] | None = None,
         system_message: str | None = None,
+        session_key: str | None = None,
     ) -> AsyncIterator[dict]:
         """Run a message through Open Interpreter with real-time streaming.
 
@@ -102,6 +103,7 @@ class OpenInterpreterAgent:
             system_prompt: Dynamic system prompt from AgentContextBuilder.
             history: Recent session history (prepended as summary to prompt).
             system_message: Legacy kwarg, superseded by system_prompt.
+            session_key: Accepted for router compatibility; unused.
         """
         if not self._interpreter:
             yield {"type": "message", "content": "❌ Open Interpreter not available."}
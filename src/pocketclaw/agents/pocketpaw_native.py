@@ -16,17 +16,23 @@ Changes:
   - 2026-02-02: SPEED FIX - Shell commands now use direct subprocess (10x faster).
                 'computer' tool uses OI for complex multi-step tasks only.
   - 2026-02-05: Added 'remember' and 'recall' tools for long-term memory.
+  - 2026-10-19: Smart routing picks the model once per chat (not per tool-loop
+                iteration) and every API call feeds latency/cost telemetry.
+  - 2026-10-19: Large tool results spill to disk (tool_results.py) and come back
+                via 'read_tool_result'; consumed results are elided from context.
 """
 
 import asyncio
 import logging
 import re
+import time
 from collections.abc import AsyncIterator
 from pathlib import Path
 
 from anthropic import AsyncAnthropic
 
 from pocketclaw.agents.protocol import AgentEvent
+from pocketclaw.agents.tool_results import READ_TOOL_RESULT_TOOL, ToolResultStore
 from pocketclaw.config import Settings
 from pocketclaw.tools.policy import ToolPolicy
 
@@ -330,6 +336,7 @@ class PocketPawOrchestrator:
         self._client: AsyncAnthropic | None = None
         self._executor = None
         self._stop_flag = False
+        self._tool_results_cleaned = False
         self._file_jail = settings.file_jail_path.resolve()
         self._policy = ToolPolicy(
             profile=settings.tool_profile,
@@ -380,6 +387,9 @@ class PocketPawOrchestrator:
         """Return TOOLS filtered by the active tool policy, plus MCP tools."""
         base = [t for t in TOOLS if self._policy.is_tool_allowed(t["name"])]
         base.extend(self._get_mcp_tools())
+        # Not policy-gated: it only re-reads output other (allowed) tools produced
+        if self.settings.tool_result_inline_chars > 0:
+            base.append(READ_TOOL_RESULT_TOOL)
         return base
 
     def _get_mcp_tools(self) -> list[dict]:
@@ -736,31 +746,43 @@ class PocketPawOrchestrator:
         max_iterations = 10
         iteration = 0
 
+        # Smart model routing (opt-in) — decided once for the whole tool loop
+        from pocketclaw.agents.model_router import ModelRouter
+        from pocketclaw.agents.model_telemetry import estimate_cost, get_model_telemetry
+
+        model_router = ModelRouter(self.settings)
+        model = self.settings.anthropic_model
+        if self.settings.smart_routing_enabled:
+            selection = model_router.select(message)
+            model = selection.model
+            logger.info(
+                "Smart routing: %s -> %s (%s)",
+                selection.complexity.value,
+                selection.model,
+                selection.reason,
+            )
+        tier = model_router.tier_for_model(model)
+        telemetry = get_model_telemetry()
+
+        # Large tool outputs go to disk; only a head/tail preview stays in context
+        results = None
+        if self.settings.tool_result_inline_chars > 0:
+            results = ToolResultStore(inline_chars=self.settings.tool_result_inline_chars)
+            if not self._tool_results_cleaned:
+                self._tool_results_cleaned = True
+                await asyncio.to_thread(results.cleanup)
+
+        # Compose final system prompt: identity/memory + tool guide
+        identity = system_prompt or _DEFAULT_IDENTITY
+        final_system = identity + "\n" + _TOOL_GUIDE
+
         try:
             while iteration < max_iterations and not self._stop_flag:
                 iteration += 1
                 logger.debug(f"Iteration {iteration}/{max_iterations}")
 
-                # Smart model routing (opt-in)
-                model = self.settings.anthropic_model
-                if self.settings.smart_routing_enabled:
-                    from pocketclaw.agents.model_router import ModelRouter
-
-                    model_router = ModelRouter(self.settings)
-                    selection = model_router.classify(message)
-                    model = selection.model
-                    logger.info(
-                        "Smart routing: %s -> %s (%s)",
-                        selection.complexity.value,
-                        selection.model,
-                        selection.reason,
-                    )
-
-                # Compose final system prompt: identity/memory + tool guide
-                identity = system_prompt or _DEFAULT_IDENTITY
-                final_system = identity + "\n" + _TOOL_GUIDE
-
                 # Call Claude with timeout wrapper for safety
+                started = time.monotonic()
                 try:
                     response = await asyncio.wait_for(
                         self._client.messages.create(
@@ -773,12 +795,20 @@ class PocketPawOrchestrator:
                         timeout=90.0,  # Additional asyncio timeout as safety net
                     )
                 except TimeoutError:
+                    elapsed_ms = (time.monotonic() - started) * 1000
+                    telemetry.record(
+                        tier, model, ttft_ms=elapsed_ms, latency_ms=elapsed_ms, error=True
+                    )
                     yield AgentEvent(
                         type="error",
                         content="⏱️ Request timed out. Please check your network connection and API key.",
                     )
                     return
                 except Exception as api_error:
+                    elapsed_ms = (time.monotonic() - started) * 1000
+                    telemetry.record(
+                        tier, model, ttft_ms=elapsed_ms, latency_ms=elapsed_ms, error=True
+                    )
                     logger.error(f"Anthropic API error: {api_error}")
                     yield AgentEvent(
                         type="error",
@@ -786,6 +816,24 @@ class PocketPawOrchestrator:
                     )
                     return
 
+                # Non-streaming call: the first token arrives with the whole response
+                elapsed_ms = (time.monotonic() - started) * 1000
+                usage = getattr(response, "usage", None)
+                input_tokens = getattr(usage, "input_tokens", 0) or 0
+                output_tokens = getattr(usage, "output_tokens", 0) or 0
+                telemetry.record(
+                    tier,
+                    model,
+                    ttft_ms=elapsed_ms,
+                    latency_ms=elapsed_ms,
+                    output_tokens=output_tokens if isinstance(output_tokens, int) else 0,
+                    cost_usd=(
+                        estimate_cost(model, input_tokens, output_tokens)
+                        if isinstance(input_tokens, int) and isinstance(output_tokens, int)
+                        else 0.0
+                    ),
+                )
+
                 # Process response content blocks
                 assistant_content = []
                 tool_results_needed = []
@@ -811,7 +859,10 @@ class PocketPawOrchestrator:
                         )
 
                         # Execute
-                        result = await self._execute_tool(tool_name, tool_input)
+                        if tool_name == "read_tool_result" and results is not None:
+                            result = await asyncio.to_thread(results.read_call, tool_input)
+                        else:
+                            result = await self._execute_tool(tool_name, tool_input)
 
                         # Emit tool_result event
                         yield AgentEvent(
@@ -821,6 +872,8 @@ class PocketPawOrchestrator:
                         )
 
                         assistant_content.append(block)
+                        if results is not None and tool_name != "read_tool_result":
+                            result = await asyncio.to_thread(results.spill, result, tool_id)
                         tool_results_needed.append(
                             {"type": "tool_result", "tool_use_id": tool_id, "content": result}
                         )
@@ -835,6 +888,13 @@ class PocketPawOrchestrator:
                 # If tools were used, add results and continue
                 if tool_results_needed:
                     messages.append({"role": "user", "content": tool_results_needed})
+                    # Results from earlier iterations have been seen — shrink them
+                    if results is not None:
+                        await asyncio.to_thread(
+                            results.elide_consumed,
+                            messages,
+                            self.settings.tool_result_keep_recent,
+                        )
                 else:
                     # No tools and not end_turn - shouldn't happen, but break anyway
                     break
@@ -851,8 +911,9 @@ class PocketPawOrchestrator:
         *,
         system_prompt: str | None = None,
         history: list[dict] | None = None,
+        session_key: str | None = None,
     ) -> AsyncIterator[dict]:
-        """Run method for compatibility with router."""
+        """Run method for compatibility with router (session_key is unused)."""
         async for event in self.chat(message, system_prompt=system_prompt, history=history):
             yield {"type": event.type, "content": event.content}
 
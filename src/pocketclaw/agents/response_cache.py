@@ -0,0 +1,224 @@
+"""Response cache for idempotent agent runs.
+
+Created: 2026-10-19
+
+Scheduled intentions, Deep Work planner phases and skills often resend the
+exact same prompt with the same context — a daily digest retried after an
+error, a planner re-run on an unchanged project. With
+``response_cache_enabled`` on, ``cached_run()`` keys each run on a hash of
+the backend, model settings, system prompt, prompt and tool policy, and
+replays the recorded chunks as a stream on a hit, so a repeat run costs zero
+LLM calls. Entries expire after ``response_cache_ttl_seconds`` and the cache
+holds at most ``response_cache_max_entries`` runs (least recently used
+evicted first). Only runs that end with ``done`` are cached — not ones that
+errored or were stopped — and callers can ``discard()`` a run whose output
+turned out to be unusable. When a router is
+passed in, the key uses the settings that router was built with.
+
+Chat messages don't go through this cache — only the autonomous callers
+that opt in by using ``cached_run()``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+
+from pocketclaw.config import Settings
+
+logger = logging.getLogger(__name__)
+
+# Settings that change which model answers (and so what it would say)
+_MODEL_FIELDS = (
+    "agent_backend",
+    "llm_provider",
+    "anthropic_model",
+    "openai_model",
+    "ollama_model",
+    "smart_routing_enabled",
+    "model_tier_simple",
+    "model_tier_moderate",
+    "model_tier_complex",
+)
+
+
+def cache_key(settings: Settings, prompt: str, system_prompt: str | None = None) -> str:
+    """Hash of everything that determines an agent run's output."""
+    payload = {
+        "model": {name: getattr(settings, name, None) for name in _MODEL_FIELDS},
+        "system_prompt": system_prompt,
+        "prompt": prompt,
+        "tools": {
+            "profile": settings.tool_profile,
+            "allow": sorted(settings.tools_allow),
+            "deny": sorted(settings.tools_deny),
+        },
+    }
+    raw = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+class ResponseCache:
+    """TTL + LRU cache of recorded agent run chunks."""
+
+    def __init__(self, ttl: float = 3600.0, max_entries: int = 128) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        # key -> (expires_at, chunks), least recently used first
+        self._entries: OrderedDict[str, tuple[float, list[dict]]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: str) -> list[dict] | None:
+        """Recorded chunks for a key, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+        expires_at, chunks = entry
+        if expires_at < time.time():
+            del self._entries[key]
+            self._misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return chunks
+
+    def put(self, key: str, chunks: list[dict]) -> None:
+        """Store a completed run's chunks."""
+        self._entries[key] = (time.time() + self.ttl, [dict(c) for c in chunks])
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def discard(self, key: str) -> bool:
+        """Drop an entry (e.g. a run whose output the caller couldn't use)."""
+        return self._entries.pop(key, None) is not None
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl,
+            "hits": self._hits,
+            "misses": self._misses,
+        }
+
+
+async def cached_run(
+    settings: Settings,
+    prompt: str,
+    *,
+    router=None,
+    system_prompt: str | None = None,
+) -> AsyncIterator[dict]:
+    """Run a prompt through an agent router, replaying a cached run if one exists.
+
+    Args:
+        settings: Effective settings (backend, model, tool policy) for the run;
+            ignored for the key when ``router`` carries its own settings.
+        prompt: Prompt to run.
+        router: Router to use on a miss (otherwise one is leased from the pool).
+        system_prompt: System prompt passed to the router, if any.
+
+    Yields:
+        The router's chunks — live on a miss, replayed on a hit.
+    """
+    settings = _effective_settings(settings, router)
+    if not settings.response_cache_enabled:
+        async for chunk in _run(settings, prompt, router, system_prompt):
+            yield chunk
+        return
+
+    cache = get_response_cache()
+    key = cache_key(settings, prompt, system_prompt)
+    cached = cache.get(key)
+    if cached is not None:
+        logger.info("Response cache hit (%d chunks)", len(cached))
+        for chunk in cached:
+            yield dict(chunk)
+        return
+
+    chunks: list[dict] = []
+    outcome = {"stopped": False}
+    async for chunk in _run(settings, prompt, router, system_prompt, outcome):
+        chunks.append(chunk)
+        yield chunk
+    # Only a run that finished on its own is worth replaying
+    complete = bool(chunks) and chunks[-1].get("type") == "done"
+    if complete and not outcome["stopped"] and not any(c.get("type") == "error" for c in chunks):
+        cache.put(key, chunks)
+
+
+def discard(
+    settings: Settings, prompt: str, *, router=None, system_prompt: str | None = None
+) -> bool:
+    """Forget the cached run for a prompt, so the next ``cached_run()`` asks again."""
+    settings = _effective_settings(settings, router)
+    if not settings.response_cache_enabled:
+        return False
+    return get_response_cache().discard(cache_key(settings, prompt, system_prompt))
+
+
+def _effective_settings(settings: Settings, router) -> Settings:
+    # A router answers with the backend/model it was built with
+    router_settings = getattr(router, "settings", None)
+    return router_settings if isinstance(router_settings, Settings) else settings
+
+
+async def _run(
+    settings: Settings,
+    prompt: str,
+    router,
+    system_prompt: str | None,
+    outcome: dict | None = None,
+) -> AsyncIterator[dict]:
+    """Stream a run; sets ``outcome["stopped"]`` when the router was stopped mid-run."""
+    kwargs = {"system_prompt": system_prompt} if system_prompt is not None else {}
+    if router is not None:
+        async for chunk in router.run(prompt, **kwargs):
+            yield chunk
+        if outcome is not None:
+            outcome["stopped"] = getattr(router, "stopped", False) is True
+        return
+
+    from pocketclaw.agents.router_pool import get_router_pool
+
+    async with get_router_pool().lease(settings) as leased:
+        async for chunk in leased.run(prompt, **kwargs):
+            yield chunk
+        if outcome is not None:
+            outcome["stopped"] = getattr(leased, "stopped", False) is True
+
+
+# Singleton instance
+_cache: ResponseCache | None = None
+
+
+def get_response_cache() -> ResponseCache:
+    """Get the global response cache."""
+    global _cache
+    if _cache is None:
+        from pocketclaw.config import get_settings
+
+        settings = get_settings()
+        _cache = ResponseCache(
+            ttl=settings.response_cache_ttl_seconds,
+            max_entries=settings.response_cache_max_entries,
+        )
+
+        from pocketclaw.lifecycle import register
+
+        def _reset():
+            global _cache
+            _cache = None
+
+        register("response_cache", reset=_reset)
+    return _cache
@@ -6,6 +6,7 @@ Changes:
   - 2026-02-02: Added pocketpaw_native - custom orchestrator with OI executor.
   - 2026-02-02: RE-ENABLED claude_agent_sdk - now uses official SDK properly!
                 claude_code still disabled (homebrew pyautogui approach).
+  - 2026-10-19: run() accepts session_key; reset() for pooled reuse (router_pool.py).
 """
 
 import logging
@@ -79,6 +80,7 @@ class AgentRouter:
         *,
         system_prompt: str | None = None,
         history: list[dict] | None = None,
+        session_key: str | None = None,
     ) -> AsyncIterator[dict]:
         """Run the agent with the given message.
 
@@ -86,6 +88,8 @@ class AgentRouter:
             message: User message to process.
             system_prompt: Dynamic system prompt from AgentContextBuilder.
             history: Recent session history as list of {"role": ..., "content": ...} dicts.
+            session_key: Conversation the message belongs to. Lets backends keep
+                per-session state (e.g. a live Claude SDK client) across turns.
 
         Yields dicts with:
           - type: "message", "tool_use", "tool_result", "error", "done"
@@ -97,9 +101,21 @@ class AgentRouter:
             yield {"type": "done", "content": ""}
             return
 
-        async for chunk in self._agent.run(message, system_prompt=system_prompt, history=history):
+        async for chunk in self._agent.run(
+            message, system_prompt=system_prompt, history=history, session_key=session_key
+        ):
             yield chunk
 
+    @property
+    def stopped(self) -> bool:
+        """Whether the last run was cut short by :meth:`stop`."""
+        return bool(getattr(self._agent, "_stop_flag", False))
+
+    def reset(self) -> None:
+        """Clear per-run state so a pooled router can serve the next run."""
+        if self._agent is not None and hasattr(self._agent, "_stop_flag"):
+            self._agent._stop_flag = False
+
     async def stop(self) -> None:
         """Stop the agent."""
         if self._agent:
@@ -0,0 +1,164 @@
+"""Warm pool of AgentRouters for autonomous work.
+
+Created: 2026-10-19
+
+Mission Control tasks, intentions, skills and the Deep Work planner used to
+build a fresh ``AgentRouter`` (and therefore a fresh backend — SDK import
+checks, API client creation, executor wiring) for every unit of work. The
+pool hands out pre-initialized routers keyed by backend plus a hash of the
+effective settings, resets their per-run state on checkout and keeps at most
+``max_idle`` of them around (least recently returned dropped first).
+
+A leased router is exclusive to its holder until released, so backends that
+keep per-run state (stop flags, OI's single-session semaphore) stay isolated.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import weakref
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+
+from pocketclaw.agents.router import AgentRouter
+from pocketclaw.config import Settings
+
+logger = logging.getLogger(__name__)
+
+RouterFactory = Callable[[Settings], AgentRouter]
+
+
+def settings_key(settings: Settings) -> str:
+    """Pool key for a Settings instance: backend + hash of the effective values."""
+    digest = hashlib.sha256(settings.model_dump_json().encode()).hexdigest()[:16]
+    return f"{settings.agent_backend}:{digest}"
+
+
+class RouterPool:
+    """Hands out pre-initialized AgentRouters keyed by effective settings.
+
+    Usage:
+        pool = get_router_pool()
+        async with pool.lease(settings) as router:
+            async for chunk in router.run(prompt):
+                ...
+    """
+
+    def __init__(self, max_idle: int = 8) -> None:
+        self.max_idle = max_idle
+        # (factory, settings_key) -> idle routers, most recently returned last
+        self._idle: OrderedDict[tuple[RouterFactory, str], list[AgentRouter]] = OrderedDict()
+        # Leased router -> its pool key (weak, so abandoned leases don't leak)
+        self._leased: weakref.WeakKeyDictionary[AgentRouter, tuple[RouterFactory, str]] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._created = 0
+        self._reused = 0
+
+    def acquire(self, settings: Settings, factory: RouterFactory = AgentRouter) -> AgentRouter:
+        """Check out a router for these settings, creating one if none is idle.
+
+        Args:
+            settings: Effective settings the router must be built with.
+            factory: Router constructor (lets callers and tests substitute their own).
+        """
+        key = (factory, settings_key(settings))
+        idle = self._idle.get(key)
+        if idle:
+            router = idle.pop()
+            if not idle:
+                del self._idle[key]
+            self._reused += 1
+            router.reset()
+            logger.debug("Reusing warm router for %s", key[1])
+        else:
+            router = factory(settings)
+            self._created += 1
+        self._leased[router] = key
+        return router
+
+    def release(self, router: AgentRouter, *, discard: bool = False) -> None:
+        """Return a router to the pool (or drop it, e.g. after a timeout)."""
+        key = self._leased.pop(router, None)
+        if key is None or discard:
+            return
+        self._idle.setdefault(key, []).append(router)
+        self._idle.move_to_end(key)
+        while self._idle_count() > self.max_idle:
+            oldest_key = next(iter(self._idle))
+            routers = self._idle[oldest_key]
+            routers.pop(0)
+            if not routers:
+                del self._idle[oldest_key]
+
+    @asynccontextmanager
+    async def lease(
+        self, settings: Settings, factory: RouterFactory = AgentRouter
+    ) -> AsyncIterator[AgentRouter]:
+        """Context manager that acquires a router and always releases it."""
+        router = self.acquire(settings, factory)
+        try:
+            yield router
+        except BaseException:
+            # A failed or cancelled run may leave the backend mid-stream
+            self.release(router, discard=True)
+            raise
+        else:
+            self.release(router)
+
+    async def warm(
+        self, settings: Settings, count: int = 1, factory: RouterFactory = AgentRouter
+    ) -> None:
+        """Pre-initialize routers so the next checkout is instant.
+
+        Building a router imports and sets up its backend, so that runs in a
+        worker thread; only the pool bookkeeping happens on the event loop.
+        """
+        key = (factory, settings_key(settings))
+        for _ in range(count):
+            router = await asyncio.to_thread(factory, settings)
+            self._created += 1
+            self._leased[router] = key
+            self.release(router)
+
+    def clear(self) -> None:
+        """Drop all idle routers (e.g. after a settings change)."""
+        self._idle.clear()
+
+    def _idle_count(self) -> int:
+        return sum(len(routers) for routers in self._idle.values())
+
+    def stats(self) -> dict:
+        """Pool occupancy and hit counts."""
+        return {
+            "idle": self._idle_count(),
+            "leased": len(self._leased),
+            "max_idle": self.max_idle,
+            "created": self._created,
+            "reused": self._reused,
+        }
+
+
+# Singleton instance
+_pool: RouterPool | None = None
+
+
+def get_router_pool() -> RouterPool:
+    """Get the global router pool."""
+    global _pool
+    if _pool is None:
+        from pocketclaw.config import get_settings
+
+        _pool = RouterPool(max_idle=get_settings().router_pool_max_idle)
+
+        from pocketclaw.lifecycle import register
+
+        def _reset():
+            global _pool
+            _pool = None
+
+        register("router_pool", reset=_reset)
+    return _pool
@@ -0,0 +1,203 @@
+"""Fair scheduler for AgentLoop turns.
+
+Created: 2026-10-19
+
+Replaces the single FIFO ``asyncio.Semaphore(max_concurrent_conversations)``
+that let a noisy webhook or group chat occupy every slot. Waiting turns are
+grouped into lanes — one per channel, plus an ``owner`` lane for messages
+from ``settings.owner_id`` and from the owner's own front-ends (the
+authenticated dashboard WebSocket and the CLI, whose sender ids are session
+ids rather than channel user ids) — and slots are handed out by:
+
+1. Owner lane first (priority lane), whenever it has a waiter.
+2. Weighted fair queuing across the other lanes: each lane's virtual time
+   advances by ``1 / weight`` per granted turn and the lane with the lowest
+   virtual start time goes next, so a lane with weight 2 gets twice the turns
+   of a lane with weight 1 while both are backlogged.
+3. Round-robin across sessions inside a lane.
+
+Lanes can also be capped (``scheduler_channel_caps``) so e.g. webhooks never
+hold more than one slot. Per-lane queue depth and wait times are exposed via
+``stats()``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+
+from pocketclaw.bus import Channel, InboundMessage
+
+OWNER_LANE = "owner"
+# Channels only the owner can reach (the dashboard requires its access token)
+OWNER_CHANNELS = frozenset({Channel.WEBSOCKET, Channel.CLI})
+
+
+@dataclass
+class _Waiter:
+    lane: str
+    session_key: str
+    future: asyncio.Future
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+@dataclass
+class _LaneStats:
+    running: int = 0
+    served: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+
+class FairScheduler:
+    """Admits agent turns by lane priority, weighted fairness and per-lane caps.
+
+    Args:
+        capacity: Max turns running at once (``max_concurrent_conversations``).
+        weights: Lane name -> weight (default 1).
+        caps: Lane name -> max turns running at once in that lane.
+        owner_id: Sender id whose messages use the owner priority lane (in
+            addition to everything arriving on ``OWNER_CHANNELS``).
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        *,
+        weights: dict[str, int] | None = None,
+        caps: dict[str, int] | None = None,
+        owner_id: str = "",
+    ) -> None:
+        self.capacity = max(1, capacity)
+        self.weights = dict(weights or {})
+        self.caps = dict(caps or {})
+        self.owner_id = owner_id
+        # lane -> session_key -> waiters (sessions in round-robin order)
+        self._queues: dict[str, OrderedDict[str, deque[_Waiter]]] = {}
+        self._vtime: dict[str, float] = {}
+        self._clock = 0.0
+        self._active = 0
+        self._stats: dict[str, _LaneStats] = {}
+
+    def lane_for(self, message: InboundMessage) -> str:
+        """Lane a message is scheduled in."""
+        if message.channel in OWNER_CHANNELS:
+            return OWNER_LANE
+        if self.owner_id and message.sender_id == self.owner_id:
+            return OWNER_LANE
+        return message.channel.value
+
+    @asynccontextmanager
+    async def slot(self, message: InboundMessage, session_key: str) -> AsyncIterator[str]:
+        """Wait for a slot for this message's turn; yields the lane name."""
+        lane = self.lane_for(message)
+        waiter = _Waiter(lane, session_key, asyncio.get_running_loop().create_future())
+        self._queues.setdefault(lane, OrderedDict()).setdefault(session_key, deque()).append(waiter)
+        self._dispatch()
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # Granted and cancelled in the same tick — hand the slot back
+                self._release(lane)
+            else:
+                self._discard(waiter)
+            raise
+        try:
+            yield lane
+        finally:
+            self._release(lane)
+
+    def _weight(self, lane: str) -> float:
+        return float(max(self.weights.get(lane, 1), 1))
+
+    def _eligible(self, lane: str) -> bool:
+        cap = self.caps.get(lane)
+        running = self._stats[lane].running if lane in self._stats else 0
+        return cap is None or cap <= 0 or running < cap
+
+    def _next_lane(self) -> str | None:
+        lanes = [lane for lane in self._queues if self._eligible(lane)]
+        if not lanes:
+            return None
+        if OWNER_LANE in lanes:
+            return OWNER_LANE
+        return min(lanes, key=lambda lane: (max(self._vtime.get(lane, 0.0), self._clock), lane))
+
+    def _dispatch(self) -> None:
+        while self._active < self.capacity:
+            lane = self._next_lane()
+            if lane is None:
+                return
+            sessions = self._queues[lane]
+            session_key, waiters = next(iter(sessions.items()))
+            waiter = waiters.popleft()
+            if waiters:
+                sessions.move_to_end(session_key)
+            else:
+                del sessions[session_key]
+            if not sessions:
+                del self._queues[lane]
+
+            start = max(self._vtime.get(lane, 0.0), self._clock)
+            self._clock = start
+            self._vtime[lane] = start + 1 / self._weight(lane)
+
+            waited = time.monotonic() - waiter.enqueued_at
+            stats = self._stats.setdefault(lane, _LaneStats())
+            stats.running += 1
+            stats.served += 1
+            stats.total_wait += waited
+            stats.max_wait = max(stats.max_wait, waited)
+            self._active += 1
+            waiter.future.set_result(None)
+
+    def _release(self, lane: str) -> None:
+        self._active -= 1
+        self._stats[lane].running -= 1
+        self._dispatch()
+
+    def _discard(self, waiter: _Waiter) -> None:
+        sessions = self._queues.get(waiter.lane)
+        if not sessions:
+            return
+        waiters = sessions.get(waiter.session_key)
+        if waiters and waiter in waiters:
+            waiters.remove(waiter)
+            if not waiters:
+                del sessions[waiter.session_key]
+            if not sessions:
+                del self._queues[waiter.lane]
+
+    def queue_depth(self, lane: str) -> int:
+        return sum(len(w) for w in self._queues.get(lane, {}).values())
+
+    def stats(self) -> dict:
+        """Capacity, slots in use and per-lane queue depth / wait times."""
+        lanes = {}
+        for lane in sorted(set(self._stats) | set(self._queues)):
+            s = self._stats.get(lane, _LaneStats())
+            queued = self._queues.get(lane, {})
+            oldest = min((w.enqueued_at for ws in queued.values() for w in ws), default=None)
+            lanes[lane] = {
+                "queued": self.queue_depth(lane),
+                "running": s.running,
+                "served": s.served,
+                "avg_wait_ms": round(s.total_wait / s.served * 1000, 1) if s.served else 0.0,
+                "max_wait_ms": round(s.max_wait * 1000, 1),
+                "oldest_wait_ms": (
+                    round((time.monotonic() - oldest) * 1000, 1) if oldest is not None else 0.0
+                ),
+                "weight": self._weight(lane),
+                "cap": self.caps.get(lane),
+            }
+        return {
+            "capacity": self.capacity,
+            "active": self._active,
+            "queued": sum(lane["queued"] for lane in lanes.values()),
+            "lanes": lanes,
+        }
@@ -0,0 +1,234 @@
+"""Session-scoped pool of long-lived Claude Agent SDK clients.
+
+Created: 2026-10-19
+
+``claude_agent_sdk.query()`` spawns a fresh Claude CLI subprocess for every
+message, re-sends the whole system prompt and relies on history flattened
+into that prompt. The pool keeps one connected ``ClaudeSDKClient`` per
+session so follow-up turns reuse the live process and its native
+conversation state.
+
+Clients are keyed by session_key and tagged with an options signature — if
+the effective options change (tool policy, cwd, MCP servers, ...) the stale
+client is disconnected and a new one is connected, waiting for a running
+turn to finish first so a client with outdated permissions is never handed
+out. Idle clients are evicted after ``idle_timeout`` seconds and the pool is
+capped at ``max_clients`` (least recently used first).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PooledClient:
+    """A connected SDK client bound to one session."""
+
+    session_key: str
+    client: Any
+    signature: str
+    system_prompt: str = ""
+    model: str | None = None
+    turns: int = 0
+    # Characters of <context-update> blocks appended since the client connected
+    context_chars: int = 0
+    created_at: float = field(default_factory=time.monotonic)
+    last_used_at: float = field(default_factory=time.monotonic)
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+    def touch(self) -> None:
+        """Update last used timestamp."""
+        self.last_used_at = time.monotonic()
+
+    @property
+    def busy(self) -> bool:
+        """Whether a turn is currently running on this client."""
+        return self.lock.locked()
+
+
+class SDKClientPool:
+    """Keeps one live ``ClaudeSDKClient`` per session with idle eviction.
+
+    Usage:
+        pool = get_sdk_client_pool()
+        entry, reused = await pool.acquire(session_key, signature, connect)
+        async with entry.lock:
+            await entry.client.query(prompt)
+            async for msg in entry.client.receive_response():
+                ...
+    """
+
+    def __init__(self, idle_timeout: float = 600.0, max_clients: int = 8) -> None:
+        self.idle_timeout = idle_timeout
+        self.max_clients = max_clients
+        self._clients: OrderedDict[str, PooledClient] = OrderedDict()
+        self._global_lock = asyncio.Lock()
+
+    async def acquire(
+        self,
+        session_key: str,
+        signature: str,
+        connect: Callable[[], Awaitable[Any]],
+    ) -> tuple[PooledClient, bool]:
+        """Get the live client for a session, connecting a new one if needed.
+
+        Args:
+            session_key: Session the client belongs to.
+            signature: Hash of the options the client must have been built with.
+            connect: Coroutine factory returning a connected client.
+
+        Returns:
+            Tuple of (pooled client, whether an existing client was reused).
+        """
+        await self.cleanup_idle()
+
+        while True:
+            stale: PooledClient | None = None
+            running: PooledClient | None = None
+            async with self._global_lock:
+                entry = self._clients.get(session_key)
+                if entry is not None and entry.signature != signature:
+                    if entry.busy:
+                        running, entry = entry, None
+                    else:
+                        stale = self._clients.pop(session_key)
+                        entry = None
+                if entry is not None:
+                    self._clients.move_to_end(session_key)
+                    entry.touch()
+            if running is None:
+                break
+            # Options changed mid-turn: let the turn finish, then rebuild
+            async with running.lock:
+                pass
+        if stale is not None:
+            logger.info("SDK options changed for %s, reconnecting client", session_key)
+            await self._disconnect(stale)
+        if entry is not None:
+            return entry, True
+
+        client = await connect()
+        entry = PooledClient(session_key=session_key, client=client, signature=signature)
+        async with self._global_lock:
+            replaced = self._clients.pop(session_key, None)
+            self._clients[session_key] = entry
+            overflow = self._pop_overflow()
+        for old in ([replaced] if replaced else []) + overflow:
+            await self._disconnect(old)
+        return entry, False
+
+    def _pop_overflow(self) -> list[PooledClient]:
+        """Remove least recently used idle clients beyond ``max_clients``."""
+        evicted: list[PooledClient] = []
+        for key in list(self._clients.keys()):
+            if len(self._clients) <= max(self.max_clients, 1):
+                break
+            if not self._clients[key].busy:
+                evicted.append(self._clients.pop(key))
+        return evicted
+
+    async def release(self, session_key: str) -> None:
+        """Disconnect and drop a session's client (e.g. after an interrupted turn)."""
+        async with self._global_lock:
+            entry = self._clients.pop(session_key, None)
+        if entry is not None:
+            await self._disconnect(entry)
+
+    async def cleanup_idle(self, timeout_seconds: float | None = None) -> int:
+        """Disconnect clients idle for longer than the timeout.
+
+        Returns:
+            Number of clients evicted.
+        """
+        timeout = self.idle_timeout if timeout_seconds is None else timeout_seconds
+        now = time.monotonic()
+        async with self._global_lock:
+            idle = [
+                key
+                for key, entry in self._clients.items()
+                if not entry.busy and now - entry.last_used_at > timeout
+            ]
+            evicted = [self._clients.pop(key) for key in idle]
+        for entry in evicted:
+            await self._disconnect(entry)
+        if evicted:
+            logger.debug("Evicted %d idle SDK client(s)", len(evicted))
+        return len(evicted)
+
+    async def close_all(self) -> None:
+        """Disconnect every pooled client."""
+        async with self._global_lock:
+            entries = list(self._clients.values())
+            self._clients.clear()
+        for entry in entries:
+            await self._disconnect(entry)
+
+    async def reconnect(self, entry: PooledClient, connect: Callable[[], Awaitable[Any]]) -> None:
+        """Replace an entry's client in place; the caller holds ``entry.lock``."""
+        await self._disconnect(entry)
+        entry.client = await connect()
+        entry.context_chars = 0
+        entry.touch()
+
+    async def _disconnect(self, entry: PooledClient) -> None:
+        try:
+            await entry.client.disconnect()
+        except Exception as e:
+            logger.debug("Error disconnecting SDK client for %s: %s", entry.session_key, e)
+
+    def has_session(self, session_key: str) -> bool:
+        """Check if a live client exists for a session."""
+        return session_key in self._clients
+
+    def stats(self) -> dict:
+        """Pool occupancy for status endpoints."""
+        now = time.monotonic()
+        return {
+            "clients": len(self._clients),
+            "max_clients": self.max_clients,
+            "idle_timeout": self.idle_timeout,
+            "sessions": [
+                {
+                    "session_key": e.session_key,
+                    "turns": e.turns,
+                    "busy": e.busy,
+                    "idle_seconds": round(now - e.last_used_at, 1),
+                }
+                for e in self._clients.values()
+            ],
+        }
+
+
+# Singleton instance
+_pool: SDKClientPool | None = None
+
+
+def get_sdk_client_pool() -> SDKClientPool:
+    """Get the global SDK client pool, sized from settings on first use."""
+    global _pool
+    if _pool is None:
+        from pocketclaw.config import get_settings
+
+        settings = get_settings()
+        _pool = SDKClientPool(
+            idle_timeout=settings.claude_sdk_pool_idle_seconds,
+            max_clients=settings.claude_sdk_pool_max_clients,
+        )
+
+        from pocketclaw.lifecycle import register
+
+        def _reset():
+            global _pool
+            _pool = None
+
+        register("sdk_client_pool", shutdown=_pool.close_all, reset=_reset)
+    return _pool
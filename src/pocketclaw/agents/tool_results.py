@@ -0,0 +1,206 @@
+"""Tool result store — keeps large tool outputs out of the native agent's context.
+
+Created: 2026-10-19
+
+Every ``tool_result`` appended to the native loop's ``messages`` is resent on
+each later iteration, so a 50 KB file read or shell log makes a 10-iteration
+task grow quadratically. Large outputs are written to disk instead and
+replaced in-context by their head and tail plus a handle the model can pass to
+the ``read_tool_result`` tool. Once the model has seen a result (i.e. a newer
+assistant turn exists), older results are elided to a one-line stub that keeps
+the handle, so nothing is lost.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+import uuid
+from pathlib import Path
+
+from pocketclaw.config import get_config_dir
+
+logger = logging.getLogger(__name__)
+
+# Results shorter than this are never elided (the stub would save nothing)
+_MIN_ELIDE_CHARS = 300
+
+READ_TOOL_RESULT_TOOL = {
+    "name": "read_tool_result",
+    "description": (
+        "Read part of a large tool result that was truncated in the conversation. "
+        "Pass the handle shown in the truncation notice and a character range."
+    ),
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "handle": {"type": "string", "description": "Handle from the truncation notice"},
+            "start": {
+                "type": "integer",
+                "description": "Start character offset (default: 0)",
+            },
+            "end": {
+                "type": "integer",
+                "description": "End character offset (default: start + the inline limit)",
+            },
+        },
+        "required": ["handle"],
+    },
+}
+
+
+def get_tool_results_dir() -> Path:
+    """Return the tool result storage directory, creating it if needed."""
+    d = get_config_dir() / "tool_results"
+    d.mkdir(parents=True, exist_ok=True)
+    return d
+
+
+class ToolResultStore:
+    """Spills large tool outputs to disk and serves ranges of them back.
+
+    One store is used per agent turn: it remembers which ``tool_use_id`` was
+    spilled under which handle and which results were already elided.
+
+    Args:
+        root: Directory for stored results.
+        inline_chars: Results longer than this are spilled; also the max range
+            returned by a single ``read()``.
+        max_age: Stored results older than this many seconds are removed by
+            ``cleanup()``.
+    """
+
+    def __init__(
+        self,
+        root: Path | None = None,
+        inline_chars: int = 4000,
+        max_age: float = 86400.0,
+    ) -> None:
+        self._root = root
+        self.inline_chars = inline_chars
+        self.max_age = max_age
+        self._handles: dict[str, str] = {}
+        self._elided: set[str] = set()
+
+    @property
+    def root(self) -> Path:
+        if self._root is None:
+            self._root = get_tool_results_dir()
+        self._root.mkdir(parents=True, exist_ok=True)
+        return self._root
+
+    def _path(self, handle: str) -> Path | None:
+        # Handles are generated hex ids — reject anything else (no path traversal)
+        if not handle.startswith("tr_") or not handle[3:].isalnum():
+            return None
+        return self.root / f"{handle}.txt"
+
+    def store(self, content: str) -> str:
+        """Write content to disk and return its handle."""
+        handle = f"tr_{uuid.uuid4().hex[:12]}"
+        self.root.joinpath(f"{handle}.txt").write_text(content, encoding="utf-8")
+        return handle
+
+    def preview(self, content: str, handle: str) -> str:
+        """Head and tail of content around a notice pointing at the handle."""
+        half = max(self.inline_chars // 2, 1)
+        elided = len(content) - 2 * half
+        return (
+            f"{content[:half]}\n\n"
+            f"[... {elided} of {len(content)} chars omitted — full result stored as "
+            f"'{handle}'. Use read_tool_result(handle='{handle}', start, end) "
+            f"to read more ...]\n\n"
+            f"{content[-half:]}"
+        )
+
+    def spill(self, content: str, tool_use_id: str | None = None) -> str:
+        """Return content unchanged if small, else a head/tail preview with a handle."""
+        if len(content) <= self.inline_chars:
+            return content
+        handle = self.store(content)
+        if tool_use_id:
+            self._handles[tool_use_id] = handle
+        logger.debug("Spilled %d-char tool result to %s", len(content), handle)
+        return self.preview(content, handle)
+
+    def read(self, handle: str, start: int = 0, end: int | None = None) -> str:
+        """Return a character range of a stored result (at most ``inline_chars``)."""
+        path = self._path(handle)
+        if path is None or not path.exists():
+            return f"Error: unknown tool result handle '{handle}'"
+        content = path.read_text(encoding="utf-8")
+        start = min(max(0, start), len(content))
+        if end is None or end <= start:
+            end = start + self.inline_chars
+        end = min(end, start + self.inline_chars, len(content))
+        if start >= len(content):
+            return f"(end of result — {len(content)} chars total)"
+        return f"[{handle} chars {start}-{end} of {len(content)}]\n{content[start:end]}"
+
+    def read_call(self, tool_input: object) -> str:
+        """Run a ``read_tool_result`` call from the model, validating its input."""
+        if not isinstance(tool_input, dict):
+            return "Error: read_tool_result expects an object with 'handle', 'start', 'end'"
+        offsets = {}
+        for name in ("start", "end"):
+            value = tool_input.get(name)
+            if value is None or value == "":
+                offsets[name] = None
+                continue
+            try:
+                offsets[name] = int(value)
+            except (TypeError, ValueError, OverflowError):
+                return f"Error: '{name}' must be an integer character offset, got {value!r}"
+        return self.read(str(tool_input.get("handle", "")), offsets["start"] or 0, offsets["end"])
+
+    def elide_consumed(self, messages: list[dict], keep_recent: int = 1) -> int:
+        """Replace tool results the model has already responded to with stubs.
+
+        The last ``keep_recent`` tool-result messages are left intact; older
+        ones larger than a few hundred chars become a one-line stub with a
+        handle (storing the full text first if it wasn't spilled already).
+
+        Returns:
+            Number of tool results elided.
+        """
+        result_msgs = [
+            m
+            for m in messages
+            if m.get("role") == "user"
+            and isinstance(m.get("content"), list)
+            and any(isinstance(b, dict) and b.get("type") == "tool_result" for b in m["content"])
+        ]
+        consumed = result_msgs[: max(len(result_msgs) - keep_recent, 0)]
+
+        elided = 0
+        for msg in consumed:
+            for block in msg["content"]:
+                tool_use_id = block.get("tool_use_id", "")
+                if block.get("type") != "tool_result" or tool_use_id in self._elided:
+                    continue
+                content = block.get("content")
+                if not isinstance(content, str) or len(content) < _MIN_ELIDE_CHARS:
+                    continue
+                handle = self._handles.get(tool_use_id) or self.store(content)
+                block["content"] = (
+                    f"[tool result already consumed and elided ({len(content)} chars) — "
+                    f"read_tool_result(handle='{handle}') to see it again]"
+                )
+                self._elided.add(tool_use_id)
+                elided += 1
+        return elided
+
+    def cleanup(self) -> int:
+        """Delete stored results older than ``max_age``. Returns the count removed."""
+        if self._root is None and not (get_config_dir() / "tool_results").exists():
+            return 0
+        cutoff = time.time() - self.max_age
+        removed = 0
+        for path in self.root.glob("tr_*.txt"):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+                    removed += 1
+            except OSError:
+                continue
+        return removed
@@ -0,0 +1,560 @@
+"""Multi-process agent workers sharded by session key.
+
+Created: 2026-10-19
+
+With ``agent_workers`` > 0 the channel adapters and dashboard stay in the
+front process, and ``AgentLoop`` instances run in N worker processes so
+CPU-heavy work (JSON rewrites, injection scanning, html2text, snapshots,
+Rich logging) spreads across cores:
+
+    adapters → front MessageBus → WorkerPool ──unix socket──▶ worker i
+                                      ▲                        (AgentLoop)
+    adapters ◀── publish_outbound ────┴──── outbound / system / ack / latency frames
+
+Each session is pinned to one worker by a consistent hash of its
+``session_key``, and the front writes a worker's messages to its socket in
+the order it consumed them, so per-session ordering is preserved. Frames are
+length-prefixed JSON carrying ``InboundMessage`` / ``OutboundMessage`` /
+``SystemEvent`` dicts. Workers ack each message when its turn completes;
+the front then acks it on its own bus (and journal), and resends any
+unacked messages to a worker that crashed and was restarted. Turn durations
+come back as ``latency`` frames, and unacked messages count as the agent
+backlog for the front bus's admission control.
+
+Shared state stays consistent across processes:
+
+- Audit entries are forwarded to the front as ``audit`` frames; the front is
+  the only writer of ``audit.jsonl`` (and its rotation) and fires the live
+  ``on_log`` callbacks.
+- Session files are only written by the worker that owns the session; the
+  session index and alias table are merged under an inter-process file lock
+  (see ``FileMemoryStore``).
+- ``control`` frames from the front make workers reset their router or
+  reload memory after a settings change, and report their scheduler state.
+
+Only the ``file`` memory backend is supported (mem0's local stores are
+process-local); ``workers_enabled()`` returns False (and logs why) for other
+backends, and callers fall back to an in-process ``AgentLoop``.
+
+Start a worker by hand with ``python -m pocketclaw.agents.workers --socket PATH``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import bisect
+import hashlib
+import json
+import logging
+import shutil
+import struct
+import sys
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from pocketclaw.bus import InboundMessage, MessageBus, OutboundMessage, SystemEvent, get_message_bus
+
+logger = logging.getLogger(__name__)
+
+_HEADER = struct.Struct("!I")
+_CONNECT_TIMEOUT = 30.0
+_RESTART_BACKOFF = (1, 2, 5, 10, 30)
+_REQUEST_TIMEOUT = 2.0
+# InboundMessage.metadata key carrying the front's sequence number inside a worker
+_SEQ_KEY = "worker_seq"
+
+# Actions a front can send in a ``control`` frame
+CONTROL_ACTIONS = ("reset_router", "reload_memory", "stats")
+
+
+def unsupported_reason(settings) -> str | None:
+    """Why agent workers can't run with these settings, or None if they can."""
+    if settings.memory_backend != "file":
+        return f"memory backend {settings.memory_backend!r} keeps process-local state"
+    return None
+
+
+def workers_enabled(settings) -> bool:
+    """Whether to run the agent in worker processes (logs why not if unsupported)."""
+    if settings.agent_workers <= 0:
+        return False
+    reason = unsupported_reason(settings)
+    if reason:
+        logger.warning("agent_workers ignored: %s; running the agent in-process", reason)
+        return False
+    return True
+
+
+# =============================================================================
+# Framing
+# =============================================================================
+
+
+def write_frame(writer: asyncio.StreamWriter, frame: dict[str, Any]) -> None:
+    """Queue one length-prefixed JSON frame on a stream."""
+    payload = json.dumps(frame, default=str).encode()
+    writer.write(_HEADER.pack(len(payload)) + payload)
+
+
+async def read_frame(reader: asyncio.StreamReader) -> dict[str, Any] | None:
+    """Read one frame; None on a clean EOF."""
+    try:
+        header = await reader.readexactly(_HEADER.size)
+        (length,) = _HEADER.unpack(header)
+        return json.loads(await reader.readexactly(length))
+    except asyncio.IncompleteReadError:
+        return None
+
+
+# =============================================================================
+# Sharding
+# =============================================================================
+
+
+class HashRing:
+    """Consistent hash ring mapping session keys to worker indexes."""
+
+    def __init__(self, nodes: int, replicas: int = 64) -> None:
+        points = []
+        for node in range(nodes):
+            for replica in range(replicas):
+                points.append((self._hash(f"worker-{node}:{replica}"), node))
+        points.sort()
+        self._keys = [p for p, _ in points]
+        self._nodes = [n for _, n in points]
+
+    @staticmethod
+    def _hash(value: str) -> int:
+        return int.from_bytes(hashlib.md5(value.encode()).digest()[:8], "big")
+
+    def node_for(self, key: str) -> int:
+        i = bisect.bisect(self._keys, self._hash(key)) % len(self._keys)
+        return self._nodes[i]
+
+
+# =============================================================================
+# Front process
+# =============================================================================
+
+
+@dataclass
+class _Worker:
+    index: int
+    socket_path: Path
+    process: asyncio.subprocess.Process | None = None
+    writer: asyncio.StreamWriter | None = None
+    ready: asyncio.Event = field(default_factory=asyncio.Event)
+    # seq -> message forwarded but not yet acked, in send order
+    inflight: dict[int, InboundMessage] = field(default_factory=dict)
+    forwarded: int = 0
+    restarts: int = 0
+    # request id -> reply future for control frames that expect an answer
+    requests: dict[int, asyncio.Future] = field(default_factory=dict)
+
+
+class WorkerPool:
+    """Front-process side: forwards inbound messages to sharded worker processes.
+
+    Drop-in for ``AgentLoop`` where the front only needs ``start()``/``stop()``
+    and ``started``.
+
+    Args:
+        workers: Number of worker processes.
+        bus: Front message bus (defaults to the global one).
+        slots: Turns each worker runs at once (default:
+            ``max_concurrent_conversations``).
+    """
+
+    def __init__(
+        self, workers: int, bus: MessageBus | None = None, *, slots: int | None = None
+    ) -> None:
+        if slots is None:
+            from pocketclaw.config import get_settings
+
+            slots = get_settings().max_concurrent_conversations
+        self.bus = bus or get_message_bus()
+        self.slots = max(1, slots)
+        self.ring = HashRing(workers)
+        self._socket_dir = Path(tempfile.mkdtemp(prefix="pocketclaw-workers-"))
+        self._workers = [_Worker(i, self._socket_dir / f"worker-{i}.sock") for i in range(workers)]
+        self._tasks: set[asyncio.Task] = set()
+        self._seq = 0
+        self._request_id = 0
+        self._running = False
+        # Set once the workers are spawned and inbound messages are forwarded
+        self.started = asyncio.Event()
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def worker_for(self, session_key: str) -> int:
+        return self.ring.node_for(session_key)
+
+    async def start(self) -> None:
+        """Spawn the workers and forward inbound messages until stopped."""
+        self._running = True
+        self.bus.track_backlog(self.backlog)
+        for worker in self._workers:
+            self._spawn(self._supervise(worker))
+        logger.info("🤖 Agent worker pool started (%d processes)", len(self._workers))
+        self.started.set()
+        while self._running:
+            message = await self.bus.consume_inbound(timeout=1.0)
+            if message is None:
+                continue
+            await self._forward(message)
+
+    async def stop(self) -> None:
+        self._running = False
+        self.started.clear()
+        self.bus.track_backlog(None)
+        for task in list(self._tasks):
+            task.cancel()
+        for worker in self._workers:
+            await self._terminate(worker)
+        await self.bus.flush_journal()
+        shutil.rmtree(self._socket_dir, ignore_errors=True)
+        logger.info("🛑 Agent worker pool stopped")
+
+    def _spawn(self, coro) -> None:
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _forward(self, message: InboundMessage) -> None:
+        worker = self._workers[self.worker_for(message.session_key)]
+        self._seq += 1
+        worker.inflight[self._seq] = message
+        worker.forwarded += 1
+        if worker.ready.is_set():
+            await self._send(worker, self._seq, message)
+        # Otherwise it's resent with the rest of inflight once the worker is back
+
+    async def _send(self, worker: _Worker, seq: int, message: InboundMessage) -> None:
+        frame = {"type": "inbound", "seq": seq, "message": message.to_dict()}
+        if not await self._write(worker, frame):
+            logger.warning("Worker %d unreachable; will resend after restart", worker.index)
+
+    async def _write(self, worker: _Worker, frame: dict[str, Any]) -> bool:
+        try:
+            write_frame(worker.writer, frame)
+            await worker.writer.drain()
+            return True
+        except (ConnectionError, AttributeError):
+            return False
+
+    async def control(self, action: str) -> None:
+        """Send a control action (``reset_router``, ``reload_memory``) to live workers.
+
+        Workers that are down load the saved settings when they restart.
+        """
+        for worker in self._workers:
+            if worker.ready.is_set():
+                await self._write(worker, {"type": "control", "action": action})
+
+    async def worker_stats(self, timeout: float = _REQUEST_TIMEOUT) -> list[dict | None]:
+        """Each worker's AgentLoop state (``running``, ``scheduler``); None if down."""
+        return list(
+            await asyncio.gather(*(self._request(w, "stats", timeout) for w in self._workers))
+        )
+
+    async def _request(self, worker: _Worker, action: str, timeout: float) -> Any:
+        if not worker.ready.is_set():
+            return None
+        self._request_id += 1
+        request_id = self._request_id
+        reply = asyncio.get_running_loop().create_future()
+        worker.requests[request_id] = reply
+        try:
+            if not await self._write(
+                worker, {"type": "control", "action": action, "id": request_id}
+            ):
+                return None
+            return await asyncio.wait_for(reply, timeout)
+        except TimeoutError:
+            logger.warning("Agent worker %d didn't answer %r", worker.index, action)
+            return None
+        finally:
+            worker.requests.pop(request_id, None)
+
+    async def _supervise(self, worker: _Worker) -> None:
+        """Run a worker process, restarting it with backoff if it dies."""
+        attempt = 0
+        while self._running:
+            try:
+                reader = await self._launch(worker)
+                attempt = 0
+                # Resend anything the previous incarnation never acked, before
+                # new messages, so per-session order survives the restart
+                sent = 0
+                while backlog := [(s, m) for s, m in worker.inflight.items() if s > sent]:
+                    for seq, message in backlog:
+                        await self._send(worker, seq, message)
+                        sent = seq
+                worker.ready.set()
+                await self._read_frames(worker, reader)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("Agent worker %d failed: %s", worker.index, e)
+            worker.ready.clear()
+            for reply in worker.requests.values():
+                if not reply.done():
+                    reply.set_result(None)
+            await self._terminate(worker)
+            if not self._running:
+                return
+            delay = _RESTART_BACKOFF[min(attempt, len(_RESTART_BACKOFF) - 1)]
+            attempt += 1
+            worker.restarts += 1
+            logger.warning("Restarting agent worker %d in %ds", worker.index, delay)
+            await asyncio.sleep(delay)
+
+    async def _launch(self, worker: _Worker) -> asyncio.StreamReader:
+        worker.socket_path.unlink(missing_ok=True)
+        worker.process = await asyncio.create_subprocess_exec(
+            sys.executable,
+            "-m",
+            "pocketclaw.agents.workers",
+            "--socket",
+            str(worker.socket_path),
+        )
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + _CONNECT_TIMEOUT
+        while True:
+            try:
+                reader, worker.writer = await asyncio.open_unix_connection(str(worker.socket_path))
+                break
+            except (FileNotFoundError, ConnectionRefusedError):
+                if worker.process.returncode is not None or loop.time() > deadline:
+                    raise RuntimeError("worker did not start listening") from None
+                await asyncio.sleep(0.1)
+        logger.info("Agent worker %d up (pid %s)", worker.index, worker.process.pid)
+        return reader
+
+    async def _read_frames(self, worker: _Worker, reader: asyncio.StreamReader) -> None:
+        while (frame := await read_frame(reader)) is not None:
+            kind = frame.get("type")
+            if kind == "outbound":
+                await self.bus.publish_outbound(OutboundMessage.from_dict(frame["message"]))
+            elif kind == "system":
+                await self.bus.publish_system(SystemEvent.from_dict(frame["event"]))
+            elif kind == "ack":
+                message = worker.inflight.pop(frame["seq"], None)
+                if message is not None:
+                    self.bus.ack_inbound(message)
+            elif kind == "latency":
+                self.bus.record_turn_latency(frame["seconds"])
+            elif kind == "audit":
+                from pocketclaw.security.audit import get_audit_logger
+
+                get_audit_logger().record(frame["entry"])
+            elif kind == "reply":
+                reply = worker.requests.get(frame.get("id"))
+                if reply is not None and not reply.done():
+                    reply.set_result(frame.get("data"))
+        logger.warning("Agent worker %d disconnected", worker.index)
+
+    async def _terminate(self, worker: _Worker) -> None:
+        if worker.writer is not None:
+            worker.writer.close()
+            worker.writer = None
+        process, worker.process = worker.process, None
+        if process is None or process.returncode is not None:
+            return
+        try:
+            await asyncio.wait_for(process.wait(), timeout=10)
+        except TimeoutError:
+            process.kill()
+            await process.wait()
+
+    def backlog(self) -> dict[str, int]:
+        """Pool-wide turn counts for the bus's admission control.
+
+        A forwarded, unacked message is running or queued in its worker, which
+        runs up to ``slots`` turns at once.
+        """
+        active = queued = 0
+        for worker in self._workers:
+            pending = len(worker.inflight)
+            active += min(pending, self.slots)
+            queued += max(0, pending - self.slots)
+        return {"capacity": self.slots * len(self._workers), "active": active, "queued": queued}
+
+    def stats(self) -> dict:
+        """Per-worker process state and in-flight counts."""
+        return {
+            "workers": [
+                {
+                    "index": w.index,
+                    "pid": w.process.pid if w.process is not None else None,
+                    "up": w.ready.is_set(),
+                    "forwarded": w.forwarded,
+                    "inflight": len(w.inflight),
+                    "restarts": w.restarts,
+                }
+                for w in self._workers
+            ]
+        }
+
+
+def merge_scheduler_stats(stats: list[dict]) -> dict:
+    """Combine per-worker ``FairScheduler.stats()`` into one pool-wide view.
+
+    Counts are summed, waits are served-weighted averages or maxima; ``cap``
+    and ``weight`` stay per-worker values.
+    """
+    lanes: dict[str, dict] = {}
+    for worker in stats:
+        for lane, s in worker.get("lanes", {}).items():
+            m = lanes.setdefault(
+                lane,
+                {
+                    "queued": 0,
+                    "running": 0,
+                    "served": 0,
+                    "avg_wait_ms": 0.0,
+                    "max_wait_ms": 0.0,
+                    "oldest_wait_ms": 0.0,
+                    "weight": s.get("weight"),
+                    "cap": s.get("cap"),
+                },
+            )
+            served = m["served"] + s["served"]
+            if served:
+                m["avg_wait_ms"] = round(
+                    (m["avg_wait_ms"] * m["served"] + s["avg_wait_ms"] * s["served"]) / served, 1
+                )
+            m["served"] = served
+            m["queued"] += s["queued"]
+            m["running"] += s["running"]
+            m["max_wait_ms"] = max(m["max_wait_ms"], s["max_wait_ms"])
+            m["oldest_wait_ms"] = max(m["oldest_wait_ms"], s["oldest_wait_ms"])
+    return {
+        "capacity": sum(w.get("capacity", 0) for w in stats),
+        "active": sum(w.get("active", 0) for w in stats),
+        "queued": sum(w.get("queued", 0) for w in stats),
+        "lanes": dict(sorted(lanes.items())),
+    }
+
+
+# =============================================================================
+# Worker process
+# =============================================================================
+
+
+class WorkerBus(MessageBus):
+    """Worker-side bus: inbound comes from the front, everything else goes back to it."""
+
+    def __init__(self, writer: asyncio.StreamWriter) -> None:
+        super().__init__()
+        self._link = writer
+
+    async def deliver_inbound(self, seq: int, message: InboundMessage) -> None:
+        message.metadata[_SEQ_KEY] = seq
+        await self.publish_inbound(message)
+
+    async def publish_outbound(self, message: OutboundMessage) -> None:
+        write_frame(self._link, {"type": "outbound", "message": message.to_dict()})
+        await self._link.drain()
+
+    async def publish_system(self, event: SystemEvent) -> None:
+        write_frame(self._link, {"type": "system", "event": event.to_dict()})
+        await self._link.drain()
+
+    def record_turn_latency(self, seconds: float) -> None:
+        # The front's admission control needs it, not this worker's own bus
+        write_frame(self._link, {"type": "latency", "seconds": seconds})
+
+    def ack_inbound(self, *messages: InboundMessage) -> None:
+        for message in messages:
+            seq = message.metadata.pop(_SEQ_KEY, None)
+            if seq is not None:
+                write_frame(self._link, {"type": "ack", "seq": seq})
+
+
+def apply_control(agent_loop, action: str | None) -> dict | None:
+    """Apply a front ``control`` action to this worker's AgentLoop.
+
+    Returns the reply payload (``stats``) or None.
+    """
+    if action == "stats":
+        return {"running": agent_loop._running, "scheduler": agent_loop.scheduler.stats()}
+    if action not in CONTROL_ACTIONS:
+        logger.warning("Ignoring unknown control action %r", action)
+        return None
+
+    from pocketclaw.config import get_settings
+
+    # The front saved new settings to disk
+    get_settings.cache_clear()
+    if action == "reset_router":
+        agent_loop.reset_router()
+    elif action == "reload_memory":
+        from pocketclaw.memory import get_memory_manager
+
+        agent_loop.memory = get_memory_manager(force_reload=True)
+        agent_loop.context_builder.memory = agent_loop.memory
+    return None
+
+
+async def run_worker(socket_path: str) -> None:
+    """Serve one front connection on ``socket_path`` with a local AgentLoop."""
+    import pocketclaw.bus.queue as bus_queue
+
+    done = asyncio.Event()
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        from pocketclaw.agents.loop import AgentLoop
+        from pocketclaw.security.audit import get_audit_logger
+
+        bus = WorkerBus(writer)
+        # Tools and the loop in this process publish through the front link
+        bus_queue._bus = bus
+        # The front owns audit.jsonl; tools may log from threads
+        loop = asyncio.get_running_loop()
+        get_audit_logger().forward_to(
+            lambda entry: loop.call_soon_threadsafe(
+                write_frame, writer, {"type": "audit", "entry": entry}
+            )
+        )
+        agent_loop = AgentLoop()
+        loop_task = asyncio.create_task(agent_loop.start())
+        try:
+            while (frame := await read_frame(reader)) is not None:
+                kind = frame.get("type")
+                if kind == "inbound":
+                    message = InboundMessage.from_dict(frame["message"])
+                    await bus.deliver_inbound(frame["seq"], message)
+                elif kind == "control":
+                    data = apply_control(agent_loop, frame.get("action"))
+                    if "id" in frame:
+                        write_frame(writer, {"type": "reply", "id": frame["id"], "data": data})
+                        await writer.drain()
+        finally:
+            await agent_loop.stop()
+            loop_task.cancel()
+            writer.close()
+            done.set()
+
+    server = await asyncio.start_unix_server(handle, path=socket_path)
+    async with server:
+        await done.wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="PocketPaw agent worker process")
+    parser.add_argument("--socket", required=True, help="Unix socket path to listen on")
+    args = parser.parse_args()
+    logging.basicConfig(
+        level=logging.INFO, format=f"%(asctime)s [worker {Path(args.socket).stem}] %(message)s"
+    )
+    asyncio.run(run_worker(args.socket))
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,7 @@
 
 from pocketclaw.bus.adapters import BaseChannelAdapter, ChannelAdapter
 from pocketclaw.bus.events import Channel, InboundMessage, OutboundMessage, SystemEvent
-from pocketclaw.bus.queue import MessageBus, get_message_bus
+from pocketclaw.bus.queue import InboundRejected, MessageBus, get_message_bus
 
 __all__ = [
     "InboundMessage",
@@ -11,6 +11,7 @@ __all__ = [
     "SystemEvent",
     "Channel",
     "MessageBus",
+    "InboundRejected",
     "get_message_bus",
     "ChannelAdapter",
     "BaseChannelAdapter",
@@ -29,6 +29,9 @@ _EXTRA_PACKAGES: dict[str, str] = {
 def auto_install(extra: str, verify_import: str) -> None:
     """Auto-install an optional dependency if it is missing.
 
+    Blocks for the duration of the install; adapters call it through
+    ``asyncio.to_thread`` so other startup work isn't held up.
+
     Args:
         extra: The pocketpaw extra name (e.g. "discord").
         verify_import: A top-level module to try importing after install (e.g. "discord").
@@ -145,7 +148,8 @@ class BaseChannelAdapter(ABC):
         """Send a message through this channel."""
         ...
 
-    async def _publish_inbound(self, message: InboundMessage) -> None:
-        """Helper to publish inbound messages."""
+    async def _publish_inbound(self, message: InboundMessage) -> bool:
+        """Helper to publish inbound messages. Returns False if the bus shed it."""
         if self._bus:
-            await self._bus.publish_inbound(message)
+            return await self._bus.publish_inbound(message) is not False
+        return False
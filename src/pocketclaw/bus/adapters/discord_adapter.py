@@ -47,7 +47,7 @@ class DiscordAdapter(BaseChannelAdapter):
         except ImportError:
             from pocketclaw.bus.adapters import auto_install
 
-            auto_install("discord", "discord")
+            await asyncio.to_thread(auto_install, "discord", "discord")
             import discord
 
         intents = discord.Intents.default()
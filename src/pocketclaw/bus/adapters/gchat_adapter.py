@@ -74,7 +74,7 @@ class GoogleChatAdapter(BaseChannelAdapter):
         except ImportError:
             from pocketclaw.bus.adapters import auto_install
 
-            auto_install("gchat", "googleapiclient")
+            await asyncio.to_thread(auto_install, "gchat", "googleapiclient")
             from google.oauth2 import service_account
             from googleapiclient.discovery import build
 
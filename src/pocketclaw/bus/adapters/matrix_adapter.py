@@ -59,7 +59,7 @@ class MatrixAdapter(BaseChannelAdapter):
         except ImportError:
             from pocketclaw.bus.adapters import auto_install
 
-            auto_install("matrix", "nio")
+            await asyncio.to_thread(auto_install, "matrix", "nio")
             from nio import AsyncClient, RoomMessageText
 
         self._client = AsyncClient(
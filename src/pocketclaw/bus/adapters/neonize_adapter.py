@@ -76,7 +76,7 @@ class NeonizeAdapter(BaseChannelAdapter):
         except ImportError:
             from pocketclaw.bus.adapters import auto_install
 
-            auto_install("whatsapp-personal", "neonize")
+            await asyncio.to_thread(auto_install, "whatsapp-personal", "neonize")
             from neonize.aioze.client import NewAClient
             from neonize.aioze.events import ConnectedEv, MessageEv
             from neonize.utils.jid import Jid2String
@@ -46,7 +46,7 @@ class SlackAdapter(BaseChannelAdapter):
         except ImportError:
             from pocketclaw.bus.adapters import auto_install
 
-            auto_install("slack", "slack_bolt")
+            await asyncio.to_thread(auto_install, "slack", "slack_bolt")
             from slack_bolt.adapter.socket_mode.async_handler import AsyncSocketModeHandler
             from slack_bolt.async_app import AsyncApp
 
@@ -59,7 +59,7 @@ class TeamsAdapter(BaseChannelAdapter):
         except ImportError:
             from pocketclaw.bus.adapters import auto_install
 
-            auto_install("teams", "botbuilder")
+            await asyncio.to_thread(auto_install, "teams", "botbuilder")
             from botbuilder.core import (
                 BotFrameworkAdapter,
                 BotFrameworkAdapterSettings,
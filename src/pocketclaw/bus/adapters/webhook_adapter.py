@@ -16,6 +16,7 @@ from dataclasses import dataclass
 
 from pocketclaw.bus.adapters import BaseChannelAdapter
 from pocketclaw.bus.events import Channel, InboundMessage, OutboundMessage
+from pocketclaw.bus.queue import InboundRejected
 
 _log = logging.getLogger(__name__)
 
@@ -156,7 +157,9 @@ class WebhookAdapter(BaseChannelAdapter):
             self._pending[request_id] = fut
             self._buffers.pop(request_id, None)
 
-        await self._publish_inbound(msg)
+        if not await self._publish_inbound(msg):
+            self._pending.pop(request_id, None)
+            raise InboundRejected(f"Agent is overloaded — webhook '{slot.name}' not accepted")
 
         if not sync:
             return None
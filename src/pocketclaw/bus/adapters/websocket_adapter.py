@@ -3,30 +3,163 @@ WebSocket channel adapter.
 Created: 2026-02-02
 Changes:
   - 2026-02-05: Fixed system_event format - send flat structure for frontend
+  - 2026-10-19: Topic subscriptions for system events (session keys, task IDs,
+                event types) and a send queue + writer task per connection, so
+                clients only get their own traffic and a slow socket delays
+                nobody else.
+  - 2026-10-19: Bounded send queues with backpressure: queued stream chunks are
+                merged, non-critical events dropped when a queue is full, and a
+                connection lagging past websocket_max_lag_seconds is closed.
+  - 2026-10-19: Chunked binary uploads (see ws_protocol) streamed to disk via
+                MediaUpload; legacy base64 media is decoded off the event loop.
+  - 2026-10-19: send_payload() and switch_chat() so dashboard replies share the
+                connection's queue and writer instead of writing to the socket.
 """
 
+import asyncio
 import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Any
 
 from fastapi import WebSocket
 
 from pocketclaw.bus.adapters import BaseChannelAdapter
+from pocketclaw.bus.adapters.ws_protocol import UploadChunk
 from pocketclaw.bus.events import Channel, InboundMessage, OutboundMessage, SystemEvent
 from pocketclaw.bus.queue import MessageBus
 
 logger = logging.getLogger(__name__)
 
 
+# Subscribing to this session key receives every session's events
+ALL_SESSIONS = "*"
+
+# Close code for connections dropped for lagging ("try again later")
+_SLOW_CLOSE_CODE = 1013
+_CLOSE_TIMEOUT = 5.0
+# Uploads a connection may have open (started, not yet ended) at once
+_MAX_OPEN_UPLOADS = 8
+# Finished uploads kept for a later chat message; the oldest is deleted past this
+_MAX_COMPLETED_UPLOADS = 16
+
+
+def _is_critical(payload: dict[str, Any]) -> bool:
+    """Whether a payload must reach the client (only system events can be shed)."""
+    return payload.get("type") != "system_event" or payload.get("event_type") == "error"
+
+
+def _is_chunk(payload: dict[str, Any]) -> bool:
+    return payload.get("type") == "message" and bool(payload.get("is_stream_chunk"))
+
+
+def _discard_uploads(uploads: list[Any], paths: list[str]) -> None:
+    """Delete partial and unclaimed upload files (runs in a worker thread)."""
+    for upload in uploads:
+        upload.abort()
+    for path in paths:
+        try:
+            Path(path).unlink(missing_ok=True)
+        except OSError as e:
+            logger.debug("Could not delete upload %s: %s", path, e)
+
+
+@dataclass
+class _Connection:
+    """A registered socket, its topic subscriptions and its send queue.
+
+    A connection always receives events for its own session. Events scoped
+    to other sessions need an explicit session subscription (or ``*``);
+    task-scoped events (Mission Control) go to every connection unless it
+    subscribed to specific task IDs; ``event_types``, when set, filters
+    everything.
+    """
+
+    websocket: WebSocket
+    chat_id: str
+    sessions: set[str] = field(default_factory=set)
+    tasks: set[str] = field(default_factory=set)
+    event_types: set[str] = field(default_factory=set)
+    # (enqueued_at, payload), oldest first
+    queue: deque[tuple[float, dict[str, Any]]] = field(default_factory=deque)
+    wakeup: asyncio.Event = field(default_factory=asyncio.Event)
+    idle: asyncio.Event = field(default_factory=asyncio.Event)
+    writer: asyncio.Task | None = None
+    # Enqueue time of the payload being written right now
+    sending_since: float | None = None
+    sent: int = 0
+    merged: int = 0
+    dropped: int = 0
+    # upload_id -> MediaUpload in progress / (name, path) once complete
+    uploads: dict[int, Any] = field(default_factory=dict)
+    completed: dict[int, tuple[str, str]] = field(default_factory=dict)
+
+    def abort_uploads(self) -> None:
+        """Drop uploads in progress and finished ones no message referenced."""
+        uploads = list(self.uploads.values())
+        paths = [path for _, path in self.completed.values()]
+        self.uploads.clear()
+        self.completed.clear()
+        if uploads or paths:
+            asyncio.get_running_loop().run_in_executor(None, _discard_uploads, uploads, paths)
+
+    def lag(self, now: float) -> float:
+        """Age of the oldest payload not yet written to the socket."""
+        oldest = self.sending_since
+        if oldest is None and self.queue:
+            oldest = self.queue[0][0]
+        return now - oldest if oldest is not None else 0.0
+
+    @property
+    def session_key(self) -> str:
+        return f"{Channel.WEBSOCKET.value}:{self.chat_id}"
+
+    def wants(self, event: SystemEvent) -> bool:
+        if self.event_types and event.event_type not in self.event_types:
+            return False
+        # source_key is the chat's own key when session_key is a /new or /resume alias
+        keys = [k for k in (event.data.get("session_key"), event.data.get("source_key")) if k]
+        if keys:
+            return ALL_SESSIONS in self.sessions or any(
+                key == self.session_key or key in self.sessions for key in keys
+            )
+        task_id = event.data.get("task_id")
+        if task_id and self.tasks:
+            return task_id in self.tasks or ALL_SESSIONS in self.tasks
+        return True
+
+    def subscriptions(self) -> dict[str, list[str]]:
+        return {
+            "sessions": sorted({self.session_key} | self.sessions),
+            "tasks": sorted(self.tasks),
+            "event_types": sorted(self.event_types),
+        }
+
+
 class WebSocketAdapter(BaseChannelAdapter):
     """
     WebSocket channel adapter.
 
     Manages multiple WebSocket connections and routes messages appropriately.
+    Every payload goes through the connection's send queue; a writer task per
+    connection drains it, so fan-out never awaits a socket.
+
+    Queues hold at most ``queue_size`` payloads. While a client is behind,
+    consecutive stream chunks are merged into one frame; once its queue is
+    full, non-critical system events are dropped (incoming first, then the
+    oldest queued). A client that is more than ``max_lag`` seconds behind, or
+    whose full queue holds nothing droppable, is disconnected.
     """
 
-    def __init__(self):
+    def __init__(self, queue_size: int = 256, max_lag: float = 30.0):
         super().__init__()
-        self._connections: dict[str, WebSocket] = {}  # chat_id -> WebSocket
+        self.queue_size = queue_size
+        self.max_lag = max_lag
+        self._connections: dict[str, _Connection] = {}  # chat_id -> connection
+        self._closing: set[asyncio.Task] = set()
+        self._disconnected_slow = 0
 
     @property
     def channel(self) -> Channel:
@@ -40,28 +173,176 @@ class WebSocketAdapter(BaseChannelAdapter):
         logger.info("🔌 WebSocket Adapter subscribed to System Events")
 
     async def on_system_event(self, event: SystemEvent) -> None:
-        """Handle system event by broadcasting to all clients."""
+        """Route a system event to the connections subscribed to it."""
         # Send flat structure: {type, event_type, data}
         # Frontend expects event_type and data at top level
         payload = {"type": "system_event", "event_type": event.event_type, "data": event.data}
 
-        # Broadcast to all connected clients
-        for ws in self._connections.values():
-            try:
-                await ws.send_json(payload)
-            except Exception:
-                pass
+        for conn in list(self._connections.values()):
+            if conn.wants(event):
+                self._enqueue(conn, payload)
 
     async def register_connection(self, websocket: WebSocket, chat_id: str) -> None:
         """Register a new WebSocket connection."""
         # Assume connection is already accepted by the handler
-        self._connections[chat_id] = websocket
+        await self.unregister_connection(chat_id, quiet=True)
+        conn = _Connection(websocket=websocket, chat_id=chat_id)
+        conn.idle.set()
+        conn.writer = asyncio.create_task(self._write_loop(conn))
+        self._connections[chat_id] = conn
         logger.info(f"🔌 WebSocket connected: {chat_id}")
 
-    async def unregister_connection(self, chat_id: str) -> None:
+    async def unregister_connection(self, chat_id: str, quiet: bool = False) -> None:
         """Unregister a WebSocket connection."""
-        self._connections.pop(chat_id, None)
-        logger.info(f"🔌 WebSocket disconnected: {chat_id}")
+        conn = self._connections.pop(chat_id, None)
+        if conn is not None:
+            conn.abort_uploads()
+            if conn.writer is not None:
+                conn.writer.cancel()
+            conn.idle.set()
+        if not quiet:
+            logger.info(f"🔌 WebSocket disconnected: {chat_id}")
+
+    async def switch_chat(self, chat_id: str, new_chat_id: str) -> None:
+        """Move a connection to another chat, keeping its send queue and writer.
+
+        Replies already queued for the socket still go out, in order, ahead of
+        anything sent under the new chat id.
+        """
+        if new_chat_id == chat_id:
+            return
+        conn = self._connections.pop(chat_id, None)
+        if conn is None:
+            return
+        await self.unregister_connection(new_chat_id, quiet=True)
+        conn.chat_id = new_chat_id
+        self._connections[new_chat_id] = conn
+        logger.info(f"🔌 WebSocket switched: {chat_id} -> {new_chat_id}")
+
+    def send_payload(self, chat_id: str, payload: dict[str, Any]) -> bool:
+        """Queue a ready-made payload for one client (False if it isn't connected)."""
+        conn = self._connections.get(chat_id)
+        if conn is None:
+            return False
+        self._enqueue(conn, payload)
+        return True
+
+    def update_subscriptions(
+        self, chat_id: str, data: dict[str, Any], subscribe: bool = True
+    ) -> dict[str, list[str]]:
+        """Add or remove topics (``sessions``, ``tasks``, ``event_types`` lists).
+
+        Returns the connection's resulting subscriptions.
+        """
+        conn = self._connections.get(chat_id)
+        if conn is None:
+            return {"sessions": [], "tasks": [], "event_types": []}
+        for name in ("sessions", "tasks", "event_types"):
+            values = data.get(name) or []
+            if isinstance(values, str):
+                values = [values]
+            topics: set[str] = getattr(conn, name)
+            if subscribe:
+                topics.update(str(v) for v in values)
+            else:
+                topics.difference_update(str(v) for v in values)
+        return conn.subscriptions()
+
+    def _enqueue(self, conn: _Connection, payload: dict[str, Any]) -> None:
+        now = time.monotonic()
+        if self.max_lag > 0 and conn.lag(now) > self.max_lag:
+            self._disconnect_slow(conn, f"{conn.lag(now):.0f}s behind")
+            return
+
+        queue = conn.queue
+        if queue and _is_chunk(payload):
+            enqueued_at, last = queue[-1]
+            if _is_chunk(last) and last.get("metadata") == payload.get("metadata"):
+                # Payloads are shared across connections, so merge into a copy
+                queue[-1] = (enqueued_at, {**last, "content": last["content"] + payload["content"]})
+                conn.merged += 1
+                return
+
+        if self.queue_size > 0 and len(queue) >= self.queue_size:
+            if not _is_critical(payload):
+                conn.dropped += 1
+                return
+            victim = next((i for i, (_, p) in enumerate(queue) if not _is_critical(p)), None)
+            if victim is None:
+                self._disconnect_slow(conn, "send queue full")
+                return
+            del queue[victim]
+            conn.dropped += 1
+
+        queue.append((now, payload))
+        conn.idle.clear()
+        conn.wakeup.set()
+
+    def _disconnect_slow(self, conn: _Connection, reason: str) -> None:
+        """Drop a lagging connection and close its socket in the background."""
+        if self._connections.get(conn.chat_id) is conn:
+            del self._connections[conn.chat_id]
+        if conn.writer is not None:
+            conn.writer.cancel()
+        conn.abort_uploads()
+        conn.queue.clear()
+        conn.idle.set()
+        self._disconnected_slow += 1
+        logger.warning("🔌 Disconnecting slow WebSocket client %s (%s)", conn.chat_id, reason)
+        task = asyncio.create_task(self._close_socket(conn.websocket))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    @staticmethod
+    async def _close_socket(websocket: WebSocket) -> None:
+        try:
+            await asyncio.wait_for(
+                websocket.close(code=_SLOW_CLOSE_CODE, reason="Client too slow"),
+                timeout=_CLOSE_TIMEOUT,
+            )
+        except Exception:
+            pass
+
+    async def _write_loop(self, conn: _Connection) -> None:
+        """Drain a connection's send queue onto its socket."""
+        while True:
+            if not conn.queue:
+                conn.idle.set()
+                conn.wakeup.clear()
+                await conn.wakeup.wait()
+                continue
+            conn.sending_since, payload = conn.queue.popleft()
+            try:
+                await conn.websocket.send_json(payload)
+                conn.sent += 1
+            except Exception as e:
+                logger.warning("WebSocket send failed for %s: %s", conn.chat_id, e)
+            finally:
+                conn.sending_since = None
+
+    async def flush(self) -> None:
+        """Wait until every connection's queued payloads have been sent."""
+        await asyncio.gather(*(conn.idle.wait() for conn in list(self._connections.values())))
+
+    def stats(self) -> dict[str, Any]:
+        """Per-connection send queue depth, lag and shed counts."""
+        now = time.monotonic()
+        return {
+            "queue_size": self.queue_size,
+            "max_lag_seconds": self.max_lag,
+            "disconnected_slow": self._disconnected_slow,
+            "connections": [
+                {
+                    "chat_id": conn.chat_id,
+                    "queued": len(conn.queue),
+                    "lag_seconds": round(conn.lag(now), 3),
+                    "sent": conn.sent,
+                    "merged": conn.merged,
+                    "dropped": conn.dropped,
+                }
+                for conn in list(self._connections.values())
+            ],
+        }
 
     async def handle_message(self, chat_id: str, data: dict[str, Any]) -> None:
         """Handle incoming WebSocket message."""
@@ -70,17 +351,25 @@ class WebSocketAdapter(BaseChannelAdapter):
         if action == "chat":
             content = data.get("message", "")
             media_paths: list[str] = []
+            names: list[str] = []
+
+            # Files uploaded beforehand as binary frames
+            conn = self._connections.get(chat_id)
+            for upload_id in data.get("uploads") or []:
+                done = conn.completed.pop(upload_id, None) if conn else None
+                if done is not None:
+                    names.append(done[0])
+                    media_paths.append(done[1])
 
-            # Handle base64-encoded media items
+            # Handle base64-encoded media items (legacy clients)
             media_items = data.get("media", [])
             if media_items:
                 try:
                     import base64
 
-                    from pocketclaw.bus.media import build_media_hint, get_media_downloader
+                    from pocketclaw.bus.media import get_media_downloader
 
                     downloader = get_media_downloader()
-                    names = []
                     for item in media_items:
                         b64_data = item.get("data", "")
                         name = item.get("name", "upload")
@@ -88,16 +377,18 @@ class WebSocketAdapter(BaseChannelAdapter):
                         if not b64_data:
                             continue
                         try:
-                            raw = base64.b64decode(b64_data)
+                            raw = await asyncio.to_thread(base64.b64decode, b64_data)
                             path = await downloader.save_from_bytes(raw, name, mime)
                             media_paths.append(path)
                             names.append(name)
                         except Exception as e:
                             logger.warning("Failed to save WebSocket media: %s", e)
-                    if names:
-                        content += build_media_hint(names)
                 except Exception as e:
                     logger.warning("WebSocket media error: %s", e)
+            if names:
+                from pocketclaw.bus.media import build_media_hint
+
+                content += build_media_hint(names)
 
             message = InboundMessage(
                 channel=Channel.WEBSOCKET,
@@ -109,48 +400,108 @@ class WebSocketAdapter(BaseChannelAdapter):
             )
 
             # Send stream_start to frontend to initialize the response UI
-            ws = self._connections.get(chat_id)
-            if ws:
-                try:
-                    await ws.send_json({"type": "stream_start"})
-                except Exception:
-                    pass
+            conn = self._connections.get(chat_id)
+            if conn:
+                self._enqueue(conn, {"type": "stream_start"})
 
             await self._publish_inbound(message)
+
+        elif action == "upload_start":
+            await self._start_upload(chat_id, data)
+
+        elif action == "upload_end":
+            await self._finish_upload(chat_id, data.get("upload_id"))
         # Other actions (settings, tools) handled separately
 
+    async def _start_upload(self, chat_id: str, data: dict[str, Any]) -> None:
+        conn = self._connections.get(chat_id)
+        if conn is None:
+            return
+        upload_id = data.get("upload_id")
+        if not isinstance(upload_id, int) or upload_id in conn.uploads:
+            self._upload_error(conn, upload_id, "Invalid or duplicate upload_id")
+            return
+        if len(conn.uploads) >= _MAX_OPEN_UPLOADS:
+            self._upload_error(conn, upload_id, "Too many uploads in progress")
+            return
+        from pocketclaw.bus.media import get_media_downloader
+
+        try:
+            upload = await get_media_downloader().open_upload(
+                data.get("name") or "upload", data.get("mime_type")
+            )
+        except Exception as e:
+            self._upload_error(conn, upload_id, str(e))
+            return
+        if conn.uploads.setdefault(upload_id, upload) is not upload:
+            # Another upload_start with this id won the race while the file opened
+            await asyncio.to_thread(upload.abort)
+            self._upload_error(conn, upload_id, "Invalid or duplicate upload_id")
+
+    async def handle_upload_chunk(self, chat_id: str, chunk: UploadChunk) -> None:
+        """Write one binary upload frame to its file."""
+        conn = self._connections.get(chat_id)
+        upload = conn.uploads.get(chunk.upload_id) if conn else None
+        if upload is None:
+            return
+        try:
+            await upload.write(chunk.data)
+        except Exception as e:
+            del conn.uploads[chunk.upload_id]
+            self._upload_error(conn, chunk.upload_id, str(e))
+
+    async def _finish_upload(self, chat_id: str, upload_id: Any) -> None:
+        conn = self._connections.get(chat_id)
+        upload = conn.uploads.pop(upload_id, None) if conn else None
+        if upload is None:
+            return
+        try:
+            path = await upload.finish()
+        except Exception as e:
+            await asyncio.to_thread(upload.abort)
+            self._upload_error(conn, upload_id, str(e))
+            return
+        if len(conn.completed) >= _MAX_COMPLETED_UPLOADS:
+            # Never referenced by a chat message; don't let them pile up
+            _, stale = conn.completed.pop(next(iter(conn.completed)))
+            await asyncio.to_thread(_discard_uploads, [], [stale])
+        conn.completed[upload_id] = (upload.name, path)
+        self._enqueue(
+            conn, {"type": "upload_complete", "upload_id": upload_id, "name": upload.name}
+        )
+
+    def _upload_error(self, conn: _Connection, upload_id: Any, error: str) -> None:
+        logger.warning("WebSocket upload %s failed for %s: %s", upload_id, conn.chat_id, error)
+        self._enqueue(conn, {"type": "upload_error", "upload_id": upload_id, "content": error})
+
     async def send(self, message: OutboundMessage) -> None:
         """Send message to WebSocket client."""
-        ws = self._connections.get(message.chat_id)
-        if not ws:
+        payload = self._payload(message)
+        conn = self._connections.get(message.chat_id)
+        if not conn:
             # Broadcast to all if no specific chat_id
-            for ws in self._connections.values():
-                await self._send_to_socket(ws, message)
+            for conn in list(self._connections.values()):
+                self._enqueue(conn, payload)
         else:
-            await self._send_to_socket(ws, message)
+            self._enqueue(conn, payload)
 
-    async def _send_to_socket(self, ws: WebSocket, message: OutboundMessage) -> None:
-        """Send to a specific WebSocket."""
-        try:
-            if message.is_stream_end:
-                await ws.send_json({"type": "stream_end"})
-                return
-
-            await ws.send_json(
-                {
-                    "type": "message",
-                    "content": message.content,
-                    "is_stream_chunk": message.is_stream_chunk,
-                    "metadata": message.metadata,
-                }
-            )
-        except Exception as e:
-            logger.warning("WebSocket send failed: %s", e)
+    @staticmethod
+    def _payload(message: OutboundMessage) -> dict[str, Any]:
+        """Frontend payload for an outbound message."""
+        if message.is_stream_end:
+            return {"type": "stream_end"}
+        return {
+            "type": "message",
+            "content": message.content,
+            "is_stream_chunk": message.is_stream_chunk,
+            "metadata": message.metadata,
+        }
 
     async def broadcast(self, content: Any, msg_type: str = "notification") -> None:
         """Broadcast to all connected clients."""
-        for ws in self._connections.values():
-            try:
-                await ws.send_json({"type": msg_type, "content": content})
-            except Exception:
-                pass
+        self.broadcast_payload({"type": msg_type, "content": content})
+
+    def broadcast_payload(self, payload: dict[str, Any]) -> None:
+        """Queue a ready-made payload for every connected client."""
+        for conn in list(self._connections.values()):
+            self._enqueue(conn, payload)
@@ -0,0 +1,94 @@
+"""
+Wire protocols for the dashboard WebSocket.
+Created: 2026-10-19
+
+Clients may offer the ``pocketpaw.json`` subprotocol (``Sec-WebSocket-Protocol``);
+plain connections speak the same thing. Control and stream frames are JSON
+text, compressed with permessage-deflate when the client offers it
+(``websocket_compression``).
+
+Files are uploaded as raw binary frames instead of base64 inside JSON, and
+streamed to disk as they arrive::
+
+    → {"action": "upload_start", "upload_id": 1, "name": "a.png", "mime_type": "image/png"}
+    → b"U" + upload_id (uint32, big-endian) + file bytes       (any number of frames)
+    → {"action": "upload_end", "upload_id": 1}
+    ← {"type": "upload_complete", "upload_id": 1, "name": "a.png"}
+    → {"action": "chat", "message": "what's this?", "uploads": [1]}
+"""
+
+import json
+import struct
+from dataclasses import dataclass
+from typing import Any
+
+from fastapi import WebSocket, WebSocketDisconnect
+
+JSON_PROTOCOL = "pocketpaw.json"
+
+FRAME_UPLOAD = b"U"
+_UPLOAD_HEADER = struct.Struct("!I")
+
+
+@dataclass
+class UploadChunk:
+    """A slice of file data from a binary upload frame."""
+
+    upload_id: int
+    data: bytes
+
+
+def choose_protocol(offered: list[str]) -> str | None:
+    """Pick a subprotocol from the client's offer (None = plain, unnamed JSON)."""
+    if JSON_PROTOCOL in offered:
+        return JSON_PROTOCOL
+    return None
+
+
+def encode_upload_chunk(upload_id: int, data: bytes) -> bytes:
+    """Build a binary upload frame (what clients send)."""
+    return FRAME_UPLOAD + _UPLOAD_HEADER.pack(upload_id) + data
+
+
+def decode_frame(message: dict[str, Any]) -> dict[str, Any] | UploadChunk:
+    """Decode an ASGI ``websocket.receive`` message into a control dict or an upload chunk."""
+    text = message.get("text")
+    if text is not None:
+        return json.loads(text)
+    data = message.get("bytes") or b""
+    kind = data[:1]
+    if kind == FRAME_UPLOAD:
+        header_end = 1 + _UPLOAD_HEADER.size
+        if len(data) < header_end:
+            raise ValueError("Truncated upload frame")
+        (upload_id,) = _UPLOAD_HEADER.unpack(data[1:header_end])
+        return UploadChunk(upload_id, data[header_end:])
+    raise ValueError("Unknown binary frame")
+
+
+class WireSocket:
+    """A ``WebSocket`` that also understands binary upload frames.
+
+    ``receive_json`` keeps its usual signature, so handlers written against
+    plain JSON sockets work unchanged; everything else is passed through to
+    the underlying socket.
+    """
+
+    def __init__(self, websocket: WebSocket, protocol: str | None = None) -> None:
+        self._websocket = websocket
+        self.protocol = protocol or JSON_PROTOCOL
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._websocket, name)
+
+    async def receive_frame(self) -> dict[str, Any] | UploadChunk:
+        message = await self._websocket.receive()
+        if message["type"] == "websocket.disconnect":
+            raise WebSocketDisconnect(message.get("code", 1000), message.get("reason"))
+        return decode_frame(message)
+
+    async def receive_json(self) -> Any:
+        frame = await self.receive_frame()
+        if isinstance(frame, UploadChunk):
+            raise ValueError("Expected a control frame, got upload data")
+        return frame
@@ -1,6 +1,9 @@
 """
 Message bus event types.
 Created: 2026-02-02
+Changes:
+  - 2026-10-19: to_dict()/from_dict() for persisting and passing events
+                between processes.
 """
 
 from dataclasses import dataclass, field
@@ -59,6 +62,30 @@ class InboundMessage:
             metadata=self.metadata,
         )
 
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-serializable form (see ``from_dict``)."""
+        return {
+            "channel": self.channel.value,
+            "sender_id": self.sender_id,
+            "chat_id": self.chat_id,
+            "content": self.content,
+            "timestamp": self.timestamp.isoformat(),
+            "media": list(self.media),
+            "metadata": self.metadata,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "InboundMessage":
+        return cls(
+            channel=Channel(data["channel"]),
+            sender_id=data["sender_id"],
+            chat_id=data["chat_id"],
+            content=data["content"],
+            timestamp=datetime.fromisoformat(data["timestamp"]),
+            media=list(data.get("media", [])),
+            metadata=dict(data.get("metadata", {})),
+        )
+
 
 @dataclass
 class OutboundMessage:
@@ -75,6 +102,32 @@ class OutboundMessage:
     is_stream_chunk: bool = False
     is_stream_end: bool = False
 
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-serializable form (see ``from_dict``)."""
+        return {
+            "channel": self.channel.value,
+            "chat_id": self.chat_id,
+            "content": self.content,
+            "reply_to": self.reply_to,
+            "media": list(self.media),
+            "metadata": self.metadata,
+            "is_stream_chunk": self.is_stream_chunk,
+            "is_stream_end": self.is_stream_end,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "OutboundMessage":
+        return cls(
+            channel=Channel(data["channel"]),
+            chat_id=data["chat_id"],
+            content=data["content"],
+            reply_to=data.get("reply_to"),
+            media=list(data.get("media", [])),
+            metadata=dict(data.get("metadata", {})),
+            is_stream_chunk=data.get("is_stream_chunk", False),
+            is_stream_end=data.get("is_stream_end", False),
+        )
+
 
 @dataclass
 class SystemEvent:
@@ -83,3 +136,19 @@ class SystemEvent:
     event_type: str  # "tool_start", "tool_end", "error", "agent_start", "agent_end"
     data: dict[str, Any] = field(default_factory=dict)
     timestamp: datetime = field(default_factory=datetime.now)
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-serializable form (see ``from_dict``)."""
+        return {
+            "event_type": self.event_type,
+            "data": self.data,
+            "timestamp": self.timestamp.isoformat(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "SystemEvent":
+        return cls(
+            event_type=data["event_type"],
+            data=dict(data.get("data", {})),
+            timestamp=datetime.fromisoformat(data["timestamp"]),
+        )
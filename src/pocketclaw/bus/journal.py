@@ -0,0 +1,212 @@
+"""Durable inbound journal for the message bus.
+
+Created: 2026-10-19
+
+With ``inbound_journal_enabled`` on, every accepted inbound message is
+appended to an on-disk journal before it enters the in-memory queue, and an
+ack record is appended once the agent loop has finished processing it (or
+the turn failed with an error, which a replay would only repeat). The
+journal id travels with the message in ``metadata["journal_id"]``.
+Messages that were accepted from Telegram, webhooks etc. but not yet
+processed when the process died are replayed into the queue on the next
+start (at-least-once delivery).
+
+Layout: append-only JSON-lines segment files (``00000001.jsonl``, ...) under
+``~/.pocketclaw/inbound_journal/``. Each line is either
+``{"op": "msg", "id": ..., "message": {...}}`` or ``{"op": "ack", "id": ...}``.
+A new segment starts when the active one passes ``segment_bytes``; the
+oldest segments are deleted once every message in them is acked (in order,
+so an ack record is never deleted before the message it refers to).
+
+Writes use group commit: records queued within ``commit_ms`` are written
+and fsynced together in a worker thread, and ``append()`` returns only once
+its record is durable. Acks don't wait — a lost ack just means a duplicate
+replay, never a lost message.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import uuid
+from collections import Counter
+from pathlib import Path
+from typing import IO
+
+from pocketclaw.bus.events import InboundMessage
+from pocketclaw.config import get_config_dir
+
+logger = logging.getLogger(__name__)
+
+# InboundMessage.metadata key holding the message's journal id
+JOURNAL_ID_KEY = "journal_id"
+
+
+def get_journal_dir() -> Path:
+    """Return the inbound journal directory, creating it if needed."""
+    path = get_config_dir() / "inbound_journal"
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+class InboundJournal:
+    """Append-only, segmented, group-committed journal of inbound messages.
+
+    Args:
+        root: Directory holding the segment files.
+        commit_ms: How long a commit waits to batch concurrent appends.
+        segment_bytes: Size after which a new segment file is started.
+    """
+
+    def __init__(
+        self, root: Path | None = None, commit_ms: int = 5, segment_bytes: int = 4 * 1024 * 1024
+    ) -> None:
+        self.root = root or get_journal_dir()
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.commit_ms = commit_ms
+        self.segment_bytes = segment_bytes
+        # Unacked message id -> segment it was written to, and count per segment
+        self._segment_of: dict[str, int] = {}
+        self._unacked_in: Counter[int] = Counter()
+        self._recovered: list[tuple[str, InboundMessage]] = []
+        self._queued: list[tuple[str, asyncio.Future | None]] = []
+        self._flusher: asyncio.Task | None = None
+        self._file: IO[str] | None = None
+        self._segment = 0
+        self._recover()
+
+    # -- Recovery ---------------------------------------------------------
+
+    def _segments(self) -> list[int]:
+        numbers = []
+        for path in self.root.glob("*.jsonl"):
+            try:
+                numbers.append(int(path.stem))
+            except ValueError:
+                continue
+        return sorted(numbers)
+
+    def _path(self, segment: int) -> Path:
+        return self.root / f"{segment:08d}.jsonl"
+
+    def _recover(self) -> None:
+        """Load unacked messages left by a previous run."""
+        pending: dict[str, tuple[int, InboundMessage]] = {}
+        segments = self._segments()
+        for segment in segments:
+            with self._path(segment).open(encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                        if record["op"] == "msg":
+                            message = InboundMessage.from_dict(record["message"])
+                            pending[record["id"]] = (segment, message)
+                        elif record["op"] == "ack":
+                            pending.pop(record["id"], None)
+                    except (ValueError, KeyError, TypeError):
+                        # Torn final write from a crash — everything before it is intact
+                        logger.warning("Skipping unreadable journal record in %s", segment)
+        for message_id, (segment, message) in pending.items():
+            self._segment_of[message_id] = segment
+            self._unacked_in[segment] += 1
+            self._recovered.append((message_id, message))
+        # Never append to a segment that may end in a torn line
+        self._segment = (segments[-1] if segments else 0) + 1
+        self._prune(segments)
+        if self._recovered:
+            logger.info(
+                "Inbound journal: %d unprocessed message(s) to replay", len(self._recovered)
+            )
+
+    def recovered(self) -> list[tuple[str, InboundMessage]]:
+        """Unacked messages from the previous run (returned once)."""
+        recovered, self._recovered = self._recovered, []
+        return recovered
+
+    # -- Writing ----------------------------------------------------------
+
+    async def append(self, message: InboundMessage) -> str:
+        """Durably record a message; returns its journal id."""
+        message_id = uuid.uuid4().hex
+        record = {"op": "msg", "id": message_id, "message": message.to_dict()}
+        future = asyncio.get_running_loop().create_future()
+        self._enqueue(json.dumps(record, default=str), future)
+        await future
+        return message_id
+
+    def ack(self, message_id: str) -> None:
+        """Mark a message processed (written with the next commit)."""
+        segment = self._segment_of.pop(message_id, None)
+        if segment is None:
+            return
+        self._unacked_in[segment] -= 1
+        if self._unacked_in[segment] <= 0:
+            del self._unacked_in[segment]
+        self._enqueue(json.dumps({"op": "ack", "id": message_id}), None)
+
+    def _enqueue(self, line: str, future: asyncio.Future | None) -> None:
+        self._queued.append((line, future))
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.ensure_future(self._flush_loop())
+
+    async def _flush_loop(self) -> None:
+        while self._queued:
+            # Let concurrent publishers join this commit
+            await asyncio.sleep(self.commit_ms / 1000)
+            batch, self._queued = self._queued, []
+            try:
+                segment = await asyncio.to_thread(self._write, [line for line, _ in batch])
+            except Exception as e:
+                logger.error("Inbound journal write failed: %s", e)
+                for _, future in batch:
+                    if future is not None and not future.done():
+                        future.set_exception(e)
+                continue
+            for line, future in batch:
+                if future is not None:
+                    message_id = json.loads(line)["id"]
+                    self._segment_of[message_id] = segment
+                    self._unacked_in[segment] += 1
+                    if not future.done():
+                        future.set_result(None)
+            self._prune(self._segments())
+
+    def _write(self, lines: list[str]) -> int:
+        """Write and fsync a batch (worker thread); returns the segment used."""
+        if self._file is None:
+            self._file = self._path(self._segment).open("a", encoding="utf-8")
+        segment = self._segment
+        self._file.write("".join(line + "\n" for line in lines))
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        if self._file.tell() >= self.segment_bytes:
+            self._file.close()
+            self._file = None
+            self._segment += 1
+        return segment
+
+    def _prune(self, segments: list[int]) -> None:
+        """Delete the oldest fully-acked segments, stopping at the first live one."""
+        for segment in segments:
+            if segment >= self._segment or self._unacked_in.get(segment):
+                break
+            try:
+                self._path(segment).unlink()
+            except OSError:
+                break
+
+    async def flush(self) -> None:
+        """Wait for everything queued so far to be written."""
+        while self._flusher is not None and not self._flusher.done():
+            await asyncio.shield(self._flusher)
+
+    async def close(self) -> None:
+        await self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def pending_count(self) -> int:
+        return len(self._segment_of)
@@ -2,8 +2,14 @@
 
 Downloads incoming media (images, documents, audio, video) to local disk
 and returns file paths for populating InboundMessage.media.
+
+Changes:
+  - 2026-10-19: MediaUpload / MediaDownloader.open_upload() for files that
+                arrive in chunks (dashboard binary WebSocket uploads), written
+                to disk off the event loop as they arrive.
 """
 
+import asyncio
 import hashlib
 import logging
 import mimetypes
@@ -64,6 +70,48 @@ def build_media_hint(filenames: list[str]) -> str:
     return f"\n[Attached: {names}]"
 
 
+def _max_bytes() -> int:
+    """Configured media size limit in bytes (0 = unlimited)."""
+    return max(get_settings().media_max_file_size_mb, 0) * 1024 * 1024
+
+
+def _too_large(name: str, size: int) -> ValueError:
+    max_mb = get_settings().media_max_file_size_mb
+    return ValueError(f"File '{name}' ({size / 1024 / 1024:.1f} MB) exceeds limit of {max_mb} MB")
+
+
+class MediaUpload:
+    """A file being received in chunks, streamed straight to disk.
+
+    Call ``write()`` per chunk, then ``finish()`` for the saved path, or
+    ``abort()`` to discard the partial file.
+    """
+
+    def __init__(self, name: str, mime: str | None = None) -> None:
+        self.name = name
+        self.path = get_media_dir() / _unique_filename(name, mime)
+        self.size = 0
+        self._max_bytes = _max_bytes()
+        self._file = self.path.open("wb")
+
+    async def write(self, data: bytes) -> None:
+        """Append a chunk; raises ValueError (and discards the file) past the size limit."""
+        self.size += len(data)
+        if self._max_bytes and self.size > self._max_bytes:
+            await asyncio.to_thread(self.abort)
+            raise _too_large(self.name, self.size)
+        await asyncio.to_thread(self._file.write, data)
+
+    async def finish(self) -> str:
+        await asyncio.to_thread(self._file.close)
+        logger.info("Saved media upload: %s (%d bytes)", self.path, self.size)
+        return str(self.path)
+
+    def abort(self) -> None:
+        self._file.close()
+        self.path.unlink(missing_ok=True)
+
+
 class MediaDownloader:
     """Downloads and saves media files from channel messages."""
 
@@ -77,12 +125,9 @@ class MediaDownloader:
 
     def _check_size(self, data: bytes, name: str) -> None:
         """Raise ValueError if data exceeds configured max size."""
-        settings = get_settings()
-        max_mb = settings.media_max_file_size_mb
-        if max_mb > 0 and len(data) > max_mb * 1024 * 1024:
-            raise ValueError(
-                f"File '{name}' ({len(data) / 1024 / 1024:.1f} MB) exceeds limit of {max_mb} MB"
-            )
+        max_bytes = _max_bytes()
+        if max_bytes and len(data) > max_bytes:
+            raise _too_large(name, len(data))
 
     async def save_from_bytes(self, data: bytes, name: str, mime: str | None = None) -> str:
         """Save raw bytes to disk and return the file path.
@@ -96,6 +141,13 @@ class MediaDownloader:
         logger.info("Saved media: %s (%d bytes)", dest, len(data))
         return str(dest)
 
+    async def open_upload(self, name: str, mime: str | None = None) -> MediaUpload:
+        """Start a chunked upload into the media directory.
+
+        Used by adapters that receive file content in pieces (dashboard WebSocket).
+        """
+        return await asyncio.to_thread(MediaUpload, name, mime)
+
     async def download_url(
         self,
         url: str,
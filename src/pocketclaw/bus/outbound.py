@@ -0,0 +1,180 @@
+"""Per-subscriber outbound queues for the message bus.
+
+Created: 2026-10-19
+
+Each outbound subscriber (channel adapter ``send`` callback) gets its own
+bounded queue drained by a dedicated worker task, so a slow adapter — a hung
+Slack API call, a congested Matrix homeserver — only delays its own channel
+and the agent's streaming loop never waits on it. When a queue is full the
+overflow policy decides what happens:
+
+- ``block``: the publisher waits for space (backpressure, nothing lost).
+- ``drop_oldest_chunk``: the oldest queued stream chunk is discarded.
+- ``collapse``: queued stream chunks for the same chat are merged into one,
+  so the text still arrives, just in fewer, larger messages.
+
+If nothing can be dropped or collapsed (the queue holds only non-chunk
+messages) the publisher waits, whatever the policy.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import logging
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+
+from pocketclaw.bus.events import Channel, OutboundMessage
+
+logger = logging.getLogger(__name__)
+
+OVERFLOW_POLICIES = ("block", "drop_oldest_chunk", "collapse")
+
+
+def _mergeable(message: OutboundMessage) -> bool:
+    return message.is_stream_chunk and not message.media
+
+
+class SubscriberQueue:
+    """Bounded delivery queue and worker for one outbound subscriber."""
+
+    def __init__(
+        self,
+        channel: Channel,
+        callback: Callable[[OutboundMessage], Awaitable[None]],
+        maxsize: int = 256,
+        policy: str = "block",
+    ) -> None:
+        if policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy {policy!r}; use one of {OVERFLOW_POLICIES}")
+        self.channel = channel
+        self.callback = callback
+        self.maxsize = max(1, maxsize)
+        self.policy = policy
+        self._items: deque[tuple[float, OutboundMessage]] = deque()
+        self._not_empty = asyncio.Event()
+        self._not_full = asyncio.Event()
+        self._not_full.set()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._worker: asyncio.Task | None = None
+        # Metrics
+        self._delivered = 0
+        self._dropped = 0
+        self._collapsed = 0
+        self._errors = 0
+        self._max_depth = 0
+        self._total_lag = 0.0
+        self._max_lag = 0.0
+
+    @property
+    def name(self) -> str:
+        return getattr(self.callback, "__qualname__", None) or repr(self.callback)
+
+    def qsize(self) -> int:
+        return len(self._items)
+
+    async def put(self, message: OutboundMessage) -> None:
+        """Queue a message for delivery, applying the overflow policy when full."""
+        while len(self._items) >= self.maxsize:
+            if self.policy == "drop_oldest_chunk" and self._drop_oldest_chunk():
+                break
+            if self.policy == "collapse" and self._collapse():
+                break
+            self._not_full.clear()
+            await self._not_full.wait()
+        self._items.append((time.monotonic(), message))
+        self._max_depth = max(self._max_depth, len(self._items))
+        self._idle.clear()
+        self._not_empty.set()
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.ensure_future(self._run())
+
+    def _drop_oldest_chunk(self) -> bool:
+        for i, (_, queued) in enumerate(self._items):
+            if queued.is_stream_chunk:
+                del self._items[i]
+                self._dropped += 1
+                return True
+        return False
+
+    def _collapse(self) -> bool:
+        """Merge runs of queued stream chunks per chat; True if anything was freed."""
+        merged: deque[tuple[float, OutboundMessage]] = deque()
+        heads: dict[str, OutboundMessage] = {}
+        for enqueued_at, queued in self._items:
+            head = heads.get(queued.chat_id)
+            if _mergeable(queued):
+                if head is not None and head.metadata == queued.metadata:
+                    head.content += queued.content
+                    continue
+                # Copy — the same message object is shared with other subscribers
+                head = dataclasses.replace(queued, metadata=dict(queued.metadata))
+                heads[queued.chat_id] = head
+                merged.append((enqueued_at, head))
+            else:
+                heads.pop(queued.chat_id, None)
+                merged.append((enqueued_at, queued))
+        freed = len(self._items) - len(merged)
+        self._items = merged
+        self._collapsed += freed
+        return freed > 0
+
+    async def _run(self) -> None:
+        while True:
+            if not self._items:
+                self._not_empty.clear()
+                self._idle.set()
+                await self._not_empty.wait()
+                continue
+            enqueued_at, message = self._items.popleft()
+            self._not_full.set()
+            try:
+                await self.callback(message)
+            except Exception as e:
+                self._errors += 1
+                logger.error("Outbound subscriber %s for %s failed: %s", self.name, self.channel, e)
+            lag = time.monotonic() - enqueued_at
+            self._delivered += 1
+            self._total_lag += lag
+            self._max_lag = max(self._max_lag, lag)
+
+    async def join(self) -> None:
+        """Wait until everything queued so far has been delivered."""
+        await self._idle.wait()
+
+    def clear(self) -> None:
+        self._items.clear()
+        self._not_full.set()
+
+    def close(self) -> None:
+        """Stop the worker; undelivered messages are discarded."""
+        self.clear()
+        if self._worker is not None:
+            self._worker.cancel()
+            self._worker = None
+        self._idle.set()
+
+    def stats(self) -> dict:
+        """Queue depth, delivery lag and overflow counters."""
+        oldest = self._items[0][0] if self._items else None
+        return {
+            "subscriber": self.name,
+            "queued": len(self._items),
+            "max_queued": self._max_depth,
+            "max_size": self.maxsize,
+            "policy": self.policy,
+            "delivered": self._delivered,
+            "dropped": self._dropped,
+            "collapsed": self._collapsed,
+            "errors": self._errors,
+            "avg_lag_ms": (
+                round(self._total_lag / self._delivered * 1000, 1) if self._delivered else 0.0
+            ),
+            "max_lag_ms": round(self._max_lag * 1000, 1),
+            "oldest_queued_ms": (
+                round((time.monotonic() - oldest) * 1000, 1) if oldest is not None else 0.0
+            ),
+        }
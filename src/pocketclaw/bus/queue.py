@@ -1,16 +1,150 @@
 """
 Message bus for unified message routing.
 Created: 2026-02-02
+Changes:
+  - 2026-10-19: Inbound admission control — when the estimated wait (backlog
+                × recent turn latency, where the backlog includes turns queued
+                and running in the agent's scheduler) passes
+                inbound_shed_wait_seconds, low-priority sources are dropped and
+                interactive senders get a "busy, position N" reply instead of
+                silently stalling.
+  - 2026-10-19: Inbound is a multi-lane priority queue (interactive > system >
+                bulk) with per-lane bounds and aging, instead of one FIFO.
+  - 2026-10-19: Outbound stream chunks for the same chat are coalesced within
+                a short window (or up to N bytes) and flushed on stream end.
+  - 2026-10-19: Optional per-subscriber bounded outbound queues with worker
+                tasks and an overflow policy, so a slow adapter can't stall
+                the agent; broadcast_outbound fans out concurrently.
+  - 2026-10-19: Optional durable inbound journal — accepted messages are
+                written to disk, acked once processed and replayed on start.
 """
 
 import asyncio
 import logging
+import time
+from collections import deque
 from collections.abc import Awaitable, Callable
+from typing import Any
 
 from pocketclaw.bus.events import Channel, InboundMessage, OutboundMessage, SystemEvent
+from pocketclaw.bus.journal import JOURNAL_ID_KEY, InboundJournal
+from pocketclaw.bus.outbound import SubscriberQueue
 
 logger = logging.getLogger(__name__)
 
+# Weight of the newest sample in the turn latency moving average
+_LATENCY_ALPHA = 0.2
+
+
+class InboundRejected(Exception):
+    """Raised by callers that need to surface a shed inbound message (e.g. as HTTP 503)."""
+
+
+# Inbound lanes, highest priority first
+LANES = ("interactive", "system", "bulk")
+
+
+class PriorityInboundQueue:
+    """Bounded inbound queue with one FIFO lane per priority class.
+
+    ``get()`` serves the highest-priority non-empty lane, except that a
+    lane's head message older than ``aging_seconds`` is served first (oldest
+    such head wins), so a steady stream of chat traffic can't starve system
+    or bulk messages forever. Each lane has its own bound; ``put()`` blocks
+    only while *its* lane is full.
+    """
+
+    def __init__(self, maxsize: int = 1000, *, lane_sizes=None, aging_seconds: float = 30.0):
+        lane_sizes = lane_sizes or {}
+        self.lane_sizes = {lane: int(lane_sizes.get(lane, maxsize)) for lane in LANES}
+        self.aging_seconds = aging_seconds
+        self._lanes: dict[str, deque[tuple[float, InboundMessage]]] = {
+            lane: deque() for lane in LANES
+        }
+        self._cond = asyncio.Condition()
+        self._wakeups: set[asyncio.Task] = set()
+
+    @property
+    def maxsize(self) -> int:
+        return sum(self.lane_sizes.values())
+
+    def qsize(self, lane: str | None = None) -> int:
+        if lane is not None:
+            return len(self._lanes[lane])
+        return sum(len(q) for q in self._lanes.values())
+
+    def ahead_of(self, lane: str) -> int:
+        """Messages that would be served before a new message in ``lane``."""
+        return sum(len(self._lanes[name]) for name in LANES[: LANES.index(lane) + 1])
+
+    def empty(self) -> bool:
+        return self.qsize() == 0
+
+    def full(self, lane: str) -> bool:
+        size = self.lane_sizes[lane]
+        return size > 0 and len(self._lanes[lane]) >= size
+
+    async def put(self, item: InboundMessage, lane: str) -> None:
+        async with self._cond:
+            await self._cond.wait_for(lambda: not self.full(lane))
+            self._lanes[lane].append((time.monotonic(), item))
+            self._cond.notify_all()
+
+    def put_nowait(self, item: InboundMessage, lane: str) -> None:
+        """Append even past the lane's bound (for senders already told to wait)."""
+        self._lanes[lane].append((time.monotonic(), item))
+        self._wake_waiters()
+
+    async def get(self) -> InboundMessage:
+        async with self._cond:
+            await self._cond.wait_for(lambda: not self.empty())
+            item = self._pop()
+            self._cond.notify_all()
+            return item
+
+    def get_nowait(self) -> InboundMessage:
+        if self.empty():
+            raise asyncio.QueueEmpty
+        item = self._pop()
+        self._wake_waiters()
+        return item
+
+    def _wake_waiters(self) -> None:
+        """Notify blocked ``put()`` calls after a synchronous removal.
+
+        Sync callers can't hold the condition's lock, so the notify runs in a
+        task; waiters re-check their predicate, so an extra wakeup is harmless.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        task = loop.create_task(self._notify_all())
+        self._wakeups.add(task)
+        task.add_done_callback(self._wakeups.discard)
+
+    async def _notify_all(self) -> None:
+        async with self._cond:
+            self._cond.notify_all()
+
+    def _pop(self) -> InboundMessage:
+        now = time.monotonic()
+        aged = [
+            (q[0][0], lane)
+            for lane, q in self._lanes.items()
+            if q and now - q[0][0] >= self.aging_seconds
+        ]
+        if aged:
+            lane = min(aged)[1]
+        else:
+            lane = next(lane for lane in LANES if self._lanes[lane])
+        return self._lanes[lane].popleft()[1]
+
+    def clear(self) -> None:
+        for q in self._lanes.values():
+            q.clear()
+        self._wake_waiters()
+
 
 class MessageBus:
     """
@@ -35,33 +169,224 @@ class MessageBus:
         msg = await bus.consume_inbound()
     """
 
-    def __init__(self, max_queue_size: int = 1000):
-        self._inbound: asyncio.Queue[InboundMessage] = asyncio.Queue(maxsize=max_queue_size)
+    def __init__(
+        self,
+        max_queue_size: int = 1000,
+        *,
+        shed_wait_seconds: float = 0.0,
+        low_priority_channels: list[str] | None = None,
+        workers: int = 1,
+        lane_sizes: dict[str, int] | None = None,
+        bulk_channels: list[str] | None = None,
+        aging_seconds: float = 30.0,
+        coalesce_window_ms: int = 0,
+        coalesce_max_bytes: int = 2048,
+        subscriber_queue_size: int = 0,
+        overflow_policy: str = "block",
+        journal: InboundJournal | None = None,
+    ):
+        self._inbound = PriorityInboundQueue(
+            max_queue_size, lane_sizes=lane_sizes, aging_seconds=aging_seconds
+        )
+        self.bulk_channels = set(
+            bulk_channels if bulk_channels is not None else (Channel.WEBHOOK.value,)
+        )
+        # Admission control: 0 disables wait-based shedding (a full queue still
+        # drops low-priority messages instead of blocking their adapter)
+        self.shed_wait_seconds = shed_wait_seconds
+        self.low_priority_channels = set(
+            low_priority_channels
+            if low_priority_channels is not None
+            else (Channel.WEBHOOK.value, Channel.SYSTEM.value)
+        )
+        self.workers = max(1, workers)
+        # Agent-side backlog (see track_backlog); messages leave this queue
+        # as soon as the agent consumes them, so its depth alone says little
+        self._backlog: Callable[[], dict[str, Any]] | None = None
+        self._turn_latency: float | None = None
+        self._busy_notified: set[str] = set()
+        self._shed = 0
+        self._busy_replies = 0
+        # Durable journal (optional); ids travel in message.metadata
+        self._journal = journal
         self._outbound_subscribers: dict[
             Channel, list[Callable[[OutboundMessage], Awaitable[None]]]
         ] = {}
         self._system_subscribers: list[Callable[[SystemEvent], Awaitable[None]]] = []
+        # Outbound stream-chunk coalescing, keyed by (channel, chat_id)
+        self.coalesce_window_ms = coalesce_window_ms
+        self.coalesce_max_bytes = coalesce_max_bytes
+        self._chunk_buffers: dict[tuple[Channel, str], OutboundMessage] = {}
+        self._chunk_timers: dict[tuple[Channel, str], asyncio.TimerHandle] = {}
+        self._chunk_locks: dict[tuple[Channel, str], asyncio.Lock] = {}
+        self._flush_tasks: set[asyncio.Task] = set()
+        # Per-subscriber delivery queues (0 = await subscribers inline)
+        self.subscriber_queue_size = subscriber_queue_size
+        self.overflow_policy = overflow_policy
+        self._outbound_queues: dict[Channel, list[SubscriberQueue]] = {}
 
     # =========================================================================
     # Inbound (Channel → Agent)
     # =========================================================================
 
-    async def publish_inbound(self, message: InboundMessage) -> None:
-        """Publish a message from a channel adapter."""
+    async def publish_inbound(self, message: InboundMessage) -> bool:
+        """Publish a message from a channel adapter.
+
+        Returns:
+            False if the message was shed under overload, True otherwise.
+        """
         logger.debug(f"📥 Inbound: {message.channel.value}:{message.sender_id[:8]}...")
-        await self._inbound.put(message)
+        lane = self.lane_for(message)
+        low_priority = message.channel.value in self.low_priority_channels
+        overloaded = self._inbound.full(lane) or (
+            self.shed_wait_seconds > 0 and self.estimated_wait(lane) > self.shed_wait_seconds
+        )
+        if overloaded:
+            if low_priority:
+                self._shed += 1
+                logger.warning(
+                    "Inbound overloaded (%d pending) — dropped %s message",
+                    self._inbound.qsize(),
+                    message.channel.value,
+                )
+                return False
+            await self._notify_busy(message, lane)
+        if self._journal is not None:
+            message.metadata[JOURNAL_ID_KEY] = await self._journal.append(message)
+        if overloaded and lane == "interactive":
+            # The chat user has been told to wait; don't stall their adapter as well
+            self._inbound.put_nowait(message, lane)
+        else:
+            await self._inbound.put(message, lane)
+        return True
+
+    def ack_inbound(self, *messages: InboundMessage) -> None:
+        """Mark consumed messages as processed so they aren't replayed on restart."""
+        for message in messages:
+            # Its turn is over; the session may be told about the next wait
+            self._busy_notified.discard(message.session_key)
+        if self._journal is None:
+            return
+        for message in messages:
+            journal_id = message.metadata.get(JOURNAL_ID_KEY)
+            if journal_id is not None:
+                self._journal.ack(journal_id)
+
+    async def replay_inbound(self) -> int:
+        """Re-queue messages journaled by a previous run but never acked."""
+        if self._journal is None:
+            return 0
+        recovered = self._journal.recovered()
+        for journal_id, message in recovered:
+            message.metadata[JOURNAL_ID_KEY] = journal_id
+            await self._inbound.put(message, self.lane_for(message))
+        return len(recovered)
+
+    async def flush_journal(self) -> None:
+        """Write out pending journal records (call on shutdown)."""
+        if self._journal is not None:
+            await self._journal.close()
+
+    def lane_for(self, message: InboundMessage) -> str:
+        """Priority lane for an inbound message: interactive, system or bulk."""
+        if message.channel == Channel.SYSTEM:
+            return "system"
+        if message.channel.value in self.bulk_channels:
+            return "bulk"
+        return "interactive"
 
     async def consume_inbound(self, timeout: float = 1.0) -> InboundMessage | None:
         """Consume the next inbound message (used by agent loop)."""
         try:
-            return await asyncio.wait_for(self._inbound.get(), timeout=timeout)
+            message = await asyncio.wait_for(self._inbound.get(), timeout=timeout)
         except TimeoutError:
             return None
+        return message
 
     def inbound_pending(self) -> int:
         """Number of pending inbound messages."""
         return self._inbound.qsize()
 
+    def record_turn_latency(self, seconds: float) -> None:
+        """Feed a completed agent turn's duration into the wait estimate."""
+        if self._turn_latency is None:
+            self._turn_latency = seconds
+        else:
+            self._turn_latency += _LATENCY_ALPHA * (seconds - self._turn_latency)
+
+    def track_backlog(self, source: Callable[[], dict[str, Any]] | None) -> None:
+        """Read the agent's backlog for admission control from ``source``.
+
+        ``source`` returns ``FairScheduler.stats()``-shaped counts (``queued``,
+        ``active``, ``capacity``). The consumer (AgentLoop, WorkerPool) sets it
+        on start; without one only this queue's depth and ``workers`` are used.
+        """
+        self._backlog = source
+
+    def _agent_backlog(self) -> tuple[int, int, int]:
+        """(turns queued, turns running, slots) on the agent side."""
+        if self._backlog is None:
+            return 0, 0, self.workers
+        stats = self._backlog()
+        return stats.get("queued", 0), stats.get("active", 0), max(1, stats.get("capacity", 1))
+
+    def queue_position(self, lane: str = LANES[-1]) -> int:
+        """Messages and turns that would start before a new message in ``lane``."""
+        queued, _, _ = self._agent_backlog()
+        return self._inbound.ahead_of(lane) + queued
+
+    def estimated_wait(self, lane: str = LANES[-1]) -> float:
+        """Seconds a new message in ``lane`` is expected to wait before its turn starts."""
+        if self._turn_latency is None:
+            return 0.0
+        queued, active, slots = self._agent_backlog()
+        ahead = self._inbound.ahead_of(lane) + queued
+        if active >= slots:
+            ahead += 1  # every slot is busy: wait for one to free up as well
+        return ahead * self._turn_latency / slots
+
+    def inbound_stats(self) -> dict:
+        """Queue depth, wait estimate and shedding counters."""
+        return {
+            "pending": self._inbound.qsize(),
+            "max_size": self._inbound.maxsize,
+            "lanes": {
+                lane: {"pending": self._inbound.qsize(lane), "max_size": size}
+                for lane, size in self._inbound.lane_sizes.items()
+            },
+            "agent_queued": self._agent_backlog()[0],
+            "agent_active": self._agent_backlog()[1],
+            "estimated_wait_seconds": round(self.estimated_wait(), 1),
+            "avg_turn_seconds": (
+                round(self._turn_latency, 2) if self._turn_latency is not None else None
+            ),
+            "shed": self._shed,
+            "journal_unacked": (
+                self._journal.pending_count() if self._journal is not None else None
+            ),
+            "busy_replies": self._busy_replies,
+        }
+
+    async def _notify_busy(self, message: InboundMessage, lane: str) -> None:
+        """Tell an interactive sender where they are in line (once per wait)."""
+        if message.session_key in self._busy_notified:
+            return
+        self._busy_notified.add(message.session_key)
+        self._busy_replies += 1
+        position = self.queue_position(lane) + 1
+        minutes = max(1, round(self.estimated_wait(lane) / 60))
+        await self.publish_outbound(
+            OutboundMessage(
+                channel=message.channel,
+                chat_id=message.chat_id,
+                content=(
+                    f"I'm busy right now — you're #{position} in line "
+                    f"(about {minutes} min). I'll get to your message as soon as I can."
+                ),
+                metadata={"busy": True, "queue_position": position},
+            )
+        )
+
     # =========================================================================
     # Outbound (Agent → Channel)
     # =========================================================================
@@ -73,6 +398,10 @@ class MessageBus:
         if channel not in self._outbound_subscribers:
             self._outbound_subscribers[channel] = []
         self._outbound_subscribers[channel].append(callback)
+        if self.subscriber_queue_size > 0:
+            self._outbound_queues.setdefault(channel, []).append(
+                SubscriberQueue(channel, callback, self.subscriber_queue_size, self.overflow_policy)
+            )
         logger.info(f"📡 Subscribed to {channel.value} outbound")
 
     def unsubscribe_outbound(
@@ -84,15 +413,95 @@ class MessageBus:
                 self._outbound_subscribers[channel].remove(callback)
             except ValueError:
                 pass
+        queues = self._outbound_queues.get(channel, [])
+        for queue in queues:
+            if queue.callback == callback:
+                queue.close()
+                queues.remove(queue)
+                break
 
     async def publish_outbound(self, message: OutboundMessage) -> None:
-        """Publish a message to channel subscribers."""
+        """Publish a message to channel subscribers.
+
+        With ``coalesce_window_ms`` set, consecutive stream chunks for the same
+        chat are merged and delivered once the window elapses or the merged
+        text reaches ``coalesce_max_bytes``. Any other message for that chat
+        (notably the stream end) first flushes what is buffered, so ordering
+        is preserved.
+        """
+        if self.coalesce_window_ms <= 0:
+            await self._deliver(message)
+            return
+
+        key = (message.channel, message.chat_id)
+        if message.is_stream_chunk and not message.media:
+            pending = self._chunk_buffers.get(key)
+            if pending is not None and pending.metadata != message.metadata:
+                await self._flush_chunks(key)
+                pending = self._chunk_buffers.get(key)
+            if pending is None:
+                pending = OutboundMessage(
+                    channel=message.channel,
+                    chat_id=message.chat_id,
+                    content=message.content,
+                    reply_to=message.reply_to,
+                    metadata=dict(message.metadata),
+                    is_stream_chunk=True,
+                )
+                self._chunk_buffers[key] = pending
+                self._chunk_timers[key] = asyncio.get_running_loop().call_later(
+                    self.coalesce_window_ms / 1000, self._schedule_flush, key
+                )
+            else:
+                pending.content += message.content
+            if len(pending.content.encode()) >= self.coalesce_max_bytes:
+                await self._flush_chunks(key)
+            return
+
+        if key in self._chunk_buffers or key in self._chunk_locks:
+            await self._flush_chunks(key, then=message)
+        else:
+            await self._deliver(message)
+
+    def _schedule_flush(self, key: tuple[Channel, str]) -> None:
+        """Timer callback: flush a chat's buffered chunks in the background."""
+        self._chunk_timers.pop(key, None)
+        self._chunk_locks.setdefault(key, asyncio.Lock())
+        task = asyncio.ensure_future(self._flush_chunks(key))
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def _flush_chunks(
+        self, key: tuple[Channel, str], then: OutboundMessage | None = None
+    ) -> None:
+        """Deliver a chat's buffered chunks (then ``then``), in publish order."""
+        lock = self._chunk_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            timer = self._chunk_timers.pop(key, None)
+            if timer is not None:
+                timer.cancel()
+            pending = self._chunk_buffers.pop(key, None)
+            if pending is not None:
+                await self._deliver(pending)
+            if then is not None:
+                await self._deliver(then)
+        if not lock.locked() and key not in self._chunk_buffers:
+            self._chunk_locks.pop(key, None)
+
+    async def _deliver(self, message: OutboundMessage) -> None:
+        """Fan a message out to its channel's subscribers."""
         subscribers = self._outbound_subscribers.get(message.channel, [])
 
         if not subscribers:
             logger.warning(f"⚠️ No subscribers for {message.channel.value}")
             return
 
+        if self.subscriber_queue_size > 0:
+            # Hand off to each subscriber's worker; only "block" can wait here
+            for queue in self._outbound_queues.get(message.channel, []):
+                await queue.put(message)
+            return
+
         # Fan out to all subscribers
         tasks = [sub(message) for sub in subscribers]
         results = await asyncio.gather(*tasks, return_exceptions=True)
@@ -109,18 +518,34 @@ class MessageBus:
         self, message: OutboundMessage, exclude: Channel | None = None
     ) -> None:
         """Broadcast to all channels (except excluded)."""
-        for channel, subscribers in self._outbound_subscribers.items():
-            if channel == exclude:
-                continue
-            msg = OutboundMessage(
-                channel=channel,
-                chat_id=message.chat_id,
-                content=message.content,
-                media=message.media,
-                metadata=message.metadata,
+        deliveries = [
+            self._deliver(
+                OutboundMessage(
+                    channel=channel,
+                    chat_id=message.chat_id,
+                    content=message.content,
+                    media=message.media,
+                    metadata=message.metadata,
+                )
             )
-            for sub in subscribers:
-                await sub(msg)
+            for channel, subscribers in self._outbound_subscribers.items()
+            if channel != exclude and subscribers
+        ]
+        await asyncio.gather(*deliveries)
+
+    async def drain_outbound(self) -> None:
+        """Wait until every subscriber queue has delivered what it holds."""
+        await asyncio.gather(
+            *(queue.join() for queues in self._outbound_queues.values() for queue in queues)
+        )
+
+    def outbound_stats(self) -> dict:
+        """Per-channel subscriber queue depth, lag and overflow counters."""
+        return {
+            channel.value: [queue.stats() for queue in queues]
+            for channel, queues in self._outbound_queues.items()
+            if queues
+        }
 
     # =========================================================================
     # System Events (Internal)
@@ -149,11 +574,15 @@ class MessageBus:
 
     def clear(self) -> None:
         """Clear all queues (for testing/reset)."""
-        while not self._inbound.empty():
-            try:
-                self._inbound.get_nowait()
-            except asyncio.QueueEmpty:
-                break
+        self._inbound.clear()
+        for timer in self._chunk_timers.values():
+            timer.cancel()
+        self._chunk_timers.clear()
+        self._chunk_buffers.clear()
+        self._busy_notified.clear()
+        for queues in self._outbound_queues.values():
+            for queue in queues:
+                queue.clear()
 
 
 # Singleton instance
@@ -164,7 +593,28 @@ def get_message_bus() -> MessageBus:
     """Get the global message bus instance."""
     global _bus
     if _bus is None:
-        _bus = MessageBus()
+        from pocketclaw.config import get_settings
+
+        settings = get_settings()
+        journal = None
+        if settings.inbound_journal_enabled:
+            journal = InboundJournal(
+                commit_ms=settings.inbound_journal_commit_ms,
+                segment_bytes=settings.inbound_journal_segment_bytes,
+            )
+        _bus = MessageBus(
+            shed_wait_seconds=settings.inbound_shed_wait_seconds,
+            low_priority_channels=settings.inbound_low_priority_channels,
+            workers=settings.max_concurrent_conversations,
+            lane_sizes=settings.inbound_lane_sizes,
+            bulk_channels=settings.inbound_bulk_channels,
+            aging_seconds=settings.inbound_aging_seconds,
+            coalesce_window_ms=settings.outbound_coalesce_window_ms,
+            coalesce_max_bytes=settings.outbound_coalesce_max_bytes,
+            subscriber_queue_size=settings.outbound_queue_size,
+            overflow_policy=settings.outbound_overflow_policy,
+            journal=journal,
+        )
 
         from pocketclaw.lifecycle import register
 
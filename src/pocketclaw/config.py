@@ -243,6 +243,25 @@ class Settings(BaseSettings):
     model_tier_complex: str = Field(
         default="claude-opus-4-6", description="Model for complex tasks (planning, debugging)"
     )
+    smart_routing_adaptive: bool = Field(
+        default=True,
+        description="Degrade complex tasks to the moderate tier when live telemetry is over budget",
+    )
+    smart_routing_latency_budget_ms: int = Field(
+        default=30000, description="p95 time-to-first-token budget for the complex tier (0 = off)"
+    )
+    smart_routing_max_error_rate: float = Field(
+        default=0.3, description="Max complex-tier error rate before degrading"
+    )
+    smart_routing_cost_budget_usd: float = Field(
+        default=0.0, description="Max average cost per complex-tier call in USD (0 = off)"
+    )
+    smart_routing_min_samples: int = Field(
+        default=5, description="Complex-tier samples needed before adaptive routing kicks in"
+    )
+    smart_routing_window_seconds: int = Field(
+        default=900, description="Only telemetry from this many recent seconds is considered"
+    )
 
     # Plan Mode
     plan_mode: bool = Field(default=False, description="Require approval before executing tools")
@@ -372,6 +391,164 @@ class Settings(BaseSettings):
     max_concurrent_conversations: int = Field(
         default=5, description="Max parallel conversations processed simultaneously"
     )
+    agent_workers: int = Field(
+        default=0,
+        description="Run the agent in this many worker processes, sessions sharded by "
+        "session key (0 = in the main process)",
+    )
+    message_coalesce_enabled: bool = Field(
+        default=False,
+        description="Merge messages sent in a burst to one session into a single agent turn",
+    )
+    message_coalesce_window_ms: int = Field(
+        default=1500,
+        description="Wait this long after a session's latest message before starting its turn "
+        "(0 = only merge messages queued behind a running turn)",
+    )
+    session_interrupt_enabled: bool = Field(
+        default=False,
+        description="A newer message cancels the session's in-flight agent run "
+        "(the partial reply is kept)",
+    )
+    session_interrupt_channels: list[str] = Field(
+        default_factory=list,
+        description="Channels the interrupt policy applies to (empty = all channels)",
+    )
+    inbound_shed_wait_seconds: float = Field(
+        default=0.0,
+        description="When the estimated inbound wait exceeds this, drop low-priority messages "
+        "and tell chat users their queue position (0 = only shed when the queue is full)",
+    )
+    inbound_low_priority_channels: list[str] = Field(
+        default_factory=lambda: ["webhook", "system"],
+        description="Channels whose messages are dropped first under overload",
+    )
+    inbound_lane_sizes: dict[str, int] = Field(
+        default_factory=dict,
+        description="Per-lane inbound queue bound, keys 'interactive', 'system', 'bulk' "
+        "(default 1000 each)",
+    )
+    inbound_bulk_channels: list[str] = Field(
+        default_factory=lambda: ["webhook"],
+        description="Channels queued in the lowest-priority (bulk) inbound lane",
+    )
+    inbound_aging_seconds: float = Field(
+        default=30.0,
+        description="A queued message waiting longer than this is served ahead of "
+        "higher-priority lanes",
+    )
+    outbound_coalesce_window_ms: int = Field(
+        default=40,
+        description="Merge streamed reply chunks for a chat sent within this window into "
+        "one message (0 = send every chunk as-is)",
+    )
+    outbound_coalesce_max_bytes: int = Field(
+        default=2048,
+        description="Flush merged stream chunks early once they reach this size",
+    )
+    outbound_queue_size: int = Field(
+        default=256,
+        description="Per-adapter outbound queue bound; each adapter is fed by its own "
+        "worker so a slow channel can't stall the agent (0 = deliver inline)",
+    )
+    outbound_overflow_policy: str = Field(
+        default="collapse",
+        description="When an adapter's outbound queue is full: 'block', "
+        "'drop_oldest_chunk' or 'collapse' (merge queued stream chunks)",
+    )
+    inbound_journal_enabled: bool = Field(
+        default=False,
+        description="Journal accepted inbound messages to disk and replay unprocessed ones "
+        "after a crash or restart",
+    )
+    inbound_journal_commit_ms: int = Field(
+        default=5, description="Group-commit window for journal fsyncs"
+    )
+    inbound_journal_segment_bytes: int = Field(
+        default=4 * 1024 * 1024, description="Start a new journal segment file past this size"
+    )
+    websocket_send_queue_size: int = Field(
+        default=256,
+        description="Payloads queued per WebSocket client before non-critical events "
+        "are dropped (0 = unbounded)",
+    )
+    websocket_max_lag_seconds: float = Field(
+        default=30.0,
+        description="Disconnect a WebSocket client whose oldest unsent payload is older "
+        "than this (0 = never)",
+    )
+    websocket_compression: bool = Field(
+        default=True,
+        description="Offer permessage-deflate compression on dashboard WebSocket frames",
+    )
+    audit_index_enabled: bool = Field(
+        default=True,
+        description="Keep a sidecar block index next to audit.jsonl to speed up filtered "
+        "audit queries",
+    )
+    audit_flush_interval_ms: int = Field(
+        default=200,
+        description="Gather audit events for this long into one background write "
+        "(0 = write each event as it arrives)",
+    )
+    audit_fsync: str = Field(
+        default="batch",
+        description="Audit log fsync policy: 'batch' (after every write) or 'none'",
+    )
+    audit_rotate_bytes: int = Field(
+        default=10 * 1024 * 1024,
+        description="Rotate audit.jsonl into a gzip-compressed segment past this size (0 = never)",
+    )
+    audit_rotate_daily: bool = Field(
+        default=True, description="Also rotate audit.jsonl at the start of each UTC day"
+    )
+    scheduler_channel_weights: dict[str, int] = Field(
+        default_factory=dict,
+        description="Fair-queuing weight per channel, e.g. {'websocket': 3} (default 1); "
+        "the owner's messages always go first",
+    )
+    scheduler_channel_caps: dict[str, int] = Field(
+        default_factory=dict,
+        description="Max concurrent conversations per channel, e.g. {'webhook': 1}",
+    )
+
+    # Claude Agent SDK client pool
+    claude_sdk_pool_enabled: bool = Field(
+        default=True,
+        description="Keep one live Claude CLI process per session instead of one per message",
+    )
+    claude_sdk_pool_idle_seconds: int = Field(
+        default=600, description="Disconnect pooled SDK clients idle for this many seconds"
+    )
+    claude_sdk_pool_max_clients: int = Field(
+        default=8, description="Max live pooled SDK clients (least recently used evicted first)"
+    )
+    router_pool_max_idle: int = Field(
+        default=8, description="Max warm agent routers kept for tasks, intentions and skills"
+    )
+
+    # Native agent tool results
+    tool_result_inline_chars: int = Field(
+        default=4000,
+        description="Tool results longer than this are spilled to disk as head/tail + handle "
+        "(0 = keep full results in context)",
+    )
+    tool_result_keep_recent: int = Field(
+        default=1, description="Most recent tool-result turns kept verbatim before eliding"
+    )
+
+    # Response cache (intentions, Deep Work planner, skills)
+    response_cache_enabled: bool = Field(
+        default=False,
+        description="Replay identical intention/planner/skill runs from cache instead of "
+        "calling the LLM again",
+    )
+    response_cache_ttl_seconds: int = Field(
+        default=3600, description="How long a cached agent run stays valid"
+    )
+    response_cache_max_entries: int = Field(
+        default=128, description="Max cached agent runs (least recently used evicted first)"
+    )
 
     def save(self) -> None:
         """Save settings to config file.
@@ -464,6 +641,12 @@ class Settings(BaseSettings):
             "model_tier_simple": self.model_tier_simple,
             "model_tier_moderate": self.model_tier_moderate,
             "model_tier_complex": self.model_tier_complex,
+            "smart_routing_adaptive": self.smart_routing_adaptive,
+            "smart_routing_latency_budget_ms": self.smart_routing_latency_budget_ms,
+            "smart_routing_max_error_rate": self.smart_routing_max_error_rate,
+            "smart_routing_cost_budget_usd": self.smart_routing_cost_budget_usd,
+            "smart_routing_min_samples": self.smart_routing_min_samples,
+            "smart_routing_window_seconds": self.smart_routing_window_seconds,
             # Plan mode
             "plan_mode": self.plan_mode,
             "plan_mode_tools": self.plan_mode_tools,
@@ -526,6 +709,45 @@ class Settings(BaseSettings):
             "welcome_hint_enabled": self.welcome_hint_enabled,
             # Concurrency
             "max_concurrent_conversations": self.max_concurrent_conversations,
+            "agent_workers": self.agent_workers,
+            "message_coalesce_enabled": self.message_coalesce_enabled,
+            "message_coalesce_window_ms": self.message_coalesce_window_ms,
+            "session_interrupt_enabled": self.session_interrupt_enabled,
+            "session_interrupt_channels": self.session_interrupt_channels,
+            "inbound_shed_wait_seconds": self.inbound_shed_wait_seconds,
+            "inbound_low_priority_channels": self.inbound_low_priority_channels,
+            "inbound_lane_sizes": self.inbound_lane_sizes,
+            "inbound_bulk_channels": self.inbound_bulk_channels,
+            "inbound_aging_seconds": self.inbound_aging_seconds,
+            "outbound_coalesce_window_ms": self.outbound_coalesce_window_ms,
+            "outbound_coalesce_max_bytes": self.outbound_coalesce_max_bytes,
+            "outbound_queue_size": self.outbound_queue_size,
+            "outbound_overflow_policy": self.outbound_overflow_policy,
+            "inbound_journal_enabled": self.inbound_journal_enabled,
+            "inbound_journal_commit_ms": self.inbound_journal_commit_ms,
+            "inbound_journal_segment_bytes": self.inbound_journal_segment_bytes,
+            "websocket_send_queue_size": self.websocket_send_queue_size,
+            "websocket_max_lag_seconds": self.websocket_max_lag_seconds,
+            "websocket_compression": self.websocket_compression,
+            "audit_index_enabled": self.audit_index_enabled,
+            "audit_flush_interval_ms": self.audit_flush_interval_ms,
+            "audit_fsync": self.audit_fsync,
+            "audit_rotate_bytes": self.audit_rotate_bytes,
+            "audit_rotate_daily": self.audit_rotate_daily,
+            "scheduler_channel_weights": self.scheduler_channel_weights,
+            "scheduler_channel_caps": self.scheduler_channel_caps,
+            # Claude Agent SDK client pool
+            "claude_sdk_pool_enabled": self.claude_sdk_pool_enabled,
+            "claude_sdk_pool_idle_seconds": self.claude_sdk_pool_idle_seconds,
+            "claude_sdk_pool_max_clients": self.claude_sdk_pool_max_clients,
+            "router_pool_max_idle": self.router_pool_max_idle,
+            # Native agent tool results
+            "tool_result_inline_chars": self.tool_result_inline_chars,
+            "tool_result_keep_recent": self.tool_result_keep_recent,
+            # Response cache
+            "response_cache_enabled": self.response_cache_enabled,
+            "response_cache_ttl_seconds": self.response_cache_ttl_seconds,
+            "response_cache_max_entries": self.response_cache_max_entries,
         }
 
         # Store secrets in the encrypted credential store, then strip
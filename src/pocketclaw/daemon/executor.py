@@ -4,7 +4,8 @@ IntentionExecutor - Executes intentions by invoking the agent.
 When an intention triggers:
 1. Gather context from configured sources
 2. Apply context to prompt template
-3. Invoke AgentRouter with the prepared prompt
+3. Invoke a pooled AgentRouter with the prepared prompt (or replay an
+   identical earlier run from the opt-in response cache)
 4. Stream results to callback (WebSocket/Telegram)
 """
 
@@ -12,7 +13,8 @@ import logging
 from collections.abc import AsyncIterator, Callable
 from datetime import UTC, datetime
 
-from ..agents.router import AgentRouter
+from ..agents.response_cache import cached_run
+from ..agents.router_pool import get_router_pool
 from ..config import Settings, get_settings
 from .context import ContextHub, get_context_hub
 from .intentions import IntentionStore, get_intention_store
@@ -52,15 +54,6 @@ class IntentionExecutor:
         # Callback for streaming results
         self.stream_callback: Callable | None = None
 
-        # Agent router (created lazily)
-        self._agent_router: AgentRouter | None = None
-
-    def _get_agent_router(self) -> AgentRouter:
-        """Get or create the agent router."""
-        if self._agent_router is None:
-            self._agent_router = AgentRouter(self.settings)
-        return self._agent_router
-
     def set_stream_callback(self, callback: Callable) -> None:
         """
         Set callback for streaming execution results.
@@ -110,9 +103,7 @@ class IntentionExecutor:
             logger.debug(f"Prepared prompt: {prepared_prompt[:100]}...")
 
             # 3. Invoke agent
-            agent = self._get_agent_router()
-
-            async for chunk in agent.run(prepared_prompt):
+            async for chunk in cached_run(self.settings, prepared_prompt):
                 yield chunk
 
             # 4. Mark intention as run
@@ -179,6 +170,6 @@ class IntentionExecutor:
             yield chunk
 
     def reset_agent(self) -> None:
-        """Reset the agent router (e.g., after settings change)."""
-        self._agent_router = None
+        """Drop warm agent routers (e.g., after settings change)."""
+        get_router_pool().clear()
         logger.info("Agent router reset")
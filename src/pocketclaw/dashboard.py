@@ -17,12 +17,31 @@ Changes:
   - 2026-02-03: Cleaned up duplicate imports, fixed duplicate save() calls.
   - 2026-02-02: Added agent status to get_settings response.
   - 2026-02-02: Enhanced logging to show which backend is processing requests.
+  - 2026-10-19: Optional multi-process agent workers (settings.agent_workers).
+  - 2026-10-19: WebSocket subscribe/unsubscribe actions for system event topics.
+  - 2026-10-19: Legacy broadcasts (reminders, intentions, audit entries) go through
+                ws_adapter's bounded per-connection send queues.
+  - 2026-10-19: /ws accepts chunked binary uploads, and permessage-deflate
+                follows websocket_compression.
+  - 2026-10-19: GET /api/audit reads the log backwards with cursor pagination and
+                server-side filters instead of readlines() on the whole file.
+  - 2026-10-19: DELETE /api/audit also removes rotated audit segments.
+  - 2026-10-19: /static serves precompressed gzip/brotli assets with strong ETags,
+                304s and immutable caching keyed by _static_version().
+  - 2026-10-19: Mission Control and Deep Work routers are mounted lazily (imported on
+                first request) to cut dashboard import time.
+  - 2026-10-19: startup_event brings subsystems up concurrently via StartupOrchestrator;
+                optional integrations finish in the background (GET /api/startup).
+  - 2026-10-19: handle_file_browse() lists via os.scandir in a worker thread with
+                offset/limit pagination, name filtering and a cached listing.
+  - 2026-10-19: websocket_endpoint replies (and handle_tool / handle_file_browse) go
+                through the connection's ws_adapter queue; switch_session and
+                new_session move the connection instead of re-registering it.
 """
 
 import asyncio
 import base64
 import io
-import json
 import logging
 import uuid
 from pathlib import Path
@@ -30,10 +49,17 @@ from pathlib import Path
 try:
     import qrcode
     import uvicorn
-    from fastapi import FastAPI, HTTPException, Query, Request, WebSocket, WebSocketDisconnect
+    from fastapi import (
+        FastAPI,
+        HTTPException,
+        Query,
+        Request,
+        Response,
+        WebSocket,
+        WebSocketDisconnect,
+    )
     from fastapi.middleware.cors import CORSMiddleware
     from fastapi.responses import StreamingResponse
-    from fastapi.staticfiles import StaticFiles
     from fastapi.templating import Jinja2Templates
 except ImportError as _exc:
     raise ImportError(
@@ -43,18 +69,20 @@ except ImportError as _exc:
 
 from pocketclaw.agents.loop import AgentLoop
 from pocketclaw.bootstrap import DefaultBootstrapProvider
-from pocketclaw.bus import get_message_bus
+from pocketclaw.bus import InboundRejected, get_message_bus
 from pocketclaw.bus.adapters.websocket_adapter import WebSocketAdapter
+from pocketclaw.bus.adapters.ws_protocol import UploadChunk, WireSocket, choose_protocol
 from pocketclaw.config import Settings, get_access_token, get_config_path, regenerate_token
 from pocketclaw.daemon import get_daemon
-from pocketclaw.deep_work.api import router as deep_work_router
+from pocketclaw.lazy_routes import LazyRouter
 from pocketclaw.memory import MemoryType, get_memory_manager
-from pocketclaw.mission_control.api import router as mission_control_router
 from pocketclaw.scheduler import get_scheduler
 from pocketclaw.security import get_audit_logger
 from pocketclaw.security.rate_limiter import api_limiter, auth_limiter, cleanup_all, ws_limiter
 from pocketclaw.security.session_tokens import create_session_token, verify_session_token
 from pocketclaw.skills import SkillExecutor, get_skill_loader
+from pocketclaw.startup import StartupOrchestrator
+from pocketclaw.static_assets import PrecompressedStaticFiles
 from pocketclaw.tunnel import get_tunnel_manager
 
 logger = logging.getLogger(__name__)
@@ -62,7 +90,9 @@ logger = logging.getLogger(__name__)
 
 ws_adapter = WebSocketAdapter()
 agent_loop = AgentLoop()
-# Retain active_connections for legacy broadcasts until fully migrated
+# Set when settings.agent_workers > 0: the agent runs in worker processes
+_worker_pool = None
+# Accepted sockets (auth-gated); broadcasts go through ws_adapter's send queues
 active_connections: list[WebSocket] = []
 
 # Channel adapters (auto-started when configured, keyed by channel name)
@@ -71,6 +101,12 @@ _channel_adapters: dict[str, object] = {}
 # Protects settings read-modify-write from concurrent WebSocket clients
 _settings_lock = asyncio.Lock()
 
+# Tracks subsystem startup (see startup_event and /api/startup)
+_startup: StartupOrchestrator | None = None
+
+# AgentLoop / WorkerPool start() task, kept so it isn't garbage-collected
+_agent_task: asyncio.Task | None = None
+
 # Set by run_dashboard() so the startup event can open the browser once the server is ready
 _open_browser_url: str | None = None
 
@@ -122,29 +158,23 @@ async def security_headers_middleware(request: Request, call_next):
     return response
 
 
-# Mount static files
-app.mount("/static", StaticFiles(directory=FRONTEND_DIR), name="static")
-
-# Mount Mission Control API router
-app.include_router(mission_control_router, prefix="/api/mission-control")
+# Mount static files (precompressed, strong ETags, immutable when ?v= matches)
+static_files = PrecompressedStaticFiles(directory=FRONTEND_DIR)
+app.mount("/static", static_files, name="static")
 
-# Mount Deep Work API router
-
-app.include_router(deep_work_router, prefix="/api/deep-work")
+# Subsystem routers, imported on their first request (see lazy_routes)
+lazy_routers = {
+    "mission_control": LazyRouter("pocketclaw.mission_control.api:router"),
+    "deep_work": LazyRouter("pocketclaw.deep_work.api:router"),
+}
+app.mount("/api/mission-control", lazy_routers["mission_control"])
+app.mount("/api/deep-work", lazy_routers["deep_work"])
 
 
 async def broadcast_reminder(reminder: dict):
     """Broadcast a reminder notification to all connected clients."""
-    # Use new adapter for broadcast
-    await ws_adapter.broadcast(reminder, msg_type="reminder")
-
-    # Legacy broadcast (backup)
-    message = {"type": "reminder", "reminder": reminder}
-    for ws in active_connections[:]:
-        try:
-            await ws.send_json(message)
-        except Exception:
-            pass
+    # One payload in both shapes (legacy clients read "reminder", newer "content")
+    ws_adapter.broadcast_payload({"type": "reminder", "reminder": reminder, "content": reminder})
 
     # Push to notification channels
     try:
@@ -157,13 +187,7 @@ async def broadcast_reminder(reminder: dict):
 
 async def broadcast_intention(intention_id: str, chunk: dict):
     """Broadcast intention execution results to all connected clients."""
-    message = {"type": "intention_event", "intention_id": intention_id, **chunk}
-    for ws in active_connections[:]:
-        try:
-            await ws.send_json(message)
-        except Exception:
-            if ws in active_connections:
-                active_connections.remove(ws)
+    ws_adapter.broadcast_payload({"type": "intention_event", "intention_id": intention_id, **chunk})
 
     # Push message-type intention chunks to notification channels
     if chunk.get("type") == "message":
@@ -175,15 +199,42 @@ async def broadcast_intention(intention_id: str, chunk: dict):
             pass
 
 
+async def _reset_agent_router() -> None:
+    """Make the agent (in-process or every worker) build a router from saved settings."""
+    agent_loop.reset_router()
+    if _worker_pool is not None:
+        await _worker_pool.control("reset_router")
+
+
+async def _reload_agent_memory() -> None:
+    """Reload the agent's memory manager (in-process or every worker) from saved settings."""
+    from pocketclaw.config import get_settings as _get_settings
+
+    # Clear settings cache so memory manager picks up new values
+    _get_settings.cache_clear()
+    agent_loop.memory = get_memory_manager(force_reload=True)
+    agent_loop.context_builder.memory = agent_loop.memory
+    if _worker_pool is not None:
+        await _worker_pool.control("reload_memory")
+
+
+def _agent_status() -> dict:
+    """Agent status for the settings panel."""
+    if _worker_pool is None:
+        return {"status": "running" if agent_loop._running else "stopped", "backend": "AgentLoop"}
+    workers = _worker_pool.stats()["workers"]
+    up = sum(1 for w in workers if w["up"])
+    return {
+        "status": "running" if _worker_pool.running and up else "stopped",
+        "backend": f"AgentLoop workers ({up}/{len(workers)} up)",
+    }
+
+
 async def _broadcast_audit_entry(entry: dict):
     """Broadcast a new audit log entry to all connected WebSocket clients."""
-    message = {"type": "system_event", "event_type": "audit_entry", "data": entry}
-    for ws in active_connections[:]:
-        try:
-            await ws.send_json(message)
-        except Exception:
-            if ws in active_connections:
-                active_connections.remove(ws)
+    ws_adapter.broadcast_payload(
+        {"type": "system_event", "event_type": "audit_entry", "data": entry}
+    )
 
 
 async def _start_channel_adapter(channel: str, settings: Settings | None = None) -> bool:
@@ -344,17 +395,66 @@ async def _stop_channel_adapter(channel: str) -> bool:
 
 @app.on_event("startup")
 async def startup_event():
-    """Start services on app startup."""
-    # Start Message Bus Integration
+    """Start services on app startup.
+
+    Subsystems come up concurrently through a StartupOrchestrator: the server
+    starts accepting requests once the critical ones (bus, agent, audit hook)
+    are ready, while channel adapters, MCP servers, Deep Work recovery etc.
+    keep starting in the background. Progress is served at /api/startup.
+    """
+    global _startup
     bus = get_message_bus()
-    await ws_adapter.start(bus)
+    settings = Settings.load()
+    startup = _startup = StartupOrchestrator()
 
-    # Start Agent Loop
-    asyncio.create_task(agent_loop.start())
-    logger.info("Agent Loop started")
+    # Message Bus integration
+    async def _start_bus():
+        ws_adapter.queue_size = settings.websocket_send_queue_size
+        ws_adapter.max_lag = settings.websocket_max_lag_seconds
+        await ws_adapter.start(bus)
+
+    # Agent Loop — in-process, or sharded across worker processes. Ready once
+    # it is actually consuming the bus, not when its task is created.
+    async def _start_agent():
+        global _worker_pool, _agent_task
+        from pocketclaw.agents.workers import workers_enabled
+
+        if workers_enabled(settings):
+            from pocketclaw.agents.workers import WorkerPool
+
+            runner = _worker_pool = WorkerPool(
+                settings.agent_workers, bus, slots=settings.max_concurrent_conversations
+            )
+        else:
+            runner = agent_loop
+        _agent_task = asyncio.create_task(runner.start())
+        started = asyncio.create_task(runner.started.wait())
+        try:
+            await asyncio.wait({_agent_task, started}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            started.cancel()
+        if not runner.started.is_set():
+            # start() returned or raised before consuming the bus
+            _agent_task.result()
+            raise RuntimeError("Agent loop stopped before it started")
+
+    # Audit log callback for live updates
+    def _register_audit_hook():
+        audit_logger = get_audit_logger()
+        audit_logger.on_log(lambda entry: asyncio.ensure_future(_broadcast_audit_entry(entry)))
+
+    startup.add("bus", _start_bus, critical=True)
+    startup.add("agent", _start_agent, depends_on=["bus"], critical=True)
+    startup.add("audit_hook", _register_audit_hook, critical=True)
+    startup.add("static_assets", lambda: asyncio.to_thread(static_files.precompress))
+
+    # Auto-start all configured channel adapters (each returns False when not configured)
+    async def _start_channel(ch: str) -> bool:
+        started = await _start_channel_adapter(ch, settings)
+        if started:
+            logger.info(f"{ch.title()} adapter auto-started alongside dashboard")
+        return started
 
-    # Auto-start all configured channel adapters
-    settings = Settings.load()
     for ch in (
         "discord",
         "slack",
@@ -365,60 +465,68 @@ async def startup_event():
         "teams",
         "google_chat",
     ):
-        try:
-            if await _start_channel_adapter(ch, settings):
-                logger.info(f"{ch.title()} adapter auto-started alongside dashboard")
-        except Exception as e:
-            logger.warning(f"Failed to auto-start {ch} adapter: {e}")
+        startup.add(f"channel:{ch}", lambda ch=ch: _start_channel(ch), depends_on=["bus"])
 
     # Auto-start webhook adapter if webhooks are configured
     if settings.webhook_configs:
-        try:
-            if await _start_channel_adapter("webhook", settings):
+
+        async def _start_webhooks() -> bool:
+            started = await _start_channel_adapter("webhook", settings)
+            if started:
                 count = len(settings.webhook_configs)
                 logger.info("Webhook adapter auto-started (%d slots)", count)
-        except Exception as e:
-            logger.warning("Failed to auto-start webhook adapter: %s", e)
+            return started
+
+        startup.add("channel:webhook", _start_webhooks, depends_on=["bus"])
 
     # Ensure project directories exist for all Deep Work projects
-    try:
+    async def _ensure_project_dirs():
         from pocketclaw.mission_control.manager import get_mission_control_manager
 
         mc_manager = get_mission_control_manager()
         await mc_manager.ensure_project_directories()
-    except Exception as e:
-        logger.warning("Failed to ensure project directories: %s", e)
 
     # Recover Deep Work projects interrupted by previous shutdown
-    try:
+    async def _recover_projects():
         from pocketclaw.deep_work import recover_interrupted_projects
 
         recovered = await recover_interrupted_projects()
         if recovered:
             logger.info("Recovered %d interrupted Deep Work project(s)", recovered)
-    except Exception as e:
-        logger.warning("Failed to recover interrupted projects: %s", e)
+
+    startup.add("project_dirs", _ensure_project_dirs)
+    startup.add("deep_work_recovery", _recover_projects, depends_on=["project_dirs"])
 
     # Auto-start enabled MCP servers
-    try:
+    async def _start_mcp():
         from pocketclaw.mcp.manager import get_mcp_manager
 
-        mcp = get_mcp_manager()
-        await mcp.start_enabled_servers()
-    except Exception as e:
-        logger.warning("Failed to start MCP servers: %s", e)
+        await get_mcp_manager().start_enabled_servers()
 
-    # Register audit log callback for live updates
-    audit_logger = get_audit_logger()
-    audit_logger.on_log(lambda entry: asyncio.ensure_future(_broadcast_audit_entry(entry)))
+    startup.add("mcp", _start_mcp)
 
-    # Start reminder scheduler
-    scheduler = get_scheduler()
-    scheduler.start(callback=broadcast_reminder)
+    # Reminder scheduler and proactive daemon (they broadcast through the bus)
+    startup.add(
+        "scheduler",
+        lambda: get_scheduler().start(callback=broadcast_reminder),
+        depends_on=["bus"],
+    )
+    startup.add(
+        "daemon",
+        lambda: get_daemon().start(stream_callback=broadcast_intention),
+        depends_on=["bus"],
+    )
 
-    # Start proactive daemon
-    daemon = get_daemon()
-    daemon.start(stream_callback=broadcast_intention)
+    # Pre-initialize an agent router for intentions, skills and the planner
+    # (built in a worker thread)
+    async def _warm_router_pool():
+        from pocketclaw.agents.router_pool import get_router_pool
+
+        await get_router_pool().warm(settings)
+
+    startup.add("router_pool", _warm_router_pool)
+
+    await startup.start()
 
     # Hourly rate-limiter cleanup
     async def _rate_limit_cleanup_loop():
@@ -440,7 +548,13 @@ async def startup_event():
 @app.on_event("shutdown")
 async def shutdown_event():
     """Stop services on app shutdown."""
+    # Abandon integrations that are still starting up
+    if _startup is not None:
+        await _startup.cancel()
+
     # Stop Agent Loop
+    if _worker_pool is not None:
+        await _worker_pool.stop()
     await agent_loop.stop()
     await ws_adapter.stop()
 
@@ -1161,12 +1275,15 @@ async def webhook_inbound(
     adapter = _channel_adapters["webhook"]
     request_id = str(uuid.uuid4())
 
-    if not wait:
-        await adapter.handle_webhook(slot, body, request_id, sync=False)
-        return {"status": "accepted", "request_id": request_id}
-
-    # Sync mode — wait for agent response
-    response_text = await adapter.handle_webhook(slot, body, request_id, sync=True)
+    try:
+        if not wait:
+            await adapter.handle_webhook(slot, body, request_id, sync=False)
+            return {"status": "accepted", "request_id": request_id}
+
+        # Sync mode — wait for agent response
+        response_text = await adapter.handle_webhook(slot, body, request_id, sync=True)
+    except InboundRejected as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "30"})
     if response_text is None:
         return {"status": "timeout", "request_id": request_id}
     return {"status": "ok", "request_id": request_id, "response": response_text}
@@ -1577,16 +1694,8 @@ async def oauth_callback(
 
 
 def _static_version() -> str:
-    """Generate a cache-busting version string from JS file mtimes."""
-    import hashlib
-
-    js_dir = FRONTEND_DIR / "js"
-    if not js_dir.exists():
-        return "0"
-    mtimes = []
-    for f in sorted(js_dir.rglob("*.js")):
-        mtimes.append(str(int(f.stat().st_mtime)))
-    return hashlib.md5("|".join(mtimes).encode()).hexdigest()[:8]
+    """Cache-busting version string: a hash of the JS/CSS asset contents."""
+    return static_files.version()
 
 
 @app.get("/")
@@ -2009,12 +2118,17 @@ async def websocket_endpoint(
         await websocket.close(code=4003, reason="Unauthorized")
         return
 
+    # Echo the pocketpaw.json subprotocol if the client offered it
+    subprotocol = choose_protocol(websocket.scope.get("subprotocols", []))
+
     # Accept connection first — token can arrive via first message
     if _token_valid(token) or is_localhost:
-        await websocket.accept()
+        await websocket.accept(subprotocol=subprotocol)
+        websocket = WireSocket(websocket, subprotocol)
     else:
         # Accept temporarily, wait for auth message
-        await websocket.accept()
+        await websocket.accept(subprotocol=subprotocol)
+        websocket = WireSocket(websocket, subprotocol)
         try:
             first_msg = await asyncio.wait_for(websocket.receive_json(), timeout=5.0)
             if first_msg.get("action") == "authenticate" and _token_valid(first_msg.get("token")):
@@ -2049,12 +2163,13 @@ async def websocket_endpoint(
                 resumed = True
 
     await ws_adapter.register_connection(websocket, chat_id)
+    replies = _QueuedReplies(chat_id)
 
     # Build session safe_key for frontend
     safe_key = f"websocket_{chat_id}"
 
     # Send welcome notification with session info
-    await websocket.send_json(
+    await replies.send_json(
         {
             "type": "connection_info",
             "content": "Connected to PocketPaw",
@@ -2068,7 +2183,7 @@ async def websocket_endpoint(
         try:
             manager = get_memory_manager()
             history = await manager.get_session_history(session_key, limit=100)
-            await websocket.send_json(
+            await replies.send_json(
                 {
                     "type": "session_history",
                     "session_id": safe_key,
@@ -2086,11 +2201,18 @@ async def websocket_endpoint(
 
     try:
         while True:
-            data = await websocket.receive_json()
+            data = await websocket.receive_frame()
+            if isinstance(data, UploadChunk):
+                await ws_adapter.handle_upload_chunk(chat_id, data)
+                continue
             action = data.get("action")
 
+            # Chunked binary file uploads
+            if action in ("upload_start", "upload_end"):
+                await ws_adapter.handle_message(chat_id, data)
+
             # Handle chat via MessageBus
-            if action == "chat":
+            elif action == "chat":
                 log_msg = f"⚡ Processing message with Backend: {settings.agent_backend} (Provider: {settings.llm_provider})"
                 logger.warning(log_msg)  # Use WARNING to ensure it shows up
                 print(log_msg)  # Force stdout just in case
@@ -2111,16 +2233,15 @@ async def websocket_endpoint(
                     raw_id = parts[1]
                     new_session_key = f"{channel_prefix}:{raw_id}"
 
-                    # Unregister old connection, register with new chat_id
-                    await ws_adapter.unregister_connection(chat_id)
-                    chat_id = raw_id
-                    await ws_adapter.register_connection(websocket, chat_id)
+                    # Move the connection (and its queued replies) to the new chat_id
+                    await ws_adapter.switch_chat(chat_id, raw_id)
+                    chat_id = replies.chat_id = raw_id
 
                     # Load and send history
                     try:
                         manager = get_memory_manager()
                         history = await manager.get_session_history(new_session_key, limit=100)
-                        await websocket.send_json(
+                        await replies.send_json(
                             {
                                 "type": "session_history",
                                 "session_id": session_id,
@@ -2129,29 +2250,36 @@ async def websocket_endpoint(
                         )
                     except Exception as e:
                         logger.warning("Failed to load session history: %s", e)
-                        await websocket.send_json(
+                        await replies.send_json(
                             {"type": "session_history", "session_id": session_id, "messages": []}
                         )
 
+            # System event topics: {"sessions": [...], "tasks": [...], "event_types": [...]}
+            elif action in ("subscribe", "unsubscribe"):
+                subscriptions = ws_adapter.update_subscriptions(
+                    chat_id, data, subscribe=action == "subscribe"
+                )
+                await replies.send_json({"type": "subscriptions", **subscriptions})
+
             # New session
             elif action == "new_session":
-                await ws_adapter.unregister_connection(chat_id)
-                chat_id = str(uuid.uuid4())
-                await ws_adapter.register_connection(websocket, chat_id)
+                new_chat_id = str(uuid.uuid4())
+                await ws_adapter.switch_chat(chat_id, new_chat_id)
+                chat_id = replies.chat_id = new_chat_id
                 safe_key = f"websocket_{chat_id}"
-                await websocket.send_json({"type": "new_session", "id": safe_key})
+                await replies.send_json({"type": "new_session", "id": safe_key})
 
             # Legacy/Other actions
             elif action == "tool":
                 tool = data.get("tool")
-                await handle_tool(websocket, tool, settings, data)
+                await handle_tool(replies, tool, settings, data)
 
             # Handle agent toggle (Legacy router control)
             elif action == "toggle_agent":
                 # For now, this just logs, as the Loop is always running in background
                 # functionality-wise, but maybe we should respect this flag in the Loop?
                 agent_active = data.get("active", False)
-                await websocket.send_json(
+                await replies.send_json(
                     {
                         "type": "notification",
                         "content": f"Legacy Mode: {'ON' if agent_active else 'OFF'} (Bus is always active)",
@@ -2224,19 +2352,11 @@ async def websocket_endpoint(
                         settings.mem0_ollama_base_url = data["mem0_ollama_base_url"]
                     settings.save()
 
-                # Reset the agent loop's router to pick up new settings
-                agent_loop.reset_router()
+                # Reset the agent's router and memory manager (in every worker)
+                await _reset_agent_router()
+                await _reload_agent_memory()
 
-                # Clear settings cache so memory manager picks up new values
-                from pocketclaw.config import get_settings as _get_settings
-
-                _get_settings.cache_clear()
-
-                # Reload memory manager with fresh settings
-                agent_loop.memory = get_memory_manager(force_reload=True)
-                agent_loop.context_builder.memory = agent_loop.memory
-
-                await websocket.send_json({"type": "message", "content": "⚙️ Settings updated"})
+                await replies.send_json({"type": "message", "content": "⚙️ Settings updated"})
 
             # ... keep other handlers ... (abbreviated)
 
@@ -2250,52 +2370,52 @@ async def websocket_endpoint(
                         settings.anthropic_api_key = key
                         settings.llm_provider = "anthropic"
                         settings.save()
-                        agent_loop.reset_router()
-                        await websocket.send_json(
+                        await _reset_agent_router()
+                        await replies.send_json(
                             {"type": "message", "content": "✅ Anthropic API key saved!"}
                         )
                     elif provider == "openai" and key:
                         settings.openai_api_key = key
                         settings.llm_provider = "openai"
                         settings.save()
-                        agent_loop.reset_router()
-                        await websocket.send_json(
+                        await _reset_agent_router()
+                        await replies.send_json(
                             {"type": "message", "content": "✅ OpenAI API key saved!"}
                         )
                     elif provider == "tavily" and key:
                         settings.tavily_api_key = key
                         settings.save()
-                        await websocket.send_json(
+                        await replies.send_json(
                             {"type": "message", "content": "✅ Tavily API key saved!"}
                         )
                     elif provider == "brave" and key:
                         settings.brave_search_api_key = key
                         settings.save()
-                        await websocket.send_json(
+                        await replies.send_json(
                             {"type": "message", "content": "✅ Brave Search API key saved!"}
                         )
                     elif provider == "parallel" and key:
                         settings.parallel_api_key = key
                         settings.save()
-                        await websocket.send_json(
+                        await replies.send_json(
                             {"type": "message", "content": "✅ Parallel AI API key saved!"}
                         )
                     elif provider == "elevenlabs" and key:
                         settings.elevenlabs_api_key = key
                         settings.save()
-                        await websocket.send_json(
+                        await replies.send_json(
                             {"type": "message", "content": "✅ ElevenLabs API key saved!"}
                         )
                     elif provider == "google_oauth_id" and key:
                         settings.google_oauth_client_id = key
                         settings.save()
-                        await websocket.send_json(
+                        await replies.send_json(
                             {"type": "message", "content": "✅ Google OAuth Client ID saved!"}
                         )
                     elif provider == "google_oauth_secret" and key:
                         settings.google_oauth_client_secret = key
                         settings.save()
-                        await websocket.send_json(
+                        await replies.send_json(
                             {
                                 "type": "message",
                                 "content": "✅ Google OAuth Client Secret saved!",
@@ -2304,20 +2424,20 @@ async def websocket_endpoint(
                     elif provider == "spotify_client_id" and key:
                         settings.spotify_client_id = key
                         settings.save()
-                        await websocket.send_json(
+                        await replies.send_json(
                             {"type": "message", "content": "✅ Spotify Client ID saved!"}
                         )
                     elif provider == "spotify_client_secret" and key:
                         settings.spotify_client_secret = key
                         settings.save()
-                        await websocket.send_json(
+                        await replies.send_json(
                             {
                                 "type": "message",
                                 "content": "✅ Spotify Client Secret saved!",
                             }
                         )
                     else:
-                        await websocket.send_json(
+                        await replies.send_json(
                             {"type": "error", "content": "Invalid API key or provider"}
                         )
 
@@ -2326,12 +2446,9 @@ async def websocket_endpoint(
                 # Get agent status if available
                 agent_status = None
                 # Get agent status if available
-                agent_status = {
-                    "status": "running" if agent_loop._running else "stopped",
-                    "backend": "AgentLoop",
-                }
+                agent_status = _agent_status()
 
-                await websocket.send_json(
+                await replies.send_json(
                     {
                         "type": "settings",
                         "content": {
@@ -2382,13 +2499,26 @@ async def websocket_endpoint(
             # Handle file navigation (legacy)
             elif action == "navigate":
                 path = data.get("path", "")
-                await handle_file_navigation(websocket, path, settings)
+                await handle_file_navigation(replies, path, settings)
 
             # Handle file browser
             elif action == "browse":
                 path = data.get("path", "~")
                 context = data.get("context")
-                await handle_file_browse(websocket, path, settings, context=context)
+                try:
+                    offset = int(data.get("offset") or 0)
+                    limit = int(data.get("limit") or _BROWSE_PAGE_SIZE)
+                except (TypeError, ValueError):
+                    offset, limit = 0, _BROWSE_PAGE_SIZE
+                await handle_file_browse(
+                    replies,
+                    path,
+                    settings,
+                    context=context,
+                    offset=offset,
+                    limit=limit,
+                    query=str(data.get("query") or ""),
+                )
 
             # Handle reminder actions
             elif action == "get_reminders":
@@ -2397,7 +2527,7 @@ async def websocket_endpoint(
                 # Add time remaining to each reminder
                 for r in reminders:
                     r["time_remaining"] = scheduler.format_time_remaining(r)
-                await websocket.send_json({"type": "reminders", "reminders": reminders})
+                await replies.send_json({"type": "reminders", "reminders": reminders})
 
             elif action == "add_reminder":
                 message = data.get("message", "")
@@ -2406,9 +2536,9 @@ async def websocket_endpoint(
 
                 if reminder:
                     reminder["time_remaining"] = scheduler.format_time_remaining(reminder)
-                    await websocket.send_json({"type": "reminder_added", "reminder": reminder})
+                    await replies.send_json({"type": "reminder_added", "reminder": reminder})
                 else:
-                    await websocket.send_json(
+                    await replies.send_json(
                         {
                             "type": "error",
                             "content": "Could not parse time from message. Try 'in 5 minutes' or 'at 3pm'",
@@ -2419,16 +2549,16 @@ async def websocket_endpoint(
                 reminder_id = data.get("id", "")
                 scheduler = get_scheduler()
                 if scheduler.delete_reminder(reminder_id):
-                    await websocket.send_json({"type": "reminder_deleted", "id": reminder_id})
+                    await replies.send_json({"type": "reminder_deleted", "id": reminder_id})
                 else:
-                    await websocket.send_json({"type": "error", "content": "Reminder not found"})
+                    await replies.send_json({"type": "error", "content": "Reminder not found"})
 
             # ==================== Intentions API ====================
 
             elif action == "get_intentions":
                 daemon = get_daemon()
                 intentions = daemon.get_intentions()
-                await websocket.send_json({"type": "intentions", "intentions": intentions})
+                await replies.send_json({"type": "intentions", "intentions": intentions})
 
             elif action == "create_intention":
                 daemon = get_daemon()
@@ -2440,9 +2570,9 @@ async def websocket_endpoint(
                         context_sources=data.get("context_sources", []),
                         enabled=data.get("enabled", True),
                     )
-                    await websocket.send_json({"type": "intention_created", "intention": intention})
+                    await replies.send_json({"type": "intention_created", "intention": intention})
                 except Exception as e:
-                    await websocket.send_json(
+                    await replies.send_json(
                         {"type": "error", "content": f"Failed to create intention: {e}"}
                     )
 
@@ -2452,26 +2582,26 @@ async def websocket_endpoint(
                 updates = data.get("updates", {})
                 intention = daemon.update_intention(intention_id, updates)
                 if intention:
-                    await websocket.send_json({"type": "intention_updated", "intention": intention})
+                    await replies.send_json({"type": "intention_updated", "intention": intention})
                 else:
-                    await websocket.send_json({"type": "error", "content": "Intention not found"})
+                    await replies.send_json({"type": "error", "content": "Intention not found"})
 
             elif action == "delete_intention":
                 daemon = get_daemon()
                 intention_id = data.get("id", "")
                 if daemon.delete_intention(intention_id):
-                    await websocket.send_json({"type": "intention_deleted", "id": intention_id})
+                    await replies.send_json({"type": "intention_deleted", "id": intention_id})
                 else:
-                    await websocket.send_json({"type": "error", "content": "Intention not found"})
+                    await replies.send_json({"type": "error", "content": "Intention not found"})
 
             elif action == "toggle_intention":
                 daemon = get_daemon()
                 intention_id = data.get("id", "")
                 intention = daemon.toggle_intention(intention_id)
                 if intention:
-                    await websocket.send_json({"type": "intention_toggled", "intention": intention})
+                    await replies.send_json({"type": "intention_toggled", "intention": intention})
                 else:
-                    await websocket.send_json({"type": "error", "content": "Intention not found"})
+                    await replies.send_json({"type": "error", "content": "Intention not found"})
 
             elif action == "run_intention":
                 daemon = get_daemon()
@@ -2479,7 +2609,7 @@ async def websocket_endpoint(
                 intention = daemon.get_intention(intention_id)
                 if intention:
                     # Run in background, results streamed via broadcast_intention
-                    await websocket.send_json(
+                    await replies.send_json(
                         {
                             "type": "notification",
                             "content": f"🚀 Running intention: {intention['name']}",
@@ -2487,7 +2617,7 @@ async def websocket_endpoint(
                     )
                     asyncio.create_task(daemon.run_intention_now(intention_id))
                 else:
-                    await websocket.send_json({"type": "error", "content": "Intention not found"})
+                    await replies.send_json({"type": "error", "content": "Intention not found"})
 
             # ==================== Plan Mode API ====================
 
@@ -2498,9 +2628,9 @@ async def websocket_endpoint(
                 session_key = data.get("session_key", "")
                 plan = pm.approve_plan(session_key)
                 if plan:
-                    await websocket.send_json({"type": "plan_approved", "session_key": session_key})
+                    await replies.send_json({"type": "plan_approved", "session_key": session_key})
                 else:
-                    await websocket.send_json(
+                    await replies.send_json(
                         {"type": "error", "content": "No active plan to approve"}
                     )
 
@@ -2511,9 +2641,9 @@ async def websocket_endpoint(
                 session_key = data.get("session_key", "")
                 plan = pm.reject_plan(session_key)
                 if plan:
-                    await websocket.send_json({"type": "plan_rejected", "session_key": session_key})
+                    await replies.send_json({"type": "plan_rejected", "session_key": session_key})
                 else:
-                    await websocket.send_json(
+                    await replies.send_json(
                         {"type": "error", "content": "No active plan to reject"}
                     )
 
@@ -2530,7 +2660,7 @@ async def websocket_endpoint(
                     }
                     for s in loader.get_invocable()
                 ]
-                await websocket.send_json({"type": "skills", "skills": skills})
+                await replies.send_json({"type": "skills", "skills": skills})
 
             elif action == "run_skill":
                 skill_name = data.get("name", "")
@@ -2546,25 +2676,25 @@ async def websocket_endpoint(
                         if available
                         else "No skills installed yet."
                     )
-                    await websocket.send_json(
+                    await replies.send_json(
                         {
                             "type": "error",
                             "content": f"Unknown command: /{skill_name}\n\n{hint}",
                         }
                     )
                 else:
-                    await websocket.send_json(
+                    await replies.send_json(
                         {"type": "notification", "content": f"🎯 Running skill: {skill_name}"}
                     )
 
                     # Execute skill through agent
                     executor = SkillExecutor(settings)
-                    await websocket.send_json({"type": "stream_start"})
+                    await replies.send_json({"type": "stream_start"})
                     try:
                         async for chunk in executor.execute_skill(skill, skill_args):
-                            await websocket.send_json(chunk)
+                            await replies.send_json(chunk)
                     finally:
-                        await websocket.send_json({"type": "stream_end"})
+                        await replies.send_json({"type": "stream_end"})
 
     except WebSocketDisconnect:
         logger.info("WebSocket client disconnected")
@@ -2614,33 +2744,85 @@ async def save_identity(request: Request):
     return {"ok": True, "updated": updated}
 
 
+@app.get("/api/routing/stats")
+async def get_routing_stats():
+    """Smart routing telemetry: per-tier latency, error rate and cost, plus decisions."""
+    from pocketclaw.agents.model_telemetry import get_model_telemetry
+
+    settings = Settings.load()
+    return {
+        "enabled": settings.smart_routing_enabled,
+        "adaptive": settings.smart_routing_adaptive,
+        "latency_budget_ms": settings.smart_routing_latency_budget_ms,
+        "max_error_rate": settings.smart_routing_max_error_rate,
+        "cost_budget_usd": settings.smart_routing_cost_budget_usd,
+        "window_seconds": settings.smart_routing_window_seconds,
+        **get_model_telemetry().snapshot(),
+    }
+
+
+@app.get("/api/startup")
+async def get_startup_status():
+    """Per-subsystem startup status and timing (optional integrations may still be starting)."""
+    if _startup is None:
+        return {"ready": False, "complete": False, "elapsed_ms": None, "components": []}
+    return _startup.snapshot()
+
+
+@app.get("/api/agent/queue")
+async def get_agent_queue():
+    """Agent scheduler state (slots, per-lane queue depth and waits) plus bus load."""
+    bus = get_message_bus()
+    if _worker_pool is not None:
+        from pocketclaw.agents.workers import merge_scheduler_stats
+
+        replies = await _worker_pool.worker_stats()
+        scheduler = merge_scheduler_stats([r["scheduler"] for r in replies if r])
+        workers = [
+            {**w, "agent_running": bool(r and r["running"])}
+            for w, r in zip(_worker_pool.stats()["workers"], replies)
+        ]
+    else:
+        scheduler, workers = agent_loop.scheduler.stats(), []
+    return {
+        **scheduler,
+        "workers": workers,
+        "inbound": bus.inbound_stats(),
+        "outbound": bus.outbound_stats(),
+        "websocket": ws_adapter.stats(),
+    }
+
+
 @app.get("/api/sessions")
-async def list_sessions_v2(limit: int = 50):
-    """List sessions using the fast session index."""
+async def list_sessions_v2(
+    limit: int = Query(50, ge=1, le=500),
+    cursor: str | None = None,
+    channel: str | None = None,
+):
+    """List sessions newest-first from the in-memory session index.
+
+    ``channel`` is a comma-separated filter; pass the returned ``next_cursor``
+    back as ``cursor`` for the next page (it's null on the last one).
+    """
     manager = get_memory_manager()
     store = manager._store
+    channels = [c.strip() for c in channel.split(",") if c.strip()] if channel else None
 
-    if hasattr(store, "_load_session_index"):
-        index = store._load_session_index()
-        # Sort by last_activity descending
-        entries = sorted(
-            index.items(),
-            key=lambda kv: kv[1].get("last_activity", ""),
-            reverse=True,
-        )[:limit]
-        sessions = []
-        for safe_key, meta in entries:
-            sessions.append({"id": safe_key, **meta})
-        return {"sessions": sessions, "total": len(index)}
+    if hasattr(store, "list_sessions_page"):
+        try:
+            sessions, next_cursor, total = store.list_sessions_page(limit, cursor, channels)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        return {"sessions": sessions, "total": total, "next_cursor": next_cursor}
 
     # Fallback for non-file stores
-    return {"sessions": [], "total": 0}
+    return {"sessions": [], "total": 0, "next_cursor": None}
 
 
 @app.get("/api/memory/sessions")
 async def list_sessions(limit: int = 20):
     """List all available sessions with metadata (legacy endpoint)."""
-    result = await list_sessions_v2(limit=limit)
+    result = await list_sessions_v2(limit=limit, cursor=None, channel=None)
     return result.get("sessions", [])
 
 
@@ -2766,37 +2948,48 @@ async def delete_long_term_memory(entry_id: str):
 
 
 @app.get("/api/audit")
-async def get_audit_log(limit: int = 100):
-    """Get audit logs."""
-    logger = get_audit_logger()
-    if not logger.log_path.exists():
-        return []
+async def get_audit_log(
+    response: Response,
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: str | None = None,
+    severity: str | None = None,
+    action: str | None = None,
+    status: str | None = None,
+    since: str | None = None,
+    until: str | None = None,
+    q: str | None = None,
+):
+    """Get audit logs, newest first.
+
+    ``severity``/``action``/``status`` take comma-separated values, ``since``/
+    ``until`` ISO timestamps, ``q`` a case-insensitive substring. Pass the
+    ``X-Next-Cursor`` response header back as ``cursor`` for the next page.
+    """
+    from pocketclaw.security.audit_reader import AuditFilter
 
-    logs: list[dict] = []
     try:
-        with open(logger.log_path) as f:
-            lines = f.readlines()
-
-        for line in reversed(lines):
-            if len(logs) >= limit:
-                break
-            try:
-                logs.append(json.loads(line))
-            except Exception:
-                pass
-    except Exception:
+        filters = AuditFilter.from_query(severity, action, status, since, until, q)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from None
+    try:
+        logs, next_cursor = await asyncio.to_thread(
+            get_audit_logger().query, limit, cursor, filters
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from None
+    except OSError:
         return []
 
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
     return logs
 
 
 @app.delete("/api/audit")
 async def clear_audit_log():
     """Clear the audit log file."""
-    logger = get_audit_logger()
     try:
-        if logger.log_path.exists():
-            logger.log_path.write_text("")
+        await asyncio.to_thread(get_audit_logger().clear)
         return {"ok": True}
     except Exception as e:
         from fastapi.responses import JSONResponse
@@ -2907,7 +3100,24 @@ async def run_self_audit_endpoint():
     return report
 
 
-async def handle_tool(websocket: WebSocket, tool: str, settings: Settings, data: dict):
+class _QueuedReplies:
+    """Stands in for the socket in websocket_endpoint's handlers.
+
+    ``send_json`` queues the payload on the adapter's writer for ``chat_id``,
+    so replies keep their order with stream chunks and get the same
+    backpressure; nothing else writes to the socket once it is registered.
+    """
+
+    def __init__(self, chat_id: str):
+        self.chat_id = chat_id
+
+    async def send_json(self, payload: dict) -> None:
+        ws_adapter.send_payload(self.chat_id, payload)
+
+
+async def handle_tool(
+    websocket: WebSocket | _QueuedReplies, tool: str, settings: Settings, data: dict
+):
     """Handle tool execution."""
 
     if tool == "status":
@@ -2951,7 +3161,13 @@ async def handle_tool(websocket: WebSocket, tool: str, settings: Settings, data:
         await websocket.send_json({"type": "error", "content": f"Unknown tool: {tool}"})
 
 
-async def handle_file_navigation(websocket: WebSocket, path: str, settings: Settings):
+_BROWSE_PAGE_SIZE = 50
+_BROWSE_MAX_PAGE_SIZE = 500
+
+
+async def handle_file_navigation(
+    websocket: WebSocket | _QueuedReplies, path: str, settings: Settings
+):
     """Handle file browser navigation."""
     from pocketclaw.tools.fetch import list_directory
 
@@ -2960,14 +3176,23 @@ async def handle_file_navigation(websocket: WebSocket, path: str, settings: Sett
 
 
 async def handle_file_browse(
-    websocket: WebSocket, path: str, settings: Settings, *, context: str | None = None
+    websocket: WebSocket | _QueuedReplies,
+    path: str,
+    settings: Settings,
+    *,
+    context: str | None = None,
+    offset: int = 0,
+    limit: int = _BROWSE_PAGE_SIZE,
+    query: str = "",
 ):
     """Handle file browser - returns structured JSON for the modal.
 
     If an optional ``context`` string is provided it is echoed back in the
     response so the frontend can route sidebar vs modal file responses.
+    ``offset``/``limit`` page through the directory (hidden files excluded)
+    and ``query`` filters by name; the listing runs in a worker thread.
     """
-    from pocketclaw.tools.fetch import is_safe_path
+    from pocketclaw.tools.fetch import is_safe_path, scan_directory
 
     def _resp(payload: dict) -> dict:
         """Attach context to every response so frontend can route sidebar vs modal."""
@@ -2995,38 +3220,15 @@ async def handle_file_browse(
         )
         return
 
-    if not resolved_path.exists():
+    limit = min(max(limit, 1), _BROWSE_MAX_PAGE_SIZE)
+    try:
+        listing = await asyncio.to_thread(scan_directory, resolved_path, offset, limit, query)
+    except FileNotFoundError:
         await websocket.send_json(_resp({"type": "files", "error": "Path does not exist"}))
         return
-
-    if not resolved_path.is_dir():
+    except NotADirectoryError:
         await websocket.send_json(_resp({"type": "files", "error": "Not a directory"}))
         return
-
-    # Build file list
-    files = []
-    try:
-        items = sorted(resolved_path.iterdir(), key=lambda x: (not x.is_dir(), x.name.lower()))
-        # Filter hidden files BEFORE applying the limit so dotfiles don't consume quota
-        visible_items = [item for item in items if not item.name.startswith(".")]
-
-        for item in visible_items[:50]:  # Limit to 50 visible items
-            file_info = {"name": item.name, "isDir": item.is_dir()}
-
-            if not item.is_dir():
-                try:
-                    size = item.stat().st_size
-                    if size < 1024:
-                        file_info["size"] = f"{size} B"
-                    elif size < 1024 * 1024:
-                        file_info["size"] = f"{size / 1024:.1f} KB"
-                    else:
-                        file_info["size"] = f"{size / (1024 * 1024):.1f} MB"
-                except Exception:
-                    file_info["size"] = "?"
-
-            files.append(file_info)
-
     except PermissionError:
         await websocket.send_json(_resp({"type": "files", "error": "Permission denied"}))
         return
@@ -3038,7 +3240,7 @@ async def handle_file_browse(
     except ValueError:
         display_path = str(resolved_path)
 
-    await websocket.send_json(_resp({"type": "files", "path": display_path, "files": files}))
+    await websocket.send_json(_resp({"type": "files", "path": display_path, **listing}))
 
 
 # =========================================================================
@@ -3088,17 +3290,8 @@ async def save_memory_settings(request: Request):
 
     settings.save()
 
-    # Clear settings cache so memory manager picks up new values
-    from pocketclaw.config import get_settings as _get_settings
-
-    _get_settings.cache_clear()
-
     # Force reload the memory manager with fresh settings
-    from pocketclaw.memory import get_memory_manager
-
-    manager = get_memory_manager(force_reload=True)
-    agent_loop.memory = manager
-    agent_loop.context_builder.memory = manager
+    await _reload_agent_memory()
 
     return {"status": "ok"}
 
@@ -3144,7 +3337,12 @@ def run_dashboard(host: str = "127.0.0.1", port: int = 8888, open_browser: bool
     if open_browser:
         _open_browser_url = f"http://localhost:{port}"
 
-    uvicorn.run(app, host=host, port=port)
+    uvicorn.run(
+        app,
+        host=host,
+        port=port,
+        ws_per_message_deflate=Settings.load().websocket_compression,
+    )
 
 
 if __name__ == "__main__":
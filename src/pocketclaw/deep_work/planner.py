@@ -2,6 +2,10 @@
 # Created: 2026-02-12
 # Updated: 2026-02-12 — Added research_depth parameter (none/quick/standard/deep).
 #   'none' skips research entirely (no LLM call), passing empty notes to PRD.
+# Updated: 2026-10-19 — Routers are leased from the shared warm router pool.
+# Updated: 2026-10-19 — _run_prompt goes through the opt-in response cache, so
+#   re-planning an unchanged project replays earlier phases without LLM calls.
+#   Task/team output that fails to parse is discarded from the cache.
 #
 # PlannerAgent runs research, PRD generation, task breakdown, and team
 # assembly through AgentRouter, producing a PlannerResult that can be
@@ -79,75 +83,70 @@ class PlannerAgent:
         Broadcasts SystemEvents for each phase so the frontend can show
         progress (e.g. spinner text).
         """
-        # Create a single AgentRouter for all phases (avoids 4x SDK init)
-        from pocketclaw.agents.router import AgentRouter
+        # Lease a single warm AgentRouter for all phases (avoids 4x SDK init)
+        from pocketclaw.agents.router_pool import get_router_pool
         from pocketclaw.config import get_settings
 
-        router = AgentRouter(get_settings())
-
-        # Phase 1: Research (depth controls prompt and thoroughness)
-        if research_depth == "none":
-            # Skip research entirely — no LLM call
-            research = ""
-        else:
-            self._broadcast_phase(project_id, "research")
-            research_prompts = {
-                "quick": RESEARCH_PROMPT_QUICK,
-                "standard": RESEARCH_PROMPT,
-                "deep": RESEARCH_PROMPT_DEEP,
-            }
-            prompt_template = research_prompts.get(research_depth, RESEARCH_PROMPT)
-            research = await self._run_prompt(
-                prompt_template.format(project_description=project_description),
+        async with get_router_pool().lease(get_settings()) as router:
+            # Phase 1: Research (depth controls prompt and thoroughness)
+            if research_depth == "none":
+                # Skip research entirely — no LLM call
+                research = ""
+            else:
+                self._broadcast_phase(project_id, "research")
+                research_prompts = {
+                    "quick": RESEARCH_PROMPT_QUICK,
+                    "standard": RESEARCH_PROMPT,
+                    "deep": RESEARCH_PROMPT_DEEP,
+                }
+                prompt_template = research_prompts.get(research_depth, RESEARCH_PROMPT)
+                research = await self._run_prompt(
+                    prompt_template.format(project_description=project_description),
+                    router=router,
+                )
+
+            # Phase 2: PRD
+            self._broadcast_phase(project_id, "prd")
+            prd = await self._run_prompt(
+                PRD_PROMPT.format(
+                    project_description=project_description,
+                    research_notes=research,
+                ),
                 router=router,
             )
 
-        # Phase 2: PRD
-        self._broadcast_phase(project_id, "prd")
-        prd = await self._run_prompt(
-            PRD_PROMPT.format(
-                project_description=project_description,
-                research_notes=research,
-            ),
-            router=router,
-        )
-
-        # Phase 3: Task breakdown
-        self._broadcast_phase(project_id, "tasks")
-        tasks_raw = await self._run_prompt(
-            TASK_BREAKDOWN_PROMPT.format(
+            # Phase 3: Task breakdown
+            self._broadcast_phase(project_id, "tasks")
+            tasks_prompt = TASK_BREAKDOWN_PROMPT.format(
                 project_description=project_description,
                 prd_content=prd,
                 research_notes=research,
-            ),
-            router=router,
-        )
-        tasks = self._parse_tasks(tasks_raw)
-
-        # Retry once if task breakdown failed to parse
-        if not tasks:
-            logger.info("Retrying task breakdown with explicit JSON instruction")
-            tasks_raw = await self._run_prompt(
-                "Your previous response was not valid JSON. "
-                "Return ONLY a JSON array of task objects, no markdown, "
-                "no explanation — just the raw JSON array.\n\n"
-                + TASK_BREAKDOWN_PROMPT.format(
-                    project_description=project_description,
-                    prd_content=prd,
-                    research_notes=research,
-                ),
-                router=router,
             )
+            tasks_raw = await self._run_prompt(tasks_prompt, router=router)
             tasks = self._parse_tasks(tasks_raw)
 
-        # Phase 4: Team assembly
-        self._broadcast_phase(project_id, "team")
-        tasks_json_str = json.dumps([t.to_dict() for t in tasks], indent=2)
-        team_raw = await self._run_prompt(
-            TEAM_ASSEMBLY_PROMPT.format(tasks_json=tasks_json_str),
-            router=router,
-        )
-        team = self._parse_team(team_raw)
+            # Retry once if task breakdown failed to parse
+            if not tasks:
+                self._discard_cached(tasks_prompt, router)
+                logger.info("Retrying task breakdown with explicit JSON instruction")
+                retry_prompt = (
+                    "Your previous response was not valid JSON. "
+                    "Return ONLY a JSON array of task objects, no markdown, "
+                    "no explanation — just the raw JSON array.\n\n" + tasks_prompt
+                )
+                tasks_raw = await self._run_prompt(retry_prompt, router=router)
+                tasks = self._parse_tasks(tasks_raw)
+                if not tasks:
+                    self._discard_cached(retry_prompt, router)
+
+            # Phase 4: Team assembly
+            self._broadcast_phase(project_id, "team")
+            tasks_json_str = json.dumps([t.to_dict() for t in tasks], indent=2)
+            team_prompt = TEAM_ASSEMBLY_PROMPT.format(tasks_json=tasks_json_str)
+            team_raw = await self._run_prompt(team_prompt, router=router)
+            team = self._parse_team(team_raw)
+            if not team:
+                self._discard_cached(team_prompt, router)
 
         # Split human tasks out for the result
         human_tasks = [t for t in tasks if t.task_type == "human"]
@@ -177,17 +176,22 @@ class PlannerAgent:
 
         Args:
             prompt: The prompt to send to the LLM.
-            router: Optional pre-created AgentRouter (avoids re-initialization).
+            router: Optional leased AgentRouter (otherwise one is leased from the pool).
         """
         if router is None:
-            from pocketclaw.agents.router import AgentRouter
+            from pocketclaw.agents.router_pool import get_router_pool
             from pocketclaw.config import get_settings
 
-            router = AgentRouter(get_settings())
+            async with get_router_pool().lease(get_settings()) as pooled:
+                return await self._run_prompt(prompt, router=pooled)
+
+        from pocketclaw.agents.response_cache import cached_run
+        from pocketclaw.config import get_settings
 
         output_parts: list[str] = []
 
-        async for chunk in router.run(prompt):
+        # The key follows router.settings (what the router was built with)
+        async for chunk in cached_run(get_settings(), prompt, router=router):
             if chunk.get("type") == "message":
                 content = chunk.get("content", "")
                 if content:
@@ -195,6 +199,13 @@ class PlannerAgent:
 
         return "".join(output_parts)
 
+    def _discard_cached(self, prompt: str, router) -> None:
+        """Drop a cached run whose output didn't parse, so re-planning asks again."""
+        from pocketclaw.agents.response_cache import discard
+        from pocketclaw.config import get_settings
+
+        discard(get_settings(), prompt, router=router)
+
     def _parse_tasks(self, raw: str) -> list[TaskSpec]:
         """Parse LLM JSON output into a list of TaskSpec objects.
 
@@ -4,6 +4,9 @@
  * Created: 2026-02-05
  * Extracted from app.js as part of componentization refactor.
  *
+ * Changes:
+ *   - 2026-10-19: File attachments, uploaded as binary frames before the message.
+ *
  * Contains chat/messaging functionality:
  * - Message handling
  * - Streaming support
@@ -29,7 +32,8 @@ window.PocketPaw.Chat = {
 
             // Messages
             messages: [],
-            inputText: ''
+            inputText: '',
+            attachments: []
         };
     },
 
@@ -174,14 +178,27 @@ window.PocketPaw.Chat = {
             },
 
             /**
-             * Send a chat message
+             * Queue files picked in the chat input
+             */
+            attachFiles(event) {
+                this.attachments.push(...event.target.files);
+                event.target.value = '';
+            },
+
+            removeAttachment(index) {
+                this.attachments.splice(index, 1);
+            },
+
+            /**
+             * Send a chat message (uploading any attachments first)
              */
-            sendMessage() {
+            async sendMessage() {
                 const text = this.inputText.trim();
-                if (!text) return;
+                const files = this.attachments;
+                if (!text && !files.length) return;
 
                 // Check for skill command (starts with /)
-                if (text.startsWith('/')) {
+                if (text.startsWith('/') && !files.length) {
                     const parts = text.slice(1).split(' ');
                     const skillName = parts[0];
                     const args = parts.slice(1).join(' ');
@@ -197,16 +214,27 @@ window.PocketPaw.Chat = {
                 }
 
                 // Add user message
-                this.addMessage('user', text);
+                const names = files.map(f => f.name).join(', ');
+                this.addMessage('user', files.length ? `${text}\n[Attached: ${names}]`.trim() : text);
                 this.inputText = '';
+                this.attachments = [];
 
                 // Start streaming indicator
                 this.startStreaming();
 
+                let uploads = [];
+                try {
+                    uploads = await Promise.all(files.map(f => socket.uploadFile(f)));
+                } catch (e) {
+                    this.endStreaming();
+                    this.showToast(`Upload failed: ${e.message}`, 'error');
+                    return;
+                }
+
                 // Send to server
-                socket.chat(text);
+                socket.chat(text, uploads);
 
-                this.log(`You: ${text}`, 'info');
+                this.log(`You: ${text}${names ? ` [${names}]` : ''}`, 'info');
             },
 
             /**
@@ -4,6 +4,7 @@
  * Created: 2026-02-05
  * Updated: 2026-02-12 — handleFiles routes sidebar_* context responses to
  *   ProjectBrowser.handleSidebarFiles() instead of updating modal state.
+ * Updated: 2026-10-19 — Paged listings ("Load more") and a name filter.
  *
  * Contains file browser modal functionality:
  * - Directory navigation
@@ -24,7 +25,10 @@ window.PocketPaw.FileBrowser = {
             filePath: '~',
             files: [],
             fileLoading: false,
-            fileError: null
+            fileError: null,
+            fileQuery: '',
+            fileTotal: 0,
+            fileHasMore: false
         };
     },
 
@@ -52,7 +56,9 @@ window.PocketPaw.FileBrowser = {
                 }
 
                 this.filePath = data.path || '~';
-                this.files = data.files || [];
+                this.files = data.offset ? [...this.files, ...(data.files || [])] : (data.files || []);
+                this.fileTotal = data.total || this.files.length;
+                this.fileHasMore = !!data.hasMore;
 
                 // Refresh Lucide icons after Alpine renders
                 this.$nextTick(() => {
@@ -69,6 +75,7 @@ window.PocketPaw.FileBrowser = {
                 this.fileError = null;
                 this.files = [];
                 this.filePath = '~';
+                this.fileQuery = '';
 
                 // Refresh icons after modal renders
                 this.$nextTick(() => {
@@ -84,9 +91,28 @@ window.PocketPaw.FileBrowser = {
             navigateTo(path) {
                 this.fileLoading = true;
                 this.fileError = null;
+                this.fileQuery = '';
                 socket.send('browse', { path });
             },
 
+            /**
+             * Re-list the current directory filtered by name
+             */
+            filterFiles() {
+                socket.send('browse', { path: this.filePath, query: this.fileQuery });
+            },
+
+            /**
+             * Fetch the next page of the current directory
+             */
+            loadMoreFiles() {
+                socket.send('browse', {
+                    path: this.filePath,
+                    query: this.fileQuery,
+                    offset: this.files.length
+                });
+            },
+
             /**
              * Navigate up one directory
              */
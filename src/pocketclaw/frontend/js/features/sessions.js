@@ -2,6 +2,7 @@
  * PocketPaw - Sessions Feature Module
  *
  * Created: 2026-02-10
+ * Updated: 2026-10-19 - Cursor-paginated session list ("Load more")
  *
  * Session-aware chat: sidebar session list, switching, new chat,
  * delete, rename, grouped display (Today/Yesterday/This Week/Older).
@@ -17,6 +18,7 @@ window.PocketPaw.Sessions = {
             currentSessionId: null,
             sessionsLoading: false,
             sessionsTotal: 0,
+            sessionsNextCursor: null,
             sessionSearch: '',
             sessionsCollapsed: false,
             editingSessionId: null,
@@ -37,6 +39,7 @@ window.PocketPaw.Sessions = {
                         const data = await res.json();
                         this.sessions = data.sessions || [];
                         this.sessionsTotal = data.total || 0;
+                        this.sessionsNextCursor = data.next_cursor || null;
                     }
                 } catch (e) {
                     console.error('[Sessions] Failed to load:', e);
@@ -45,6 +48,27 @@ window.PocketPaw.Sessions = {
                 }
             },
 
+            /**
+             * Append the next page of older sessions
+             */
+            async loadMoreSessions() {
+                if (!this.sessionsNextCursor) return;
+                const cursor = encodeURIComponent(this.sessionsNextCursor);
+                try {
+                    const res = await fetch(`/api/sessions?limit=100&cursor=${cursor}`);
+                    if (res.ok) {
+                        const data = await res.json();
+                        const seen = new Set(this.sessions.map(s => s.id));
+                        const older = (data.sessions || []).filter(s => !seen.has(s.id));
+                        this.sessions = [...this.sessions, ...older];
+                        this.sessionsTotal = data.total || 0;
+                        this.sessionsNextCursor = data.next_cursor || null;
+                    }
+                } catch (e) {
+                    console.error('[Sessions] Failed to load more:', e);
+                }
+            },
+
             /**
              * Select and switch to a session
              */
@@ -3,6 +3,7 @@
  *
  * Created: 2026-02-05
  * Updated: 2026-02-12 — Added dw_ prefix routing for Deep Work events
+ * Updated: 2026-10-19 — Audit panel pages through /api/audit with X-Next-Cursor
  *
  * Contains transparency panel features:
  * - Identity panel
@@ -61,6 +62,7 @@ window.PocketPaw.Transparency = {
             showAudit: false,
             auditLoading: false,
             auditLogs: [],
+            auditNextCursor: null,
             auditFilter: '',              // text search
             auditSeverityFilter: 'all',   // 'all' | 'info' | 'warning' | 'alert' | 'critical'
 
@@ -304,8 +306,12 @@ window.PocketPaw.Transparency = {
                 this.auditLoading = true;
                 this.auditFilter = '';
                 this.auditSeverityFilter = 'all';
+                this.auditNextCursor = null;
                 fetch('/api/audit')
-                    .then(r => r.json())
+                    .then(r => {
+                        this.auditNextCursor = r.headers.get('X-Next-Cursor');
+                        return r.json();
+                    })
                     .then(data => {
                         this.auditLogs = Array.isArray(data) ? data : [];
                         this.auditLoading = false;
@@ -316,6 +322,24 @@ window.PocketPaw.Transparency = {
                     });
             },
 
+            /**
+             * Fetch the next (older) page of audit logs
+             */
+            loadMoreAudit() {
+                if (!this.auditNextCursor) return;
+                fetch(`/api/audit?cursor=${encodeURIComponent(this.auditNextCursor)}`)
+                    .then(r => {
+                        this.auditNextCursor = r.headers.get('X-Next-Cursor');
+                        return r.json();
+                    })
+                    .then(data => {
+                        if (Array.isArray(data)) this.auditLogs.push(...data);
+                    })
+                    .catch(() => {
+                        this.showToast('Failed to load audit logs', 'error');
+                    });
+            },
+
             /**
              * Filtered audit logs based on search + severity filter
              */
@@ -393,6 +417,7 @@ window.PocketPaw.Transparency = {
                     .then(data => {
                         if (data.ok) {
                             this.auditLogs = [];
+                            this.auditNextCursor = null;
                             this.showToast('Audit log cleared', 'success');
                         }
                     })
@@ -4,6 +4,8 @@
  *
  * Changes:
  *   - 2026-02-06: Auto-upgrade to wss:// on HTTPS; send token via first message instead of URL.
+ *   - 2026-10-19: uploadFile() sends files as chunked binary frames (no base64);
+ *                 the chat input uses it for attachments.
  */
 
 class PocketPawSocket {
@@ -14,6 +16,7 @@ class PocketPawSocket {
         this.maxReconnectAttempts = 5;
         this.isConnecting = false;
         this.isConnected = false;
+        this.nextUploadId = 1;
     }
 
     /**
@@ -37,7 +40,7 @@ class PocketPawSocket {
         if (params.length > 0) url += '?' + params.join('&');
         console.log('[WS] Connecting to', `${wsProtocol}//${window.location.host}/ws...`);
 
-        this.ws = new WebSocket(url);
+        this.ws = new WebSocket(url, ['pocketpaw.json']);
 
         this.ws.onopen = () => {
             console.log('[WS] Connected');
@@ -181,8 +184,8 @@ class PocketPawSocket {
         this.send('toggle_agent', { active });
     }
 
-    chat(message) {
-        this.send('chat', { message });
+    chat(message, uploads = []) {
+        this.send('chat', uploads.length ? { message, uploads } : { message });
     }
 
     saveSettings(settings) {
@@ -229,6 +232,40 @@ class PocketPawSocket {
     newSession() {
         this.send('new_session');
     }
+
+    /**
+     * Upload a File/Blob as binary frames; resolves with the upload id to pass
+     * to chat(message, [id]) once the server has it on disk.
+     */
+    async uploadFile(file, chunkSize = 256 * 1024) {
+        const uploadId = this.nextUploadId++;
+        const done = new Promise((resolve, reject) => {
+            const finish = (data) => {
+                if (data.upload_id !== uploadId) return;
+                this.off('upload_complete', finish);
+                this.off('upload_error', finish);
+                data.type === 'upload_complete' ? resolve(uploadId) : reject(new Error(data.content));
+            };
+            this.on('upload_complete', finish);
+            this.on('upload_error', finish);
+        });
+
+        this.send('upload_start', { upload_id: uploadId, name: file.name || 'upload', mime_type: file.type || null });
+        for (let offset = 0; offset < file.size; offset += chunkSize) {
+            // Let the socket drain instead of buffering the whole file in memory
+            while (this.ws && this.ws.bufferedAmount > 4 * chunkSize) {
+                await new Promise(r => setTimeout(r, 20));
+            }
+            const body = new Uint8Array(await file.slice(offset, offset + chunkSize).arrayBuffer());
+            const frame = new Uint8Array(5 + body.length);
+            frame[0] = 0x55; // 'U'
+            new DataView(frame.buffer).setUint32(1, uploadId);
+            frame.set(body, 5);
+            this.ws.send(frame);
+        }
+        this.send('upload_end', { upload_id: uploadId });
+        return done;
+    }
 }
 
 // Export singleton - only one instance ever
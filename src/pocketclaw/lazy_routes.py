@@ -0,0 +1,68 @@
+"""Routers that import their subsystem on first request.
+
+Created: 2026-10-19
+
+Mission Control and Deep Work pull in their models, managers and stores when
+their API modules are imported. Mounting them through ``LazyRouter`` keeps
+that work off the dashboard's import path (and so off time-to-first-byte)::
+
+    app.mount("/api/deep-work", LazyRouter("pocketclaw.deep_work.api:router"))
+
+The first request under the prefix imports the module in a worker thread,
+wraps the ``APIRouter`` in a small FastAPI app and serves it from then on.
+The main app's middleware (auth, rate limiting, security headers) still runs
+in front of it; the lazily loaded routes are left out of ``/openapi.json``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import logging
+import threading
+import time
+
+from fastapi import APIRouter, FastAPI
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+
+class LazyRouter:
+    """ASGI app serving an ``APIRouter`` that is imported on first use.
+
+    Args:
+        target: ``"package.module:attribute"`` naming the router.
+    """
+
+    def __init__(self, target: str) -> None:
+        self.target = target
+        self.load_seconds: float | None = None
+        self._app: ASGIApp | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._app is not None
+
+    def load(self) -> ASGIApp:
+        """Import the router (once) and return the app that serves it."""
+        with self._lock:
+            if self._app is None:
+                start = time.perf_counter()
+                module_name, _, attr = self.target.partition(":")
+                router = getattr(importlib.import_module(module_name), attr or "router")
+                if not isinstance(router, APIRouter):
+                    raise TypeError(f"{self.target} is not an APIRouter")
+                app = FastAPI(openapi_url=None, docs_url=None, redoc_url=None)
+                app.include_router(router)
+                self.load_seconds = time.perf_counter() - start
+                logger.info("Loaded %s in %.0f ms", self.target, self.load_seconds * 1000)
+                self._app = app
+        return self._app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        app = self._app
+        if app is None:
+            app = await asyncio.to_thread(self.load)
+        await app(scope, receive, send)
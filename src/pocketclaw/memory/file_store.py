@@ -2,6 +2,10 @@
 # Created: 2026-02-02 - Memory System
 # Updated: 2026-02-09 - Fixed UUID collision, daily file loading, search, persistent delete
 # Updated: 2026-02-10 - Session index for fast listing, delete/rename support
+# Updated: 2026-10-19 - In-memory sorted session order with cursor pagination
+# Updated: 2026-10-19 - Session index reloaded when another process rewrites it;
+#   read-modify-write of _index.json / _aliases.json held under an inter-process
+#   file lock (agent worker processes share this directory)
 #
 # Stores memories as markdown files for human readability:
 # - ~/.pocketclaw/memory/MEMORY.md     (long-term)
@@ -10,12 +14,22 @@
 # - ~/.pocketclaw/memory/sessions/_index.json (session metadata index)
 
 import asyncio
+import base64
+import heapq
 import json
 import re
 import uuid
+from bisect import bisect_left, insort
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import UTC, date, datetime
 from pathlib import Path
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
 from pocketclaw.memory.protocol import MemoryEntry, MemoryType
 
 
@@ -151,6 +165,108 @@ def _tokenize(text: str) -> set[str]:
     return words - _STOP_WORDS
 
 
+@contextmanager
+def _interprocess_lock(path: Path) -> Iterator[None]:
+    """Exclusive advisory lock on ``path`` shared with other processes.
+
+    Serializes read-modify-write of shared JSON files between the dashboard,
+    agent workers and the CLI. A no-op where ``fcntl`` is unavailable.
+    """
+    if fcntl is None:
+        yield
+        return
+    with open(path, "a") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def encode_session_cursor(last_activity: str, safe_key: str) -> str:
+    """Opaque cursor pointing just past a listed session."""
+    raw = json.dumps([last_activity, safe_key], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_session_cursor(cursor: str) -> tuple[str, str]:
+    """Inverse of :func:`encode_session_cursor`. Raises ValueError if malformed."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        last_activity, safe_key = json.loads(raw)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid session cursor: {cursor!r}") from e
+    return str(last_activity), str(safe_key)
+
+
+class _SessionOrder:
+    """Session index entries kept sorted by ``(last_activity, safe_key)``.
+
+    One ascending list overall plus one per channel, maintained with bisect
+    on every index write, so listing a page walks back from the cursor
+    position instead of sorting the whole index.
+    """
+
+    def __init__(self) -> None:
+        self.meta: dict[str, dict] = {}
+        self._all: list[tuple[str, str]] = []
+        self._by_channel: dict[str, list[tuple[str, str]]] = {}
+
+    @staticmethod
+    def _key(safe_key: str, meta: dict) -> tuple[str, str]:
+        return (str(meta.get("last_activity") or ""), safe_key)
+
+    def load(self, index: dict) -> None:
+        self.meta = dict(index)
+        self._all = sorted(self._key(k, m) for k, m in self.meta.items())
+        self._by_channel = {}
+        for key in self._all:
+            channel = self.meta[key[1]].get("channel", "unknown")
+            self._by_channel.setdefault(channel, []).append(key)
+
+    def put(self, safe_key: str, meta: dict) -> None:
+        self.remove(safe_key)
+        self.meta[safe_key] = meta
+        key = self._key(safe_key, meta)
+        insort(self._all, key)
+        insort(self._by_channel.setdefault(meta.get("channel", "unknown"), []), key)
+
+    def remove(self, safe_key: str) -> None:
+        meta = self.meta.pop(safe_key, None)
+        if meta is None:
+            return
+        key = self._key(safe_key, meta)
+        channel = meta.get("channel", "unknown")
+        for keys in (self._all, self._by_channel.get(channel, [])):
+            i = bisect_left(keys, key)
+            if i < len(keys) and keys[i] == key:
+                del keys[i]
+        if not self._by_channel.get(channel, True):
+            del self._by_channel[channel]
+
+    def page(
+        self, limit: int, cursor: str | None = None, channels: list[str] | None = None
+    ) -> tuple[list[tuple[str, dict]], str | None, int]:
+        """Newest-first page of ``(safe_key, meta)`` plus the next cursor and total."""
+        if channels:
+            lists = [self._by_channel[c] for c in dict.fromkeys(channels) if c in self._by_channel]
+        else:
+            lists = [self._all]
+        total = sum(len(keys) for keys in lists)
+        after = decode_session_cursor(cursor) if cursor else None
+
+        # Each list contributes at most limit + 1 keys below the cursor
+        runs = []
+        for keys in lists:
+            end = bisect_left(keys, after) if after else len(keys)
+            runs.append(keys[max(0, end - limit - 1) : end][::-1])
+        window = list(heapq.merge(*runs, reverse=True))[: limit + 1]
+
+        items = [(safe_key, self.meta[safe_key]) for _, safe_key in window[:limit]]
+        next_cursor = encode_session_cursor(*window[limit - 1]) if len(window) > limit else None
+        return items, next_cursor, total
+
+
 class FileMemoryStore:
     """
     File-based memory store.
@@ -175,11 +291,15 @@ class FileMemoryStore:
         self._session_write_locks: dict[str, asyncio.Lock] = {}
         self._session_index_lock = asyncio.Lock()  # Protects _index.json read-modify-write
         self._alias_lock = asyncio.Lock()  # Protects _aliases.json read-modify-write
+        self._session_order = _SessionOrder()  # Sorted in-memory copy of _index.json
+        self._index_stamp: tuple | None = None  # _index.json version the order reflects
         self._load_index()
 
         # Build session index on first run (migration)
         if not self._index_path.exists():
             self.rebuild_session_index()
+        else:
+            self._refresh_session_order()
 
     # =========================================================================
     # Session Index
@@ -190,6 +310,29 @@ class FileMemoryStore:
         """Path to the session index file."""
         return self.sessions_path / "_index.json"
 
+    @property
+    def _index_lock_path(self) -> Path:
+        return self.sessions_path / "_index.lock"
+
+    def _index_file_stamp(self) -> tuple | None:
+        try:
+            st = self._index_path.stat()
+        except OSError:
+            return None
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+    def _refresh_session_order(self) -> None:
+        """Reload the in-memory order if _index.json changed on disk.
+
+        Agent workers, the CLI and other dashboards write the same index; one
+        stat per call keeps this process's listing and writes current.
+        """
+        # Stamp first: a write racing the read just triggers another reload
+        stamp = self._index_file_stamp()
+        if stamp != self._index_stamp:
+            self._session_order.load(self._load_session_index())
+            self._index_stamp = stamp
+
     def _load_session_index(self) -> dict:
         """Read session index from disk. Returns empty dict if missing/corrupt."""
         if not self._index_path.exists():
@@ -200,10 +343,51 @@ class FileMemoryStore:
             return {}
 
     def _save_session_index(self, index: dict) -> None:
+        """Replace the whole session index, on disk and in memory."""
+        self._write_session_index(index)
+        self._session_order.load(index)
+
+    def _write_session_index(self, index: dict) -> None:
         """Atomic write of session index (write to .tmp then rename)."""
         tmp = self._index_path.with_suffix(".tmp")
         tmp.write_text(json.dumps(index, indent=2), encoding="utf-8")
         tmp.replace(self._index_path)
+        self._index_stamp = self._index_file_stamp()
+
+    @contextmanager
+    def _locked_session_order(self) -> Iterator[_SessionOrder]:
+        """Current session order under the inter-process index lock.
+
+        Callers modify it and then call :meth:`_write_session_index`; hold
+        ``_session_index_lock`` as well to serialize this process's writers.
+        """
+        with _interprocess_lock(self._index_lock_path):
+            self._refresh_session_order()
+            yield self._session_order
+
+    def list_sessions_page(
+        self, limit: int = 50, cursor: str | None = None, channels: list[str] | None = None
+    ) -> tuple[list[dict], str | None, int]:
+        """List sessions newest-first from the in-memory index.
+
+        Costs O(page size) per channel regardless of how many sessions exist.
+
+        Args:
+            limit: Maximum sessions to return.
+            cursor: ``next_cursor`` from the previous page, or None for the first.
+            channels: Only include these channels (None = all).
+
+        Returns:
+            ``(sessions, next_cursor, total)`` — each session is its index
+            entry plus ``id`` (the safe key); ``next_cursor`` is None on the
+            last page; ``total`` counts all sessions matching ``channels``.
+
+        Raises:
+            ValueError: If ``cursor`` is malformed.
+        """
+        self._refresh_session_order()
+        items, next_cursor, total = self._session_order.page(max(limit, 1), cursor, channels)
+        return [{"id": safe_key, **meta} for safe_key, meta in items], next_cursor, total
 
     # =========================================================================
     # Session Aliases
@@ -214,6 +398,10 @@ class FileMemoryStore:
         """Path to the session aliases file."""
         return self.sessions_path / "_aliases.json"
 
+    @property
+    def _aliases_lock_path(self) -> Path:
+        return self.sessions_path / "_aliases.lock"
+
     def _load_aliases(self) -> dict[str, str]:
         """Read session aliases from disk. Returns empty dict if missing/corrupt."""
         if not self._aliases_path.exists():
@@ -241,19 +429,21 @@ class FileMemoryStore:
     async def set_session_alias(self, source_key: str, target_key: str) -> None:
         """Set or overwrite a session alias (source_key -> target_key)."""
         async with self._alias_lock:
-            aliases = self._load_aliases()
-            aliases[source_key] = target_key
-            self._save_aliases(aliases)
+            with _interprocess_lock(self._aliases_lock_path):
+                aliases = self._load_aliases()
+                aliases[source_key] = target_key
+                self._save_aliases(aliases)
 
     async def remove_session_alias(self, source_key: str) -> bool:
         """Remove a session alias. Returns True if it existed."""
         async with self._alias_lock:
-            aliases = self._load_aliases()
-            if source_key not in aliases:
-                return False
-            del aliases[source_key]
-            self._save_aliases(aliases)
-            return True
+            with _interprocess_lock(self._aliases_lock_path):
+                aliases = self._load_aliases()
+                if source_key not in aliases:
+                    return False
+                del aliases[source_key]
+                self._save_aliases(aliases)
+                return True
 
     async def get_session_keys_for_chat(self, source_key: str) -> list[str]:
         """Return all session keys associated with this source key.
@@ -281,50 +471,51 @@ class FileMemoryStore:
         self, session_key: str, entry: MemoryEntry, session_data: list[dict]
     ) -> None:
         """Update a single entry in the session index after a message save."""
+        safe_key = session_key.replace(":", "_").replace("/", "_")
+
+        # Extract channel from session_key (format: "channel:uuid")
+        parts = session_key.split(":", 1)
+        channel = parts[0] if len(parts) > 1 else "unknown"
+
+        # Find first user message for title
+        title = ""
+        for msg in session_data:
+            if msg.get("role") == "user" and msg.get("content", "").strip():
+                title = msg["content"].strip()[:80]
+                break
+        if not title:
+            title = "New Chat"
+
+        # Last message preview
+        last_msg = session_data[-1] if session_data else {}
+        preview = last_msg.get("content", "")[:120]
+
+        # Timestamps
+        first_msg = session_data[0] if session_data else {}
+        created = first_msg.get("timestamp", datetime.now(tz=UTC).isoformat())
+        last_activity = last_msg.get("timestamp", datetime.now(tz=UTC).isoformat())
+
         async with self._session_index_lock:
-            index = self._load_session_index()
-            safe_key = session_key.replace(":", "_").replace("/", "_")
-
-            # Extract channel from session_key (format: "channel:uuid")
-            parts = session_key.split(":", 1)
-            channel = parts[0] if len(parts) > 1 else "unknown"
-
-            # Find first user message for title
-            title = ""
-            for msg in session_data:
-                if msg.get("role") == "user" and msg.get("content", "").strip():
-                    title = msg["content"].strip()[:80]
-                    break
-            if not title:
-                title = "New Chat"
+            with self._locked_session_order() as order:
+                # Preserve existing title if user renamed it
+                existing = order.meta.get(safe_key, {})
+                if existing.get("user_title"):
+                    title = existing["user_title"]
+
+                meta = {
+                    "title": title,
+                    "channel": channel,
+                    "created": existing.get("created", created),
+                    "last_activity": last_activity,
+                    "message_count": len(session_data),
+                    "preview": preview,
+                }
+                # Preserve user_title flag if set
+                if existing.get("user_title"):
+                    meta["user_title"] = existing["user_title"]
 
-            # Last message preview
-            last_msg = session_data[-1] if session_data else {}
-            preview = last_msg.get("content", "")[:120]
-
-            # Timestamps
-            first_msg = session_data[0] if session_data else {}
-            created = first_msg.get("timestamp", datetime.now(tz=UTC).isoformat())
-            last_activity = last_msg.get("timestamp", datetime.now(tz=UTC).isoformat())
-
-            # Preserve existing title if user renamed it
-            existing = index.get(safe_key, {})
-            if existing.get("user_title"):
-                title = existing["user_title"]
-
-            index[safe_key] = {
-                "title": title,
-                "channel": channel,
-                "created": existing.get("created", created),
-                "last_activity": last_activity,
-                "message_count": len(session_data),
-                "preview": preview,
-            }
-            # Preserve user_title flag if set
-            if existing.get("user_title"):
-                index[safe_key]["user_title"] = existing["user_title"]
-
-            self._save_session_index(index)
+                order.put(safe_key, meta)
+                self._write_session_index(order.meta)
 
     def rebuild_session_index(self) -> dict:
         """Full directory scan to build index from all session files."""
@@ -382,9 +573,9 @@ class FileMemoryStore:
 
         # Remove from index (protected by lock to prevent lost updates)
         async with self._session_index_lock:
-            index = self._load_session_index()
-            index.pop(safe_key, None)
-            self._save_session_index(index)
+            with self._locked_session_order() as order:
+                order.remove(safe_key)
+                self._write_session_index(order.meta)
 
         # Clean up write lock
         self._session_write_locks.pop(session_key, None)
@@ -395,12 +586,13 @@ class FileMemoryStore:
         """Update the title of a session in the index."""
         safe_key = session_key.replace(":", "_").replace("/", "_")
         async with self._session_index_lock:
-            index = self._load_session_index()
-            if safe_key not in index:
-                return False
-            index[safe_key]["title"] = title
-            index[safe_key]["user_title"] = title  # Mark as user-renamed
-            self._save_session_index(index)
+            with self._locked_session_order() as order:
+                meta = order.meta.get(safe_key)
+                if meta is None:
+                    return False
+                # Mark as user-renamed
+                order.put(safe_key, {**meta, "title": title, "user_title": title})
+                self._write_session_index(order.meta)
         return True
 
     def _load_index(self) -> None:
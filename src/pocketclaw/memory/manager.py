@@ -3,6 +3,7 @@
 # Updated: 2026-02-04 - Added Mem0 backend support
 # Updated: 2026-02-07 - Configurable providers, auto-learn, semantic context - Memory System
 # Updated: 2026-02-11 - Sender-scoped memory isolation
+# Updated: 2026-10-19 - get_compacted_history accepts not-yet-stored `pending` messages
 
 import hashlib
 import logging
@@ -331,6 +332,7 @@ class MemoryManager:
         char_budget: int = 8000,
         summary_chars: int = 150,
         llm_summarize: bool = False,
+        pending: list[dict[str, str]] | None = None,
     ) -> list[dict[str, str]]:
         """Get session history with compaction.
 
@@ -344,16 +346,19 @@ class MemoryManager:
             char_budget: Max total characters for the returned history.
             summary_chars: Max chars per older message extract (Tier 1).
             llm_summarize: Use LLM to summarize older messages (Tier 2).
+            pending: Messages not stored yet, treated as the newest entries
+                (lets callers build history concurrently with add_to_session).
 
         Returns:
             List of {"role": "...", "content": "..."} dicts.
         """
         entries = await self._store.get_session(session_key)
-        if not entries:
+        all_messages = [{"role": e.role or "user", "content": e.content} for e in entries or []]
+        if pending:
+            all_messages.extend(pending)
+        if not all_messages:
             return []
 
-        all_messages = [{"role": e.role or "user", "content": e.content} for e in entries]
-
         # Split into older and recent
         split_point = max(0, len(all_messages) - recent_window)
         older = all_messages[:split_point]
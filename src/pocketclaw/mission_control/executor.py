@@ -5,11 +5,13 @@ Updated: 2026-02-12 - Fixed execute_task_background self-defeating bug: removed
   stale _running_tasks check from execute_task, added guard + cleanup wrapper
   to execute_task_background to prevent zombie entries and 409 Conflicts.
   Previous: 2026-02-05 - Added task output persistence (auto-save deliverables on completion)
+Updated: 2026-10-19 - Routers come from the shared warm pool (agents/router_pool.py);
+  per-backend task settings are cached instead of rebuilt per task.
 
 Enables execution of AI agents on tasks with real-time streaming via WebSocket.
 
 Key features:
-- Creates dedicated AgentRouter per task for isolation
+- Leases a dedicated AgentRouter per task from the warm router pool
 - Uses agent's backend field (claude_agent_sdk, pocketpaw_native, open_interpreter)
 - Streams execution to activity feed
 - Updates task/agent status automatically
@@ -35,6 +37,8 @@ import re
 from datetime import UTC, datetime
 from typing import Any
 
+from pocketclaw.agents.router_pool import get_router_pool
+
 # UUID validation pattern
 UUID_PATTERN = re.compile(
     r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$",
@@ -77,6 +81,7 @@ class MCTaskExecutor:
         self._running_tasks: dict[str, asyncio.Task] = {}
         self._agent_routers: dict[str, AgentRouter] = {}
         self._stop_flags: dict[str, bool] = {}
+        self._settings_cache: dict[str, tuple[Settings, Settings]] = {}
         self._background_launched: set[str] = set()
         # Callback for direct scheduler integration (avoids MessageBus dependency
         # on the critical task-completion → cascade-dispatch path).
@@ -90,7 +95,7 @@ class MCTaskExecutor:
     ) -> dict[str, Any]:
         """Execute a task with the specified agent.
 
-        Creates a dedicated AgentRouter for the task, streams output
+        Leases a dedicated AgentRouter for the task, streams output
         via WebSocket, and updates task/agent status.
 
         Security:
@@ -158,25 +163,8 @@ class MCTaskExecutor:
         # Initialize stop flag
         self._stop_flags[task_id] = False
 
-        # Build agent settings with the agent's backend.
-        # bypass_permissions is ALWAYS True for task execution because
-        # tasks run headlessly (no terminal for interactive prompts).
-        # The PreToolUse hook still blocks dangerous commands.
-        base_settings = get_settings()
-        agent_settings = Settings(
-            agent_backend=agent.backend,
-            anthropic_api_key=base_settings.anthropic_api_key,
-            anthropic_model=base_settings.anthropic_model,
-            openai_api_key=base_settings.openai_api_key,
-            openai_model=base_settings.openai_model,
-            ollama_host=base_settings.ollama_host,
-            ollama_model=base_settings.ollama_model,
-            llm_provider=base_settings.llm_provider,
-            bypass_permissions=True,
-        )
-
-        # Create dedicated router for this task
-        router = AgentRouter(agent_settings)
+        # Check out a warm router for the agent's backend
+        router = get_router_pool().acquire(self._agent_settings(agent.backend), AgentRouter)
         self._agent_routers[task_id] = router
 
         # Update task and agent status
@@ -273,8 +261,9 @@ class MCTaskExecutor:
             final_status = "error"
 
         finally:
-            # Cleanup
+            # Cleanup — only a cleanly finished router goes back to the pool
             self._agent_routers.pop(task_id, None)
+            get_router_pool().release(router, discard=final_status != "completed")
             self._running_tasks.pop(task_id, None)
             self._stop_flags.pop(task_id, None)
 
@@ -346,6 +335,35 @@ class MCTaskExecutor:
             "error": error_message,
         }
 
+    def _agent_settings(self, backend: str) -> Settings:
+        """Effective settings for a task agent, cached per backend.
+
+        bypass_permissions is ALWAYS True for task execution because
+        tasks run headlessly (no terminal for interactive prompts).
+        The PreToolUse hook still blocks dangerous commands.
+
+        The cache is invalidated whenever the global settings object is
+        reloaded, so routers are pooled under a stable settings key.
+        """
+        base_settings = get_settings()
+        cached = self._settings_cache.get(backend)
+        if cached is not None and cached[0] is base_settings:
+            return cached[1]
+
+        agent_settings = Settings(
+            agent_backend=backend,
+            anthropic_api_key=base_settings.anthropic_api_key,
+            anthropic_model=base_settings.anthropic_model,
+            openai_api_key=base_settings.openai_api_key,
+            openai_model=base_settings.openai_model,
+            ollama_host=base_settings.ollama_host,
+            ollama_model=base_settings.ollama_model,
+            llm_provider=base_settings.llm_provider,
+            bypass_permissions=True,
+        )
+        self._settings_cache[backend] = (base_settings, agent_settings)
+        return agent_settings
+
     async def execute_task_background(
         self,
         task_id: str,
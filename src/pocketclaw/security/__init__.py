@@ -1,10 +1,15 @@
 from pocketclaw.security.audit import AuditEvent, AuditLogger, AuditSeverity, get_audit_logger
+from pocketclaw.security.audit_reader import AuditFilter, AuditReader
+from pocketclaw.security.audit_writer import AuditWriter
 from pocketclaw.security.guardian import GuardianAgent, get_guardian
 
 __all__ = [
     "AuditLogger",
     "AuditEvent",
     "AuditSeverity",
+    "AuditFilter",
+    "AuditReader",
+    "AuditWriter",
     "get_audit_logger",
     "GuardianAgent",
     "get_guardian",
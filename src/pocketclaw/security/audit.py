@@ -4,6 +4,15 @@ Created: 2026-02-02
 
 This module provides a secure, append-only audit log for all critical agent actions.
 It is designed to be immutable and persistent.
+
+Changes:
+  - 2026-10-19: query() — newest-first, cursor-paginated, filtered reads via
+                AuditReader (reverse block reads + sidecar block index).
+  - 2026-10-19: log() queues the line for a background AuditWriter (batched
+                writes, fsync policy, size/daily rotation into .gz segments);
+                flush() and clear() added.
+  - 2026-10-19: forward_to()/record() — agent worker processes hand entries to
+                the front process, which is the only writer of audit.jsonl.
 """
 
 import json
@@ -17,6 +26,8 @@ from pathlib import Path
 from typing import Any
 
 from pocketclaw.config import get_settings
+from pocketclaw.security.audit_reader import AuditFilter, AuditReader
+from pocketclaw.security.audit_writer import AuditWriter, list_segments
 
 logger = logging.getLogger("audit")
 
@@ -82,26 +93,79 @@ class AuditLogger:
             self.log_path = base_dir / "audit.jsonl"
 
         self._callbacks: list[Callable[[dict], None]] = []
+        self._sink: Callable[[dict], None] | None = None
+        self._reader: AuditReader | None = None
+        self._writer: AuditWriter | None = None
 
     def on_log(self, callback: Callable[[dict], None]) -> None:
         """Register a callback to be called after each audit log write."""
         self._callbacks.append(callback)
 
+    def forward_to(self, sink: Callable[[dict], None] | None) -> None:
+        """Hand entries to ``sink`` instead of writing them here.
+
+        Used by agent worker processes so a single process owns the file,
+        its rotation and the live ``on_log`` callbacks.
+        """
+        self._sink = sink
+
+    def _get_writer(self) -> AuditWriter:
+        if self._writer is None:
+            settings = get_settings()
+            self._writer = AuditWriter(
+                self.log_path,
+                flush_interval_ms=settings.audit_flush_interval_ms,
+                fsync=settings.audit_fsync,
+                rotate_bytes=settings.audit_rotate_bytes,
+                rotate_daily=settings.audit_rotate_daily,
+            )
+        return self._writer
+
     def log(self, event: AuditEvent) -> None:
-        """Write an event to the audit log."""
+        """Queue an event for the audit log (written by a background thread)."""
         try:
-            event_dict = asdict(event)
-            with open(self.log_path, "a", encoding="utf-8") as f:
-                f.write(json.dumps(event_dict) + "\n")
-            for cb in self._callbacks:
-                try:
-                    cb(event_dict)
-                except Exception:
-                    pass
+            self.record(asdict(event))
         except Exception as e:
             # Fallback to system logger if audit fails (critical failure)
             logger.critical(f"FAILED TO WRITE AUDIT LOG: {e} | Event: {event}")
 
+    def record(self, event_dict: dict) -> None:
+        """Write an already serialised entry and notify the ``on_log`` callbacks."""
+        if self._sink is not None:
+            self._sink(event_dict)
+            return
+        self._get_writer().write(json.dumps(event_dict))
+        for cb in self._callbacks:
+            try:
+                cb(event_dict)
+            except Exception:
+                pass
+
+    def query(
+        self, limit: int = 100, cursor: str | None = None, filters: AuditFilter | None = None
+    ) -> tuple[list[dict], str | None]:
+        """Read entries newest first; returns ``(entries, next_cursor)``.
+
+        Blocking file I/O — call from a worker thread in async code.
+        """
+        self.flush()
+        if self._reader is None:
+            self._reader = AuditReader(self.log_path, use_index=get_settings().audit_index_enabled)
+        return self._reader.query(limit, cursor, filters)
+
+    def flush(self) -> None:
+        """Block until every logged event is on disk."""
+        if self._writer is not None:
+            self._writer.flush()
+
+    def clear(self) -> None:
+        """Empty the live log and delete rotated segments."""
+        self.flush()
+        if self.log_path.exists():
+            self.log_path.write_text("")
+        for _, path in list_segments(self.log_path):
+            path.unlink(missing_ok=True)
+
     def log_tool_use(
         self,
         tool_name: str,
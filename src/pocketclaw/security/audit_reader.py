@@ -0,0 +1,381 @@
+"""
+Audit log reader: newest-first queries without loading the whole log.
+Created: 2026-10-19
+
+``audit.jsonl`` only grows, and the dashboard asks for its tail, so entries
+are read backwards in fixed-size blocks from the end of the file (or from a
+cursor), stopping as soon as a page is full.
+
+Filtered queries can also use a sidecar index (``audit.jsonl.idx``): one JSON
+line per ~64 KB block of the log with the block's byte range, first/last
+timestamp and the severities, actions and statuses it contains. Blocks that
+can't match are skipped without reading them, and a ``since`` filter stops
+the scan at the first block that is entirely older. The index is brought up
+to date incrementally on each query; only complete blocks are indexed, and
+the unindexed tail is always scanned directly. It is rebuilt if the log is
+truncated or replaced.
+
+Cursors are byte offsets: a page's cursor is the offset of its oldest entry,
+and the next page is everything before it. Rotated segments
+(``audit.jsonl.<stamp>.gz``, see ``audit_writer``) continue the log: their
+cursors are ``"<stamp>:<offset>"``, and a ``since`` filter stops at the first
+segment rotated before it.
+
+Changes:
+  - 2026-10-19: Read across rotated, gzip-compressed segments.
+"""
+
+import gzip
+import hashlib
+import io
+import json
+import logging
+import re
+import threading
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import IO, Any
+
+from pocketclaw.security.audit_writer import list_segments
+
+logger = logging.getLogger(__name__)
+
+_READ_BLOCK = 64 * 1024
+_HEAD_BYTES = 256
+_INDEX_VERSION = 1
+_STAMP_RE = re.compile(r"\d{8}T\d{6}(?:-\d+)?")
+
+
+def _parse_time(value: str) -> datetime | None:
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except (TypeError, ValueError):
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=UTC)
+
+
+@dataclass
+class AuditFilter:
+    """Server-side filters for an audit query (all optional, ANDed)."""
+
+    severities: set[str] = field(default_factory=set)
+    actions: set[str] = field(default_factory=set)
+    statuses: set[str] = field(default_factory=set)
+    since: datetime | None = None
+    until: datetime | None = None
+    search: str = ""
+
+    @classmethod
+    def from_query(
+        cls,
+        severity: str | None = None,
+        action: str | None = None,
+        status: str | None = None,
+        since: str | None = None,
+        until: str | None = None,
+        search: str | None = None,
+    ) -> "AuditFilter":
+        """Build from API parameters (comma-separated values, ISO timestamps)."""
+
+        def values(raw: str | None) -> set[str]:
+            return {v.strip() for v in raw.split(",") if v.strip()} if raw else set()
+
+        def moment(raw: str | None) -> datetime | None:
+            if not raw:
+                return None
+            parsed = _parse_time(raw)
+            if parsed is None:
+                raise ValueError(f"Invalid timestamp: {raw}")
+            return parsed
+
+        return cls(
+            severities=values(severity),
+            actions=values(action),
+            statuses=values(status),
+            since=moment(since),
+            until=moment(until),
+            search=(search or "").strip().lower(),
+        )
+
+    def matches(self, entry: dict[str, Any], line: bytes) -> bool:
+        if self.severities and entry.get("severity") not in self.severities:
+            return False
+        if self.actions and entry.get("action") not in self.actions:
+            return False
+        if self.statuses and entry.get("status") not in self.statuses:
+            return False
+        if self.since or self.until:
+            ts = _parse_time(entry.get("timestamp", ""))
+            if ts is None or (self.since and ts < self.since) or (self.until and ts > self.until):
+                return False
+        return not self.search or self.search in line.decode("utf-8", "replace").lower()
+
+
+@dataclass
+class _Block:
+    """Index record summarising one run of complete log lines."""
+
+    start: int
+    end: int
+    first: str = ""
+    last: str = ""
+    count: int = 0
+    severities: list[str] = field(default_factory=list)
+    actions: list[str] = field(default_factory=list)
+    statuses: list[str] = field(default_factory=list)
+
+    def add(self, entry: dict[str, Any]) -> None:
+        ts = entry.get("timestamp", "")
+        self.first = self.first or ts
+        self.last = ts or self.last
+        self.count += 1
+        for name, key in (
+            ("severities", "severity"),
+            ("actions", "action"),
+            ("statuses", "status"),
+        ):
+            value = entry.get(key)
+            values: list[str] = getattr(self, name)
+            if value is not None and value not in values:
+                values.append(value)
+
+    def may_match(self, f: AuditFilter) -> bool:
+        if f.severities and not f.severities.intersection(self.severities):
+            return False
+        if f.actions and not f.actions.intersection(self.actions):
+            return False
+        if f.statuses and not f.statuses.intersection(self.statuses):
+            return False
+        if f.since and (last := _parse_time(self.last)) and last < f.since:
+            return False
+        if f.until and (first := _parse_time(self.first)) and first > f.until:
+            return False
+        return True
+
+
+def reverse_lines(fh: IO[bytes], start: int, end: int) -> Iterator[tuple[int, bytes]]:
+    """Yield ``(offset, line)`` for the lines in ``[start, end)``, last line first.
+
+    ``start`` must be a line boundary. Reads ``_READ_BLOCK`` bytes at a time.
+    """
+    pos = end
+    carry = b""
+    while pos > start:
+        read_from = max(start, pos - _READ_BLOCK)
+        fh.seek(read_from)
+        chunk = fh.read(pos - read_from) + carry
+        pos = read_from
+        pieces = chunk.split(b"\n")
+        offset = read_from
+        if pos > start:
+            # The first piece may be the tail of a line that began earlier
+            carry = pieces.pop(0)
+            offset += len(carry) + 1
+        else:
+            carry = b""
+        located = []
+        for piece in pieces:
+            located.append((offset, piece))
+            offset += len(piece) + 1
+        for line_offset, piece in reversed(located):
+            if piece.strip():
+                yield line_offset, piece
+
+
+class AuditIndex:
+    """Sidecar block index for one audit log file."""
+
+    def __init__(self, log_path: Path, block_bytes: int = _READ_BLOCK) -> None:
+        self.log_path = log_path
+        self.path = log_path.with_name(log_path.name + ".idx")
+        self.block_bytes = block_bytes
+        self.blocks: list[_Block] = []
+        self._head = ""
+        self._loaded = False
+
+    @property
+    def end(self) -> int:
+        """Offset up to which the log is indexed."""
+        return self.blocks[-1].end if self.blocks else 0
+
+    def _log_head(self) -> str:
+        with self.log_path.open("rb") as fh:
+            return hashlib.sha1(fh.read(_HEAD_BYTES)).hexdigest()
+
+    def _load(self) -> None:
+        self._loaded = True
+        self.blocks = []
+        if not self.path.exists():
+            return
+        try:
+            with self.path.open(encoding="utf-8") as fh:
+                header = json.loads(fh.readline() or "{}")
+                if header.get("version") != _INDEX_VERSION:
+                    return
+                self._head = header.get("head", "")
+                self.blocks = [_Block(**json.loads(line)) for line in fh if line.strip()]
+        except (ValueError, TypeError) as e:
+            logger.warning("Audit index unreadable, rebuilding: %s", e)
+            self.blocks = []
+
+    def refresh(self) -> None:
+        """Index any complete blocks appended since the last refresh."""
+        if not self._loaded:
+            self._load()
+        size = self.log_path.stat().st_size
+        # Truncated, cleared or replaced: start over
+        if self.blocks and (size < self.end or self._log_head() != self._head):
+            self.blocks = []
+            self.path.unlink(missing_ok=True)
+        if size - self.end < self.block_bytes:
+            return
+
+        new_blocks: list[_Block] = []
+        with self.log_path.open("rb") as fh:
+            fh.seek(self.end)
+            block = _Block(start=self.end, end=self.end)
+            for line in fh:
+                if not line.endswith(b"\n"):
+                    break  # a write in progress
+                block.end += len(line)
+                try:
+                    block.add(json.loads(line))
+                except ValueError:
+                    pass
+                if block.end - block.start >= self.block_bytes:
+                    new_blocks.append(block)
+                    block = _Block(start=block.end, end=block.end)
+        if not new_blocks:
+            return
+        lines = [json.dumps(asdict(b)) + "\n" for b in new_blocks]
+        if self.blocks:
+            with self.path.open("a", encoding="utf-8") as fh:
+                fh.writelines(lines)
+        else:
+            self._head = self._log_head()
+            header = json.dumps({"version": _INDEX_VERSION, "head": self._head}) + "\n"
+            self.path.write_text(header + "".join(lines), encoding="utf-8")
+        self.blocks.extend(new_blocks)
+
+
+class AuditReader:
+    """Newest-first, cursor-paginated queries over an audit log.
+
+    Args:
+        log_path: The ``audit.jsonl`` file.
+        use_index: Maintain and use the sidecar block index.
+    """
+
+    def __init__(self, log_path: Path, use_index: bool = True) -> None:
+        self.log_path = log_path
+        self.index = AuditIndex(log_path) if use_index else None
+        self._lock = threading.Lock()
+        # Last decompressed segment, so paging through it doesn't re-inflate it
+        self._segment_cache: tuple[Path, bytes] | None = None
+
+    def _ranges(self, upper: int, f: AuditFilter) -> Iterator[tuple[int, int]]:
+        """Byte ranges to scan, newest first."""
+        if self.index is None:
+            yield 0, upper
+            return
+        indexed = self.index.end
+        if upper > indexed:
+            yield indexed, upper
+        for block in reversed(self.index.blocks):
+            if block.start >= upper:
+                continue
+            if f.since and (last := _parse_time(block.last)) and last < f.since:
+                return  # every earlier block is older still
+            if block.may_match(f):
+                yield block.start, min(block.end, upper)
+
+    @staticmethod
+    def _parse_cursor(cursor: str | None) -> tuple[str | None, int | None]:
+        """``"123"`` → live file; ``"<stamp>:123"`` / ``"<stamp>:"`` → a segment."""
+        if not cursor:
+            return None, None
+        stamp, _, offset = cursor.rpartition(":")
+        try:
+            if stamp and not _STAMP_RE.fullmatch(stamp):
+                raise ValueError
+            return stamp or None, int(offset) if offset else None
+        except ValueError:
+            raise ValueError(f"Invalid cursor: {cursor!r}") from None
+
+    def _segment_bytes(self, path: Path) -> bytes:
+        cached = self._segment_cache
+        if cached is None or cached[0] != path:
+            data = path.read_bytes()
+            if path.suffix == ".gz":
+                data = gzip.decompress(data)
+            self._segment_cache = cached = (path, data)
+        return cached[1]
+
+    @staticmethod
+    def _collect(
+        fh: IO[bytes], start: int, end: int, f: AuditFilter, entries: list, limit: int
+    ) -> int | None:
+        """Append matches in ``[start, end)``; returns the offset that filled the page."""
+        for offset, line in reverse_lines(fh, start, end):
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            if f.matches(entry, line):
+                entries.append(entry)
+                if len(entries) >= limit:
+                    return offset
+        return None
+
+    def query(
+        self, limit: int = 100, cursor: str | None = None, filters: AuditFilter | None = None
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        """Return up to ``limit`` matching entries, newest first, and the next cursor.
+
+        Reads the live file first, then rotated segments from newest to oldest.
+        """
+        f = filters or AuditFilter()
+        if limit <= 0:
+            return [], None
+        cursor_stamp, upper = self._parse_cursor(cursor)
+        entries: list[dict[str, Any]] = []
+        with self._lock:
+            segments = list_segments(self.log_path)
+
+            def next_cursor(stamp: str | None, offset: int) -> str | None:
+                if offset > 0:
+                    return str(offset) if stamp is None else f"{stamp}:{offset}"
+                older = next((s for s, _ in segments if stamp is None or s < stamp), None)
+                return f"{older}:" if older else None
+
+            if cursor_stamp is None and self.log_path.exists():
+                if self.index is not None:
+                    self.index.refresh()
+                size = self.log_path.stat().st_size
+                live_upper = size if upper is None else min(upper, size)
+                with self.log_path.open("rb") as fh:
+                    for start, end in self._ranges(live_upper, f):
+                        filled = self._collect(fh, start, end, f, entries, limit)
+                        if filled is not None:
+                            return entries, next_cursor(None, filled)
+
+            for stamp, path in segments:
+                if cursor_stamp is not None and stamp > cursor_stamp:
+                    continue
+                rotated = datetime.strptime(stamp[:15], "%Y%m%dT%H%M%S").replace(tzinfo=UTC)
+                if f.since and rotated < f.since:
+                    break  # this segment and everything older predate the window
+                try:
+                    data = self._segment_bytes(path)
+                except (OSError, EOFError, gzip.BadGzipFile) as e:
+                    logger.warning("Skipping unreadable audit segment %s: %s", path.name, e)
+                    continue
+                end = len(data)
+                if stamp == cursor_stamp and upper is not None:
+                    end = min(upper, end)
+                filled = self._collect(io.BytesIO(data), 0, end, f, entries, limit)
+                if filled is not None:
+                    return entries, next_cursor(stamp, filled)
+        return entries, None
@@ -0,0 +1,195 @@
+"""
+Background writer for the audit log.
+Created: 2026-10-19
+
+``AuditLogger.log`` runs on the event loop for every tool attempt, success
+and error, so it only queues the serialized line; a writer thread appends
+queued lines in batches (one write per ``flush_interval_ms``), fsyncs per
+the ``fsync`` policy (``"batch"`` after every batch, ``"none"`` to leave it
+to the OS), and exits when idle so no file handle or thread lingers.
+
+Rotation: when ``audit.jsonl`` passes ``rotate_bytes``, or (with
+``rotate_daily``) its first write of a new UTC day comes in, the file is
+renamed to ``audit.jsonl.<YYYYmmddTHHMMSS>`` and gzip-compressed to
+``audit.jsonl.<stamp>.gz`` in the writer thread. ``AuditReader`` reads the
+live file and these segments as one newest-first log.
+"""
+
+import atexit
+import gzip
+import logging
+import os
+import queue
+import re
+import shutil
+import threading
+import time
+import weakref
+from datetime import UTC, date, datetime
+from pathlib import Path
+from typing import IO
+
+logger = logging.getLogger("audit")
+
+# Seconds without events before the writer thread closes the file and exits
+_IDLE_EXIT = 5.0
+_SEGMENT_RE = r"(\d{8}T\d{6}(?:-\d+)?)(\.gz)?"
+
+_writers: "weakref.WeakSet[AuditWriter]" = weakref.WeakSet()
+
+
+def segment_pattern(log_path: Path) -> re.Pattern[str]:
+    """Regex matching rotated segment names of ``log_path`` (group 1 = stamp)."""
+    return re.compile(re.escape(log_path.name) + r"\." + _SEGMENT_RE + "$")
+
+
+def list_segments(log_path: Path) -> list[tuple[str, Path]]:
+    """Rotated segments as ``(stamp, path)``, newest first.
+
+    While a segment is being compressed both forms exist; the plain file wins.
+    """
+    pattern = segment_pattern(log_path)
+    found: dict[str, Path] = {}
+    for path in log_path.parent.glob(log_path.name + ".*"):
+        match = pattern.match(path.name)
+        if match and (match.group(1) not in found or not match.group(2)):
+            found[match.group(1)] = path
+    return sorted(found.items(), reverse=True)
+
+
+class AuditWriter:
+    """Queue + thread that appends audit lines, rotating and compressing segments.
+
+    Args:
+        log_path: The live ``audit.jsonl`` file.
+        flush_interval_ms: How long to gather events into one write (0 = write at once).
+        fsync: ``"batch"`` to fsync after each write, ``"none"`` to skip it.
+        rotate_bytes: Rotate once the live file reaches this size (0 = never).
+        rotate_daily: Also rotate at the first write of each new UTC day.
+    """
+
+    def __init__(
+        self,
+        log_path: Path,
+        flush_interval_ms: int = 200,
+        fsync: str = "batch",
+        rotate_bytes: int = 10 * 1024 * 1024,
+        rotate_daily: bool = True,
+    ) -> None:
+        self.log_path = log_path
+        self.flush_interval = max(flush_interval_ms, 0) / 1000
+        self.fsync = fsync
+        self.rotate_bytes = rotate_bytes
+        self.rotate_daily = rotate_daily
+        self._queue: queue.SimpleQueue[str | threading.Event] = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._file: IO[str] | None = None
+        self._day: date | None = None
+        _writers.add(self)
+
+    def write(self, line: str) -> None:
+        """Queue one serialized event (no trailing newline)."""
+        self._queue.put(line)
+        self._ensure_thread()
+
+    def flush(self, timeout: float = 5.0) -> None:
+        """Block until everything queued so far is on disk."""
+        with self._lock:
+            if self._thread is None and self._queue.empty():
+                return
+        done = threading.Event()
+        self._queue.put(done)
+        self._ensure_thread()
+        done.wait(timeout)
+
+    def _ensure_thread(self) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="audit-writer", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            try:
+                first = self._queue.get(timeout=_IDLE_EXIT)
+            except queue.Empty:
+                with self._lock:
+                    if self._queue.empty():
+                        self._close_file()
+                        self._thread = None
+                        return
+                continue
+            batch = [first]
+            deadline = time.monotonic() + self.flush_interval
+            while isinstance(batch[-1], str) and (remaining := deadline - time.monotonic()) > 0:
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            lines = [item for item in batch if isinstance(item, str)]
+            if lines:
+                self._write(lines)
+            for item in batch:
+                if isinstance(item, threading.Event):
+                    item.set()
+
+    def _write(self, lines: list[str]) -> None:
+        try:
+            today = datetime.now(tz=UTC).date()
+            if self._file is None:
+                self._open()
+            if self.rotate_daily and self._day is not None and self._day < today:
+                self._rotate()
+            self._file.write("".join(line + "\n" for line in lines))
+            self._file.flush()
+            if self.fsync == "batch":
+                os.fsync(self._file.fileno())
+            if self.rotate_bytes and self._file.tell() >= self.rotate_bytes:
+                self._rotate()
+        except Exception as e:
+            # Fallback to system logger if audit fails (critical failure)
+            logger.critical(f"FAILED TO WRITE AUDIT LOG: {e} | {len(lines)} event(s): {lines}")
+            self._close_file()
+
+    def _open(self) -> None:
+        self._file = open(self.log_path, "a", encoding="utf-8")  # noqa: SIM115
+        today = datetime.now(tz=UTC).date()
+        if self.log_path.stat().st_size:
+            mtime = datetime.fromtimestamp(self.log_path.stat().st_mtime, tz=UTC).date()
+            self._day = min(mtime, today)
+        else:
+            self._day = today
+
+    def _close_file(self) -> None:
+        if self._file is not None:
+            try:
+                self._file.close()
+            except OSError:
+                pass
+            self._file = None
+
+    def _rotate(self) -> None:
+        """Move the live file aside, start a new one, and gzip the old one."""
+        self._close_file()
+        stamp = datetime.now(tz=UTC).strftime("%Y%m%dT%H%M%S")
+        segment = self.log_path.with_name(f"{self.log_path.name}.{stamp}")
+        n = 0
+        while segment.exists() or segment.with_name(segment.name + ".gz").exists():
+            n += 1
+            segment = self.log_path.with_name(f"{self.log_path.name}.{stamp}-{n}")
+        os.replace(self.log_path, segment)
+        self._open()
+        compressed = segment.with_name(segment.name + ".gz")
+        tmp = segment.with_name(segment.name + ".gz.tmp")
+        with segment.open("rb") as src, gzip.open(tmp, "wb") as dst:
+            shutil.copyfileobj(src, dst)
+        os.replace(tmp, compressed)
+        segment.unlink()
+        logger.info("Audit log rotated to %s", compressed.name)
+
+
+@atexit.register
+def _flush_all() -> None:
+    for writer in list(_writers):
+        writer.flush(timeout=2.0)
@@ -1,16 +1,19 @@
 """
 Guardian Agent - AI Security Filter.
 Created: 2026-02-02
+Updated: 2026-10-19 - anthropic is imported on first check, not at import time
+  (it dominated dashboard startup via pocketclaw.security).
 
 This module provides a secondary LLM check for dangerous actions.
 """
 
+from __future__ import annotations
+
 import logging
+from typing import TYPE_CHECKING
 
-try:
+if TYPE_CHECKING:
     from anthropic import AsyncAnthropic
-except ImportError:
-    AsyncAnthropic = None
 
 from pocketclaw.config import get_settings
 from pocketclaw.security.audit import AuditEvent, AuditSeverity, get_audit_logger
@@ -53,6 +56,10 @@ Respond with valid JSON only:
 
     async def _ensure_client(self):
         if not self.client and self.settings.anthropic_api_key:
+            try:
+                from anthropic import AsyncAnthropic
+            except ImportError:
+                return
             self.client = AsyncAnthropic(api_key=self.settings.anthropic_api_key)
 
     async def check_command(self, command: str) -> tuple[bool, str]:
@@ -3,7 +3,8 @@ SkillExecutor - Execute skills through the AgentRouter.
 
 Handles:
 1. Building the prompt from skill content + user args
-2. Running through the configured agent (Open Interpreter / Claude Code)
+2. Running through the configured agent (Open Interpreter / Claude Code),
+   or replaying an identical earlier run from the opt-in response cache
 3. Streaming results back
 """
 
@@ -11,7 +12,8 @@ import logging
 from collections.abc import AsyncIterator
 from datetime import UTC, datetime
 
-from ..agents.router import AgentRouter
+from ..agents.response_cache import cached_run
+from ..agents.router_pool import get_router_pool
 from ..config import Settings, get_settings
 from .loader import Skill, SkillLoader, get_skill_loader
 
@@ -38,15 +40,6 @@ class SkillExecutor:
         self.settings = settings or get_settings()
         self.skill_loader = skill_loader or get_skill_loader()
 
-        # Agent router (created lazily)
-        self._agent_router: AgentRouter | None = None
-
-    def _get_agent_router(self) -> AgentRouter:
-        """Get or create the agent router."""
-        if self._agent_router is None:
-            self._agent_router = AgentRouter(self.settings)
-        return self._agent_router
-
     async def execute(
         self,
         skill_name: str,
@@ -121,9 +114,7 @@ User request: {args if args else "(no additional input)"}
             logger.debug(f"Skill prompt: {full_prompt[:200]}...")
 
             # Execute through agent
-            agent = self._get_agent_router()
-
-            async for chunk in agent.run(full_prompt):
+            async for chunk in cached_run(self.settings, full_prompt):
                 yield chunk
 
             # Notify completion
@@ -144,8 +135,8 @@ User request: {args if args else "(no additional input)"}
             }
 
     def reset_agent(self) -> None:
-        """Reset the agent router (e.g., after settings change)."""
-        self._agent_router = None
+        """Drop warm agent routers (e.g., after settings change)."""
+        get_router_pool().clear()
         logger.info("Agent router reset")
 
     def list_skills(self) -> list[dict]:
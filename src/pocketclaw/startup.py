@@ -0,0 +1,237 @@
+"""Dependency-aware, concurrent subsystem startup.
+
+Created: 2026-10-19
+
+The dashboard used to bring its subsystems up one after another, so a slow
+MCP stdio server or channel login held up everything behind it.
+``StartupOrchestrator`` runs each initializer as soon as the components it
+depends on are ready, in parallel with everything else, and records status
+and timing per component (served at ``GET /api/startup``).
+
+Components are either *critical* (the server doesn't accept requests until
+they're up, and a failure aborts startup) or optional (they keep starting in
+the background while the UI is already usable)::
+
+    startup = StartupOrchestrator()
+    startup.add("bus", start_bus, critical=True)
+    startup.add("agent", start_agent, depends_on=["bus"], critical=True)
+    startup.add("mcp", start_mcp, timeout=60)
+    await startup.start()  # returns once the critical ones are ready
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+PENDING = "pending"
+RUNNING = "running"
+READY = "ready"
+FAILED = "failed"
+SKIPPED = "skipped"  # initializer returned False, or a dependency didn't come up
+
+_DONE = {READY, FAILED, SKIPPED}
+
+
+@dataclass
+class Component:
+    """One initializer and its outcome."""
+
+    name: str
+    init: Callable[[], Any]
+    depends_on: tuple[str, ...] = ()
+    critical: bool = False
+    timeout: float | None = None
+    status: str = PENDING
+    error: str | None = None
+    started_at: float | None = None
+    finished_at: float | None = None
+    done: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
+    exception: BaseException | None = field(default=None, repr=False)
+
+
+class StartupOrchestrator:
+    """Runs startup initializers concurrently in dependency order."""
+
+    def __init__(self) -> None:
+        self._components: dict[str, Component] = {}
+        self._tasks: list[asyncio.Task] = []
+        self._started_at: float | None = None
+
+    def add(
+        self,
+        name: str,
+        init: Callable[[], Any],
+        *,
+        depends_on: Iterable[str] = (),
+        critical: bool = False,
+        timeout: float | None = None,
+    ) -> None:
+        """Register a component.
+
+        Args:
+            name: Unique component name.
+            init: Sync or async callable (an awaitable result is awaited). Sync
+                callables run on the event loop; wrap blocking work in
+                ``asyncio.to_thread``. Returning ``False`` marks it skipped.
+            depends_on: Components that must be ready first.
+            critical: Block :meth:`start` on it and abort startup if it fails.
+            timeout: Seconds before the initializer is cancelled and failed.
+        """
+        if name in self._components:
+            raise ValueError(f"Startup component {name!r} already registered")
+        self._components[name] = Component(name, init, tuple(depends_on), critical, timeout)
+
+    def _check_graph(self) -> None:
+        for comp in self._components.values():
+            unknown = [d for d in comp.depends_on if d not in self._components]
+            if unknown:
+                raise ValueError(f"{comp.name!r} depends on unknown component(s) {unknown}")
+            if comp.critical:
+                optional = [d for d in comp.depends_on if not self._components[d].critical]
+                if optional:
+                    raise ValueError(f"Critical {comp.name!r} depends on optional {optional}")
+
+        visiting: set[str] = set()
+        visited: set[str] = set()
+
+        def visit(name: str) -> None:
+            if name in visited:
+                return
+            if name in visiting:
+                raise ValueError(f"Startup dependency cycle through {name!r}")
+            visiting.add(name)
+            for dep in self._components[name].depends_on:
+                visit(dep)
+            visiting.discard(name)
+            visited.add(name)
+
+        for name in self._components:
+            visit(name)
+
+    async def start(self) -> None:
+        """Launch every component; return once all critical ones are ready.
+
+        Raises:
+            ValueError: Unknown dependencies or a dependency cycle.
+            Exception: The error of the first critical component that failed.
+        """
+        self._check_graph()
+        self._started_at = time.monotonic()
+        self._tasks = [
+            asyncio.create_task(self._run(comp), name=f"startup:{comp.name}")
+            for comp in self._components.values()
+        ]
+        await self.wait(critical_only=True)
+        for comp in self._components.values():
+            if comp.critical and comp.status != READY:
+                raise comp.exception or RuntimeError(f"Startup component {comp.name!r} failed")
+
+    async def wait(
+        self, names: Iterable[str] | None = None, *, critical_only: bool = False
+    ) -> None:
+        """Wait until the given components (default: all) have finished."""
+        if names is None:
+            selected = [c for c in self._components.values() if c.critical or not critical_only]
+        else:
+            selected = [self._components[n] for n in names]
+        await asyncio.gather(*(c.done.wait() for c in selected))
+
+    async def cancel(self) -> None:
+        """Cancel initializers that are still running (used on shutdown)."""
+        pending = [t for t in self._tasks if not t.done()]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        # Tasks cancelled before their first step never reach _run's handlers
+        for comp in self._components.values():
+            if not comp.done.is_set():
+                comp.status = FAILED
+                comp.error = "cancelled"
+                comp.done.set()
+
+    async def _run(self, comp: Component) -> None:
+        try:
+            for dep in comp.depends_on:
+                await self._components[dep].done.wait()
+            failed = [d for d in comp.depends_on if self._components[d].status != READY]
+            if failed:
+                comp.status = SKIPPED
+                comp.error = f"dependency not ready: {', '.join(failed)}"
+                return
+
+            comp.status = RUNNING
+            comp.started_at = time.monotonic()
+            result = await asyncio.wait_for(self._call(comp.init), comp.timeout)
+            comp.status = SKIPPED if result is False else READY
+        except asyncio.CancelledError:
+            comp.status = FAILED
+            comp.error = "cancelled"
+            raise
+        except Exception as e:
+            comp.status = FAILED
+            comp.exception = e
+            if isinstance(e, TimeoutError) and comp.timeout is not None:
+                comp.error = f"timed out after {comp.timeout:g}s"
+            else:
+                comp.error = str(e) or type(e).__name__
+            log = logger.error if comp.critical else logger.warning
+            log("Failed to start %s: %s", comp.name, comp.error)
+        finally:
+            if comp.started_at is not None:
+                comp.finished_at = time.monotonic()
+            comp.done.set()
+
+    @staticmethod
+    async def _call(init: Callable[[], Any]) -> Any:
+        result = init()
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
+    def snapshot(self) -> dict:
+        """Readiness and per-component timing (milliseconds since start)."""
+        origin = self._started_at
+
+        def _ms(value: float | None) -> float | None:
+            if value is None or origin is None:
+                return None
+            return round((value - origin) * 1000, 1)
+
+        components = []
+        for comp in self._components.values():
+            duration = None
+            if comp.started_at is not None:
+                end = comp.finished_at if comp.finished_at is not None else time.monotonic()
+                duration = round((end - comp.started_at) * 1000, 1)
+            components.append(
+                {
+                    "name": comp.name,
+                    "status": comp.status,
+                    "critical": comp.critical,
+                    "depends_on": list(comp.depends_on),
+                    "started_ms": _ms(comp.started_at),
+                    "duration_ms": duration,
+                    "error": comp.error,
+                }
+            )
+        values = self._components.values()
+        complete = all(c.status in _DONE for c in values)
+        if complete:
+            # Time until the last initializer finished
+            end = max((c.finished_at for c in values if c.finished_at is not None), default=origin)
+        else:
+            end = time.monotonic()
+        return {
+            "ready": all(c.status == READY for c in values if c.critical),
+            "complete": complete,
+            "elapsed_ms": _ms(end),
+            "components": components,
+        }
@@ -0,0 +1,151 @@
+"""Import-time report for PocketPaw's entry points.
+
+Created: 2026-10-19
+
+Imports each entry point in a fresh interpreter under ``python -X importtime``
+and summarises where the time goes, so regressions in time-to-first-byte of
+``pocketpaw`` (``pocketclaw.__main__``) and ``run_dashboard``
+(``pocketclaw.dashboard``, which builds the app before uvicorn binds) are
+easy to spot::
+
+    pocketpaw --startup-report
+    python -m pocketclaw.startup_report --top 20 --budget-ms 1500
+
+With ``--budget-ms`` the command exits non-zero when any entry point's
+import takes longer, so it can gate CI.
+"""
+
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+
+# Report name -> module whose import is measured
+TARGETS = {
+    "pocketpaw": "pocketclaw.__main__",
+    "run_dashboard": "pocketclaw.dashboard",
+}
+
+
+@dataclass
+class ImportTiming:
+    """One line of ``-X importtime`` output (times in microseconds)."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+
+
+@dataclass
+class StartupProfile:
+    name: str
+    module: str
+    wall_seconds: float
+    timings: list[ImportTiming]
+
+    @property
+    def import_ms(self) -> float:
+        for timing in reversed(self.timings):
+            if timing.module == self.module:
+                return timing.cumulative_us / 1000
+        return sum(t.self_us for t in self.timings) / 1000
+
+
+def parse_importtime(output: str) -> list[ImportTiming]:
+    """Parse the ``import time:`` lines that ``-X importtime`` writes to stderr."""
+    timings = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:") :].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # header row
+        timings.append(ImportTiming(parts[2].strip(), int(parts[0]), int(parts[1])))
+    return timings
+
+
+def profile(name: str, module: str) -> StartupProfile:
+    """Import ``module`` in a subprocess and collect its import timings."""
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+    )
+    wall = time.perf_counter() - start
+    if proc.returncode != 0:
+        tail = proc.stderr.strip().splitlines()[-1:] or ["unknown error"]
+        raise RuntimeError(f"import {module} failed: {tail[0]}")
+    return StartupProfile(name, module, wall, parse_importtime(proc.stderr))
+
+
+def format_report(result: StartupProfile, top: int = 15) -> str:
+    """Render a profile as a short plain-text report."""
+    by_package: dict[str, int] = defaultdict(int)
+    for timing in result.timings:
+        by_package[timing.module.split(".")[0]] += timing.self_us
+    heaviest = sorted(
+        (t for t in result.timings if t.module != result.module),
+        key=lambda t: t.cumulative_us,
+        reverse=True,
+    )
+
+    lines = [
+        f"{result.name} ({result.module})",
+        f"  import: {result.import_ms:8.1f} ms   process wall: {result.wall_seconds * 1000:.0f} ms"
+        f"   modules: {len(result.timings)}",
+        "  packages by self time:",
+    ]
+    for package, us in sorted(by_package.items(), key=lambda kv: kv[1], reverse=True)[:top]:
+        lines.append(f"    {us / 1000:8.1f} ms  {package}")
+    lines.append("  slowest imports (cumulative):")
+    for timing in heaviest[:top]:
+        lines.append(f"    {timing.cumulative_us / 1000:8.1f} ms  {timing.module}")
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Report PocketPaw startup import times")
+    parser.add_argument(
+        "targets",
+        nargs="*",
+        metavar="TARGET",
+        help=f"Entry points to measure (default: {', '.join(TARGETS)})",
+    )
+    parser.add_argument("--top", type=int, default=15, help="Rows per section (default: 15)")
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=None,
+        help="Exit with status 1 if any import takes longer than this",
+    )
+    args = parser.parse_args(argv)
+    unknown = [name for name in args.targets if name not in TARGETS]
+    if unknown:
+        parser.error(f"unknown target(s): {', '.join(unknown)}")
+
+    over_budget = False
+    for name in args.targets or list(TARGETS):
+        try:
+            result = profile(name, TARGETS[name])
+        except RuntimeError as e:
+            print(f"{name}: {e}", file=sys.stderr)
+            return 2
+        print(format_report(result, top=args.top))
+        print()
+        if args.budget_ms is not None and result.import_ms > args.budget_ms:
+            print(
+                f"{name}: import took {result.import_ms:.0f} ms, "
+                f"over the {args.budget_ms:.0f} ms budget",
+                file=sys.stderr,
+            )
+            over_budget = True
+    return 1 if over_budget else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,288 @@
+"""Precompressed, cache-busted static assets for the dashboard.
+
+Created: 2026-10-19
+
+``/static`` serves ``frontend/`` (JS, CSS, templates). Text assets are
+hashed into a manifest and precompressed once — gzip always, brotli when the
+optional ``brotli`` package is installed — into content-addressed files under
+``~/.pocketclaw/static_cache/``, either at dashboard startup (in a worker
+thread) or ahead of time with ``python -m pocketclaw.static_assets``.
+
+Responses pick the best encoding the client accepts, carry a strong ETag per
+content hash and encoding, and answer ``If-None-Match`` with 304. JS and CSS
+requests whose ``?v=`` matches the current asset version (what the templates
+emit) are cached as ``immutable`` for a year; anything else must revalidate.
+
+Serving never touches the disk beyond what ``StaticFiles`` already does: the
+manifest is warmed by :meth:`PrecompressedStaticFiles.precompress` and
+re-scanned in a background thread at most every ``_VERSION_TTL`` seconds, so
+edits show up without a restart. Files the manifest doesn't know yet (or that
+changed since the last scan) are served plainly until the scan catches up.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import logging
+import mimetypes
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from starlette.datastructures import Headers, QueryParams
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Scope
+
+from pocketclaw.config import get_config_dir
+
+try:
+    import brotli
+except ImportError:  # optional: gzip only without it
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+COMPRESSIBLE = {".js", ".css", ".html", ".svg", ".json", ".txt", ".map"}
+# Extensions that make up the cache-busting version (what templates load with ?v=)
+VERSIONED = {".js", ".css"}
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "no-cache"
+_MIN_SIZE = 1024
+# How long version() reuses its last result before re-checking files
+_VERSION_TTL = 2.0
+# version() before the first scan has finished; never treated as current
+_UNVERSIONED = "0"
+_ENCODINGS = ("br", "gzip")  # preference order
+_SUFFIX = {"br": ".br", "gzip": ".gz"}
+
+
+def get_static_cache_dir() -> Path:
+    """Return the precompressed asset directory, creating it if needed."""
+    path = get_config_dir() / "static_cache"
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def accepted_encodings(header: str) -> set[str]:
+    """Encodings with a non-zero q-value in an ``Accept-Encoding`` header."""
+    accepted = set()
+    for part in header.split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        if name and q > 0:
+            accepted.add(name.strip().lower())
+    return accepted
+
+
+@dataclass
+class _Asset:
+    digest: str
+    mtime: float
+    size: int
+    # encoding -> precompressed file and its stat
+    variants: dict[str, tuple[Path, os.stat_result]] = field(default_factory=dict)
+
+    def matches(self, st: os.stat_result) -> bool:
+        return self.mtime == st.st_mtime and self.size == st.st_size
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """``StaticFiles`` that serves precompressed variants with strong ETags.
+
+    Args:
+        directory: Asset root.
+        cache_dir: Where compressed variants are stored (default: config dir).
+    """
+
+    def __init__(self, *, directory: str | os.PathLike, cache_dir: Path | None = None) -> None:
+        super().__init__(directory=directory)
+        self.root = Path(directory).resolve()
+        self._cache_dir = cache_dir
+        self._assets: dict[Path, _Asset] = {}
+        self._lock = threading.Lock()
+        self._refreshing = threading.Lock()
+        self._version: tuple[float, str] | None = None
+
+    @property
+    def cache_dir(self) -> Path:
+        if self._cache_dir is None:
+            self._cache_dir = get_static_cache_dir()
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        return self._cache_dir
+
+    # -- Manifest ---------------------------------------------------------
+
+    def _entry(self, path: Path, st: os.stat_result) -> _Asset:
+        """Manifest entry for a file, re-hashed if it changed since last seen.
+
+        Blocking; callers hold ``_lock`` and run off the event loop.
+        """
+        asset = self._assets.get(path)
+        if asset is None or not asset.matches(st):
+            digest = hashlib.sha256(path.read_bytes()).hexdigest()[:20]
+            asset = _Asset(digest, st.st_mtime, st.st_size)
+        variants = {}
+        for encoding, suffix in _SUFFIX.items():
+            variant = self.cache_dir / f"{asset.digest}{suffix}"
+            try:
+                variants[encoding] = (variant, variant.stat())
+            except OSError:
+                pass
+        if variants != asset.variants:
+            # Swap in a new entry rather than mutating one a request may be reading
+            asset = _Asset(asset.digest, asset.mtime, asset.size, variants)
+        self._assets[path] = asset
+        return asset
+
+    def _files(self) -> list[Path]:
+        return sorted(p for p in self.root.rglob("*") if p.suffix in COMPRESSIBLE and p.is_file())
+
+    def refresh(self) -> str:
+        """Re-scan the asset tree, re-hash changed files and return the new version.
+
+        Blocking; runs in a worker thread (startup, or :meth:`version` once the
+        last scan is older than ``_VERSION_TTL``).
+        """
+        files = self._files()
+        with self._lock:
+            digests = []
+            for path in files:
+                try:
+                    asset = self._entry(path, path.stat())
+                except OSError:
+                    continue  # removed mid-scan
+                if path.suffix in VERSIONED:
+                    digests.append(f"{path.relative_to(self.root)}={asset.digest}")
+            for gone in self._assets.keys() - set(files):
+                del self._assets[gone]
+        version = hashlib.md5("|".join(digests).encode()).hexdigest()[:8]
+        self._version = (time.monotonic(), version)
+        return version
+
+    def _refresh_in_background(self) -> None:
+        if not self._refreshing.acquire(blocking=False):
+            return  # a scan is already running
+
+        def run() -> None:
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.warning("Static asset scan failed: %s", e)
+            finally:
+                self._refreshing.release()
+
+        threading.Thread(target=run, name="static-assets-scan", daemon=True).start()
+
+    def version(self) -> str:
+        """Short hash over every versioned asset's content.
+
+        Returns the result of the last scan without blocking, starting a new
+        scan in the background once it's older than ``_VERSION_TTL``.
+        """
+        state = self._version
+        if state is None or time.monotonic() - state[0] >= _VERSION_TTL:
+            self._refresh_in_background()
+        return state[1] if state is not None else _UNVERSIONED
+
+    def precompress(self) -> int:
+        """Warm the manifest and write missing gzip/brotli variants.
+
+        Returns how many variants were created.
+        """
+        self.refresh()
+        created = 0
+        for path, asset in list(self._assets.items()):
+            if asset.size < _MIN_SIZE:
+                continue
+            data = None
+            for encoding, suffix in _SUFFIX.items():
+                if encoding in asset.variants or (encoding == "br" and brotli is None):
+                    continue
+                data = data if data is not None else path.read_bytes()
+                if encoding == "br":
+                    packed = brotli.compress(data, quality=11)
+                else:
+                    packed = gzip.compress(data, compresslevel=9, mtime=0)
+                if len(packed) >= len(data) * 0.9:
+                    continue
+                variant = self.cache_dir / f"{asset.digest}{suffix}"
+                tmp = variant.with_name(variant.name + ".tmp")
+                tmp.write_bytes(packed)
+                tmp.replace(variant)
+                created += 1
+        if created:
+            self.refresh()  # pick up the new variants
+            logger.info("Precompressed %d static asset variant(s)", created)
+        return created
+
+    # -- Serving ----------------------------------------------------------
+
+    def file_response(
+        self,
+        full_path: str | os.PathLike,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        path = Path(full_path).resolve()
+        if path.suffix not in COMPRESSIBLE:
+            return super().file_response(full_path, stat_result, scope, status_code)
+
+        # Lock-free lookup: a scan in progress swaps entries in atomically
+        asset = self._assets.get(path)
+        current = self.version()
+        if asset is None or not asset.matches(stat_result):
+            # New or edited since the last scan; starlette's stat-based ETag until it catches up
+            response = super().file_response(full_path, stat_result, scope, status_code)
+            response.headers["cache-control"] = REVALIDATE
+            return response
+
+        request_headers = Headers(scope=scope)
+        accepted = accepted_encodings(request_headers.get("accept-encoding", ""))
+        encoding = next((e for e in _ENCODINGS if e in accepted and e in asset.variants), None)
+
+        serve_path, serve_stat = path, stat_result
+        etag = f'"{asset.digest}"'
+        headers = {"vary": "Accept-Encoding"}
+        if encoding is not None:
+            serve_path, serve_stat = asset.variants[encoding]
+            etag = f'"{asset.digest}-{encoding}"'
+            headers["content-encoding"] = encoding
+
+        version = QueryParams(scope.get("query_string", b"")).get("v")
+        immutable = path.suffix in VERSIONED and version == current != _UNVERSIONED
+        headers["etag"] = etag
+        headers["cache-control"] = IMMUTABLE if immutable else REVALIDATE
+
+        response = FileResponse(
+            serve_path,
+            status_code=status_code,
+            stat_result=serve_stat,
+            headers=headers,
+            media_type=mimetypes.guess_type(path.name)[0] or "text/plain",
+        )
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
+
+
+def main() -> None:
+    """Precompress the dashboard frontend (run at build/install time)."""
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    frontend = Path(__file__).parent / "frontend"
+    created = PrecompressedStaticFiles(directory=frontend).precompress()
+    print(f"Precompressed {created} asset variant(s) into {get_static_cache_dir()}")
+
+
+if __name__ == "__main__":
+    main()
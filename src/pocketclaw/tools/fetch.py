@@ -1,5 +1,13 @@
-"""File browser tool."""
+"""File browser tool.
 
+Updated: 2026-10-19 - scan_directory(): os.scandir listing with pagination,
+name filtering and a short-lived, mtime-checked directory cache.
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
 
 try:
@@ -19,6 +27,93 @@ def is_safe_path(path: Path, jail: Path) -> bool:
         return False
 
 
+# Directory listings are reused while the directory's mtime is unchanged, for at
+# most this many seconds (file sizes can change without touching the mtime)
+_LISTING_TTL = 5.0
+_LISTING_CACHE_SIZE = 64
+
+_listing_cache: OrderedDict[str, tuple[int, float, list[dict]]] = OrderedDict()
+_listing_lock = threading.Lock()
+
+
+def _format_size(size: int) -> str:
+    if size < 1024:
+        return f"{size} B"
+    if size < 1024 * 1024:
+        return f"{size / 1024:.1f} KB"
+    return f"{size / (1024 * 1024):.1f} MB"
+
+
+def _scan(path: Path) -> list[dict]:
+    """Visible entries of ``path``, directories first, then by name."""
+    items = []
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.name.startswith("."):
+                continue
+            try:
+                is_dir = entry.is_dir()  # from the dirent type, no stat() on most filesystems
+            except OSError:
+                is_dir = False
+            info = {"name": entry.name, "isDir": is_dir}
+            if not is_dir:
+                try:
+                    info["size"] = _format_size(entry.stat().st_size)
+                except OSError:
+                    info["size"] = "?"
+            items.append(((not is_dir, entry.name.lower()), info))
+    items.sort(key=lambda item: item[0])
+    return [info for _, info in items]
+
+
+def _listing(path: Path) -> list[dict]:
+    mtime = os.stat(path).st_mtime_ns
+    key = str(path)
+    now = time.monotonic()
+    with _listing_lock:
+        cached = _listing_cache.get(key)
+        if cached is not None and cached[0] == mtime and now - cached[1] < _LISTING_TTL:
+            _listing_cache.move_to_end(key)
+            return cached[2]
+
+    entries = _scan(path)
+    with _listing_lock:
+        _listing_cache[key] = (mtime, now, entries)
+        _listing_cache.move_to_end(key)
+        while len(_listing_cache) > _LISTING_CACHE_SIZE:
+            _listing_cache.popitem(last=False)
+    return entries
+
+
+def scan_directory(path: Path, offset: int = 0, limit: int = 50, query: str = "") -> dict:
+    """List one page of a directory's visible entries (blocking; run in a thread).
+
+    Args:
+        path: Resolved directory to list.
+        offset: Number of matching entries to skip.
+        limit: Maximum entries to return.
+        query: Case-insensitive substring the name must contain.
+
+    Returns:
+        Dict with ``files`` (``name``, ``isDir``, ``size`` for files),
+        ``total`` matching entries, ``offset`` and ``hasMore``.
+
+    Raises:
+        FileNotFoundError, NotADirectoryError, PermissionError: As ``os.scandir``.
+    """
+    entries = _listing(path)
+    if query:
+        needle = query.lower()
+        entries = [e for e in entries if needle in e["name"].lower()]
+    offset = max(offset, 0)
+    return {
+        "files": entries[offset : offset + limit],
+        "total": len(entries),
+        "offset": offset,
+        "hasMore": offset + limit < len(entries),
+    }
+
+
 def get_directory_keyboard(path: Path, jail: Path | None = None) -> InlineKeyboardMarkup:
     """Generate inline keyboard for directory contents."""
     if jail is None:
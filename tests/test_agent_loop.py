@@ -1,7 +1,9 @@
 # Tests for Unified Agent Loop
 # Created: 2026-02-02
 # Updated: 2026-02-05 - Refactored to test router-based architecture
+# Updated: 2026-10-19 - Concurrent context assembly
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -34,7 +36,7 @@ def mock_router():
     """Mock AgentRouter that yields test responses."""
     router = MagicMock()
 
-    async def mock_run(message, *, system_prompt=None, history=None):
+    async def mock_run(message, *, system_prompt=None, history=None, session_key=None):
         yield {"type": "message", "content": "Hello ", "metadata": {}}
         yield {"type": "message", "content": "world!", "metadata": {}}
         yield {
@@ -83,6 +85,8 @@ async def test_agent_loop_process_message(
         settings = MagicMock()
         settings.agent_backend = "claude_agent_sdk"
         settings.max_concurrent_conversations = 5
+        settings.owner_id = ""
+        settings.message_coalesce_enabled = False
         mock_settings.return_value = settings
 
         with patch("pocketclaw.agents.loop.Settings") as mock_settings_cls:
@@ -127,6 +131,8 @@ async def test_agent_loop_reset_router(
         settings = MagicMock()
         settings.agent_backend = "claude_agent_sdk"
         settings.max_concurrent_conversations = 5
+        settings.owner_id = ""
+        settings.message_coalesce_enabled = False
         mock_settings.return_value = settings
 
         loop = AgentLoop()
@@ -154,7 +160,7 @@ async def test_agent_loop_handles_error(
     # Router that raises an error
     error_router = MagicMock()
 
-    async def mock_run_error(message, *, system_prompt=None, history=None):
+    async def mock_run_error(message, *, system_prompt=None, history=None, session_key=None):
         yield {"type": "error", "content": "Something went wrong", "metadata": {}}
         yield {"type": "done", "content": ""}
 
@@ -168,6 +174,8 @@ async def test_agent_loop_handles_error(
         settings = MagicMock()
         settings.agent_backend = "claude_agent_sdk"
         settings.max_concurrent_conversations = 5
+        settings.owner_id = ""
+        settings.message_coalesce_enabled = False
         mock_settings.return_value = settings
 
         with patch("pocketclaw.agents.loop.Settings") as mock_settings_cls:
@@ -215,6 +223,8 @@ async def test_agent_loop_emits_tool_events(
         settings = MagicMock()
         settings.agent_backend = "claude_agent_sdk"
         settings.max_concurrent_conversations = 5
+        settings.owner_id = ""
+        settings.message_coalesce_enabled = False
         mock_settings.return_value = settings
 
         with patch("pocketclaw.agents.loop.Settings") as mock_settings_cls:
@@ -260,9 +270,10 @@ async def test_agent_loop_builds_context_and_passes_to_router(
     # Track what router.run receives
     captured_kwargs = {}
 
-    async def capturing_run(message, *, system_prompt=None, history=None):
+    async def capturing_run(message, *, system_prompt=None, history=None, session_key=None):
         captured_kwargs["system_prompt"] = system_prompt
         captured_kwargs["history"] = history
+        captured_kwargs["session_key"] = session_key
         yield {"type": "message", "content": "OK", "metadata": {}}
         yield {"type": "done", "content": ""}
 
@@ -288,6 +299,8 @@ async def test_agent_loop_builds_context_and_passes_to_router(
         settings = MagicMock()
         settings.agent_backend = "claude_agent_sdk"
         settings.max_concurrent_conversations = 5
+        settings.owner_id = ""
+        settings.message_coalesce_enabled = False
         mock_settings.return_value = settings
 
         with patch("pocketclaw.agents.loop.Settings") as mock_settings_cls:
@@ -313,3 +326,257 @@ async def test_agent_loop_builds_context_and_passes_to_router(
             # Verify router.run received the context
             assert captured_kwargs["system_prompt"] == "You are PocketPaw with identity and memory."
             assert captured_kwargs["history"] == session_history
+            assert captured_kwargs["session_key"] == msg.session_key
+
+
+@patch("pocketclaw.agents.loop.get_message_bus")
+@patch("pocketclaw.agents.loop.get_memory_manager")
+@patch("pocketclaw.agents.loop.AgentContextBuilder")
+@patch("pocketclaw.agents.loop.AgentRouter")
+@pytest.mark.asyncio
+async def test_context_assembly_runs_concurrently(
+    mock_router_cls,
+    mock_builder_cls,
+    mock_get_memory,
+    mock_get_bus,
+    mock_bus,
+    mock_memory,
+    mock_router,
+):
+    """System prompt and history are built in parallel; history is read before the store."""
+    mock_get_bus.return_value = mock_bus
+    mock_get_memory.return_value = mock_memory
+    mock_router_cls.return_value = mock_router
+    order: list[str] = []
+    prompt_started = asyncio.Event()
+    history_started = asyncio.Event()
+    overlapped: dict[str, bool] = {}
+
+    async def _overlaps(name: str, other: asyncio.Event) -> None:
+        # Sequential assembly would leave the other step unstarted until this one returns
+        try:
+            await asyncio.wait_for(other.wait(), timeout=2)
+            overlapped[name] = True
+        except TimeoutError:
+            overlapped[name] = False
+
+    async def slow_prompt(**kwargs):
+        prompt_started.set()
+        await _overlaps("prompt", history_started)
+        return "System Prompt"
+
+    async def slow_history(session_key, **kwargs):
+        order.append("history")
+        history_started.set()
+        await _overlaps("history", prompt_started)
+        return kwargs["pending"]
+
+    async def store(**kwargs):
+        order.append("store")
+
+    mock_builder_cls.return_value.build_system_prompt = AsyncMock(side_effect=slow_prompt)
+    mock_memory.get_compacted_history = AsyncMock(side_effect=slow_history)
+    mock_memory.add_to_session = AsyncMock(side_effect=store)
+
+    with patch("pocketclaw.agents.loop.get_settings") as mock_settings:
+        settings = MagicMock()
+        settings.max_concurrent_conversations = 5
+        settings.owner_id = ""
+        settings.message_coalesce_enabled = False
+        settings.injection_scan_enabled = False
+        settings.welcome_hint_enabled = False
+        mock_settings.return_value = settings
+
+        with patch("pocketclaw.agents.loop.Settings") as mock_settings_cls:
+            mock_settings_cls.load.return_value = settings
+            loop = AgentLoop()
+            msg = InboundMessage(
+                channel=Channel.CLI, sender_id="user1", chat_id="chat1", content="Hello"
+            )
+
+            await loop._process_message(msg)
+
+    assert overlapped == {"prompt": True, "history": True}
+    assert order[:2] == ["history", "store"]
+    pending = mock_memory.get_compacted_history.call_args.kwargs["pending"]
+    assert pending == [{"role": "user", "content": "Hello"}]
+
+
+@patch("pocketclaw.agents.loop.get_message_bus")
+@patch("pocketclaw.agents.loop.get_memory_manager")
+@patch("pocketclaw.agents.loop.AgentContextBuilder")
+@patch("pocketclaw.agents.loop.AgentRouter")
+@pytest.mark.asyncio
+async def test_events_after_new_carry_the_source_key(
+    mock_router_cls,
+    mock_builder_cls,
+    mock_get_memory,
+    mock_get_bus,
+    mock_bus,
+    mock_memory,
+    mock_router,
+):
+    """Events of an aliased session (/new, /resume) also name the chat's own key."""
+    mock_get_bus.return_value = mock_bus
+    mock_memory.resolve_session_key = AsyncMock(return_value="websocket:chat1:1f2e3d4c")
+    mock_get_memory.return_value = mock_memory
+    mock_router_cls.return_value = mock_router
+    mock_builder_cls.return_value.build_system_prompt = AsyncMock(return_value="System Prompt")
+
+    with patch("pocketclaw.agents.loop.get_settings") as mock_settings:
+        settings = MagicMock()
+        settings.max_concurrent_conversations = 5
+        settings.owner_id = ""
+        settings.message_coalesce_enabled = False
+        settings.injection_scan_enabled = False
+        settings.welcome_hint_enabled = False
+        mock_settings.return_value = settings
+
+        with patch("pocketclaw.agents.loop.Settings") as mock_settings_cls:
+            mock_settings_cls.load.return_value = settings
+            loop = AgentLoop()
+            msg = InboundMessage(
+                channel=Channel.WEBSOCKET, sender_id="user1", chat_id="chat1", content="Hello"
+            )
+            await loop._process_message(msg)
+
+    events = [c.args[0] for c in mock_bus.publish_system.call_args_list]
+    assert {e.event_type for e in events} >= {"thinking", "tool_start", "tool_result"}
+    for event in events:
+        assert event.data["session_key"] == "websocket:chat1:1f2e3d4c"
+        assert event.data["source_key"] == "websocket:chat1"
+
+
+@patch("pocketclaw.agents.loop.get_message_bus")
+@patch("pocketclaw.agents.loop.get_memory_manager")
+@patch("pocketclaw.agents.loop.AgentContextBuilder")
+@pytest.mark.asyncio
+async def test_started_is_set_once_consuming(
+    mock_builder_cls, mock_get_memory, mock_get_bus, mock_bus, mock_memory
+):
+    """Startup readiness waits for the journal replay, not just task creation."""
+    mock_get_bus.return_value = mock_bus
+    mock_get_memory.return_value = mock_memory
+    replaying = asyncio.Event()
+
+    async def replay():
+        await replaying.wait()
+        return 0
+
+    async def consume(timeout=None):
+        await asyncio.sleep(0.01)
+
+    mock_bus.replay_inbound = replay
+    mock_bus.consume_inbound = consume
+    mock_bus.flush_journal = AsyncMock()
+
+    with patch("pocketclaw.agents.loop.get_settings") as mock_settings:
+        settings = MagicMock()
+        settings.max_concurrent_conversations = 5
+        settings.owner_id = ""
+        mock_settings.return_value = settings
+
+        with patch("pocketclaw.agents.loop.Settings") as mock_settings_cls:
+            mock_settings_cls.load.return_value = settings
+            loop = AgentLoop()
+            runner = asyncio.create_task(loop.start())
+
+            await asyncio.sleep(0.02)
+            assert not loop.started.is_set()
+            replaying.set()
+            await asyncio.wait_for(loop.started.wait(), 1)
+
+            await loop.stop()
+            assert not loop.started.is_set()
+            await asyncio.wait_for(runner, 1)
+
+
+@patch("pocketclaw.agents.loop.get_message_bus")
+@patch("pocketclaw.agents.loop.get_memory_manager")
+@patch("pocketclaw.agents.loop.AgentContextBuilder")
+@pytest.mark.asyncio
+async def test_busy_reply_reflects_turns_waiting_in_the_scheduler(
+    mock_builder_cls, mock_get_memory, mock_get_bus, mock_memory
+):
+    """The bus drains instantly; the backlog that matters is in the scheduler."""
+    from pocketclaw.bus import MessageBus
+
+    bus = MessageBus(shed_wait_seconds=10)
+    bus.record_turn_latency(20)
+    replies = AsyncMock()
+    bus.subscribe_outbound(Channel.TELEGRAM, replies)
+    mock_get_bus.return_value = bus
+    mock_get_memory.return_value = mock_memory
+
+    with patch("pocketclaw.agents.loop.get_settings") as mock_settings:
+        settings = MagicMock()
+        settings.max_concurrent_conversations = 1
+        settings.owner_id = ""
+        settings.message_coalesce_enabled = False
+        settings.session_interrupt_enabled = False
+        mock_settings.return_value = settings
+
+        with patch("pocketclaw.agents.loop.Settings") as mock_settings_cls:
+            mock_settings_cls.load.return_value = settings
+            loop = AgentLoop()
+            gate = asyncio.Event()
+
+            async def turn(message, session_key, originals=None):
+                await gate.wait()
+
+            loop._process_message_inner = turn
+            runner = asyncio.create_task(loop.start())
+
+            async def until(predicate):
+                for _ in range(200):
+                    if predicate():
+                        return
+                    await asyncio.sleep(0.01)
+                raise AssertionError("timed out")
+
+            await bus.publish_inbound(InboundMessage(Channel.TELEGRAM, "u", "a", "1"))
+            await until(lambda: loop.scheduler.stats()["active"] == 1)
+            await bus.publish_inbound(InboundMessage(Channel.TELEGRAM, "u", "b", "2"))
+            await until(lambda: loop.scheduler.stats()["queued"] == 1)
+            await bus.publish_inbound(InboundMessage(Channel.TELEGRAM, "u", "c", "3"))
+
+            assert bus.inbound_pending() <= 1
+            busy = [c.args[0] for c in replies.call_args_list]
+            assert [(r.chat_id, r.metadata["queue_position"]) for r in busy] == [
+                ("b", 1),
+                ("c", 2),
+            ]
+
+            gate.set()
+            await until(lambda: loop.scheduler.stats()["lanes"]["telegram"]["served"] == 3)
+            await loop.stop()
+            await asyncio.wait_for(runner, 2)
+
+
+@patch("pocketclaw.agents.loop.get_message_bus")
+@patch("pocketclaw.agents.loop.get_memory_manager")
+@patch("pocketclaw.agents.loop.AgentContextBuilder")
+@pytest.mark.asyncio
+async def test_failed_turn_is_acked(
+    mock_builder_cls, mock_get_memory, mock_get_bus, mock_bus, mock_memory
+):
+    """A turn that raises isn't left in the journal to fail again on replay."""
+    mock_bus.ack_inbound = MagicMock()
+    mock_get_bus.return_value = mock_bus
+    mock_get_memory.return_value = mock_memory
+
+    with patch("pocketclaw.agents.loop.get_settings") as mock_settings:
+        settings = MagicMock()
+        settings.max_concurrent_conversations = 1
+        settings.owner_id = ""
+        settings.message_coalesce_enabled = False
+        settings.session_interrupt_enabled = False
+        mock_settings.return_value = settings
+        loop = AgentLoop()
+        loop._process_message_inner = AsyncMock(side_effect=RuntimeError("boom"))
+        message = InboundMessage(Channel.TELEGRAM, "u", "a", "hi")
+
+        with pytest.raises(RuntimeError):
+            await loop._process_message(message)
+
+    mock_bus.ack_inbound.assert_called_once_with(message)
@@ -0,0 +1,261 @@
+# Tests for agents/workers.py — session-sharded worker processes over unix sockets
+# Created: 2026-10-19
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from pocketclaw.agents.workers import (
+    HashRing,
+    WorkerBus,
+    WorkerPool,
+    apply_control,
+    merge_scheduler_stats,
+    read_frame,
+    workers_enabled,
+    write_frame,
+)
+from pocketclaw.bus import Channel, InboundMessage, MessageBus, OutboundMessage
+from pocketclaw.config import Settings
+
+
+def _msg(chat_id: str, content: str = "hi") -> InboundMessage:
+    return InboundMessage(channel=Channel.CLI, sender_id="u", chat_id=chat_id, content=content)
+
+
+class TestHashRing:
+    def test_assignment_is_stable_and_spread(self):
+        ring = HashRing(4)
+        keys = [f"telegram:{i}" for i in range(2000)]
+        nodes = [ring.node_for(k) for k in keys]
+
+        assert nodes == [HashRing(4).node_for(k) for k in keys]
+        for node in range(4):
+            assert nodes.count(node) > 2000 * 0.1
+
+    def test_adding_a_worker_moves_few_sessions(self):
+        keys = [f"discord:{i}" for i in range(2000)]
+        before = HashRing(4)
+        after = HashRing(5)
+
+        moved = sum(before.node_for(k) != after.node_for(k) for k in keys)
+
+        assert moved < 2000 * 0.35
+
+
+async def _fake_worker(tmp_path, received: list):
+    """Unix-socket server that answers each inbound frame and acks it."""
+
+    async def handle(reader, writer):
+        while (frame := await read_frame(reader)) is not None:
+            if frame["type"] == "control":
+                received.append(f"control:{frame['action']}")
+                if "id" in frame:
+                    data = {"running": True, "scheduler": {"capacity": 2, "active": 1}}
+                    write_frame(writer, {"type": "reply", "id": frame["id"], "data": data})
+                    await writer.drain()
+                continue
+            message = InboundMessage.from_dict(frame["message"])
+            received.append(message.content)
+            reply = OutboundMessage(
+                channel=message.channel, chat_id=message.chat_id, content=f"re: {message.content}"
+            )
+            write_frame(writer, {"type": "outbound", "message": reply.to_dict()})
+            write_frame(writer, {"type": "ack", "seq": frame["seq"]})
+            await writer.drain()
+
+    path = tmp_path / "w.sock"
+    return await asyncio.start_unix_server(handle, path=str(path)), path
+
+
+class TestWorkerPool:
+    async def test_forwards_in_order_and_relays_replies(self, tmp_path):
+        received: list[str] = []
+        server, path = await _fake_worker(tmp_path, received)
+        bus = MessageBus()
+        subscriber = AsyncMock()
+        bus.subscribe_outbound(Channel.CLI, subscriber)
+        pool = WorkerPool(1, bus)
+
+        async def launch(worker):
+            reader, worker.writer = await asyncio.open_unix_connection(str(path))
+            return reader
+
+        pool._launch = launch
+        runner = asyncio.create_task(pool.start())
+        for i in range(5):
+            await bus.publish_inbound(_msg("chat", str(i)))
+
+        for _ in range(100):
+            if subscriber.call_count == 5:
+                break
+            await asyncio.sleep(0.01)
+
+        assert received == ["0", "1", "2", "3", "4"]
+        assert [c.args[0].content for c in subscriber.call_args_list] == [
+            f"re: {i}" for i in range(5)
+        ]
+        assert pool.stats()["workers"][0]["inflight"] == 0
+        assert pool.started.is_set()
+
+        await pool.stop()
+        assert not pool.started.is_set()
+        runner.cancel()
+        server.close()
+
+    async def test_messages_queued_while_worker_is_down_are_resent(self, tmp_path):
+        received: list[str] = []
+        server, path = await _fake_worker(tmp_path, received)
+        pool = WorkerPool(1, MessageBus())
+        worker = pool._workers[0]
+
+        await pool._forward(_msg("chat", "early"))
+        assert worker.inflight
+
+        async def launch(w):
+            reader, w.writer = await asyncio.open_unix_connection(str(path))
+            return reader
+
+        pool._launch = launch
+        pool._running = True
+        supervisor = asyncio.create_task(pool._supervise(worker))
+        for _ in range(100):
+            if not worker.inflight:
+                break
+            await asyncio.sleep(0.01)
+
+        assert received == ["early"]
+        assert worker.ready.is_set()
+
+        pool._running = False
+        supervisor.cancel()
+        server.close()
+
+    async def test_control_frames_and_stats_replies(self, tmp_path):
+        received: list[str] = []
+        server, path = await _fake_worker(tmp_path, received)
+        pool = WorkerPool(2, MessageBus())
+        up, down = pool._workers
+
+        async def launch(w):
+            reader, w.writer = await asyncio.open_unix_connection(str(path))
+            return reader
+
+        pool._launch = launch
+        pool._running = True
+        supervisor = asyncio.create_task(pool._supervise(up))
+        await asyncio.wait_for(up.ready.wait(), timeout=1)
+
+        await pool.control("reset_router")
+        stats = await pool.worker_stats(timeout=1)
+
+        assert received == ["control:reset_router", "control:stats"]
+        assert stats == [{"running": True, "scheduler": {"capacity": 2, "active": 1}}, None]
+        assert not up.requests and not down.requests
+
+        pool._running = False
+        supervisor.cancel()
+        server.close()
+
+    async def test_audit_frames_are_recorded_by_the_front(self, tmp_path):
+        async def handle(reader, writer):
+            write_frame(writer, {"type": "audit", "entry": {"target": "shell"}})
+            await writer.drain()
+            writer.close()
+
+        server = await asyncio.start_unix_server(handle, path=str(tmp_path / "a.sock"))
+        reader, _ = await asyncio.open_unix_connection(str(tmp_path / "a.sock"))
+        pool = WorkerPool(1, MessageBus())
+        audit = MagicMock()
+
+        with patch("pocketclaw.security.audit.get_audit_logger", return_value=audit):
+            await pool._read_frames(pool._workers[0], reader)
+
+        audit.record.assert_called_once_with({"target": "shell"})
+        server.close()
+
+
+class TestWorkerSupport:
+    def test_only_file_memory_backend_is_supported(self):
+        assert workers_enabled(Settings(agent_workers=2, memory_backend="file"))
+        assert not workers_enabled(Settings(agent_workers=2, memory_backend="mem0"))
+        assert not workers_enabled(Settings(agent_workers=0))
+
+    def test_apply_control(self):
+        agent_loop = MagicMock(_running=True)
+        agent_loop.scheduler.stats.return_value = {"capacity": 1}
+
+        assert apply_control(agent_loop, "stats") == {
+            "running": True,
+            "scheduler": {"capacity": 1},
+        }
+        assert apply_control(agent_loop, "reset_router") is None
+        agent_loop.reset_router.assert_called_once()
+        with patch("pocketclaw.memory.get_memory_manager") as get_manager:
+            apply_control(agent_loop, "reload_memory")
+        get_manager.assert_called_once_with(force_reload=True)
+        assert agent_loop.context_builder.memory is get_manager.return_value
+
+    async def test_backlog_counts_unacked_messages(self):
+        pool = WorkerPool(2, MessageBus(), slots=2)
+        for i in range(3):
+            pool._workers[0].inflight[i] = _msg("a")
+        pool._workers[1].inflight[9] = _msg("b")
+
+        assert pool.backlog() == {"capacity": 4, "active": 3, "queued": 1}
+
+    def test_merge_scheduler_stats(self):
+        lane = {
+            "queued": 1,
+            "running": 1,
+            "served": 1,
+            "avg_wait_ms": 10.0,
+            "max_wait_ms": 10.0,
+            "oldest_wait_ms": 5.0,
+            "weight": 1,
+            "cap": None,
+        }
+        other = {**lane, "served": 3, "avg_wait_ms": 30.0, "max_wait_ms": 50.0}
+
+        merged = merge_scheduler_stats(
+            [
+                {"capacity": 4, "active": 1, "lanes": {"websocket": lane}},
+                {"capacity": 4, "active": 2, "lanes": {"websocket": other, "cli": lane}},
+            ]
+        )
+
+        assert merged["capacity"] == 8 and merged["active"] == 3
+        ws = merged["lanes"]["websocket"]
+        assert ws["served"] == 4 and ws["queued"] == 2
+        assert ws["avg_wait_ms"] == 25.0
+        assert ws["max_wait_ms"] == 50.0
+        assert list(merged["lanes"]) == ["cli", "websocket"]
+
+
+class TestWorkerBus:
+    async def test_outbound_system_and_acks_go_over_the_link(self, tmp_path):
+        frames: list[dict] = []
+        got = asyncio.Event()
+
+        async def handle(reader, writer):
+            while (frame := await read_frame(reader)) is not None:
+                frames.append(frame)
+                if frame["type"] == "ack":
+                    got.set()
+
+        server = await asyncio.start_unix_server(handle, path=str(tmp_path / "b.sock"))
+        _, writer = await asyncio.open_unix_connection(str(tmp_path / "b.sock"))
+        bus = WorkerBus(writer)
+
+        message = _msg("chat")
+        await bus.deliver_inbound(7, message)
+        consumed = await bus.consume_inbound(timeout=0.1)
+        await bus.publish_outbound(OutboundMessage(channel=Channel.CLI, chat_id="c", content="x"))
+        bus.record_turn_latency(1.5)
+        bus.ack_inbound(consumed)
+        await asyncio.wait_for(got.wait(), timeout=1)
+
+        assert [f["type"] for f in frames] == ["outbound", "latency", "ack"]
+        assert frames[1]["seconds"] == 1.5
+        assert frames[2]["seq"] == 7
+        writer.close()
+        server.close()
@@ -0,0 +1,95 @@
+# Tests for security/audit_reader.py — reverse tail reads, block index, cursors
+# Created: 2026-10-19
+
+import json
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from pocketclaw.security.audit_reader import AuditFilter, AuditIndex, AuditReader
+
+_T0 = datetime(2026, 10, 1, tzinfo=UTC)
+
+
+def _write_log(path, count: int) -> None:
+    with path.open("w") as f:
+        for i in range(count):
+            entry = {
+                "id": str(i),
+                "timestamp": (_T0 + timedelta(minutes=i)).isoformat(),
+                "severity": "alert" if i % 50 == 0 else "info",
+                "actor": "agent",
+                "action": "tool_use",
+                "target": f"tool-{i}",
+                "status": "block" if i % 50 == 0 else "success",
+                "context": {"pad": "x" * 200},
+            }
+            f.write(json.dumps(entry) + "\n")
+
+
+@pytest.fixture(params=[True, False], ids=["indexed", "scan"])
+def reader(request, tmp_path):
+    log = tmp_path / "audit.jsonl"
+    _write_log(log, 2000)
+    r = AuditReader(log, use_index=request.param)
+    if r.index is not None:
+        r.index.block_bytes = 16 * 1024
+    return r
+
+
+def test_tail_is_newest_first(reader):
+    entries, cursor = reader.query(limit=3)
+
+    assert [e["id"] for e in entries] == ["1999", "1998", "1997"]
+    assert cursor is not None
+
+
+def test_cursor_pages_cover_the_log_once(reader):
+    seen: list[str] = []
+    cursor = None
+    while True:
+        page, cursor = reader.query(limit=333, cursor=cursor)
+        seen.extend(e["id"] for e in page)
+        if cursor is None:
+            break
+
+    assert seen == [str(i) for i in range(1999, -1, -1)]
+
+
+def test_filters(reader):
+    f = AuditFilter.from_query(
+        severity="alert,critical", since=(_T0 + timedelta(minutes=1000)).isoformat()
+    )
+    entries, cursor = reader.query(limit=100, filters=f)
+
+    assert [e["id"] for e in entries] == [str(i) for i in range(1950, 999, -50)]
+    assert cursor is None
+
+    entries, _ = reader.query(limit=100, filters=AuditFilter.from_query(search="TOOL-123"))
+    assert [e["id"] for e in entries] == [str(i) for i in range(1239, 1229, -1)] + ["123"]
+
+
+def test_index_skips_blocks_and_survives_truncation(tmp_path):
+    log = tmp_path / "audit.jsonl"
+    _write_log(log, 2000)
+    index = AuditIndex(log, block_bytes=16 * 1024)
+    index.refresh()
+    assert len(index.blocks) > 10
+    assert all(b.end == n.start for b, n in zip(index.blocks, index.blocks[1:]))
+
+    # A fresh index object picks the sidecar file back up
+    reloaded = AuditIndex(log, block_bytes=16 * 1024)
+    reloaded.refresh()
+    assert reloaded.end == index.end
+
+    log.write_text("")
+    _write_log(log, 10)
+    reader = AuditReader(log)
+    entries, _ = reader.query(limit=100)
+    assert len(entries) == 10
+    assert reader.index.blocks == []
+
+
+def test_invalid_input():
+    with pytest.raises(ValueError):
+        AuditFilter.from_query(since="yesterday")
@@ -0,0 +1,96 @@
+# Tests for security/audit_writer.py — batched background writes and rotation
+# Created: 2026-10-19
+
+import gzip
+import json
+from datetime import date
+
+from pocketclaw.security.audit import AuditEvent, AuditLogger, AuditSeverity
+from pocketclaw.security.audit_reader import AuditReader
+from pocketclaw.security.audit_writer import AuditWriter, list_segments
+
+
+def _line(i: int) -> str:
+    return json.dumps({"id": str(i), "timestamp": f"2026-10-19T10:00:{i % 60:02d}+00:00"})
+
+
+def test_events_are_batched(tmp_path):
+    log = tmp_path / "audit.jsonl"
+    writer = AuditWriter(log, flush_interval_ms=100, rotate_bytes=0)
+    batches = []
+    write = writer._write
+    writer._write = lambda lines: (batches.append(len(lines)), write(lines))
+
+    for i in range(20):
+        writer.write(_line(i))
+    writer.flush()
+
+    assert batches == [20]
+    assert len(log.read_text().splitlines()) == 20
+
+
+def test_size_rotation_compresses_and_reader_spans_segments(tmp_path):
+    log = tmp_path / "audit.jsonl"
+    writer = AuditWriter(log, flush_interval_ms=0, rotate_bytes=400)
+    for i in range(30):
+        writer.write(_line(i))
+        writer.flush()
+
+    segments = list_segments(log)
+    assert len(segments) >= 3
+    assert all(path.suffix == ".gz" for _, path in segments)
+    assert gzip.decompress(segments[-1][1].read_bytes()).startswith(b'{"id": "0"')
+
+    reader = AuditReader(log)
+    seen, cursor = [], None
+    while True:
+        page, cursor = reader.query(limit=7, cursor=cursor)
+        seen.extend(e["id"] for e in page)
+        if cursor is None:
+            break
+    assert seen == [str(i) for i in range(29, -1, -1)]
+
+
+def test_daily_rotation(tmp_path):
+    log = tmp_path / "audit.jsonl"
+    writer = AuditWriter(log, flush_interval_ms=0, rotate_bytes=0, rotate_daily=True)
+    writer.write(_line(1))
+    writer.flush()
+    writer._day = date(2026, 1, 1)  # pretend the file was started on an earlier day
+
+    writer.write(_line(2))
+    writer.flush()
+
+    assert len(list_segments(log)) == 1
+    assert [json.loads(x)["id"] for x in log.read_text().splitlines()] == ["2"]
+
+
+def test_logger_callbacks_query_and_clear(tmp_path):
+    audit = AuditLogger(log_path=tmp_path / "audit.jsonl")
+    seen = []
+    audit.on_log(seen.append)
+
+    audit.log(AuditEvent.create(AuditSeverity.ALERT, "agent", "tool_use", "shell", "block"))
+
+    assert seen[0]["target"] == "shell"
+    entries, _ = audit.query(limit=10)
+    assert [e["target"] for e in entries] == ["shell"]
+
+    audit.clear()
+    assert audit.query(limit=10) == ([], None)
+
+
+def test_forwarded_entries_are_written_by_the_receiver(tmp_path):
+    # A worker process forwards; the front records the entry and fires callbacks
+    front = AuditLogger(log_path=tmp_path / "audit.jsonl")
+    worker = AuditLogger(log_path=tmp_path / "worker.jsonl")
+    seen = []
+    front.on_log(seen.append)
+    worker.forward_to(front.record)
+
+    worker.log(AuditEvent.create(AuditSeverity.INFO, "agent", "tool_use", "read_file", "ok"))
+    worker.flush()
+
+    assert [e["target"] for e in seen] == ["read_file"]
+    assert [e["target"] for e in front.query(limit=10)[0]] == ["read_file"]
+    assert not (tmp_path / "worker.jsonl").exists()
@@ -2,13 +2,14 @@
 # Created: 2026-02-02
 
 
+import asyncio
 from unittest.mock import AsyncMock
 
 import pytest
 
 from pocketclaw.bus.adapters import BaseChannelAdapter
 from pocketclaw.bus.events import Channel, InboundMessage, OutboundMessage
-from pocketclaw.bus.queue import MessageBus
+from pocketclaw.bus.queue import MessageBus, PriorityInboundQueue
 
 
 class MockAdapter(BaseChannelAdapter):
@@ -225,3 +226,192 @@ async def test_broadcast_excludes_new_channels():
     assert sub_discord.call_count == 1
     assert sub_slack.call_count == 0  # Excluded
     assert sub_whatsapp.call_count == 1
+
+
+def _inbound(channel: Channel, chat_id: str = "chat1") -> InboundMessage:
+    return InboundMessage(channel=channel, sender_id="user1", chat_id=chat_id, content="hi")
+
+
+@pytest.mark.asyncio
+async def test_full_queue_sheds_low_priority():
+    bus = MessageBus(lane_sizes={"bulk": 1})
+    assert await bus.publish_inbound(_inbound(Channel.WEBHOOK)) is True
+
+    assert await bus.publish_inbound(_inbound(Channel.WEBHOOK)) is False
+    assert bus.inbound_pending() == 1
+    assert bus.inbound_stats()["shed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_overload_replies_with_queue_position_once():
+    bus = MessageBus(shed_wait_seconds=10)
+    subscriber = AsyncMock()
+    bus.subscribe_outbound(Channel.TELEGRAM, subscriber)
+    bus.record_turn_latency(20)
+
+    await bus.publish_inbound(_inbound(Channel.TELEGRAM, "a"))  # no backlog yet
+    subscriber.assert_not_called()
+
+    await bus.publish_inbound(_inbound(Channel.TELEGRAM, "b"))
+    await bus.publish_inbound(_inbound(Channel.TELEGRAM, "b"))
+    assert subscriber.call_count == 1
+    reply = subscriber.call_args[0][0]
+    assert reply.chat_id == "b"
+    assert reply.metadata == {"busy": True, "queue_position": 2}
+    # Interactive messages are still queued, low-priority ones are dropped
+    assert await bus.publish_inbound(_inbound(Channel.SYSTEM)) is False
+    assert bus.inbound_pending() == 3
+
+    # Once a session's turn is done it can be notified again
+    bus.ack_inbound(await bus.consume_inbound(), await bus.consume_inbound())
+    await bus.publish_inbound(_inbound(Channel.TELEGRAM, "b"))
+    assert subscriber.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_wait_counts_the_agent_backlog():
+    bus = MessageBus(shed_wait_seconds=10, lane_sizes={"interactive": 1})
+    subscriber = AsyncMock()
+    bus.subscribe_outbound(Channel.TELEGRAM, subscriber)
+    bus.record_turn_latency(20)
+    backlog = {"capacity": 2, "active": 2, "queued": 3}
+    bus.track_backlog(lambda: backlog)
+
+    assert bus.queue_position("interactive") == 3
+    assert bus.estimated_wait("interactive") == 40.0
+
+    await bus.publish_inbound(_inbound(Channel.TELEGRAM, "a"))
+    # Lane full and busy reply sent: queued past the bound, adapter not blocked
+    await asyncio.wait_for(bus.publish_inbound(_inbound(Channel.TELEGRAM, "b")), timeout=1)
+    assert bus.inbound_pending() == 2
+    assert [c.args[0].metadata["queue_position"] for c in subscriber.call_args_list] == [4, 5]
+
+
+@pytest.mark.asyncio
+async def test_estimated_wait_uses_turn_latency_and_workers():
+    bus = MessageBus(workers=2)
+    assert bus.estimated_wait() == 0.0
+
+    bus.record_turn_latency(10)
+    for _ in range(4):
+        await bus.publish_inbound(_inbound(Channel.CLI))
+
+    assert bus.estimated_wait() == 20.0
+
+
+@pytest.mark.asyncio
+async def test_inbound_lanes_serve_by_priority():
+    bus = MessageBus()
+    await bus.publish_inbound(_inbound(Channel.WEBHOOK, "bulk"))
+    await bus.publish_inbound(_inbound(Channel.SYSTEM, "system"))
+    await bus.publish_inbound(_inbound(Channel.TELEGRAM, "chat"))
+
+    order = [(await bus.consume_inbound()).chat_id for _ in range(3)]
+
+    assert order == ["chat", "system", "bulk"]
+    assert bus.inbound_pending() == 0
+
+
+@pytest.mark.asyncio
+async def test_inbound_aging_prevents_starvation():
+    bus = MessageBus(aging_seconds=0.05)
+    await bus.publish_inbound(_inbound(Channel.WEBHOOK, "bulk"))
+    await asyncio.sleep(0.06)
+    await bus.publish_inbound(_inbound(Channel.TELEGRAM, "chat"))
+
+    assert (await bus.consume_inbound()).chat_id == "bulk"
+
+
+@pytest.mark.asyncio
+async def test_full_lane_blocks_only_its_own_publishers():
+    bus = MessageBus(lane_sizes={"system": 1}, low_priority_channels=[])
+    await bus.publish_inbound(_inbound(Channel.SYSTEM, "s1"))
+
+    blocked = asyncio.create_task(bus.publish_inbound(_inbound(Channel.SYSTEM, "s2")))
+    await bus.publish_inbound(_inbound(Channel.CLI, "chat"))
+    await asyncio.sleep(0)
+    assert not blocked.done()
+
+    assert (await bus.consume_inbound()).chat_id == "chat"
+    assert (await bus.consume_inbound()).chat_id == "s1"
+    await asyncio.wait_for(blocked, timeout=1)
+    assert (await bus.consume_inbound()).chat_id == "s2"
+
+
+@pytest.mark.asyncio
+async def test_sync_removal_wakes_blocked_publishers():
+    queue = PriorityInboundQueue(lane_sizes={"bulk": 1})
+    await queue.put(_inbound(Channel.WEBHOOK, "b1"), "bulk")
+
+    blocked = asyncio.create_task(queue.put(_inbound(Channel.WEBHOOK, "b2"), "bulk"))
+    await asyncio.sleep(0)
+    assert not blocked.done()
+    assert queue.get_nowait().chat_id == "b1"
+    await asyncio.wait_for(blocked, timeout=1)
+
+    blocked = asyncio.create_task(queue.put(_inbound(Channel.WEBHOOK, "b3"), "bulk"))
+    await asyncio.sleep(0)
+    assert not blocked.done()
+    queue.clear()
+    await asyncio.wait_for(blocked, timeout=1)
+    assert queue.get_nowait().chat_id == "b3"
+
+
+@pytest.mark.asyncio
+async def test_consume_inbound_times_out_when_empty():
+    bus = MessageBus()
+    assert await bus.consume_inbound(timeout=0.01) is None
+
+
+def _chunk(content: str, chat_id: str = "chat1") -> OutboundMessage:
+    return OutboundMessage(
+        channel=Channel.WEBSOCKET, chat_id=chat_id, content=content, is_stream_chunk=True
+    )
+
+
+@pytest.mark.asyncio
+async def test_stream_chunks_coalesce_within_window():
+    bus = MessageBus(coalesce_window_ms=20)
+    subscriber = AsyncMock()
+    bus.subscribe_outbound(Channel.WEBSOCKET, subscriber)
+
+    for part in ("Hel", "lo", " world"):
+        await bus.publish_outbound(_chunk(part))
+    subscriber.assert_not_called()
+
+    await asyncio.sleep(0.05)
+    assert subscriber.call_count == 1
+    merged = subscriber.call_args[0][0]
+    assert merged.content == "Hello world"
+    assert merged.is_stream_chunk
+
+
+@pytest.mark.asyncio
+async def test_stream_end_flushes_buffered_chunks_first():
+    bus = MessageBus(coalesce_window_ms=1000)
+    subscriber = AsyncMock()
+    bus.subscribe_outbound(Channel.WEBSOCKET, subscriber)
+
+    await bus.publish_outbound(_chunk("a"))
+    await bus.publish_outbound(_chunk("b", chat_id="other"))
+    await bus.publish_outbound(_chunk("c"))
+    await bus.publish_outbound(
+        OutboundMessage(channel=Channel.WEBSOCKET, chat_id="chat1", content="", is_stream_end=True)
+    )
+
+    delivered = [c.args[0] for c in subscriber.call_args_list]
+    assert [(m.content, m.is_stream_end) for m in delivered] == [("ac", False), ("", True)]
+    bus.clear()
+
+
+@pytest.mark.asyncio
+async def test_stream_chunks_flush_at_max_bytes():
+    bus = MessageBus(coalesce_window_ms=1000, coalesce_max_bytes=4)
+    subscriber = AsyncMock()
+    bus.subscribe_outbound(Channel.WEBSOCKET, subscriber)
+
+    await bus.publish_outbound(_chunk("ab"))
+    await bus.publish_outbound(_chunk("cd"))
+
+    assert subscriber.call_count == 1
+    assert subscriber.call_args[0][0].content == "abcd"
@@ -0,0 +1,148 @@
+# Tests for bus/outbound.py — per-subscriber outbound queues
+# Created: 2026-10-19
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from pocketclaw.bus.events import Channel, OutboundMessage
+from pocketclaw.bus.outbound import SubscriberQueue
+from pocketclaw.bus.queue import MessageBus
+
+
+def _chunk(content: str, chat_id: str = "chat1") -> OutboundMessage:
+    return OutboundMessage(
+        channel=Channel.SLACK, chat_id=chat_id, content=content, is_stream_chunk=True
+    )
+
+
+def _final(chat_id: str = "chat1") -> OutboundMessage:
+    return OutboundMessage(channel=Channel.SLACK, chat_id=chat_id, content="", is_stream_end=True)
+
+
+class _Gate:
+    """Subscriber that blocks until released and records what it received."""
+
+    def __init__(self):
+        self.released = asyncio.Event()
+        self.received: list[OutboundMessage] = []
+
+    async def __call__(self, message: OutboundMessage) -> None:
+        await self.released.wait()
+        self.received.append(message)
+
+
+class TestSubscriberQueue:
+    async def test_slow_subscriber_does_not_stall_publisher(self):
+        bus = MessageBus(subscriber_queue_size=10)
+        slow = _Gate()
+        fast = AsyncMock()
+        bus.subscribe_outbound(Channel.SLACK, slow)
+        bus.subscribe_outbound(Channel.DISCORD, fast)
+
+        await asyncio.wait_for(bus.publish_outbound(_chunk("hi")), timeout=0.5)
+        await bus.publish_outbound(
+            OutboundMessage(channel=Channel.DISCORD, chat_id="c", content="x")
+        )
+        await asyncio.sleep(0)
+        assert fast.call_count == 1
+        assert slow.received == []
+
+        slow.released.set()
+        await asyncio.wait_for(bus.drain_outbound(), timeout=1)
+        assert [m.content for m in slow.received] == ["hi"]
+
+    async def test_drop_oldest_chunk_policy(self):
+        gate = _Gate()
+        queue = SubscriberQueue(Channel.SLACK, gate, maxsize=2, policy="drop_oldest_chunk")
+        await queue.put(_chunk("a"))
+        await asyncio.sleep(0)  # worker takes "a" and blocks in the callback
+        for part in ("b", "c", "d"):
+            await queue.put(_chunk(part))
+
+        gate.released.set()
+        await asyncio.wait_for(queue.join(), timeout=1)
+
+        assert [m.content for m in gate.received] == ["a", "c", "d"]
+        assert queue.stats()["dropped"] == 1
+        queue.close()
+
+    async def test_collapse_policy_keeps_all_text(self):
+        gate = _Gate()
+        queue = SubscriberQueue(Channel.SLACK, gate, maxsize=3, policy="collapse")
+        await queue.put(_chunk("a"))
+        await asyncio.sleep(0)
+        for message in (_chunk("b"), _chunk("c"), _chunk("x", chat_id="other"), _chunk("d")):
+            await queue.put(message)
+        await queue.put(_final())
+
+        gate.released.set()
+        await asyncio.wait_for(queue.join(), timeout=1)
+
+        assert [(m.chat_id, m.content) for m in gate.received] == [
+            ("chat1", "a"),
+            ("chat1", "bcd"),
+            ("other", "x"),
+            ("chat1", ""),
+        ]
+        assert gate.received[-1].is_stream_end
+        queue.close()
+
+    async def test_collapse_does_not_mutate_shared_messages(self):
+        gate = _Gate()
+        queue = SubscriberQueue(Channel.SLACK, gate, maxsize=2, policy="collapse")
+        await queue.put(_chunk("a"))
+        await asyncio.sleep(0)
+        b = _chunk("b")
+        await queue.put(b)
+        await queue.put(_chunk("c"))
+        await queue.put(_chunk("d"))
+
+        assert b.content == "b"
+        queue.close()
+
+    async def test_block_policy_waits_for_space(self):
+        gate = _Gate()
+        queue = SubscriberQueue(Channel.SLACK, gate, maxsize=1, policy="block")
+        await queue.put(_chunk("a"))
+        await asyncio.sleep(0)
+        await queue.put(_chunk("b"))
+
+        blocked = asyncio.create_task(queue.put(_chunk("c")))
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+
+        gate.released.set()
+        await asyncio.wait_for(blocked, timeout=1)
+        await asyncio.wait_for(queue.join(), timeout=1)
+        assert [m.content for m in gate.received] == ["a", "b", "c"]
+        queue.close()
+
+    async def test_errors_and_lag_are_recorded(self):
+        failing = AsyncMock(side_effect=RuntimeError("boom"))
+        queue = SubscriberQueue(Channel.SLACK, failing, maxsize=4)
+        await queue.put(_chunk("a"))
+        await asyncio.wait_for(queue.join(), timeout=1)
+
+        stats = queue.stats()
+        assert stats["delivered"] == 1
+        assert stats["errors"] == 1
+        assert stats["queued"] == 0
+        assert stats["max_lag_ms"] >= 0
+        queue.close()
+
+    def test_unknown_policy_rejected(self):
+        with pytest.raises(ValueError):
+            SubscriberQueue(Channel.SLACK, AsyncMock(), policy="nope")
+
+    async def test_unsubscribe_stops_worker(self):
+        bus = MessageBus(subscriber_queue_size=4)
+        sub = AsyncMock()
+        bus.subscribe_outbound(Channel.SLACK, sub)
+        await bus.publish_outbound(_chunk("a"))
+        await bus.drain_outbound()
+
+        bus.unsubscribe_outbound(Channel.SLACK, sub)
+
+        assert bus.outbound_stats() == {}
@@ -912,6 +912,8 @@ class TestAgentLoopCommandIntegration:
 
         settings = MagicMock()
         settings.max_concurrent_conversations = 5
+        settings.owner_id = ""
+        settings.message_coalesce_enabled = False
         settings.injection_scan_enabled = False
         mock_settings.return_value = settings
 
@@ -964,6 +966,8 @@ class TestAgentLoopCommandIntegration:
 
         settings = MagicMock()
         settings.max_concurrent_conversations = 5
+        settings.owner_id = ""
+        settings.message_coalesce_enabled = False
         settings.injection_scan_enabled = False
         settings.welcome_hint_enabled = False
         mock_settings.return_value = settings
@@ -1018,6 +1022,8 @@ class TestAgentLoopCommandIntegration:
 
         settings = MagicMock()
         settings.max_concurrent_conversations = 5
+        settings.owner_id = ""
+        settings.message_coalesce_enabled = False
         mock_settings.return_value = settings
 
         bus = MagicMock()
@@ -1037,7 +1043,7 @@ class TestAgentLoopCommandIntegration:
         # Mock _process_message_inner to just track what session_key it receives
         received_keys = []
 
-        async def _capture_inner(message, session_key):
+        async def _capture_inner(message, session_key, originals=None):
             received_keys.append(session_key)
 
         loop._process_message_inner = _capture_inner
@@ -1118,6 +1124,8 @@ class TestWelcomeHint:
 
         settings = MagicMock()
         settings.max_concurrent_conversations = 5
+        settings.owner_id = ""
+        settings.message_coalesce_enabled = False
         settings.injection_scan_enabled = False
         settings.welcome_hint_enabled = True
         mock_settings.return_value = settings
@@ -1174,6 +1182,8 @@ class TestWelcomeHint:
 
         settings = MagicMock()
         settings.max_concurrent_conversations = 5
+        settings.owner_id = ""
+        settings.message_coalesce_enabled = False
         settings.injection_scan_enabled = False
         settings.welcome_hint_enabled = True
         mock_settings.return_value = settings
@@ -1229,6 +1239,8 @@ class TestWelcomeHint:
 
         settings = MagicMock()
         settings.max_concurrent_conversations = 5
+        settings.owner_id = ""
+        settings.message_coalesce_enabled = False
         settings.injection_scan_enabled = False
         settings.welcome_hint_enabled = True
         mock_settings.return_value = settings
@@ -1287,6 +1299,8 @@ class TestWelcomeHint:
 
         settings = MagicMock()
         settings.max_concurrent_conversations = 5
+        settings.owner_id = ""
+        settings.message_coalesce_enabled = False
         settings.injection_scan_enabled = False
         settings.welcome_hint_enabled = False
         mock_settings.return_value = settings
@@ -1345,6 +1359,8 @@ class TestWelcomeHint:
 
         settings = MagicMock()
         settings.max_concurrent_conversations = 5
+        settings.owner_id = ""
+        settings.message_coalesce_enabled = False
         settings.injection_scan_enabled = False
         settings.welcome_hint_enabled = True
         mock_settings.return_value = settings
@@ -57,6 +57,23 @@ class TestTier1Compaction:
         result = await mgr.get_compacted_history("test")
         assert result == []
 
+    async def test_pending_messages_are_newest(self):
+        """Pending (not yet stored) messages are appended after stored entries."""
+        entries = _make_entries(4)
+        mgr = _make_manager(entries)
+        result = await mgr.get_compacted_history(
+            "test", recent_window=3, pending=[{"role": "user", "content": "new question"}]
+        )
+        assert result[-1] == {"role": "user", "content": "new question"}
+        assert result[0]["content"].startswith("[Earlier conversation]")
+
+    async def test_pending_only(self):
+        mgr = _make_manager([])
+        result = await mgr.get_compacted_history(
+            "test", pending=[{"role": "user", "content": "hi"}]
+        )
+        assert result == [{"role": "user", "content": "hi"}]
+
     async def test_exact_window_no_summary(self):
         """When message count equals recent_window, no summary block is created."""
         entries = _make_entries(10)
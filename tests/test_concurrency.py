@@ -26,7 +26,7 @@ def _make_slow_router(delay: float = 0.1):
     """Return a mock router whose run() sleeps for *delay* seconds."""
     router = MagicMock()
 
-    async def mock_run(message, *, system_prompt=None, history=None):
+    async def mock_run(message, *, system_prompt=None, history=None, session_key=None):
         await asyncio.sleep(delay)
         yield {"type": "message", "content": "ok", "metadata": {}}
         yield {"type": "done", "content": ""}
@@ -64,6 +64,8 @@ async def test_session_lock_serialises_same_session(
     settings.compaction_summary_chars = 150
     settings.compaction_llm_summarize = False
     settings.max_concurrent_conversations = 5
+    settings.owner_id = ""
+    settings.message_coalesce_enabled = False
     mock_get_settings.return_value = settings
 
     bus = MagicMock()
@@ -91,7 +93,7 @@ async def test_session_lock_serialises_same_session(
     order = []
     delay = 0.05
 
-    async def slow_run(message, *, system_prompt=None, history=None):
+    async def slow_run(message, *, system_prompt=None, history=None, session_key=None):
         order.append(f"start:{message}")
         await asyncio.sleep(delay)
         order.append(f"end:{message}")
@@ -144,6 +146,8 @@ async def test_cross_session_runs_in_parallel(
     settings.compaction_summary_chars = 150
     settings.compaction_llm_summarize = False
     settings.max_concurrent_conversations = 5
+    settings.owner_id = ""
+    settings.message_coalesce_enabled = False
     mock_get_settings.return_value = settings
 
     bus = MagicMock()
@@ -170,7 +174,7 @@ async def test_cross_session_runs_in_parallel(
 
     order = []
 
-    async def slow_run(message, *, system_prompt=None, history=None):
+    async def slow_run(message, *, system_prompt=None, history=None, session_key=None):
         order.append(f"start:{message}")
         await asyncio.sleep(0.05)
         order.append(f"end:{message}")
@@ -227,6 +231,8 @@ async def test_global_semaphore_caps_concurrency(
     settings.compaction_summary_chars = 150
     settings.compaction_llm_summarize = False
     settings.max_concurrent_conversations = 1  # Force serial
+    settings.owner_id = ""
+    settings.message_coalesce_enabled = False
     mock_get_settings.return_value = settings
 
     bus = MagicMock()
@@ -253,7 +259,7 @@ async def test_global_semaphore_caps_concurrency(
 
     order = []
 
-    async def slow_run(message, *, system_prompt=None, history=None):
+    async def slow_run(message, *, system_prompt=None, history=None, session_key=None):
         order.append(f"start:{message}")
         await asyncio.sleep(0.05)
         order.append(f"end:{message}")
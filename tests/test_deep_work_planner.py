@@ -424,6 +424,22 @@ class TestPlanFlow:
         assert result.estimated_total_minutes == 25
         assert result.dependency_graph == {"t2": ["t1"]}
 
+    @pytest.mark.asyncio
+    async def test_unparseable_output_is_discarded_from_cache(self):
+        planner = PlannerAgent(AsyncMock())
+        replies = iter(["notes", "prd", "not json", "still not json", VALID_TEAM_JSON])
+        prompts: list[str] = []
+
+        async def mock_run_prompt(prompt: str, router=None) -> str:
+            prompts.append(prompt)
+            return next(replies)
+
+        planner._run_prompt = mock_run_prompt
+        with patch.object(planner, "_discard_cached") as discard:
+            await planner.plan("Build a TODO app")
+
+        assert [c.args[0] for c in discard.call_args_list] == [prompts[2], prompts[3]]
+
     @pytest.mark.asyncio
     async def test_plan_with_human_tasks(self):
         manager = AsyncMock()
@@ -0,0 +1,83 @@
+# Tests for the dashboard file browser — scandir listing, pagination, cache
+# Created: 2026-10-19
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+
+def scan_directory(*args, **kwargs) -> dict:
+    # Imported lazily: other tests stub ``telegram`` before fetch.py is loaded
+    from pocketclaw.tools.fetch import scan_directory
+
+    return scan_directory(*args, **kwargs)
+
+
+@pytest.fixture
+def tree(tmp_path):
+    (tmp_path / ".hidden").mkdir()
+    for name in ("beta", "Alpha"):
+        (tmp_path / name).mkdir()
+    for i in range(5):
+        (tmp_path / f"file_{i}.txt").write_text("x" * (i * 600))
+    return tmp_path
+
+
+def _settings(jail):
+    settings = MagicMock()
+    settings.file_jail_path = jail
+    return settings
+
+
+async def _browse(path, jail, **kwargs) -> dict:
+    from pocketclaw.dashboard import handle_file_browse
+
+    ws = MagicMock()
+    ws.send_json = AsyncMock()
+    await handle_file_browse(ws, str(path), _settings(jail), **kwargs)
+    return ws.send_json.call_args.args[0]
+
+
+class TestScanDirectory:
+    def test_dirs_first_hidden_skipped(self, tree):
+        listing = scan_directory(tree)
+        names = [f["name"] for f in listing["files"]]
+        assert names[:2] == ["Alpha", "beta"]
+        assert ".hidden" not in names
+        assert listing["total"] == 7
+        assert listing["files"][3] == {"name": "file_1.txt", "isDir": False, "size": "600 B"}
+        assert "size" not in listing["files"][0]
+
+    def test_pagination_and_filter(self, tree):
+        page = scan_directory(tree, offset=2, limit=3)
+        assert [f["name"] for f in page["files"]] == ["file_0.txt", "file_1.txt", "file_2.txt"]
+        assert page["hasMore"] is True
+        assert scan_directory(tree, offset=5, limit=3)["hasMore"] is False
+
+        found = scan_directory(tree, query="FILE_3")
+        assert [f["name"] for f in found["files"]] == ["file_3.txt"]
+        assert found["total"] == 1
+
+    def test_cache_reused_until_directory_changes(self, tree):
+        scan_directory(tree)
+        with patch("pocketclaw.tools.fetch._scan") as scan:
+            scan_directory(tree)
+            scan.assert_not_called()
+
+        (tree / "new.txt").write_text("")
+        assert "new.txt" in [f["name"] for f in scan_directory(tree, limit=100)["files"]]
+
+
+class TestHandleFileBrowse:
+    async def test_page_response(self, tree):
+        resp = await _browse(tree, tree, offset=1, limit=2, context="sidebar_x")
+        assert [f["name"] for f in resp["files"]] == ["beta", "file_0.txt"]
+        assert resp["total"] == 7
+        assert resp["hasMore"] is True
+        assert resp["context"] == "sidebar_x"
+
+    async def test_errors(self, tree, tmp_path_factory):
+        assert (await _browse(tree / "missing", tree))["error"] == "Path does not exist"
+        assert (await _browse(tree / "file_0.txt", tree))["error"] == "Not a directory"
+        outside = tmp_path_factory.mktemp("outside")
+        assert "Access denied" in (await _browse(outside, tree))["error"]
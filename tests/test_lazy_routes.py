@@ -0,0 +1,91 @@
+# Tests for lazy_routes.py and startup_report.py — deferred routers, import report
+# Created: 2026-10-19
+
+import subprocess
+import sys
+import types
+
+import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+
+from pocketclaw.lazy_routes import LazyRouter
+from pocketclaw.startup_report import StartupProfile, format_report, parse_importtime
+
+
+@pytest.fixture
+def fake_api(monkeypatch):
+    module = types.ModuleType("fake_lazy_api")
+    router = APIRouter()
+
+    @router.get("/items/{item_id}")
+    async def get_item(item_id: int):
+        return {"id": item_id}
+
+    module.router = router
+    monkeypatch.setitem(sys.modules, "fake_lazy_api", module)
+    return module
+
+
+class TestLazyRouter:
+    def test_loads_on_first_request(self, fake_api):
+        lazy = LazyRouter("fake_lazy_api:router")
+        app = FastAPI()
+        app.mount("/api/fake", lazy)
+        assert not lazy.loaded
+
+        client = TestClient(app)
+        assert client.get("/api/fake/items/3").json() == {"id": 3}
+        assert lazy.loaded
+        assert lazy.load_seconds is not None
+        assert client.get("/api/fake/items/x").status_code == 422
+        assert client.get("/api/fake/missing").status_code == 404
+
+    def test_rejects_non_router(self, fake_api):
+        fake_api.not_a_router = object()
+        with pytest.raises(TypeError):
+            LazyRouter("fake_lazy_api:not_a_router").load()
+
+    def test_dashboard_import_skips_subsystems(self):
+        code = (
+            "import sys, pocketclaw.dashboard; "
+            "print(any(m.startswith(('pocketclaw.mission_control', 'pocketclaw.deep_work')) "
+            "for m in sys.modules))"
+        )
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+        assert out.returncode == 0, out.stderr
+        assert out.stdout.strip() == "False"
+
+
+class TestStartupReport:
+    OUTPUT = "\n".join(
+        [
+            "import time: self [us] | cumulative | imported package",
+            "import time:       100 |        100 |   json.decoder",
+            "import time:       200 |        300 | json",
+            "import time:      1000 |       1500 |   pocketclaw.config",
+            "import time:       500 |       2300 | pocketclaw.dashboard",
+            "Traceback noise",
+        ]
+    )
+
+    def test_parse(self):
+        timings = parse_importtime(self.OUTPUT)
+        assert [t.module for t in timings] == [
+            "json.decoder",
+            "json",
+            "pocketclaw.config",
+            "pocketclaw.dashboard",
+        ]
+        assert timings[2].self_us == 1000
+        assert timings[2].cumulative_us == 1500
+
+    def test_report(self):
+        result = StartupProfile(
+            "run_dashboard", "pocketclaw.dashboard", 0.5, parse_importtime(self.OUTPUT)
+        )
+        assert result.import_ms == 2.3
+        report = format_report(result, top=1)
+        assert "import:      2.3 ms" in report
+        assert "1.5 ms  pocketclaw\n" in report  # package self time: 1000 + 500 us
+        assert "1.5 ms  pocketclaw.config" in report
@@ -251,3 +251,34 @@ async def test_download_url_infers_name(mock_settings, mock_dir, tmp_path):
     path = await dl.download_url("https://cdn.example.com/images/cat.png")
     # Filename should contain "cat.png" somewhere
     assert "cat.png" in path
+
+
+# --- Chunked uploads ---
+
+
+@patch("pocketclaw.bus.media.get_media_dir")
+@patch("pocketclaw.bus.media.get_settings")
+async def test_chunked_upload_streams_to_disk(mock_settings, mock_dir, tmp_path):
+    mock_settings.return_value = MagicMock(media_max_file_size_mb=1)
+    mock_dir.return_value = tmp_path
+
+    upload = await MediaDownloader().open_upload("notes.txt", "text/plain")
+    await upload.write(b"hello ")
+    await upload.write(b"world")
+    path = await upload.finish()
+
+    assert open(path, "rb").read() == b"hello world"
+
+
+@patch("pocketclaw.bus.media.get_media_dir")
+@patch("pocketclaw.bus.media.get_settings")
+async def test_chunked_upload_size_limit_discards_file(mock_settings, mock_dir, tmp_path):
+    mock_settings.return_value = MagicMock(media_max_file_size_mb=1)
+    mock_dir.return_value = tmp_path
+
+    upload = await MediaDownloader().open_upload("big.bin")
+    await upload.write(b"x" * (1024 * 1024))
+    with pytest.raises(ValueError, match="exceeds limit"):
+        await upload.write(b"x")
+
+    assert not os.path.exists(upload.path)
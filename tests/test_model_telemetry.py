@@ -0,0 +1,121 @@
+# Tests for agents/model_telemetry.py and telemetry-aware ModelRouter.select()
+# Created: 2026-10-19
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from pocketclaw.agents.model_router import ModelRouter, TaskComplexity
+from pocketclaw.agents.model_telemetry import ModelTelemetry, _percentile, estimate_cost
+
+COMPLEX_MESSAGE = "Plan the architecture for a microservices system with authentication"
+
+
+@pytest.fixture
+def telemetry():
+    t = ModelTelemetry()
+    with patch("pocketclaw.agents.model_router.get_model_telemetry", return_value=t):
+        yield t
+
+
+@pytest.fixture
+def settings():
+    mock = MagicMock()
+    mock.model_tier_simple = "claude-haiku-4-5-20251001"
+    mock.model_tier_moderate = "claude-sonnet-4-5-20250929"
+    mock.model_tier_complex = "claude-opus-4-6"
+    mock.smart_routing_adaptive = True
+    mock.smart_routing_latency_budget_ms = 10_000
+    mock.smart_routing_max_error_rate = 0.3
+    mock.smart_routing_cost_budget_usd = 0.0
+    mock.smart_routing_min_samples = 3
+    mock.smart_routing_window_seconds = 900
+    return mock
+
+
+def _record(telemetry, n, ttft_ms=1000, error=False, cost=0.01):
+    for _ in range(n):
+        telemetry.record(
+            "complex",
+            "claude-opus-4-6",
+            ttft_ms=ttft_ms,
+            latency_ms=ttft_ms + 2000,
+            output_tokens=100,
+            cost_usd=cost,
+            error=error,
+        )
+
+
+class TestModelTelemetry:
+    def test_percentile(self):
+        assert _percentile([], 95) == 0.0
+        assert _percentile([1, 2, 3, 4], 50) == 2
+        assert _percentile(list(range(1, 101)), 95) == 95
+
+    def test_tier_stats(self):
+        t = ModelTelemetry()
+        _record(t, 3)
+        _record(t, 1, error=True)
+
+        stats = t.tier_stats("complex")
+        assert stats.samples == 4
+        assert stats.error_rate == 0.25
+        assert stats.ttft_p95_ms == 1000
+        assert stats.output_tokens_per_sec == pytest.approx(50.0)
+        assert stats.total_cost_usd == pytest.approx(0.04)
+        assert t.tier_stats("simple") is None
+
+    def test_max_age_ignores_old_samples(self):
+        t = ModelTelemetry()
+        _record(t, 2)
+        for sample in t._samples["complex"]:
+            sample.at -= 3600
+
+        assert t.tier_stats("complex", max_age=900) is None
+        assert t.tier_stats("complex").samples == 2
+
+    def test_estimate_cost(self):
+        assert estimate_cost("claude-sonnet-4-5", 1_000_000, 0) == pytest.approx(3.0)
+        assert estimate_cost("unknown-model", 1000, 1000) == 0.0
+
+
+class TestAdaptiveSelect:
+    def test_healthy_complex_tier_is_kept(self, settings, telemetry):
+        _record(telemetry, 5, ttft_ms=2000)
+        result = ModelRouter(settings).select(COMPLEX_MESSAGE)
+
+        assert result.complexity == TaskComplexity.COMPLEX
+        assert telemetry.snapshot()["decisions"] == {"complex": 1}
+
+    def test_slow_complex_tier_degrades(self, settings, telemetry):
+        _record(telemetry, 5, ttft_ms=20_000)
+        result = ModelRouter(settings).select(COMPLEX_MESSAGE)
+
+        assert result.complexity == TaskComplexity.MODERATE
+        assert result.model == settings.model_tier_moderate
+        assert "degraded" in result.reason
+        assert telemetry.snapshot()["degraded"] == {"complex->moderate": 1}
+
+    def test_error_rate_degrades(self, settings, telemetry):
+        _record(telemetry, 2)
+        _record(telemetry, 2, error=True)
+        assert ModelRouter(settings).select(COMPLEX_MESSAGE).complexity == TaskComplexity.MODERATE
+
+    def test_cost_budget_degrades(self, settings, telemetry):
+        settings.smart_routing_cost_budget_usd = 0.05
+        _record(telemetry, 5, cost=0.2)
+        assert ModelRouter(settings).select(COMPLEX_MESSAGE).complexity == TaskComplexity.MODERATE
+
+    def test_too_few_samples_keeps_complex(self, settings, telemetry):
+        _record(telemetry, 2, ttft_ms=20_000)
+        assert ModelRouter(settings).select(COMPLEX_MESSAGE).complexity == TaskComplexity.COMPLEX
+
+    def test_adaptive_disabled(self, settings, telemetry):
+        settings.smart_routing_adaptive = False
+        _record(telemetry, 5, ttft_ms=20_000)
+        assert ModelRouter(settings).select(COMPLEX_MESSAGE).complexity == TaskComplexity.COMPLEX
+
+    def test_tier_for_model(self, settings):
+        router = ModelRouter(settings)
+        assert router.tier_for_model("claude-opus-4-6") == "complex"
+        assert router.tier_for_model("something-else") == "other"
@@ -0,0 +1,136 @@
+# Tests for agents/response_cache.py — replaying idempotent agent runs
+# Created: 2026-10-19
+
+import time
+from unittest.mock import patch
+
+from pocketclaw.agents.response_cache import ResponseCache, cache_key, cached_run, discard
+from pocketclaw.config import Settings
+
+
+class FakeRouter:
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.calls = 0
+        self.stopped = False
+
+    async def run(self, prompt, **kwargs):
+        self.calls += 1
+        for chunk in self.chunks:
+            yield chunk
+
+
+async def _collect(gen):
+    return [c async for c in gen]
+
+
+class TestResponseCache:
+    def test_ttl_expiry(self):
+        cache = ResponseCache(ttl=60)
+        cache.put("k", [{"type": "message", "content": "hi"}])
+        assert cache.get("k") == [{"type": "message", "content": "hi"}]
+
+        cache._entries["k"] = (time.time() - 1, cache._entries["k"][1])
+        assert cache.get("k") is None
+        assert cache.stats()["entries"] == 0
+
+    def test_lru_eviction(self):
+        cache = ResponseCache(max_entries=2)
+        cache.put("a", [])
+        cache.put("b", [])
+        cache.get("a")
+        cache.put("c", [])
+
+        assert cache.get("a") == []
+        assert cache.get("b") is None
+
+    def test_cache_key_covers_model_prompt_and_policy(self):
+        base = Settings(agent_backend="pocketpaw_native")
+        key = cache_key(base, "digest")
+
+        assert key == cache_key(Settings(agent_backend="pocketpaw_native"), "digest")
+        assert key != cache_key(base, "other prompt")
+        assert key != cache_key(base, "digest", system_prompt="be terse")
+        assert key != cache_key(Settings(agent_backend="claude_agent_sdk"), "digest")
+        assert key != cache_key(
+            Settings(agent_backend="pocketpaw_native", anthropic_model="other"), "digest"
+        )
+        assert key != cache_key(
+            Settings(agent_backend="pocketpaw_native", tools_deny=["shell"]), "digest"
+        )
+        assert key != cache_key(
+            Settings(agent_backend="pocketpaw_native", llm_provider="ollama"), "digest"
+        )
+
+
+class TestCachedRun:
+    async def test_repeat_run_is_replayed(self):
+        settings = Settings(response_cache_enabled=True)
+        router = FakeRouter([{"type": "message", "content": "hi"}, {"type": "done"}])
+
+        with patch(
+            "pocketclaw.agents.response_cache.get_response_cache", return_value=ResponseCache()
+        ):
+            first = await _collect(cached_run(settings, "p", router=router))
+            second = await _collect(cached_run(settings, "p", router=router))
+
+        assert first == second
+        assert router.calls == 1
+
+    async def test_errors_are_not_cached(self):
+        settings = Settings(response_cache_enabled=True)
+        router = FakeRouter([{"type": "error", "content": "boom"}])
+
+        with patch(
+            "pocketclaw.agents.response_cache.get_response_cache", return_value=ResponseCache()
+        ):
+            await _collect(cached_run(settings, "p", router=router))
+            await _collect(cached_run(settings, "p", router=router))
+
+        assert router.calls == 2
+
+    async def test_disabled_by_default(self):
+        settings = Settings()
+        router = FakeRouter([{"type": "message", "content": "hi"}])
+
+        await _collect(cached_run(settings, "p", router=router))
+        await _collect(cached_run(settings, "p", router=router))
+
+        assert router.calls == 2
+
+    async def test_key_uses_router_settings(self):
+        cache = ResponseCache()
+        router = FakeRouter([{"type": "message", "content": "hi"}, {"type": "done"}])
+        router.settings = Settings(response_cache_enabled=True, llm_provider="ollama")
+
+        with patch("pocketclaw.agents.response_cache.get_response_cache", return_value=cache):
+            await _collect(cached_run(Settings(), "p", router=router))
+
+        assert cache.get(cache_key(router.settings, "p")) is not None
+        assert cache.get(cache_key(Settings(response_cache_enabled=True), "p")) is None
+
+    async def test_discard_forces_a_fresh_run(self):
+        settings = Settings(response_cache_enabled=True)
+        router = FakeRouter([{"type": "message", "content": "not json"}, {"type": "done"}])
+
+        with patch(
+            "pocketclaw.agents.response_cache.get_response_cache", return_value=ResponseCache()
+        ):
+            await _collect(cached_run(settings, "p", router=router))
+            assert discard(settings, "p", router=router) is True
+            await _collect(cached_run(settings, "p", router=router))
+
+        assert router.calls == 2
+
+    async def test_incomplete_or_stopped_runs_are_not_cached(self):
+        settings = Settings(response_cache_enabled=True)
+        truncated = FakeRouter([{"type": "message", "content": "half"}])
+        stopped = FakeRouter([{"type": "message", "content": "half"}, {"type": "done"}])
+        stopped.stopped = True
+
+        for router in (truncated, stopped):
+            cache = ResponseCache()
+            with patch("pocketclaw.agents.response_cache.get_response_cache", return_value=cache):
+                await _collect(cached_run(settings, "p", router=router))
+                await _collect(cached_run(settings, "p", router=router))
+            assert router.calls == 2
@@ -0,0 +1,120 @@
+# Tests for the warm AgentRouter pool
+# Created: 2026-10-19
+
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from pocketclaw.agents.router_pool import RouterPool, settings_key
+from pocketclaw.config import Settings
+
+
+def _factory():
+    """Router factory that records how many routers it built."""
+    built = []
+
+    def make(settings):
+        router = MagicMock()
+        router.settings = settings
+        built.append(router)
+        return router
+
+    make.built = built
+    return make
+
+
+class TestRouterPool:
+    def test_released_router_is_reused(self):
+        pool = RouterPool()
+        factory = _factory()
+        settings = Settings(agent_backend="pocketpaw_native")
+
+        first = pool.acquire(settings, factory)
+        pool.release(first)
+        second = pool.acquire(settings, factory)
+
+        assert second is first
+        assert len(factory.built) == 1
+        second.reset.assert_called_once()
+        assert pool.stats()["reused"] == 1
+
+    def test_different_settings_get_different_routers(self):
+        pool = RouterPool()
+        factory = _factory()
+
+        a = pool.acquire(Settings(agent_backend="pocketpaw_native"), factory)
+        pool.release(a)
+        b = pool.acquire(Settings(agent_backend="claude_agent_sdk"), factory)
+
+        assert a is not b
+        assert len(factory.built) == 2
+
+    def test_settings_key_includes_backend_and_values(self):
+        native = Settings(agent_backend="pocketpaw_native")
+        assert settings_key(native).startswith("pocketpaw_native:")
+        assert settings_key(native) == settings_key(Settings(agent_backend="pocketpaw_native"))
+        assert settings_key(native) != settings_key(
+            Settings(agent_backend="pocketpaw_native", anthropic_model="other")
+        )
+
+    def test_leased_routers_are_exclusive(self):
+        pool = RouterPool()
+        factory = _factory()
+        settings = Settings()
+
+        a = pool.acquire(settings, factory)
+        b = pool.acquire(settings, factory)
+
+        assert a is not b
+        assert pool.stats()["leased"] == 2
+
+    def test_discarded_router_is_not_reused(self):
+        pool = RouterPool()
+        factory = _factory()
+        settings = Settings()
+
+        pool.release(pool.acquire(settings, factory), discard=True)
+        pool.acquire(settings, factory)
+
+        assert len(factory.built) == 2
+
+    def test_max_idle_caps_pool(self):
+        pool = RouterPool(max_idle=2)
+        factory = _factory()
+        routers = [pool.acquire(Settings(anthropic_model=f"m{i}"), factory) for i in range(3)]
+        for router in routers:
+            pool.release(router)
+
+        assert pool.stats()["idle"] == 2
+
+    async def test_lease_discards_on_error(self):
+        pool = RouterPool()
+        factory = _factory()
+        settings = Settings()
+
+        with pytest.raises(RuntimeError):
+            async with pool.lease(settings, factory):
+                raise RuntimeError("boom")
+        async with pool.lease(settings, factory):
+            pass
+
+        assert len(factory.built) == 2
+        assert pool.stats()["idle"] == 1
+
+    async def test_warm_builds_routers_off_the_event_loop(self):
+        pool = RouterPool()
+        factory = _factory()
+        threads = []
+
+        def make(settings):
+            threads.append(threading.current_thread())
+            return factory(settings)
+
+        settings = Settings(agent_backend="pocketpaw_native")
+        await pool.warm(settings, count=2, factory=make)
+
+        assert len(threads) == 2 and threading.main_thread() not in threads
+        assert pool.stats()["idle"] == 2
+        assert pool.acquire(settings, make) in factory.built
+        assert len(factory.built) == 2
@@ -0,0 +1,137 @@
+# Tests for agents/scheduler.py — fair admission of agent turns
+# Created: 2026-10-19
+
+import asyncio
+
+from pocketclaw.agents.scheduler import OWNER_LANE, FairScheduler
+from pocketclaw.bus import Channel, InboundMessage
+
+
+def _msg(channel: Channel = Channel.TELEGRAM, sender: str = "user1") -> InboundMessage:
+    return InboundMessage(channel=channel, sender_id=sender, chat_id="c", content="hi")
+
+
+async def _run_order(scheduler: FairScheduler, jobs: list[tuple[InboundMessage, str]]) -> list:
+    """Queue jobs behind a blocker and return the order they were admitted in."""
+    order = []
+    gate = asyncio.Event()
+
+    async def blocker():
+        async with scheduler.slot(_msg(Channel.CLI), "blocker"):
+            await gate.wait()
+
+    async def job(message, key):
+        async with scheduler.slot(message, key):
+            order.append(key)
+            await asyncio.sleep(0)
+
+    blockers = [asyncio.create_task(blocker()) for _ in range(scheduler.capacity)]
+    await asyncio.sleep(0)
+    tasks = []
+    for message, key in jobs:
+        tasks.append(asyncio.create_task(job(message, key)))
+        await asyncio.sleep(0)
+    gate.set()
+    await asyncio.gather(*blockers, *tasks)
+    return order
+
+
+class TestFairScheduler:
+    async def test_owner_lane_goes_first(self):
+        scheduler = FairScheduler(1, owner_id="boss")
+        order = await _run_order(
+            scheduler,
+            [(_msg(), "a"), (_msg(), "b"), (_msg(Channel.DISCORD, sender="boss"), "owner")],
+        )
+
+        assert order == ["owner", "a", "b"]
+        assert scheduler.lane_for(_msg(sender="boss")) == OWNER_LANE
+
+    async def test_dashboard_session_uses_owner_lane(self):
+        # The WebSocket adapter publishes with sender_id = the session's chat id
+        dashboard = _msg(Channel.WEBSOCKET, sender="3f2b9c1e-5d7a-4e1b-9a0c-8d6e4f2a1b3c")
+        scheduler = FairScheduler(1, owner_id="123456789")
+
+        order = await _run_order(scheduler, [(_msg(), "a"), (dashboard, "dashboard")])
+
+        assert scheduler.lane_for(dashboard) == OWNER_LANE
+        assert order == ["dashboard", "a"]
+
+    async def test_noisy_lane_does_not_starve_others(self):
+        scheduler = FairScheduler(1)
+        jobs = [(_msg(Channel.WEBHOOK), f"w{i}") for i in range(4)]
+        jobs.append((_msg(Channel.TELEGRAM), "t0"))
+
+        order = await _run_order(scheduler, jobs)
+
+        assert order.index("t0") <= 1
+
+    async def test_weights_share_turns(self):
+        scheduler = FairScheduler(1, weights={"telegram": 2})
+        jobs = [(_msg(Channel.WEBHOOK), f"w{i}") for i in range(3)]
+        jobs += [(_msg(Channel.TELEGRAM), f"t{i}") for i in range(6)]
+
+        order = await _run_order(scheduler, jobs)
+
+        first_six = order[:6]
+        assert sum(k.startswith("t") for k in first_six) == 4
+
+    async def test_round_robin_sessions_within_lane(self):
+        scheduler = FairScheduler(1)
+        jobs = [(_msg(), "a"), (_msg(), "a"), (_msg(), "b")]
+
+        order = await _run_order(scheduler, jobs)
+
+        assert order == ["a", "b", "a"]
+
+    async def test_lane_cap(self):
+        scheduler = FairScheduler(4, caps={"webhook": 1})
+        running = {"webhook": 0, "peak": 0}
+
+        async def job():
+            async with scheduler.slot(_msg(Channel.WEBHOOK), "w"):
+                running["webhook"] += 1
+                running["peak"] = max(running["peak"], running["webhook"])
+                await asyncio.sleep(0.01)
+                running["webhook"] -= 1
+
+        await asyncio.gather(*(job() for _ in range(3)))
+
+        assert running["peak"] == 1
+
+    async def test_cancelled_waiter_is_removed(self):
+        scheduler = FairScheduler(1)
+        gate = asyncio.Event()
+
+        async def hold():
+            async with scheduler.slot(_msg(), "a"):
+                await gate.wait()
+
+        async def wait():
+            async with scheduler.slot(_msg(), "b"):
+                pass
+
+        holder = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(wait())
+        await asyncio.sleep(0)
+        assert scheduler.queue_depth("telegram") == 1
+
+        waiter.cancel()
+        await asyncio.sleep(0)
+        assert scheduler.queue_depth("telegram") == 0
+        gate.set()
+        await holder
+        assert scheduler.stats()["active"] == 0
+
+    async def test_stats_report_queue_and_wait(self):
+        scheduler = FairScheduler(1)
+        await _run_order(scheduler, [(_msg(), "a"), (_msg(), "b")])
+
+        stats = scheduler.stats()
+        assert stats["capacity"] == 1
+        assert stats["active"] == 0
+        lane = stats["lanes"]["telegram"]
+        assert lane["served"] == 2
+        assert lane["queued"] == 0
+        assert lane["max_wait_ms"] >= lane["avg_wait_ms"] >= 0
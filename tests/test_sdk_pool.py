@@ -0,0 +1,239 @@
+# Tests for the session-scoped Claude SDK client pool
+# Created: 2026-10-19
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from pocketclaw.agents.sdk_pool import SDKClientPool
+from tests.test_stream_event import (
+    FakeAssistantMessage,
+    FakeResultMessage,
+    FakeStreamEvent,
+    FakeTextBlock,
+    _make_sdk,
+)
+
+
+def _fake_client():
+    client = MagicMock()
+    client.connect = AsyncMock()
+    client.disconnect = AsyncMock()
+    return client
+
+
+class TestSDKClientPool:
+    async def test_acquire_connects_once_per_session(self):
+        pool = SDKClientPool()
+        connect = AsyncMock(side_effect=lambda: _fake_client())
+
+        first, reused_first = await pool.acquire("s1", "sig", connect)
+        second, reused_second = await pool.acquire("s1", "sig", connect)
+
+        assert reused_first is False
+        assert reused_second is True
+        assert first is second
+        assert connect.await_count == 1
+
+    async def test_signature_change_reconnects(self):
+        pool = SDKClientPool()
+        old, _ = await pool.acquire("s1", "sig-a", AsyncMock(return_value=_fake_client()))
+        new, reused = await pool.acquire("s1", "sig-b", AsyncMock(return_value=_fake_client()))
+
+        assert reused is False
+        assert new is not old
+        old.client.disconnect.assert_awaited_once()
+
+    async def test_signature_change_waits_for_running_turn(self):
+        pool = SDKClientPool()
+        old, _ = await pool.acquire("s1", "sig-a", AsyncMock(return_value=_fake_client()))
+
+        await old.lock.acquire()
+        pending = asyncio.create_task(
+            pool.acquire("s1", "sig-b", AsyncMock(return_value=_fake_client()))
+        )
+        await asyncio.sleep(0)
+        assert not pending.done()
+        old.client.disconnect.assert_not_awaited()
+
+        old.lock.release()
+        new, reused = await pending
+
+        assert reused is False
+        assert new is not old and new.signature == "sig-b"
+        old.client.disconnect.assert_awaited_once()
+
+    async def test_cleanup_idle_evicts_and_disconnects(self):
+        pool = SDKClientPool(idle_timeout=60)
+        entry, _ = await pool.acquire("s1", "sig", AsyncMock(return_value=_fake_client()))
+        entry.last_used_at -= 120
+
+        assert await pool.cleanup_idle() == 1
+        assert not pool.has_session("s1")
+        entry.client.disconnect.assert_awaited_once()
+
+    async def test_cleanup_skips_busy_clients(self):
+        pool = SDKClientPool(idle_timeout=60)
+        entry, _ = await pool.acquire("s1", "sig", AsyncMock(return_value=_fake_client()))
+        entry.last_used_at -= 120
+
+        async with entry.lock:
+            assert await pool.cleanup_idle() == 0
+        assert pool.has_session("s1")
+
+    async def test_max_clients_evicts_least_recently_used(self):
+        pool = SDKClientPool(max_clients=2)
+        a, _ = await pool.acquire("a", "sig", AsyncMock(return_value=_fake_client()))
+        await pool.acquire("b", "sig", AsyncMock(return_value=_fake_client()))
+        await pool.acquire("a", "sig", AsyncMock())  # touch a
+        await pool.acquire("c", "sig", AsyncMock(return_value=_fake_client()))
+
+        assert pool.has_session("a")
+        assert not pool.has_session("b")
+        assert pool.has_session("c")
+        assert pool.stats()["clients"] == 2
+
+    async def test_close_all(self):
+        pool = SDKClientPool()
+        entry, _ = await pool.acquire("s1", "sig", AsyncMock(return_value=_fake_client()))
+        await pool.close_all()
+
+        assert pool.stats()["clients"] == 0
+        entry.client.disconnect.assert_awaited_once()
+
+
+class FakeSDKClient:
+    """Mimics ClaudeSDKClient: query() then receive_response() per turn."""
+
+    instances: list["FakeSDKClient"] = []
+
+    def __init__(self, options=None):
+        self.options = options
+        self.prompts: list[str] = []
+        self.models: list[str] = []
+        self.disconnected = False
+        FakeSDKClient.instances.append(self)
+
+    async def connect(self):
+        pass
+
+    async def disconnect(self):
+        self.disconnected = True
+
+    async def set_model(self, model):
+        self.models.append(model)
+
+    async def query(self, prompt):
+        self.prompts.append(prompt)
+
+    async def receive_response(self):
+        yield FakeStreamEvent({"type": "content_block_delta", "delta": {"text": "ok"}})
+        yield FakeAssistantMessage([FakeTextBlock("ok")])
+        yield FakeResultMessage(result="ok")
+
+
+class TestPooledChat:
+    def _make_pooled_sdk(self):
+        sdk = _make_sdk()
+        sdk._cli_available = True
+        sdk._ClaudeSDKClient = FakeSDKClient
+        sdk._ClaudeAgentOptions = lambda **kw: kw
+        sdk.settings.smart_routing_enabled = False
+        sdk.settings.claude_sdk_pool_enabled = True
+        sdk.settings.anthropic_api_key = None
+        sdk._get_mcp_servers = lambda: {}
+        sdk._query = MagicMock(side_effect=AssertionError("query() must not be used"))
+        return sdk
+
+    async def _turn(self, sdk, message, **kwargs):
+        return [e async for e in sdk.chat(message, **kwargs)]
+
+    async def test_follow_up_reuses_client_without_history(self):
+        FakeSDKClient.instances.clear()
+        pool = SDKClientPool()
+        sdk = self._make_pooled_sdk()
+        history = [{"role": "user", "content": "earlier"}]
+
+        with patch("pocketclaw.agents.sdk_pool.get_sdk_client_pool", return_value=pool):
+            first = await self._turn(
+                sdk, "hello", system_prompt="ID", history=history, session_key="s1"
+            )
+            await self._turn(sdk, "again", system_prompt="ID", history=history, session_key="s1")
+
+        assert len(FakeSDKClient.instances) == 1
+        client = FakeSDKClient.instances[0]
+        assert "earlier" in client.options["system_prompt"]
+        assert client.prompts == ["hello", "again"]
+        assert [e.content for e in first if e.type == "message"] == ["ok"]
+        assert first[-1].type == "done"
+
+    async def test_changed_identity_is_sent_as_context_update(self):
+        FakeSDKClient.instances.clear()
+        pool = SDKClientPool()
+        sdk = self._make_pooled_sdk()
+
+        with patch("pocketclaw.agents.sdk_pool.get_sdk_client_pool", return_value=pool):
+            await self._turn(sdk, "hello", system_prompt="ID v1", session_key="s1")
+            await self._turn(sdk, "again", system_prompt="ID v2", session_key="s1")
+
+        prompts = FakeSDKClient.instances[0].prompts
+        assert prompts[0] == "hello"
+        assert "ID v2" in prompts[1] and prompts[1].endswith("again")
+
+    async def test_context_update_only_sends_changed_blocks(self):
+        FakeSDKClient.instances.clear()
+        pool = SDKClientPool()
+        sdk = self._make_pooled_sdk()
+        first = "IDENTITY\n\nMEMORY v1"
+        second = "IDENTITY\n\nMEMORY v2"
+
+        with patch("pocketclaw.agents.sdk_pool.get_sdk_client_pool", return_value=pool):
+            await self._turn(sdk, "hello", system_prompt=first, session_key="s1")
+            await self._turn(sdk, "again", system_prompt=second, session_key="s1")
+            await self._turn(sdk, "third", system_prompt=second, session_key="s1")
+
+        prompts = FakeSDKClient.instances[0].prompts
+        assert "MEMORY v2" in prompts[1]
+        assert "IDENTITY" not in prompts[1]
+        assert prompts[2] == "third"
+
+    async def test_context_updates_past_limit_reconnect(self):
+        FakeSDKClient.instances.clear()
+        pool = SDKClientPool()
+        sdk = self._make_pooled_sdk()
+
+        with (
+            patch("pocketclaw.agents.sdk_pool.get_sdk_client_pool", return_value=pool),
+            patch("pocketclaw.agents.claude_sdk._CONTEXT_UPDATE_LIMIT", 8),
+        ):
+            await self._turn(sdk, "hello", system_prompt="ID\n\nmem 1", session_key="s1")
+            await self._turn(sdk, "two", system_prompt="ID\n\nmem 2", session_key="s1")
+            await self._turn(sdk, "three", system_prompt="ID\n\nmem 3", session_key="s1")
+
+        first, second = FakeSDKClient.instances
+        assert first.disconnected
+        assert first.prompts[1].startswith("<context-update>")
+        assert "mem 3" in second.options["system_prompt"]
+        assert second.prompts == ["three"]
+
+    async def test_stopped_turn_discards_client(self):
+        FakeSDKClient.instances.clear()
+        pool = SDKClientPool()
+        sdk = self._make_pooled_sdk()
+
+        with patch("pocketclaw.agents.sdk_pool.get_sdk_client_pool", return_value=pool):
+            async for _event in sdk.chat("hello", session_key="s1"):
+                await sdk.stop()
+
+        assert not pool.has_session("s1")
+        assert FakeSDKClient.instances[0].disconnected
+
+    async def test_without_session_key_uses_one_shot_query(self):
+        sdk = self._make_pooled_sdk()
+
+        async def fake_query(**kw):
+            yield FakeResultMessage(result="done")
+
+        sdk._query = fake_query
+        events = await self._turn(sdk, "hello")
+
+        assert events[-1].type == "done"
@@ -283,6 +283,105 @@ class TestIndexMigration:
         assert "websocket_migration" in index
 
 
+class TestListSessionsPage:
+    """Cursor pagination over the in-memory sorted session order."""
+
+    @pytest.fixture
+    def paged_store(self, store):
+        index = {
+            f"{channel}_{i}": {
+                "title": f"{channel} {i}",
+                "channel": channel,
+                "last_activity": f"2026-01-{i + 1:02d}T00:00:00",
+            }
+            for i in range(10)
+            for channel in (["telegram"] if i % 3 == 0 else ["websocket"])
+        }
+        store._save_session_index(index)
+        return store
+
+    def test_pages_newest_first(self, paged_store):
+        seen, cursor = [], None
+        while True:
+            page, cursor, total = paged_store.list_sessions_page(limit=4, cursor=cursor)
+            seen.extend(s["id"] for s in page)
+            if cursor is None:
+                break
+        assert total == 10
+        assert seen == [
+            "telegram_9",
+            "websocket_8",
+            "websocket_7",
+            "telegram_6",
+            "websocket_5",
+            "websocket_4",
+            "telegram_3",
+            "websocket_2",
+            "websocket_1",
+            "telegram_0",
+        ]
+
+    def test_channel_filter(self, paged_store):
+        page, cursor, total = paged_store.list_sessions_page(limit=2, channels=["telegram"])
+        assert [s["id"] for s in page] == ["telegram_9", "telegram_6"]
+        assert total == 4
+        page, cursor, _ = paged_store.list_sessions_page(2, cursor, ["telegram"])
+        assert [s["id"] for s in page] == ["telegram_3", "telegram_0"]
+        assert cursor is None
+
+        page, _, total = paged_store.list_sessions_page(3, channels=["telegram", "websocket"])
+        assert [s["id"] for s in page] == ["telegram_9", "websocket_8", "websocket_7"]
+        assert total == 10
+
+    async def test_writes_keep_order(self, paged_store):
+        entry = MemoryEntry(
+            id="",
+            type=MemoryType.SESSION,
+            content="Newest",
+            role="user",
+            session_key="websocket:1",
+        )
+        await paged_store.save(entry)
+        await paged_store.delete_session("telegram_9")  # no file: index untouched
+        await paged_store.update_session_title("websocket_8", "Renamed")
+
+        page, _, total = paged_store.list_sessions_page(limit=3)
+        assert [s["id"] for s in page] == ["websocket_1", "telegram_9", "websocket_8"]
+        assert page[0]["message_count"] == 1
+        assert page[2]["title"] == "Renamed"
+        assert total == 10
+        assert FileMemoryStore(base_path=paged_store.base_path).list_sessions_page(3)[0] == page
+
+    async def test_other_writers_are_merged(self, paged_store):
+        # e.g. the dashboard and an agent worker process sharing one memory dir
+        other = FileMemoryStore(base_path=paged_store.base_path)
+
+        def _entry(session_key, content):
+            return MemoryEntry(
+                id="",
+                type=MemoryType.SESSION,
+                content=content,
+                role="user",
+                session_key=session_key,
+            )
+
+        await other.save(_entry("telegram:worker", "From a worker"))
+        page, _, total = paged_store.list_sessions_page(limit=1)
+        assert page[0]["id"] == "telegram_worker"
+        assert total == 11
+
+        await other.update_session_title("websocket_7", "Renamed elsewhere")
+        await paged_store.save(_entry("websocket:front", "From the front"))
+        index = json.loads(paged_store._index_path.read_text())
+        assert "telegram_worker" in index
+        assert index["websocket_7"]["title"] == "Renamed elsewhere"
+        assert len(index) == 12
+
+    def test_invalid_cursor(self, paged_store):
+        with pytest.raises(ValueError):
+            paged_store.list_sessions_page(limit=2, cursor="not-a-cursor")
+
+
 # =========================================================================
 # A2: REST Endpoints
 # =========================================================================
@@ -319,6 +418,11 @@ class TestSessionsRESTEndpoints:
         data = resp.json()
         assert "sessions" in data
         assert "total" in data
+        assert "next_cursor" in data
+
+    def test_list_sessions_bad_cursor(self, client):
+        resp = client.get("/api/sessions?cursor=%21%21", headers=_auth_headers())
+        assert resp.status_code == 400
 
     def test_list_sessions_legacy(self, client):
         resp = client.get("/api/memory/sessions?limit=5", headers=_auth_headers())
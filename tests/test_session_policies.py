@@ -0,0 +1,186 @@
+# Tests for per-session message policies in AgentLoop (coalescing, interrupt)
+# Created: 2026-10-19
+
+import asyncio
+from contextlib import ExitStack
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from pocketclaw.bus import Channel, InboundMessage
+
+
+def _make_inbound(content: str, chat_id: str = "chat1") -> InboundMessage:
+    return InboundMessage(
+        channel=Channel.TELEGRAM,
+        sender_id="user1",
+        chat_id=chat_id,
+        content=content,
+        metadata={"n": content},
+    )
+
+
+@pytest.fixture
+def loop_env():
+    """AgentLoop with mocked bus/memory/context and a recording router."""
+    settings = MagicMock()
+    settings.injection_scan_enabled = False
+    settings.welcome_hint_enabled = False
+    settings.memory_backend = "file"
+    settings.file_auto_learn = False
+    settings.mem0_auto_learn = False
+    settings.compaction_recent_window = 10
+    settings.compaction_char_budget = 8000
+    settings.compaction_summary_chars = 150
+    settings.compaction_llm_summarize = False
+    settings.max_concurrent_conversations = 5
+    settings.owner_id = ""
+    settings.message_coalesce_enabled = True
+    settings.message_coalesce_window_ms = 0
+    settings.session_interrupt_enabled = False
+    settings.session_interrupt_channels = []
+
+    bus = MagicMock()
+    bus.publish_outbound = AsyncMock()
+    bus.publish_system = AsyncMock()
+
+    mem = MagicMock()
+    mem.add_to_session = AsyncMock()
+    mem.get_session_history = AsyncMock(return_value=[])
+    mem.get_compacted_history = AsyncMock(return_value=[])
+    mem.resolve_session_key = AsyncMock(side_effect=lambda k: k)
+
+    with ExitStack() as stack:
+        stack.enter_context(patch("pocketclaw.agents.loop.get_settings", return_value=settings))
+        stack.enter_context(patch("pocketclaw.agents.loop.get_message_bus", return_value=bus))
+        stack.enter_context(patch("pocketclaw.agents.loop.get_memory_manager", return_value=mem))
+        ctx_cls = stack.enter_context(patch("pocketclaw.agents.loop.AgentContextBuilder"))
+        ctx_cls.return_value.build_system_prompt = AsyncMock(return_value="system")
+
+        from pocketclaw.agents.loop import AgentLoop
+
+        loop = AgentLoop()
+        runs: list[str] = []
+
+        async def run(message, *, system_prompt=None, history=None, session_key=None):
+            runs.append(message)
+            yield {"type": "message", "content": f"re: {message}", "metadata": {}}
+            await asyncio.sleep(0.05 if "slow" not in message else 5)
+            yield {"type": "message", "content": " (end)", "metadata": {}}
+            yield {"type": "done", "content": ""}
+
+        router = MagicMock()
+        router.run = run
+        router.stop = AsyncMock()
+        loop._router = router
+        yield loop, settings, mem, runs
+
+
+def _stored_user_messages(mem) -> list[str]:
+    return [
+        c.kwargs["content"] for c in mem.add_to_session.call_args_list if c.kwargs["role"] == "user"
+    ]
+
+
+class TestCoalescing:
+    async def test_messages_queued_behind_a_turn_are_merged(self, loop_env):
+        loop, _settings, mem, runs = loop_env
+
+        first = asyncio.create_task(loop._process_message(_make_inbound("one")))
+        await asyncio.sleep(0.01)  # "one" is now running
+        await asyncio.gather(
+            loop._process_message(_make_inbound("two")),
+            loop._process_message(_make_inbound("three")),
+            first,
+        )
+
+        assert runs == ["one", "two\n\nthree"]
+        assert _stored_user_messages(mem) == ["one", "two", "three"]
+
+    async def test_window_merges_a_burst(self, loop_env):
+        loop, settings, mem, runs = loop_env
+        settings.message_coalesce_window_ms = 50
+
+        async def send(content, delay):
+            await asyncio.sleep(delay)
+            await loop._process_message(_make_inbound(content))
+
+        await asyncio.gather(send("a", 0), send("b", 0.02), send("c", 0.04))
+
+        assert runs == ["a\n\nb\n\nc"]
+        assert _stored_user_messages(mem) == ["a", "b", "c"]
+        metadata = [
+            c.kwargs["metadata"]
+            for c in mem.add_to_session.call_args_list
+            if c.kwargs["role"] == "user"
+        ]
+        assert metadata == [{"n": "a"}, {"n": "b"}, {"n": "c"}]
+
+    async def test_other_sessions_are_not_merged(self, loop_env):
+        loop, _settings, _mem, runs = loop_env
+
+        await asyncio.gather(
+            loop._process_message(_make_inbound("x", chat_id="a")),
+            loop._process_message(_make_inbound("y", chat_id="b")),
+        )
+
+        assert sorted(runs) == ["x", "y"]
+
+    async def test_disabled_runs_every_message(self, loop_env):
+        loop, settings, _mem, runs = loop_env
+        settings.message_coalesce_enabled = False
+
+        await asyncio.gather(
+            loop._process_message(_make_inbound("one")),
+            loop._process_message(_make_inbound("two")),
+        )
+
+        assert runs == ["one", "two"]
+
+
+class TestInterrupt:
+    async def test_newer_message_cancels_running_turn(self, loop_env):
+        loop, settings, mem, runs = loop_env
+        settings.message_coalesce_enabled = False
+        settings.session_interrupt_enabled = True
+
+        first = asyncio.create_task(loop._process_message(_make_inbound("slow task")))
+        await asyncio.sleep(0.02)
+        await asyncio.wait_for(loop._process_message(_make_inbound("correction")), timeout=1)
+        await asyncio.wait_for(first, timeout=1)
+
+        assert runs == ["slow task", "correction"]
+        assistant = [
+            c.kwargs for c in mem.add_to_session.call_args_list if c.kwargs["role"] == "assistant"
+        ]
+        assert assistant[0]["content"] == "re: slow task"
+        assert assistant[0]["metadata"] == {"interrupted": True}
+        assert assistant[1]["content"] == "re: correction (end)"
+        stream_ends = [
+            c.args[0] for c in loop.bus.publish_outbound.call_args_list if c.args[0].is_stream_end
+        ]
+        assert stream_ends[0].metadata == {"interrupted": True}
+        assert not loop._interrupted
+        assert not loop._streaming_turns
+
+    async def test_channel_filter(self, loop_env):
+        loop, settings, _mem, _runs = loop_env
+        settings.session_interrupt_enabled = True
+        settings.session_interrupt_channels = ["whatsapp"]
+
+        assert not loop._should_interrupt(_make_inbound("x"))
+        settings.session_interrupt_channels = ["telegram"]
+        assert loop._should_interrupt(_make_inbound("x"))
+        assert not loop._should_interrupt(_make_inbound("/help"))
+
+    async def test_loop_cancellation_still_propagates(self, loop_env):
+        loop, settings, _mem, _runs = loop_env
+        settings.message_coalesce_enabled = False
+        settings.session_interrupt_enabled = True
+
+        task = asyncio.create_task(loop._process_message(_make_inbound("slow task")))
+        await asyncio.sleep(0.02)
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
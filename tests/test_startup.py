@@ -0,0 +1,135 @@
+# Tests for startup.py — concurrent, dependency-aware subsystem startup
+# Created: 2026-10-19
+
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+
+from pocketclaw.startup import StartupOrchestrator
+
+
+async def _sleep(seconds: float, log: list[str] | None = None, name: str = ""):
+    await asyncio.sleep(seconds)
+    if log is not None:
+        log.append(name)
+
+
+class TestOrchestrator:
+    async def test_independent_components_run_concurrently(self):
+        startup = StartupOrchestrator()
+        for name in ("a", "b", "c"):
+            startup.add(name, lambda: _sleep(0.1), critical=True)
+
+        start = time.monotonic()
+        await startup.start()
+
+        assert time.monotonic() - start < 0.25
+        assert startup.snapshot()["ready"] is True
+
+    async def test_dependencies_run_first(self):
+        log = []
+        startup = StartupOrchestrator()
+        startup.add("agent", lambda: log.append("agent"), depends_on=["bus"], critical=True)
+        startup.add("bus", lambda: _sleep(0.02, log, "bus"), critical=True)
+        startup.add("scheduler", lambda: log.append("scheduler"), depends_on=["bus"])
+
+        await startup.start()
+        await startup.wait()
+
+        assert log[0] == "bus"
+        assert set(log) == {"bus", "agent", "scheduler"}
+
+    async def test_start_returns_before_optional_components(self):
+        gate = asyncio.Event()
+        startup = StartupOrchestrator()
+        startup.add("bus", lambda: None, critical=True)
+        startup.add("mcp", gate.wait)
+
+        await asyncio.wait_for(startup.start(), timeout=0.5)
+        snap = startup.snapshot()
+        assert snap["ready"] is True
+        assert snap["complete"] is False
+        assert {c["name"]: c["status"] for c in snap["components"]}["mcp"] == "running"
+
+        gate.set()
+        await startup.wait(["mcp"])
+        assert startup.snapshot()["complete"] is True
+
+    async def test_failures_skip_dependents(self):
+        async def broken():
+            raise ConnectionError("login failed")
+
+        startup = StartupOrchestrator()
+        startup.add("projects", broken)
+        startup.add("recovery", lambda: None, depends_on=["projects"])
+        startup.add("telegram", lambda: False)
+        startup.add("mcp", lambda: _sleep(1), timeout=0.01)
+
+        await startup.start()
+        await startup.wait()
+
+        status = {c["name"]: c for c in startup.snapshot()["components"]}
+        assert status["projects"]["status"] == "failed"
+        assert status["projects"]["error"] == "login failed"
+        assert status["recovery"]["status"] == "skipped"
+        assert status["telegram"]["status"] == "skipped"
+        assert status["mcp"]["error"] == "timed out after 0.01s"
+
+    async def test_critical_failure_aborts(self):
+        startup = StartupOrchestrator()
+        startup.add("bus", lambda: 1 / 0, critical=True)
+        with pytest.raises(ZeroDivisionError):
+            await startup.start()
+
+    async def test_cancel_stops_pending(self):
+        startup = StartupOrchestrator()
+        startup.add("slow", lambda: _sleep(10))
+        await startup.start()
+        await startup.cancel()
+        assert startup.snapshot()["components"][0]["error"] == "cancelled"
+
+    @pytest.mark.parametrize(
+        "graph",
+        [
+            {"a": ["b"], "b": ["a"]},
+            {"a": ["missing"]},
+        ],
+    )
+    async def test_invalid_graph(self, graph):
+        startup = StartupOrchestrator()
+        for name, deps in graph.items():
+            startup.add(name, lambda: None, depends_on=deps)
+        with pytest.raises(ValueError):
+            await startup.start()
+
+    def test_critical_cannot_depend_on_optional(self):
+        startup = StartupOrchestrator()
+        startup.add("mcp", lambda: None)
+        startup.add("agent", lambda: None, depends_on=["mcp"], critical=True)
+        with pytest.raises(ValueError):
+            asyncio.run(startup.start())
+
+    def test_duplicate_name(self):
+        startup = StartupOrchestrator()
+        startup.add("bus", lambda: None)
+        with pytest.raises(ValueError):
+            startup.add("bus", lambda: None)
+
+
+class TestStartupEndpoint:
+    async def test_reports_snapshot(self):
+        from pocketclaw import dashboard
+
+        startup = StartupOrchestrator()
+        startup.add("bus", lambda: None, critical=True)
+        await startup.start()
+
+        with patch.object(dashboard, "_startup", startup):
+            data = await dashboard.get_startup_status()
+        assert data["ready"] is True
+        assert data["components"][0]["name"] == "bus"
+
+        with patch.object(dashboard, "_startup", None):
+            assert (await dashboard.get_startup_status())["ready"] is False
@@ -0,0 +1,117 @@
+# Tests for static_assets.py — precompressed, ETagged, cache-busted /static
+# Created: 2026-10-19
+
+import gzip
+
+import pytest
+from starlette.applications import Starlette
+from starlette.testclient import TestClient
+
+from pocketclaw.static_assets import (
+    IMMUTABLE,
+    REVALIDATE,
+    PrecompressedStaticFiles,
+    accepted_encodings,
+)
+
+_JS = "console.log('paw');\n" * 200
+
+
+@pytest.fixture
+def static(tmp_path):
+    root = tmp_path / "frontend"
+    (root / "js").mkdir(parents=True)
+    (root / "js" / "app.js").write_text(_JS)
+    (root / "icon.png").write_bytes(b"\x89PNG")
+    (root / "index.html").write_text("<p>paw</p>\n" * 200)
+    files = PrecompressedStaticFiles(directory=root, cache_dir=tmp_path / "cache")
+    app = Starlette()
+    app.mount("/static", files)
+    return files, TestClient(app), root
+
+
+def test_accept_encoding_parsing():
+    assert accepted_encodings("gzip, deflate, br;q=0") == {"gzip", "deflate"}
+    assert accepted_encodings("") == set()
+
+
+def test_precompressed_variant_with_strong_etag(static):
+    files, client, _ = static
+    assert files.precompress() >= 1
+
+    r = client.get("/static/js/app.js", headers={"Accept-Encoding": "gzip"})
+
+    assert r.status_code == 200
+    assert r.headers["content-encoding"] == "gzip"
+    assert r.headers["vary"] == "Accept-Encoding"
+    assert r.headers["etag"].endswith('-gzip"') and not r.headers["etag"].startswith("W/")
+    assert int(r.headers["content-length"]) < len(_JS)
+    assert r.text == _JS  # the client transparently inflates it
+    stored = next(files.cache_dir.glob("*.gz")).read_bytes()
+    assert gzip.decompress(stored).decode() == _JS
+
+
+def test_identity_when_not_accepted(static):
+    files, client, _ = static
+    files.precompress()
+
+    r = client.get("/static/js/app.js", headers={"Accept-Encoding": "identity"})
+
+    assert "content-encoding" not in r.headers
+    assert r.content == _JS.encode()
+
+
+def test_if_none_match_and_cache_control(static):
+    files, client, root = static
+    files.precompress()
+    v = files.version()
+
+    r = client.get(f"/static/js/app.js?v={v}", headers={"Accept-Encoding": "gzip"})
+    assert r.headers["cache-control"] == IMMUTABLE
+    etag = r.headers["etag"]
+
+    r = client.get(
+        f"/static/js/app.js?v={v}",
+        headers={"Accept-Encoding": "gzip", "If-None-Match": etag},
+    )
+    assert r.status_code == 304
+    assert r.headers["etag"] == etag
+
+    # Stale ?v= must revalidate; an edit changes the version and the ETag
+    assert client.get("/static/js/app.js?v=old").headers["cache-control"] == REVALIDATE
+    (root / "js" / "app.js").write_text(_JS + "// edited\n")
+    assert files.refresh() != v
+    r = client.get("/static/js/app.js", headers={"If-None-Match": etag})
+    assert r.status_code == 200
+    assert r.text.endswith("// edited\n")
+
+
+def test_binary_assets_use_default_handling(static):
+    _, client, _ = static
+
+    r = client.get("/static/icon.png")
+
+    assert r.status_code == 200
+    assert "content-encoding" not in r.headers
+
+
+def test_immutable_only_for_versioned_suffixes(static):
+    files, client, _ = static
+    files.precompress()
+    v = files.version()
+
+    assert client.get(f"/static/js/app.js?v={v}").headers["cache-control"] == IMMUTABLE
+    assert client.get(f"/static/index.html?v={v}").headers["cache-control"] == REVALIDATE
+
+
+def test_serving_does_not_scan_before_warmup(static, monkeypatch):
+    files, client, _ = static
+    monkeypatch.setattr(files, "_refresh_in_background", lambda: None)
+
+    assert files.version() == "0"
+    r = client.get("/static/js/app.js?v=0", headers={"Accept-Encoding": "gzip"})
+
+    assert r.status_code == 200
+    assert r.text == _JS
+    assert r.headers["cache-control"] == REVALIDATE
+    assert files._assets == {}
@@ -53,6 +53,7 @@ def _make_sdk(settings=None):
 
     # Wire up fake types
     sdk._sdk_available = True
+    sdk._cli_available = True
     sdk._StreamEvent = FakeStreamEvent
     sdk._AssistantMessage = FakeAssistantMessage
     sdk._TextBlock = FakeTextBlock
@@ -239,6 +240,8 @@ class TestLoopThinkingIntegration:
             mock_settings.return_value = MagicMock(
                 agent_backend="claude_agent_sdk",
                 max_concurrent_conversations=5,
+                owner_id="",
+                message_coalesce_enabled=False,
             )
             bus = MagicMock()
             bus.publish_system = AsyncMock()
@@ -261,7 +264,7 @@ class TestLoopThinkingIntegration:
             # Mock router to yield thinking + done
             router = MagicMock()
 
-            async def fake_run(msg, *, system_prompt=None, history=None):
+            async def fake_run(msg, *, system_prompt=None, history=None, session_key=None):
                 yield {"type": "thinking", "content": "Deep thought", "metadata": {}}
                 yield {"type": "thinking_done", "content": "", "metadata": {}}
                 yield {"type": "done", "content": "", "metadata": {}}
@@ -302,6 +305,8 @@ class TestLoopThinkingIntegration:
             mock_settings.return_value = MagicMock(
                 agent_backend="claude_agent_sdk",
                 max_concurrent_conversations=5,
+                owner_id="",
+                message_coalesce_enabled=False,
             )
             bus = MagicMock()
             bus.publish_system = AsyncMock()
@@ -323,7 +328,7 @@ class TestLoopThinkingIntegration:
 
             router = MagicMock()
 
-            async def fake_run(msg, *, system_prompt=None, history=None):
+            async def fake_run(msg, *, system_prompt=None, history=None, session_key=None):
                 yield {"type": "thinking", "content": "secret reasoning", "metadata": {}}
                 yield {"type": "message", "content": "Hello!", "metadata": {}}
                 yield {"type": "done", "content": "", "metadata": {}}
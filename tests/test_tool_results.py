@@ -0,0 +1,107 @@
+# Tests for agents/tool_results.py — spilling large native tool outputs to disk
+# Created: 2026-10-19
+
+import os
+import re
+import time
+
+from pocketclaw.agents.tool_results import ToolResultStore
+
+
+def _handle(text: str) -> str:
+    return re.search(r"tr_[0-9a-f]{12}", text).group(0)
+
+
+def _result_msg(tool_use_id: str, content: str) -> dict:
+    return {
+        "role": "user",
+        "content": [{"type": "tool_result", "tool_use_id": tool_use_id, "content": content}],
+    }
+
+
+class TestToolResultStore:
+    def test_small_result_is_unchanged(self, tmp_path):
+        store = ToolResultStore(root=tmp_path, inline_chars=100)
+        assert store.spill("short") == "short"
+        assert list(tmp_path.iterdir()) == []
+
+    def test_large_result_spills_head_and_tail(self, tmp_path):
+        store = ToolResultStore(root=tmp_path, inline_chars=100)
+        content = "H" * 50 + "x" * 10_000 + "T" * 50
+
+        preview = store.spill(content, "tool_1")
+
+        assert preview.startswith("H" * 50)
+        assert preview.endswith("T" * 50)
+        assert "read_tool_result" in preview
+        assert len(preview) < 400
+        assert (tmp_path / f"{_handle(preview)}.txt").read_text() == content
+
+    def test_read_range_is_capped(self, tmp_path):
+        store = ToolResultStore(root=tmp_path, inline_chars=100)
+        handle = store.store("".join(str(i % 10) for i in range(1000)))
+
+        out = store.read(handle, 10, 20)
+        assert out.endswith("0123456789")
+        assert "chars 10-20 of 1000" in out
+        assert "chars 0-100 of 1000" in store.read(handle, 0, 900)
+        assert store.read(handle, 5000).startswith("(end of result")
+
+    def test_read_call_coerces_and_rejects_bad_offsets(self, tmp_path):
+        store = ToolResultStore(root=tmp_path, inline_chars=100)
+        handle = store.store("".join(str(i % 10) for i in range(1000)))
+
+        assert "chars 10-20 of 1000" in store.read_call(
+            {"handle": handle, "start": "10", "end": 20}
+        )
+        assert "chars 0-100" in store.read_call({"handle": handle, "start": None, "end": ""})
+        assert "chars 0-5" in store.read_call({"handle": handle, "start": -50, "end": 5})
+        assert store.read_call({"handle": handle, "start": 10**30}).startswith("(end of result")
+        assert store.read_call({"handle": handle, "start": "abc"}).startswith("Error")
+        assert store.read_call({"handle": handle, "end": [1]}).startswith("Error")
+        assert store.read_call("not a dict").startswith("Error")
+
+    def test_read_rejects_unknown_or_unsafe_handles(self, tmp_path):
+        store = ToolResultStore(root=tmp_path)
+        assert store.read("tr_doesnotexist").startswith("Error")
+        assert store.read("../../etc/passwd").startswith("Error")
+
+    def test_elide_consumed_keeps_recent(self, tmp_path):
+        store = ToolResultStore(root=tmp_path, inline_chars=1000)
+        old = "a" * 500
+        messages = [
+            {"role": "user", "content": "do things"},
+            _result_msg("t1", old),
+            {"role": "assistant", "content": []},
+            _result_msg("t2", "b" * 500),
+        ]
+
+        assert store.elide_consumed(messages, keep_recent=1) == 1
+
+        stub = messages[1]["content"][0]["content"]
+        assert "elided" in stub
+        assert store.read(_handle(stub)).endswith(old)
+        assert messages[3]["content"][0]["content"] == "b" * 500
+        # Already-elided results are left alone on the next pass
+        assert store.elide_consumed(messages, keep_recent=1) == 0
+
+    def test_elide_reuses_spill_handle(self, tmp_path):
+        store = ToolResultStore(root=tmp_path, inline_chars=100)
+        preview = store.spill("z" * 5000, "t1")
+        messages = [_result_msg("t1", preview), _result_msg("t2", "y" * 500)]
+
+        store.elide_consumed(messages)
+
+        assert _handle(messages[0]["content"][0]["content"]) == _handle(preview)
+        assert len(list(tmp_path.iterdir())) == 1
+
+    def test_cleanup_removes_old_results(self, tmp_path):
+        store = ToolResultStore(root=tmp_path, max_age=60)
+        old = tmp_path / f"{store.store('old')}.txt"
+        store.store("new")
+        past = time.time() - 120
+        os.utime(old, (past, past))
+
+        assert store.cleanup() == 1
+        assert not old.exists()
+        assert len(list(tmp_path.iterdir())) == 1
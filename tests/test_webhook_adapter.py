@@ -58,6 +58,14 @@ class TestWebhookAdapterProperties:
 
 
 class TestHandleWebhookAsync:
+    async def test_shed_message_raises(self, adapter, slot):
+        from pocketclaw.bus import InboundRejected
+
+        adapter._bus.publish_inbound = AsyncMock(return_value=False)
+        with pytest.raises(InboundRejected):
+            await adapter.handle_webhook(slot, {"content": "hi"}, "req-x", sync=True)
+        assert adapter._pending == {}
+
     async def test_standard_payload(self, adapter, slot):
         body = {"content": "hello world", "sender": "user@github"}
         result = await adapter.handle_webhook(slot, body, "req-1", sync=False)
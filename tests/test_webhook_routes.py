@@ -146,6 +146,18 @@ class TestWebhookInbound:
         assert "request_id" in data
         _mock_adapter.handle_webhook.assert_called_once()
 
+    def test_overloaded_returns_503(self, client, _mock_adapter):
+        from pocketclaw.bus import InboundRejected
+
+        _mock_adapter.handle_webhook = AsyncMock(side_effect=InboundRejected("busy"))
+        resp = client.post(
+            "/webhook/inbound/test-hook",
+            json={"content": "hello"},
+            headers={"X-Webhook-Secret": "supersecret"},
+        )
+        assert resp.status_code == 503
+        assert resp.headers["Retry-After"] == "30"
+
     def test_sync_mode_timeout(self, client, _mock_adapter):
         """Sync mode returns timeout when adapter returns None."""
         _mock_adapter.handle_webhook = AsyncMock(return_value=None)
@@ -0,0 +1,355 @@
+# Tests for bus/adapters/websocket_adapter.py — topic routing and send queues
+# Created: 2026-10-19
+
+import asyncio
+import json
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from pocketclaw.bus.adapters.websocket_adapter import WebSocketAdapter
+from pocketclaw.bus.adapters.ws_protocol import (
+    JSON_PROTOCOL,
+    UploadChunk,
+    choose_protocol,
+    decode_frame,
+    encode_upload_chunk,
+)
+from pocketclaw.bus.events import Channel, OutboundMessage, SystemEvent
+
+
+def _socket() -> MagicMock:
+    ws = MagicMock()
+    ws.send_json = AsyncMock()
+    return ws
+
+
+def _sent(ws: MagicMock) -> list[dict]:
+    return [c.args[0] for c in ws.send_json.call_args_list]
+
+
+@pytest.fixture
+async def adapter():
+    a = WebSocketAdapter()
+    yield a
+    for chat_id in list(a._connections):
+        await a.unregister_connection(chat_id)
+
+
+class TestTopicRouting:
+    async def test_session_events_only_reach_their_session(self, adapter):
+        ws_a, ws_b = _socket(), _socket()
+        await adapter.register_connection(ws_a, "a")
+        await adapter.register_connection(ws_b, "b")
+
+        await adapter.on_system_event(
+            SystemEvent(event_type="thinking", data={"session_key": "websocket:a"})
+        )
+        await adapter.flush()
+
+        assert [p["event_type"] for p in _sent(ws_a)] == ["thinking"]
+        assert _sent(ws_b) == []
+
+    async def test_events_for_an_aliased_session_reach_the_chat(self, adapter):
+        # After /new the loop runs under "websocket:a:<hex>" and tags the chat's key
+        ws_a, ws_b = _socket(), _socket()
+        await adapter.register_connection(ws_a, "a")
+        await adapter.register_connection(ws_b, "b")
+
+        for event_type in ("thinking", "tool_start", "tool_result", "error"):
+            await adapter.on_system_event(
+                SystemEvent(
+                    event_type=event_type,
+                    data={"session_key": "websocket:a:1f2e3d4c", "source_key": "websocket:a"},
+                )
+            )
+        await adapter.flush()
+
+        assert [p["event_type"] for p in _sent(ws_a)] == [
+            "thinking",
+            "tool_start",
+            "tool_result",
+            "error",
+        ]
+        assert _sent(ws_b) == []
+
+    async def test_unscoped_events_reach_everyone(self, adapter):
+        ws_a, ws_b = _socket(), _socket()
+        await adapter.register_connection(ws_a, "a")
+        await adapter.register_connection(ws_b, "b")
+
+        await adapter.on_system_event(SystemEvent(event_type="dw_planning_complete", data={}))
+        await adapter.flush()
+
+        assert len(_sent(ws_a)) == len(_sent(ws_b)) == 1
+
+    async def test_subscriptions(self, adapter):
+        ws = _socket()
+        await adapter.register_connection(ws, "a")
+
+        subs = adapter.update_subscriptions(
+            "a", {"sessions": ["telegram:42"], "tasks": ["t1"], "event_types": ["tool_start"]}
+        )
+        assert subs["sessions"] == ["telegram:42", "websocket:a"]
+
+        events = [
+            SystemEvent(event_type="tool_start", data={"session_key": "telegram:42"}),
+            SystemEvent(event_type="tool_start", data={"session_key": "telegram:7"}),
+            SystemEvent(event_type="thinking", data={"session_key": "telegram:42"}),
+            SystemEvent(event_type="tool_start", data={"task_id": "t1"}),
+            SystemEvent(event_type="tool_start", data={"task_id": "t2"}),
+        ]
+        for event in events:
+            await adapter.on_system_event(event)
+        await adapter.flush()
+
+        assert [p["data"] for p in _sent(ws)] == [{"session_key": "telegram:42"}, {"task_id": "t1"}]
+
+        adapter.update_subscriptions("a", {"event_types": ["tool_start"]}, subscribe=False)
+        adapter.update_subscriptions("a", {"sessions": "*"})
+        await adapter.on_system_event(
+            SystemEvent(event_type="thinking", data={"session_key": "telegram:7"})
+        )
+        await adapter.flush()
+        assert _sent(ws)[-1]["event_type"] == "thinking"
+
+
+class TestSendQueues:
+    async def test_slow_socket_does_not_block_others(self, adapter):
+        gate = asyncio.Event()
+        slow, fast = _socket(), _socket()
+
+        async def stalled(payload):
+            await gate.wait()
+
+        slow.send_json = AsyncMock(side_effect=stalled)
+        await adapter.register_connection(slow, "slow")
+        await adapter.register_connection(fast, "fast")
+
+        await asyncio.wait_for(adapter.broadcast("hello"), timeout=0.5)
+        await asyncio.sleep(0.01)
+
+        assert _sent(fast) == [{"type": "notification", "content": "hello"}]
+        assert slow.send_json.await_count == 1
+        assert len(adapter._connections["slow"].queue) == 0
+        gate.set()
+        await adapter.flush()
+
+    async def test_outbound_order_is_kept(self, adapter):
+        ws = _socket()
+        await adapter.register_connection(ws, "a")
+
+        for content in ("x", "y"):
+            await adapter.send(
+                OutboundMessage(
+                    channel=Channel.WEBSOCKET, chat_id="a", content=content, is_stream_chunk=True
+                )
+            )
+        await adapter.send(
+            OutboundMessage(channel=Channel.WEBSOCKET, chat_id="a", content="", is_stream_end=True)
+        )
+        await adapter.flush()
+
+        # Both chunks were still queued, so they went out as one frame
+        assert [p.get("content") for p in _sent(ws)] == ["xy", None]
+        assert _sent(ws)[-1] == {"type": "stream_end"}
+
+    async def test_replies_queue_behind_stream_chunks(self, adapter):
+        gate = asyncio.Event()
+        ws = _socket()
+
+        async def stalled(payload):
+            await gate.wait()
+
+        ws.send_json = AsyncMock(side_effect=stalled)
+        await adapter.register_connection(ws, "a")
+        await adapter.send(
+            OutboundMessage(
+                channel=Channel.WEBSOCKET, chat_id="a", content="x", is_stream_chunk=True
+            )
+        )
+        await asyncio.sleep(0)
+        await adapter.send(
+            OutboundMessage(
+                channel=Channel.WEBSOCKET, chat_id="a", content="y", is_stream_chunk=True
+            )
+        )
+        assert adapter.send_payload("a", {"type": "skills", "skills": []})
+        assert not adapter.send_payload("missing", {"type": "skills", "skills": []})
+
+        # Only the writer touches the socket, so the reply waits its turn
+        assert ws.send_json.await_count == 1
+        gate.set()
+        await adapter.flush()
+        assert [p.get("content", p["type"]) for p in _sent(ws)] == ["x", "y", "skills"]
+
+    async def test_switch_chat_keeps_queued_replies(self, adapter):
+        gate = asyncio.Event()
+        ws = _socket()
+
+        async def stalled(payload):
+            await gate.wait()
+
+        ws.send_json = AsyncMock(side_effect=stalled)
+        await adapter.register_connection(ws, "a")
+        adapter.send_payload("a", {"type": "subscriptions"})
+        adapter.send_payload("a", {"type": "skills"})
+        await asyncio.sleep(0)
+
+        await adapter.switch_chat("a", "b")
+        adapter.send_payload("b", {"type": "session_history"})
+        gate.set()
+        await adapter.flush()
+
+        assert list(adapter._connections) == ["b"]
+        assert [p["type"] for p in _sent(ws)] == ["subscriptions", "skills", "session_history"]
+
+
+class TestBackpressure:
+    async def _stalled(self, adapter, **limits) -> tuple[MagicMock, asyncio.Event]:
+        gate = asyncio.Event()
+        ws = _socket()
+
+        async def stalled(payload):
+            await gate.wait()
+
+        ws.send_json = AsyncMock(side_effect=stalled)
+        ws.close = AsyncMock()
+        for name, value in limits.items():
+            setattr(adapter, name, value)
+        await adapter.register_connection(ws, "a")
+        adapter.broadcast_payload({"type": "stream_start"})
+        await asyncio.sleep(0)  # writer is now stuck on the first send
+        return ws, gate
+
+    async def test_queued_stream_chunks_are_merged(self, adapter):
+        ws, gate = await self._stalled(adapter)
+        for content in ("a", "b", "c"):
+            await adapter.send(
+                OutboundMessage(
+                    channel=Channel.WEBSOCKET, chat_id="a", content=content, is_stream_chunk=True
+                )
+            )
+        gate.set()
+        await adapter.flush()
+
+        assert [p.get("content") for p in _sent(ws)] == [None, "abc"]
+        assert adapter.stats()["connections"][0]["merged"] == 2
+
+    async def test_full_queue_sheds_system_events_not_messages(self, adapter):
+        ws, gate = await self._stalled(adapter, queue_size=2)
+        await adapter.on_system_event(SystemEvent(event_type="thinking", data={}))
+        await adapter.on_system_event(SystemEvent(event_type="tool_start", data={}))
+        await adapter.broadcast("important")
+        await adapter.on_system_event(SystemEvent(event_type="tool_result", data={}))
+        gate.set()
+        await adapter.flush()
+
+        sent = _sent(ws)
+        assert [p["type"] for p in sent] == ["stream_start", "system_event", "notification"]
+        assert sent[1]["event_type"] == "tool_start"
+        assert adapter.stats()["connections"][0]["dropped"] == 2
+
+    async def test_lagging_client_is_disconnected(self, adapter):
+        ws, _ = await self._stalled(adapter, max_lag=0.01)
+        await asyncio.sleep(0.02)
+
+        await adapter.broadcast("late")
+        await asyncio.sleep(0)
+
+        assert "a" not in adapter._connections
+        ws.close.assert_awaited_once()
+        assert ws.close.call_args.kwargs["code"] == 1013
+        assert adapter.stats()["disconnected_slow"] == 1
+
+
+class TestWireProtocol:
+    def test_negotiation(self):
+        assert choose_protocol([]) is None
+        assert choose_protocol([JSON_PROTOCOL]) == JSON_PROTOCOL
+        assert choose_protocol(["other"]) is None
+
+    def test_decode_frames(self):
+        assert decode_frame({"text": json.dumps({"action": "chat"})}) == {"action": "chat"}
+        chunk = decode_frame({"bytes": encode_upload_chunk(7, b"\x00\x01raw")})
+        assert chunk == UploadChunk(7, b"\x00\x01raw")
+        with pytest.raises(ValueError):
+            decode_frame({"bytes": b"?junk"})
+
+
+class TestBinaryUploads:
+    async def test_upload_is_attached_to_chat(self, adapter, tmp_path):
+        ws = _socket()
+        adapter._bus = MagicMock()
+        adapter._bus.publish_inbound = AsyncMock(return_value=True)
+        await adapter.register_connection(ws, "a")
+
+        with (
+            patch("pocketclaw.bus.media.get_media_dir", return_value=tmp_path),
+            patch("pocketclaw.bus.media.get_settings") as settings,
+        ):
+            settings.return_value = MagicMock(media_max_file_size_mb=1)
+            await adapter.handle_message(
+                "a", {"action": "upload_start", "upload_id": 1, "name": "a.png"}
+            )
+            for part in (b"\x89PNG", b"data"):
+                await adapter.handle_upload_chunk("a", UploadChunk(1, part))
+            await adapter.handle_message("a", {"action": "upload_end", "upload_id": 1})
+            await adapter.handle_message("a", {"action": "chat", "message": "see", "uploads": [1]})
+        await adapter.flush()
+
+        assert _sent(ws)[0] == {"type": "upload_complete", "upload_id": 1, "name": "a.png"}
+        message = adapter._bus.publish_inbound.call_args.args[0]
+        assert message.content == "see\n[Attached: a.png]"
+        assert open(message.media[0], "rb").read() == b"\x89PNGdata"
+
+    async def test_unknown_upload_id_is_rejected(self, adapter):
+        ws = _socket()
+        await adapter.register_connection(ws, "a")
+
+        await adapter.handle_message("a", {"action": "upload_start", "upload_id": "x"})
+        await adapter.flush()
+
+        assert _sent(ws)[0]["type"] == "upload_error"
+
+    async def test_failed_finish_reports_error_and_discards_file(self, adapter, tmp_path):
+        ws = _socket()
+        await adapter.register_connection(ws, "a")
+
+        with (
+            patch("pocketclaw.bus.media.get_media_dir", return_value=tmp_path),
+            patch("pocketclaw.bus.media.get_settings") as settings,
+            patch("pocketclaw.bus.media.MediaUpload.finish", side_effect=OSError("disk full")),
+        ):
+            settings.return_value = MagicMock(media_max_file_size_mb=1)
+            await adapter.handle_message("a", {"action": "upload_start", "upload_id": 1})
+            await adapter.handle_upload_chunk("a", UploadChunk(1, b"data"))
+            await adapter.handle_message("a", {"action": "upload_end", "upload_id": 1})
+        await adapter.flush()
+
+        assert _sent(ws) == [{"type": "upload_error", "upload_id": 1, "content": "disk full"}]
+        assert adapter._connections["a"].completed == {}
+        assert list(tmp_path.iterdir()) == []
+
+    async def test_unclaimed_uploads_are_bounded(self, adapter, tmp_path):
+        ws = _socket()
+        await adapter.register_connection(ws, "a")
+
+        with (
+            patch("pocketclaw.bus.adapters.websocket_adapter._MAX_COMPLETED_UPLOADS", 2),
+            patch("pocketclaw.bus.media.get_media_dir", return_value=tmp_path),
+            patch("pocketclaw.bus.media.get_settings") as settings,
+        ):
+            settings.return_value = MagicMock(media_max_file_size_mb=1)
+            for upload_id in (1, 2, 3):
+                await adapter.handle_message(
+                    "a", {"action": "upload_start", "upload_id": upload_id, "name": f"{upload_id}"}
+                )
+                await adapter.handle_message("a", {"action": "upload_end", "upload_id": upload_id})
+
+        completed = adapter._connections["a"].completed
+        assert list(completed) == [2, 3]
+        assert sorted(p.name for p in tmp_path.iterdir()) == sorted(
+            Path(path).name for _, path in completed.values()
+        )